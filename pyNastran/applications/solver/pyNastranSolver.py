@@ -8,18 +8,21 @@ import sys
 from struct import pack
 
 # 3rd party
-from numpy import array, zeros, ones
+from numpy import array, zeros, ones, isfinite
 from numpy import searchsorted
-from numpy.linalg import solve
+from numpy.linalg import solve, LinAlgError
 
-from scipy.sparse import coo_matrix
+from scipy.sparse import issparse
+from scipy.sparse.linalg import spsolve
 
 # pyNastran
-from pyNastran.utils import list_print
+from pyNastran.utils.dev import list_print
 from pyNastran.utils.mathematics import print_matrix, print_annotated_matrix
 from pyNastran.bdf.bdf import BDF, SPC, SPC1
 from pyNastran.f06.f06 import F06
 from pyNastran.op2.op2 import OP2
+from pyNastran.bdf.dev_vectorized.solver.utils import (
+    element_triplets, assemble_sparse, partition_sparse_symmetric)
 
 # Tables
 from pyNastran.op2.tables.oug.oug_displacements import RealDisplacement
@@ -223,13 +226,17 @@ class Solver(F06, OP2):
     """
     def __init__(self):
         F06.__init_data__(self)
-        OP2.__init__(self, '')
+        OP2.__init__(self)
 
         self.page_num = 1
 
         # normalization of stiffness matrix
         self.fnorm = 1.0
 
+        #: prints the element/global matrices and vectors; the matrices are
+        #: converted to dense, so this is only for small models
+        self.log_matrices = False
+
         self.iSubcases = []
         self.nU = 0
         self.nUs = 0
@@ -247,25 +254,32 @@ class Solver(F06, OP2):
         self.case_result_flags = {}
 
     def _solve(self, K, F, dofs):  # can be overwritten
-        r"""solves \f$ [K]{x} = {F}\f$ for \f${x}\f$"""
-        print("--------------")
-        print("Kaa_norm / %s = \n" % self.fnorm + list_print(K / self.fnorm))
-        print("--------------")
-        print("Fa = ", F)
+        r"""
+        solves \f$ [K]{x} = {F}\f$ for \f${x}\f$
+
+        :param K: the (n, n) dense or sparse stiffness matrix
+        :param F: the (n,) load vector
+        :param dofs: the (n,) global DOFs of K/F
+        """
+        if self.log_matrices:
+            Kdense = K.toarray() if issparse(K) else K
+            print("--------------")
+            print("Kaa_norm / %s = \n" % self.fnorm + list_print(Kdense / self.fnorm))
+            print("--------------")
+            print("Fa = ", F)
         if F[0] == 0.0:
             assert max(F) != min(F), 'no load is applied...'
-        print("--------------")
 
         try:
-            U = solve(K, F)
+            U = self._solve_linear(K, F)
         except:
             failed = []
             faileds = []
+            Kdiag = K.diagonal()
             for i, iu in enumerate(dofs):
-                absF = abs(F)
                 nid, dof = self.IDtoNidComponents[iu]
                 #if absF[iu] == 0.0 and ??:
-                if K[i, i] == 0.0:
+                if Kdiag[i] == 0.0:
                     failed.append([nid, dof])
                     faileds.append(i)
             msg = self.make_grid_point_singularity_table(failed)
@@ -286,7 +300,7 @@ class Solver(F06, OP2):
                     # remove the DOFs and solve
                     K2 = K[ilist, :][:, ilist]
                     F2 = F[ilist]
-                    U2 = solve(K2, F2)
+                    U2 = self._solve_linear(K2, F2)
 
                     # put the removed DOFs back in and set their displacement to 0.0
                     U = zeros(len(F), 'float64')
@@ -297,6 +311,20 @@ class Solver(F06, OP2):
 
         return U
 
+    def _solve_linear(self, K, F):
+        """
+        Solves a dense or sparse system; a singular sparse matrix raises
+        a LinAlgError like the dense solver
+        """
+        if not issparse(K):
+            return solve(K, F)
+        if (K.diagonal() == 0.0).any():
+            raise LinAlgError('Singular matrix')
+        U = spsolve(K.tocsc(), F)
+        if not isfinite(U).all():
+            raise LinAlgError('Singular matrix')
+        return U
+
     def run_solver(self, bdfName):
         bdfName = os.path.abspath(bdfName)
         bdf_base, ext = os.path.splitext(bdfName)
@@ -306,7 +334,7 @@ class Solver(F06, OP2):
 
         self.model = BDF()
         self.model.cards_to_read = get_cards()
-        self.model.readBDF(bdfName)
+        self.model.read_bdf(bdfName)
         cc = self.model.caseControlDeck
         #print cc.subcases
         analysisCases = []
@@ -360,6 +388,9 @@ class Solver(F06, OP2):
             else:
                 self.label = ''
             self.iSubcaseNameMap[isubcase] = [self.Subtitle, self.label]
+            if (isubcase, self.Subtitle) not in self.labels:
+                self.subtitles[isubcase].append(self.Subtitle)
+                self.labels[(isubcase, self.Subtitle)] = self.label
 
             # really should be is_f06_stress, is_op2_stress, etc.
             # also should have SET support
@@ -485,22 +516,20 @@ class Solver(F06, OP2):
             print("------------------------\n")
             print("solving...")
             Ua = self.solve_sol_101(Kgg, Fg)
-            print("Ua = ", Ua)
-            print("Us = ", self.Us)
 
             dofsA = getDOF_Set(n, self.iUs)
             dofsA.sort()
             U = zeros(n, 'float64')
-            print("U = ", U)
-            print("iUs   = ", self.iUs)
 
             # TODO handle MPCs
-            for (i, iu) in enumerate(self.iUs):
-                U[iu] = self.Us[i]
-            for (i, iu) in enumerate(dofsA):
-                U[iu] = Ua[i]
-            print("*U = ", U)
-            print("dofsA = ", dofsA)
+            U[self.iUs] = self.Us
+            U[dofsA] = Ua
+            if self.log_matrices:
+                print("Ua = ", Ua)
+                print("Us = ", self.Us)
+                print("iUs   = ", self.iUs)
+                print("*U = ", U)
+                print("dofsA = ", dofsA)
 
             if self.is_displacement:
                 self._store_displacements(model, U, case)
@@ -799,14 +828,13 @@ class Solver(F06, OP2):
             # SOLIDS
         #=========================
         self.write_f06(self.f06_file, end_flag=True)
-        self.write_op2(self.op2_file, packing=True)
-        self.write_op2(self.op2_pack_file, packing=False)
+        self.write_op2(self.op2_file, self.op2_pack_file)
 
-    def _op2_header(self, f, packing=True):
+    def _op2_header(self, f, fascii):
         data = [4,3,4,
          1,28,12,
          4,7,4,   # 7
-         'NASTRAN FORT TAPE ID CODE - ',   # 28 = 7*4
+         b'NASTRAN FORT TAPE ID CODE - ',   # 28 = 7*4
          4,2,4,   # 7
          4,-1,4,
          4,0,4,
@@ -814,34 +842,33 @@ class Solver(F06, OP2):
          4,2,4,
          4,0,4,
          4,2,4]
-        if packing:
-            f.write(pack('9i28s18i', *data))
-        if not packing:
-            f.write(str(data)+'\n')
+        f.write(pack('9i28s18i', *data))
+        fascii.write(str(data)+'\n')
 
-    def write_op2(self, f, packing=False):
-        results = [self.displacements]
-        header = None
-        pageStamp = None
+    def write_op2(self, f, fascii):
+        """
+        Writes the results to an OP2
 
-        self._op2_header(f, packing=packing)
+        :param f:       the binary OP2 file
+        :param fascii:  an ASCII dump of the records written to f
+        """
+        results = [self.displacements]
+        self._op2_header(f, fascii)
 
         for result in results:
             for subcase, case in sorted(iteritems(result)):
-                case.write_op2(header, pageStamp, f, is_mag_phase=False, packing=packing)
-                if not packing:
-                    f.write('\n')
+                case.write_op2(f, fascii, is_mag_phase=False)
+                fascii.write('\n')
         marker1 = [4,  0, 4]
         marker2 = [4,  0, 4]
         marker3 = [4,  0, 4]
         marker = marker1 + marker2 + marker3
-        if packing:
-            nmarker = len(marker)
-            p = pack('%ii' % nmarker, *marker)
-            f.write(p)
-        else:
-            f.write(str(marker)+'\n')
+        nmarker = len(marker)
+        p = pack('%ii' % nmarker, *marker)
+        f.write(p)
+        fascii.write(str(marker)+'\n')
         f.close()
+        fascii.close()
 
     def _store_beam_oes(self, model, eids, axial, case, elementType='CBEAM', Type='strain'):
         #print('eids =', eids)
@@ -860,7 +887,7 @@ class Solver(F06, OP2):
                     'sort_bits': [0, 0, 0], 'num_wide': 8, 'table_name': 'OES',
                     'element_name': elementType, 'format_code':format_code,
                     's_code': s_code,
-                    'nonlinear_factor': None}
+                    'nonlinear_factor': None, 'dataNames':['lsdvmn']}
         if Type == 'stress':
             if elementType == 'CBEAM':
                 stress = RealBeamStress(data_code, is_sort1, isubcase, dt=False)
@@ -911,7 +938,7 @@ class Solver(F06, OP2):
                     'sort_bits': [0, 0, 0], 'num_wide': 8, 'table_name': 'OEF',
                     'element_name': elementType, 'format_code':format_code,
                     #'s_code': s_code,
-                    'nonlinear_factor': None}
+                    'nonlinear_factor': None, 'dataNames':['lsdvmn']}
 
         if elementType == 'CBEAM':
             forces = RealCBeamForce(data_code, is_sort1, isubcase, dt=False)
@@ -955,7 +982,7 @@ class Solver(F06, OP2):
                     'sort_bits': [0, 0, 0], 'num_wide': 8, 'table_name': 'OEF',
                     'element_name': elementType, 'format_code':format_code,
                     #'s_code': s_code,
-                    'nonlinear_factor': None}
+                    'nonlinear_factor': None, 'dataNames':['lsdvmn']}
         return data_code
 
     def _store_cshear_oef(self, model, eids, force, case, elementType):
@@ -1014,7 +1041,7 @@ class Solver(F06, OP2):
                     'sort_bits': [0, 0, 0], 'num_wide': 8, 'table_name': 'OES',
                     'element_name': elementType, 'format_code':format_code,
                     's_code': s_code,
-                    'nonlinear_factor': None}
+                    'nonlinear_factor': None, 'dataNames':['lsdvmn']}
 
         if Type == 'stress':
             #if elementType == 'CELAS2':
@@ -1062,7 +1089,7 @@ class Solver(F06, OP2):
                     'sort_bits': [0, 0, 0], 'num_wide': 8, 'table_name': 'OES',
                     'element_name': elementType, 'format_code':format_code,
                     's_code': s_code,
-                    'nonlinear_factor': None}
+                    'nonlinear_factor': None, 'dataNames':['lsdvmn']}
 
         if Type == 'stress':
             #if elementType == 'CELAS2':
@@ -1149,9 +1176,9 @@ class Solver(F06, OP2):
         if elementType == 'CROD':
             self.rodForces[isubcase] = forces
         elif elementType == 'CONROD':
-            self.conrodForces[isubcase] = forces
+            self.conrod_force[isubcase] = forces
         elif elementType == 'CTUBE':
-            self.ctubeForces[isubcase] = forces
+            self.ctube_force[isubcase] = forces
         else:
             raise NotImplementedError(elementType)
         #stress.dt = None
@@ -1172,7 +1199,7 @@ class Solver(F06, OP2):
                     'sort_bits': [0, 0, 0], 'num_wide': 8, 'table_name': 'OES',
                     'element_name': elementType, 'format_code':format_code,
                     's_code': s_code,
-                    'nonlinear_factor': None}
+                    'nonlinear_factor': None, 'dataNames':['lsdvmn']}
         if Type == 'stress':
             if elementType == 'CROD':
                 stress = RealRodStress(data_code, is_sort1, isubcase, dt=False)
@@ -1203,13 +1230,13 @@ class Solver(F06, OP2):
         elif elementType == 'CROD' and Type == 'strain':
             self.rodStrain[isubcase] = stress
         elif elementType == 'CONROD' and Type == 'stress':
-            self.conrodStress[isubcase] = stress
+            self.conrod_stress[isubcase] = stress
         elif elementType == 'CONROD' and Type == 'strain':
-            self.conrodStrain[isubcase] = stress
+            self.conrod_strain[isubcase] = stress
         elif elementType == 'CTUBE' and Type == 'stress':
-            self.ctubeStress[isubcase] = stress
+            self.ctube_stress[isubcase] = stress
         elif elementType == 'CTUBE' and Type == 'strain':
-            self.ctubeStrain[isubcase] = stress
+            self.ctube_strain[isubcase] = stress
         else:
             raise NotImplementedError('elementType=%r Type=%r' % (elementType, Type))
         stress.dt = None
@@ -1227,7 +1254,8 @@ class Solver(F06, OP2):
         data_code = {'log': self.log, 'analysis_code': analysis_code,
                     'device_code': 1, 'table_code': 1, 'sort_code': 0,
                     'sort_bits': [0, 0, 0], 'num_wide': 8, 'table_name': 'OUG',
-                    'nonlinear_factor': None}
+                    'Title': self.Title, 'subtitle': self.Subtitle, 'label': self.label,
+                    'nonlinear_factor': None, 'dataNames':['lsdvmn']}
         disp = RealDisplacement(data_code, is_sort1, isubcase, dt=None)
 
         data = []
@@ -1238,7 +1266,7 @@ class Solver(F06, OP2):
             if node.type == 'GRID':
                 line = [nid, 'G']
                 xyz = U[i:i + 6]  # 1,2,3,4,5,6
-                line += xyz
+                line += xyz.tolist()
                 i += 6
             #elif node.type == 'SPOINT':
                 #line = [nid, 'S', U[i], 0., 0., 0., 0., 0.]
@@ -1271,7 +1299,6 @@ class Solver(F06, OP2):
         #=====================
 
         (self.IDtoNidComponents) = reverse_dict(self.nidComponentToID)
-        print("IDtoNidComponents = ", self.IDtoNidComponents)
         #print("Kgg =\n" + print_annotated_matrix(Kgg, self.IDtoNidComponents))
         #print("Kgg = \n", Kgg)
         #print("iSize = ", i)
@@ -1280,16 +1307,19 @@ class Solver(F06, OP2):
         #sys.exit('verify Kgg')
 
         #print("Kgg = \n%s" % (print_matrix(Kgg / self.fnorm)))
-        Kaa, dofs2 = partition_dense_symmetric(Kgg, self.iUs)
-        print("Kaa = \n%s" % (print_matrix(Kaa / self.fnorm)))
+        Kaa, dofs2 = partition_sparse_symmetric(Kgg, self.iUs)
+        if self.log_matrices:
+            print("IDtoNidComponents = ", self.IDtoNidComponents)
+            print("Kaa = \n%s" % (print_matrix(Kaa.toarray() / self.fnorm)))
         #print("Kaa.shape = ",Kaa.shape)
 
         #sys.exit('verify Kaa')
         Fa, _dofs2 = partition_dense_vector(Fg, self.iUs)
         #print("Kaa = \n%s" % (print_matrix(Kaa)))
 
-        print("Fg = ", Fg)
-        print("Fa = ", Fa)
+        if self.log_matrices:
+            print("Fg = ", Fg)
+            print("Fa = ", Fa)
         #print("Us = ", self.Us)
 
         #self.Us = array(self.Us, 'float64')  # SPC
@@ -1342,11 +1372,18 @@ class Solver(F06, OP2):
         index0s *= 6
         return node_ids, index0s
 
-    def assemble_global_stiffness(self, model, i, Dofs):
-        Kgg = zeros((i, i), 'float64')
+    def assemble_global_stiffness(self, model, ndofs, Dofs):
+        """
+        Assembles the stiffness matrix from the element COO triplets
 
+        :param model: the BDF object
+        :param ndofs: the number of DOFs in the g-set
+        :param Dofs: the (nid, component) -> DOF map
+        :returns Kgg: the (ndofs, ndofs) CSR matrix
+        :returns Kgg_sparse: Kgg (for backwards compatibility)
+        """
+        triplets = []
         dof_mapper = []
-        print("Kgg.shape", Kgg.shape)
 
         nnodes = len(model.nodes)
         try:
@@ -1356,9 +1393,7 @@ class Solver(F06, OP2):
         #ndofs = 6 * nnodes + nspoints
 
         i = 0
-        nids = model.nodes.keys()
-        nids.sort()
-        print('nids =', nids, i)
+        nids = sorted(model.nodes.keys())
         #dof_ids = arange(0, 6*nnodes, 6)
 
         #dofs_0 = [nid=2, 1] -> searchsorted(nids, nid)[0]
@@ -1367,9 +1402,7 @@ class Solver(F06, OP2):
             #nid_dof_mapper[]
 
         for (eid, elem) in sorted(iteritems(model.elements)):  # CROD, CONROD
-            print("----------------------------")
             node_ids, index0s = self.element_dof_start(elem, nids)
-            print("node_ids=%s index0s=%s" % (node_ids, index0s))
 
             # nIJV is the position of the values of K in the dof
             try:
@@ -1384,7 +1417,10 @@ class Solver(F06, OP2):
                 #if dof in Dofs:
                     #F[Dofs[dof]] += fg
 
-            print("K[%s] = \n%s" % (eid, list_print(K / self.fnorm)))
+            if self.log_matrices:
+                print("----------------------------")
+                print("node_ids=%s index0s=%s" % (node_ids, index0s))
+                print("K[%s] = \n%s" % (eid, list_print(K / self.fnorm)))
             #print("Ke[%s] = \n%s" % (eid, Ke / self.fnorm))
             #print("dofs = %s" % dofs)
 
@@ -1401,27 +1437,8 @@ class Solver(F06, OP2):
                             Kgg[dof1, dof2] += K[i, j]
                 continue
 
-            (Ki, Kj) = K.shape
-            ij = 0
-            nij2 = []
-            print('**Dofs', Dofs.keys())
-            for ij in nIJV:
-                nij2.append(Dofs[ij])
-            print('nij2', nij2)
-
-            for i in range(Ki):
-                for j in range(Kj):
-                    #kij = K[i, j]
-                    #if abs(kij)>1e-8:
-                    #print('niJV = ',nIJV[ij])
-                    ii = nij2[i]
-                    jj = nij2[j]
-                    #dof = Dofs[n]
-                    #if K[i, j] / fnorm > 1000.0:
-                        #asdf
-                    Kgg[ii, jj] += K[i, j]
-
-                    #ij += 1
+            nij2 = [Dofs[ij] for ij in nIJV]
+            triplets.append(element_triplets(K, nij2))
 
         if 0:
             # n is (nid,componentID), IJV is the (ith,jth,value) in K
@@ -1435,9 +1452,8 @@ class Solver(F06, OP2):
                 #KggJ.append(j)
                 #KggV.append(v)
 
-        #Kgg_sparse = coo_matrix((entries, (rows, cols)), shape=(i, i))
-        Kgg_sparse = None
-        return Kgg, Kgg_sparse
+        Kgg = assemble_sparse(triplets, ndofs)
+        return Kgg, Kgg
 
     def apply_SPCs2(self, model, case, nidComponentToID):
         if case.has_parameter('SPC'):
@@ -0,0 +1,43 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import pyNastran
+from pyNastran.f06.f06 import F06
+from pyNastran.applications.solver.pyNastranSolver import Solver
+from pyNastran.bdf.dev_vectorized.test.test_solver import compare_sol_101
+
+root_path = pyNastran.__path__[0]
+solver_path = os.path.join(root_path, 'applications', 'solver')
+
+
+class TestSolver(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def run_sol_101(self, bdf_name, f06_expected):
+        """runs a SOL 101 deck and compares it to the MSC Nastran F06"""
+        bdf_filename = os.path.join(self.dirname, bdf_name)
+        shutil.copyfile(os.path.join(solver_path, bdf_name), bdf_filename)
+        solver = Solver()
+        solver.run_solver(bdf_filename)
+        self.assertTrue(os.path.exists(solver.f06_name))
+        self.assertTrue(os.path.exists(solver.op2_name))
+
+        f06 = F06(debug=False)
+        f06.read_f06(os.path.join(solver_path, f06_expected))
+        compare_sol_101(self, solver, f06)
+
+    def test_sol_101_rod(self):
+        self.run_sol_101('rod.bdf', 'rod_expected.f06')
+
+    def test_sol_101_2dtruss(self):
+        self.run_sol_101('2dTruss.bdf', '2dtruss_expected.f06')
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -10,12 +10,18 @@ from six import string_types, iteritems, itervalues, next
 from pyNastran.utils import (object_attributes, print_bad_path)
 from pyNastran.bdf.utils import (to_fields, get_include_filename,
     parse_executive_control_deck, clean_empty_lines, _clean_comment)
+from pyNastran.bdf.bdf_tokenizer import (tokenize_bulk_data, tokenize_file,
+    get_card_chunks, check_include_filename)
 
 #from codecs import open as codec_open
 import io
 import os
 import sys
 import traceback
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:  # python 2 without the futures backport
+    ProcessPoolExecutor = None
 
 from pyNastran.utils import (object_attributes, print_bad_path)
 from pyNastran.utils.dev import list_print
@@ -102,10 +108,173 @@ from pyNastran.bdf.bdfInterface.addCard import AddMethods
 from pyNastran.bdf.bdfInterface.BDF_Card import BDFCard
 from pyNastran.bdf.bdfInterface.assign_type import interpret_value
 from pyNastran.bdf.bdfInterface.bdf_writeMesh import WriteMesh
-from pyNastran.bdf.bdfInterface.crossReference import XrefMesh
+from pyNastran.bdf.bdfInterface.crossReference import XrefMesh, CardDict
 from pyNastran.bdf.cards.utils import wipe_empty_fields
 
 
+#: cards that have their own method add_CARDNAME to add them
+_ADD_CARDNAME_CARDS = [
+    'LSEQ', 'PHBDY', 'AERO', 'AEROS', 'AEFACT',
+    'AELINK', 'AELIST', 'AEPARM', 'AESTAT', 'AESURF', 'TRIM',
+    'FLUTTER', 'FLFACT', 'GUST', 'NLPARM', 'NLPCI', 'TSTEP',
+    'TSTEPNL', 'SESET', 'DCONSTR', 'DESVAR', 'DDVAL', 'DLINK',
+    'PARAM', 'PDAMPT', 'PELAST', 'PBUSHT']
+
+#: dictionary of cards. Key is the name of the function to add the card
+# 'PCOMPG':  # hasnt been verified
+# 'MAT8':  # note there is no MAT6 or MAT7
+_CARDS = {
+ 'add_node': ['GRID'],
+ 'add_mass': ['CONM1', 'CONM2', 'CMASS1',
+              'CMASS2', 'CMASS3', 'CMASS4', ],
+ 'add_element': ['CQUAD4', 'CQUAD8', 'CQUAD', 'CQUADR', 'CQUADX',
+                 'CTRIA3', 'CTRIA6', 'CTRIAR', 'CTRIAX', 'CTRIAX6',
+                 'CBAR', 'CBEAM', 'CBEAM3', 'CROD', 'CONROD',
+                 'CTUBE', 'CBEND', 'CELAS1', 'CELAS2', 'CELAS3',
+                 'CELAS4', 'CVISC', 'CSHEAR', 'CGAP',
+                 'CRAC2D', 'CRAC3D'],
+ 'add_damper': ['CBUSH', 'CBUSH1D', 'CFAST', 'CDAMP1',
+                'CDAMP2', 'CDAMP3', 'CDAMP4', 'CDAMP5'],
+ 'add_rigid_element': ['RBAR', 'RBAR1', 'RBE1', 'RBE2', 'RBE3'],
+ 'add_property': ['PSHELL', 'PCOMP', 'PCOMPG', 'PSHEAR', 'PSOLID',
+                  'PBAR', 'PBARL', 'PBEAM', 'PBCOMP', 'PBEAML',
+                  'PROD', 'PTUBE', 'PLSOLID', 'PBUSH1D', 'PBUSH',
+                  'PFAST', 'PDAMP5', 'PGAP', 'PRAC2D', 'PRAC3D',
+                  'PLPLANE',],
+
+ # hasnt been verified, links up to MAT1, MAT2, MAT9 w/ same MID
+ 'add_creep_material': ['CREEP'],
+ 'add_structural_material': ['MAT1', 'MAT2', 'MAT3', 'MAT8',
+                             'MAT9', 'MAT10', 'MAT11',
+                             'EQUIV'],
+ 'add_hyperelastic_material': ['MATHE', 'MATHP',],
+ 'add_thermal_material': ['MAT4', 'MAT5'],
+ 'add_material_dependence': ['MATS1', 'MATS3', 'MATS8',
+                             'MATT1', 'MATT2', 'MATT3', 'MATT4',
+                             'MATT5', 'MATT8', 'MATT9'],
+ 'add_load': ['FORCE', 'FORCE1', 'FORCE2', 'MOMENT', 'MOMENT1',
+              'MOMENT2', 'GRAV', 'ACCEL', 'ACCEL1', 'LOAD', 'PLOAD',
+                  'PLOAD1', 'PLOAD2', 'PLOAD4', 'PLOADX1',
+                  'RFORCE', 'DLOAD', 'SLOAD', 'TLOAD1', 'TLOAD2',
+                  'RLOAD1', 'RLOAD2', 'RANDPS'],
+ 'add_thermal_load': ['TEMP', 'QBDY1', 'QBDY2', 'QBDY3', 'QHBDY'],
+ 'add_thermal_element': ['CHBDYE', 'CHBDYG', 'CHBDYP'],
+ 'add_convection_property': ['PCONV', 'PCONVM'],
+ 'add_constraint_MPC': ['MPC', 'MPCADD'],
+ 'add_constraint_SPC': ['SPC', 'SPC1', 'SPCAX', 'SPCD', 'SPCADD'],
+ 'add_suport': ['SUPORT'],  # pseudo-constraint
+ 'add_constraint': ['SUPORT1'],  # pseudo-constraint
+ 'add_SPLINE': ['SPLINE1', 'SPLINE2', 'SPLINE3', 'SPLINE4', 'SPLINE5'],
+ 'add_CAERO': ['CAERO1', 'CAERO2', 'CAERO3', 'CAERO4', 'CAERO5'],
+ 'add_PAERO': ['PAERO1', 'PAERO2', 'PAERO3', 'PAERO4', 'PAERO5'],
+ 'add_MKAERO': ['MKAERO1', 'MKAERO2'],
+ 'add_FREQ': ['FREQ', 'FREQ1', 'FREQ2'],
+ 'add_ASET': ['ASET', 'ASET1'], 'add_BSET': ['BSET', 'BSET1'],
+ 'add_CSET': ['CSET', 'CSET1'], 'add_QSET': ['QSET', 'QSET1'],
+ 'add_SET': ['SET1', 'SET3'],
+ 'add_DRESP': ['DRESP1', 'DRESP2'],
+ 'add_DVPREL': ['DVPREL1', 'DVPREL2'],
+ 'add_coord': ['CORD2R', 'CORD2C', 'CORD2S'],
+ 'add_table': ['TABLED1', 'TABLED2', 'TABLED3', 'TABLED4',
+               'TABLEM1', 'TABLEM2', 'TABLEM3', 'TABLEM4',
+               'TABLES1', 'TABLEST', 'TABDMP1'],
+ 'add_random_table': ['TABRND1', 'TABRNDG'],
+ 'add_method': ['EIGB', 'EIGR', 'EIGRL'],
+ 'add_cmethod': ['EIGC', 'EIGP'],
+ 'add_DVMREL': ['DVMREL1'],
+}
+
+#: card_name -> the name of the function to add the card
+_ADD_FUNCS = dict([(card_name, 'add_' + card_name) for card_name in _ADD_CARDNAME_CARDS])
+for _func, _names in iteritems(_CARDS):
+    for _card_name in _names:
+        _ADD_FUNCS[_card_name] = _func
+
+# card that requires more careful processing, elements
+_SOLIDS = {'CTETRA': (7, CTETRA4, CTETRA10),
+           'CHEXA': (11, CHEXA8, CHEXA20),
+           'CPENTA': (9, CPENTA6, CPENTA15)}
+
+# dampers
+_DAMPER_PROPERTIES = {'PELAS': (5,), 'PVISC': (5,), 'PDAMP': (3, 5)}
+
+
+def _build_card_objects(card_name, card_obj, comment=''):
+    """
+    Creates the card objects for cards that are just added with an
+    add_xxx method (e.g. GRID -> add_node).  This doesn't touch the BDF,
+    so it can be run in another process.
+
+    :param card_name: the card_name -> 'GRID'
+    :param card_obj:  the BDFCard object
+    :param comment:   the comment for the card
+    :returns objects: a list of (add_function_name, card object) or None
+                      if the card needs the BDF (e.g. DMIG columns)
+    """
+    if card_name in _ADD_FUNCS:
+        try:
+            obj = globals()[card_name](card_obj, comment=comment)
+        except Exception as e:
+            if not e.args:
+                e.args = ('',)
+            e.args = ('%s' % e.args[0] + "\ncard = %s" % card_obj.card,) + e.args[1:]
+            raise
+        return [(_ADD_FUNCS[card_name], obj)]
+
+    if card_name in _SOLIDS:
+        d = _SOLIDS[card_name]
+        return [('add_element', (d[1] if card_obj.nFields() == d[0]
+                                 else d[2])(card_obj, comment=comment))]
+
+    if card_name in _DAMPER_PROPERTIES:
+        cls = globals()[card_name]
+        try:
+            objects = [('add_property', cls(card_obj, comment=comment))]
+        except Exception as e:
+            if not e.args:
+                e.args = ('',)
+            e.args = ('%s' % e.args[0] + "\ncard = %s" % card_obj.card,) + e.args[1:]
+            raise
+        for i in _DAMPER_PROPERTIES[card_name]:
+            if card_obj.field(i):
+                objects.append(('add_property', cls(card_obj, 1, comment=comment)))
+        return objects
+    return None
+
+
+def _parse_bulk_data_chunk(bdf_filename, include_dir, byte_range, cards_to_read):
+    """
+    Tokenizes a chunk of a file and creates the card objects that don't
+    need the BDF.  This is run in a worker process by
+    ``BDF.read_bdf(..., num_workers=N)``.
+
+    :param bdf_filename:  the file to read
+    :param include_dir:   the directory the INCLUDE files are relative to
+    :param byte_range:    the (start, end) bytes of the chunk
+    :param cards_to_read: the cards that aren't rejected
+    :returns cards: a list of (card_name, fields, comment, card_lines, objects),
+                    where objects is None if the card is added by add_card
+                    (fields/card_lines are None if objects is not None)
+    """
+    cards = []
+    for (card_name, fields, comment, card_lines) in tokenize_file(
+            bdf_filename, include_dir, cards_to_read=cards_to_read, byte_range=byte_range):
+        objects = None
+        if fields is not None and card_name != 'INCLUDE':
+            try:
+                objects = _build_card_objects(card_name, BDFCard(wipe_empty_fields(fields)),
+                                              comment)
+            except Exception:
+                # add_card will raise the error when the card is reached
+                objects = None
+        if objects is not None:
+            # the fields/lines aren't needed, so don't send them back
+            fields = None
+            card_lines = None
+        cards.append((card_name, fields, comment, card_lines, objects))
+    return cards
+
+
 class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
     """
     NASTRAN BDF Reader/Writer/Editor class.
@@ -138,12 +307,22 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
         self.include_dir = ''
         self.active_filename = None
         self.active_filenames = []
+        #: the main bdf and the INCLUDE files that were read
+        self.bdf_filenames = []
+        #: the reverse-dependency index for cross_reference(incremental=True)
+        self._xref_index = None
+        #: the cached topology index (see get_topology)
+        self._topology = None
+        #: the cached compiled load cases (see get_load_sum)
+        self._load_sums = {}
         self._stored_Is = {}
         self._stored_lines = {}
         self._stored_comments = {}
         self._line_streams = {}
         self._card_streams = {}
         self._break_comment = None
+        #: the (ifile, line number) of the first line after BEGIN BULK
+        self._ibulk = None
 
         self._relpath = True
         if sys.version_info < (2, 6):
@@ -446,7 +625,7 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
         # ------------------------------- nodes -------------------------------
         # main structural block
         #: stores SPOINT, GRID cards
-        self.nodes = {}
+        self.nodes = CardDict()
         #: stores POINT cards
         self.points = {}
         #self.grids = {}
@@ -457,52 +636,52 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
 
         #: stores elements (CQUAD4, CTRIA3, CHEXA8, CTETRA4, CROD, CONROD,
         #: etc.)
-        self.elements = {}
+        self.elements = CardDict()
 
         #: stores rigid elements (RBE2, RBE3, RJOINT, etc.)
         self.rigidElements = {}
 
         #: store CONM1, CONM2, CMASS1,CMASS2, CMASS3, CMASS4, CMASS5
-        self.masses = {}
-        self.properties_mass = {} # PMASS
+        self.masses = CardDict()
+        self.properties_mass = CardDict() # PMASS
 
         #: stores LOTS of propeties (PBAR, PBEAM, PSHELL, PCOMP, etc.)
-        self.properties = {}
+        self.properties = CardDict()
 
         #: stores MAT1, MAT2, MAT3, MAT8, MAT10, MAT11
-        self.materials = {}
+        self.materials = CardDict()
 
         #: defines the MAT4, MAT5
-        self.thermalMaterials = {}
+        self.thermalMaterials = CardDict()
 
         #: defines the MATHE, MATHP
-        self.hyperelasticMaterials = {}
+        self.hyperelasticMaterials = CardDict()
 
         #: stores MATSx
-        self.MATS1 = {}
-        self.MATS3 = {}
-        self.MATS8 = {}
+        self.MATS1 = CardDict()
+        self.MATS3 = CardDict()
+        self.MATS8 = CardDict()
 
         #: stores MATTx
-        self.MATT1 = {}
-        self.MATT2 = {}
-        self.MATT3 = {}
-        self.MATT4 = {}
-        self.MATT5 = {}
-        self.MATT8 = {}
-        self.MATT9 = {}
+        self.MATT1 = CardDict()
+        self.MATT2 = CardDict()
+        self.MATT3 = CardDict()
+        self.MATT4 = CardDict()
+        self.MATT5 = CardDict()
+        self.MATT8 = CardDict()
+        self.MATT9 = CardDict()
 
         #: stores the CREEP card
-        self.creepMaterials = {}
+        self.creepMaterials = CardDict()
 
         # loads
         #: stores LOAD, FORCE, MOMENT, etc.
-        self.loads = {}
+        self.loads = CardDict()
         #self.gusts  = {} # Case Control GUST = 100
         #self.random = {} # Case Control RANDOM = 100
 
         #: stores coordinate systems
-        self.coords = {0: CORD2R()}
+        self.coords = CardDict({0: CORD2R()})
 
         # --------------------------- constraints ----------------------------
         #: stores SUPORT1s
@@ -514,11 +693,11 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
         #: stores MPCADD,MPC
         self.mpcObject = ConstraintObject()
 
-        self.spcs = {}
-        self.spcadds = {}
+        self.spcs = CardDict()
+        self.spcadds = CardDict()
 
-        self.mpcs = {}
-        self.mpcadds = {}
+        self.mpcs = CardDict()
+        self.mpcadds = CardDict()
 
         # --------------------------- dynamic ----------------------------
         #: stores DAREA
@@ -587,7 +766,7 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
         # --------------------------- aero defaults --------------------------
         # aero cards
         #: stores CAEROx
-        self.caeros = {}
+        self.caeros = CardDict()
         #: stores PAEROx
         self.paeros = {}
         #: stores AERO
@@ -617,7 +796,7 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
         #: mkaeros
         self.mkaeros = []
         #: store SPLINE1,SPLINE2,SPLINE4,SPLINE5
-        self.splines = {}
+        self.splines = CardDict()
         #: stores TRIM
         self.trims = {}
 
@@ -678,7 +857,8 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
                 raise
 
     def read_bdf(self, bdf_filename=None, include_dir=None,
-                 xref=True, punch=False):
+                 xref=True, punch=False, use_bulk_tokenizer=False,
+                 num_workers=None, cache_dir=None):
         """
         Read method for the bdf files
 
@@ -688,6 +868,18 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
                              (default=None if no include files)
         :param xref:  should the bdf be cross referenced (default=True)
         :param punch: indicates whether the file is a punch file (default=False)
+        :param use_bulk_tokenizer: read the Bulk Data Deck with the chunked
+                             tokenizer in bdf_tokenizer.py instead of the
+                             line/card generators (default=False)
+        :param num_workers:  the number of processes used to parse the
+                             INCLUDE files and large card chunks of the
+                             Bulk Data Deck (default=None -> 1; >1 implies
+                             use_bulk_tokenizer=True)
+        :param cache_dir:    a directory to store a snapshot of the model in
+                             (see bdf_cache.py).  If the main bdf and its
+                             INCLUDE files haven't changed since the snapshot
+                             was written, the snapshot is loaded instead of
+                             reading the bdf (default=None -> no cache)
 
         >>> bdf = BDF()
         >>> bdf.read_bdf(bdf_filename, xref=True)
@@ -728,6 +920,18 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
         if bdf_filename.lower().endswith('.pch'):
             punch = True
 
+        # a second read_bdf doesn't use the files of the first one
+        self.bdf_filenames = []
+        if cache_dir is not None:
+            from pyNastran.bdf.bdf_cache import get_cache_filename, load_cache, save_cache
+            cache_filename = get_cache_filename(cache_dir, bdf_filename)
+            cache_options = {
+                'xref' : xref, 'punch' : punch, 'include_dir' : include_dir,
+                'cards_to_read' : sorted(self.cards_to_read),
+            }
+            if load_cache(self, cache_filename, cache_options):
+                return
+
         try:
             self._open_file(self.bdf_filename)
             self.log.debug('---starting BDF.read_bdf of %s---' % self.bdf_filename)
@@ -738,13 +942,20 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
             else:
                 self.log.debug('---skipping executive & case control decks---')
 
-            self._read_bulk_data_deck()
+            if num_workers is not None and num_workers > 1:
+                self._read_bulk_data_deck_parallel(punch, num_workers)
+            elif use_bulk_tokenizer:
+                self._read_bulk_data_deck_tokenized(punch)
+            else:
+                self._read_bulk_data_deck()
             self.cross_reference(xref=xref)
             self._xref = xref
             self._cleanup_file_streams()
         except:
             self._cleanup_file_streams()
             raise
+        if cache_dir is not None:
+            save_cache(self, cache_filename, cache_options)
         self.log.debug('---finished BDF.read_bdf of %s---' % self.bdf_filename)
 
     def _cleanup_file_streams(self):
@@ -784,6 +995,7 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
         else:
             self.has_case_control_deck = False
             (i, line, comment) = self._get_line()   # BEGIN BULK
+            self._ibulk = (self._ifile, i + 1)
 
         sol, method, iSolLine = parse_executive_control_deck(self.executive_control_lines)
         self.update_solution(sol, method, iSolLine)
@@ -928,6 +1140,7 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
 
             if 'BEGIN' in lineUpper and ('BULK' in lineUpper or 'SUPER' in lineUpper):
                 self.log.debug('found the end of the Case Control Deck!')
+                self._ibulk = (self._ifile, i + 1)
                 break
         self.log.debug("finished with Case Control Deck...")
 
@@ -980,6 +1193,7 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
         self._ifile += 1
         self.active_filename = bdf_filename
         self.active_filenames.append(bdf_filename)
+        self.bdf_filenames.append(bdf_filename)
 
         self._stored_Is[self._ifile] = []
         self._stored_lines[self._ifile] = []
@@ -1180,17 +1394,209 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
                 # card_count is increased in add_card function
                 self.add_card(lines, card_name, comment, is_list=False)
             else:
-                if self.echo:
-                    self.log.info('Rejecting %s:\n' % card_name + ''.join(lines))
-                else:
-                    if card_name not in self.card_count:
-                        # don't print 1000 copies of reject card X
-                        self.log.info("reject card_name = %s" % card_name)
+                self._reject_card(lines, card_name, comment)
 
-                self._increase_card_count(card_name)
+    def _reject_card(self, lines, card_name, comment):
+        """
+        Stores the lines of a card that can't be read
+
+        :param self:      the BDF object
+        :param lines:     the lines of the card
+        :param card_name: the card_name -> 'GRID'
+        :param comment:   the comment for the card
+        """
+        if self.echo:
+            self.log.info('Rejecting %s:\n' % card_name + ''.join(lines))
+        else:
+            if card_name not in self.card_count:
+                # don't print 1000 copies of reject card X
+                self.log.info("reject card_name = %s" % card_name)
+
+        self._increase_card_count(card_name)
+        if comment:
+            self.rejects.append([comment])
+        self.rejects.append(lines)
+
+    def _get_bulk_data_nskip(self, punch):
+        """
+        Gets the number of lines before the Bulk Data Deck in the main
+        file and drops the line streams, so the file can be reopened by
+        the tokenizer.
+
+        :param self:  the BDF object
+        :param punch: the file doesn't have an executive/case control deck
+        :returns nskip: the number of lines to skip; None if BEGIN BULK
+                        isn't in the main file
+        """
+        if punch:
+            nskip = 0
+        elif self._ibulk is None or self._ibulk[0] != 0:
+            self.log.debug('BEGIN BULK is not in the main file; '
+                           'using the line streams')
+            return None
+        else:
+            nskip = self._ibulk[1]
+
+        self._stored_Is = {}
+        self._stored_lines = {}
+        self._stored_comments = {}
+        self._line_streams = {}
+        self._card_streams = {}
+        self._ifile = -1
+        self.active_filename = None
+        return nskip
+
+    def _read_bulk_data_deck_tokenized(self, punch=False):
+        """
+        Parses the Bulk Data Deck with the chunked tokenizer
+
+        :param self:  the BDF object
+        :param punch: the file doesn't have an executive/case control deck
+
+        .. note:: falls back to _read_bulk_data_deck if BEGIN BULK isn't
+                  in the main file
+        """
+        nskip = self._get_bulk_data_nskip(punch)
+        if nskip is None:
+            self._read_bulk_data_deck()
+            return
+
+        self.log.debug("reading Bulk Data Deck...")
+        cards = tokenize_bulk_data(self.bdf_filename, include_dir=self.include_dir,
+                                   nskip=nskip)
+        for (card_name, fields, comment, lines) in cards:
+            if card_name == 'INCLUDE':
+                self.log.info('opening %r' % fields[0])
+                self.bdf_filenames.append(fields[0])
+                reject = '$ INCLUDE processed:  %s\n' % fields[0]
                 if comment:
                     self.rejects.append([comment])
-                self.rejects.append(lines)
+                self.rejects.append([reject])
+                continue
+            elif 'ENDDATA' in card_name:
+                self._increase_card_count(card_name)
+                break
+
+            if not self.is_reject(card_name):
+                if fields is None:
+                    self.add_card(lines, card_name, comment, is_list=False)
+                else:
+                    self.add_card(fields, card_name, comment, is_list=True)
+            else:
+                self._reject_card(lines, card_name, comment)
+
+    def _read_bulk_data_deck_parallel(self, punch, num_workers):
+        """
+        Parses the Bulk Data Deck by tokenizing the INCLUDE files and
+        large card chunks and creating the card objects in a process
+        pool.  The cards are added in the same order as the serial
+        reader, so the duplicate ID checks are the same.
+
+        :param self:        the BDF object
+        :param punch:       the file doesn't have an executive/case control deck
+        :param num_workers: the number of processes
+        """
+        if ProcessPoolExecutor is None:
+            raise ImportError('num_workers=%s requires concurrent.futures '
+                              '(pip install futures)' % num_workers)
+        if self._is_dynamic_syntax or self.echo or self._auto_reject:
+            self.log.debug('dynamic syntax/echo/auto_reject is used; '
+                           'reading the Bulk Data Deck serially')
+            self._read_bulk_data_deck_tokenized(punch)
+            return
+
+        nskip = self._get_bulk_data_nskip(punch)
+        if nskip is None:
+            self._read_bulk_data_deck()
+            return
+
+        self.log.debug("reading Bulk Data Deck with %s workers..." % num_workers)
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            futures = self._submit_bulk_data_file(executor, self.bdf_filename, nskip)
+            self._add_parsed_bulk_data(executor, futures, [self.bdf_filename], {})
+
+    def _submit_bulk_data_file(self, executor, bdf_filename, nskip=0):
+        """submits the card chunks of a file to the process pool"""
+        return [executor.submit(_parse_bulk_data_chunk, bdf_filename,
+                                self.include_dir, byte_range, self.cards_to_read)
+                for byte_range in get_card_chunks(bdf_filename, nskip)]
+
+    def _add_parsed_bulk_data(self, executor, futures, active_filenames, submitted):
+        """
+        Adds the cards parsed by _parse_bulk_data_chunk
+
+        :param self:             the BDF object
+        :param executor:         the process pool
+        :param futures:          the futures of the card chunks of a file
+        :param active_filenames: the file and the files that include it
+        :param submitted:        the INCLUDE files that have been submitted
+                                 (filename -> futures)
+        :returns is_enddata:     was ENDDATA found
+        """
+        for future in futures:
+            cards = future.result()
+
+            # start parsing the INCLUDE files, so they're ready when we get to them
+            for card in cards:
+                if card[0] == 'INCLUDE':
+                    filename = card[1][0]
+                    if filename not in submitted and os.path.exists(filename):
+                        submitted[filename] = self._submit_bulk_data_file(executor, filename)
+
+            for (card_name, fields, comment, card_lines, objects) in cards:
+                if card_name == 'INCLUDE':
+                    filename = fields[0]
+                    check_include_filename(filename, active_filenames)
+                    self.log.info('opening %r' % filename)
+                    self.bdf_filenames.append(filename)
+                    reject = '$ INCLUDE processed:  %s\n' % filename
+                    if comment:
+                        self.rejects.append([comment])
+                    self.rejects.append([reject])
+
+                    include_futures = submitted.pop(filename, None)
+                    if include_futures is None:
+                        # the file is included more than once
+                        include_futures = self._submit_bulk_data_file(executor, filename)
+                    if self._add_parsed_bulk_data(executor, include_futures,
+                                                  active_filenames + [filename], submitted):
+                        return True
+                    continue
+                elif 'ENDDATA' in card_name:
+                    self._increase_card_count(card_name)
+                    return True
+
+                if self.is_reject(card_name):
+                    self._reject_card(card_lines, card_name, comment)
+                elif objects is None:
+                    if fields is None:
+                        self.add_card(card_lines, card_name, comment, is_list=False)
+                    else:
+                        self.add_card(fields, card_name, comment, is_list=True)
+                else:
+                    self._increase_card_count(card_name)
+                    self._add_card_objects(objects)
+        return False
+
+    def _add_card_objects(self, objects, card=None):
+        """
+        Adds the objects created by _build_card_objects
+
+        :param self:    the BDF object
+        :param objects: a list of (add_function_name, card object)
+        :param card:    the fields of the card for the error message
+                        (default=None -> the card object)
+        """
+        for func, obj in objects:
+            try:
+                getattr(self, func)(obj)
+            except Exception as e:
+                if not e.args:
+                    e.args = ('',)
+                if card is None:
+                    card = obj
+                e.args = ('%s' % e.args[0] + "\ncard = %s" % card,) + e.args[1:]
+                raise
 
     def _increase_card_count(self, card_name, n=1):
         """
@@ -1325,130 +1731,14 @@ class BDF(BDFMethods, GetMethods, AddMethods, WriteMesh, XrefMesh):
             print(print_card_8(card_obj).rstrip())
 
         # function that gets by name the initialized object (from global scope)
-        try:
-            _get_cls = lambda name: globals()[name](card_obj, comment=comment)
-        except Exception as e:
-            if not e.args:
-                e.args = ('',)
-            e.args = ('%s' % e.args[0] + "\ncard = %s" % card,) + e.args[1:]
-            raise
+        _get_cls = lambda name: globals()[name](card_obj, comment=comment)
         _cls = lambda name: globals()[name]
 
         try:
-            # cards that have their own method add_CARDNAME to add them
-            if card_name in ['LSEQ', 'PHBDY', 'AERO', 'AEROS', 'AEFACT',
-              'AELINK', 'AELIST', 'AEPARM', 'AESTAT', 'AESURF', 'TRIM',
-              'FLUTTER', 'FLFACT', 'GUST', 'NLPARM', 'NLPCI', 'TSTEP',
-              'TSTEPNL', 'SESET', 'DCONSTR', 'DESVAR', 'DDVAL', 'DLINK',
-              'PARAM', 'PDAMPT', 'PELAST', 'PBUSHT']:
-                try:
-                    # PHBDY -> add_PHBDY
-                    getattr(self, 'add_' + card_name)(_get_cls(card_name))
-                except Exception as e:
-                    if not e.args:
-                        e.args = ('',)
-                    e.args = ('%s' % e.args[0] + "\ncard = %s" % card,) + e.args[1:]
-                    raise
-                return card_obj
-
-            # dictionary of cards. Key is the name of the function to add the
-            # card
-            # 'PCOMPG':  # hasnt been verified
-            # 'MAT8':  # note there is no MAT6 or MAT7
-            _cards = {
-             'add_node': ['GRID'],
-             'add_mass': ['CONM1', 'CONM2', 'CMASS1',
-                          'CMASS2', 'CMASS3', 'CMASS4', ],
-             'add_element': ['CQUAD4', 'CQUAD8', 'CQUAD', 'CQUADR', 'CQUADX',
-                             'CTRIA3', 'CTRIA6', 'CTRIAR', 'CTRIAX', 'CTRIAX6',
-                             'CBAR', 'CBEAM', 'CBEAM3', 'CROD', 'CONROD',
-                             'CTUBE', 'CBEND', 'CELAS1', 'CELAS2', 'CELAS3',
-                             'CELAS4', 'CVISC', 'CSHEAR', 'CGAP',
-                             'CRAC2D', 'CRAC3D'],
-             'add_damper': ['CBUSH', 'CBUSH1D', 'CFAST', 'CDAMP1',
-                            'CDAMP2', 'CDAMP3', 'CDAMP4', 'CDAMP5'],
-             'add_rigid_element': ['RBAR', 'RBAR1', 'RBE1', 'RBE2', 'RBE3'],
-             'add_property': ['PSHELL', 'PCOMP', 'PCOMPG', 'PSHEAR', 'PSOLID',
-                              'PBAR', 'PBARL', 'PBEAM', 'PBCOMP', 'PBEAML',
-                              'PROD', 'PTUBE', 'PLSOLID', 'PBUSH1D', 'PBUSH',
-                              'PFAST', 'PDAMP5', 'PGAP', 'PRAC2D', 'PRAC3D',
-                              'PLPLANE',],
-
-             # hasnt been verified, links up to MAT1, MAT2, MAT9 w/ same MID
-             'add_creep_material': ['CREEP'],
-             'add_structural_material': ['MAT1', 'MAT2', 'MAT3', 'MAT8',
-                                         'MAT9', 'MAT10', 'MAT11',
-                                         'EQUIV'],
-             'add_hyperelastic_material': ['MATHE', 'MATHP',],
-             'add_thermal_material': ['MAT4', 'MAT5'],
-             'add_material_dependence': ['MATS1', 'MATS3', 'MATS8',
-                                         'MATT1', 'MATT2', 'MATT3', 'MATT4',
-                                         'MATT5', 'MATT8', 'MATT9'],
-             'add_load': ['FORCE', 'FORCE1', 'FORCE2', 'MOMENT', 'MOMENT1',
-                          'MOMENT2', 'GRAV', 'ACCEL', 'ACCEL1', 'LOAD', 'PLOAD',
-                              'PLOAD1', 'PLOAD2', 'PLOAD4', 'PLOADX1',
-                              'RFORCE', 'DLOAD', 'SLOAD', 'TLOAD1', 'TLOAD2',
-                              'RLOAD1', 'RLOAD2', 'RANDPS'],
-             'add_thermal_load': ['TEMP', 'QBDY1', 'QBDY2', 'QBDY3', 'QHBDY'],
-             'add_thermal_element': ['CHBDYE', 'CHBDYG', 'CHBDYP'],
-             'add_convection_property': ['PCONV', 'PCONVM'],
-             'add_constraint_MPC': ['MPC', 'MPCADD'],
-             'add_constraint_SPC': ['SPC', 'SPC1', 'SPCAX', 'SPCD', 'SPCADD'],
-             'add_suport': ['SUPORT'],  # pseudo-constraint
-             'add_constraint': ['SUPORT1'],  # pseudo-constraint
-             'add_SPLINE': ['SPLINE1', 'SPLINE2', 'SPLINE3', 'SPLINE4', 'SPLINE5'],
-             'add_CAERO': ['CAERO1', 'CAERO2', 'CAERO3', 'CAERO4', 'CAERO5'],
-             'add_PAERO': ['PAERO1', 'PAERO2', 'PAERO3', 'PAERO4', 'PAERO5'],
-             'add_MKAERO': ['MKAERO1', 'MKAERO2'],
-             'add_FREQ': ['FREQ', 'FREQ1', 'FREQ2'],
-             'add_ASET': ['ASET', 'ASET1'], 'add_BSET': ['BSET', 'BSET1'],
-             'add_CSET': ['CSET', 'CSET1'], 'add_QSET': ['QSET', 'QSET1'],
-             'add_SET': ['SET1', 'SET3'],
-             'add_DRESP': ['DRESP1', 'DRESP2'],
-             'add_DVPREL': ['DVPREL1', 'DVPREL2'],
-             'add_coord': ['CORD2R', 'CORD2C', 'CORD2S'],
-             'add_table': ['TABLED1', 'TABLED2', 'TABLED3', 'TABLED4',
-                           'TABLEM1', 'TABLEM2', 'TABLEM3', 'TABLEM4',
-                           'TABLES1', 'TABLEST', 'TABDMP1'],
-             'add_random_table': ['TABRND1', 'TABRNDG'],
-             'add_method': ['EIGB', 'EIGR', 'EIGRL'],
-             'add_cmethod': ['EIGC', 'EIGP'],
-             'add_DVMREL': ['DVMREL1'],
-            }
-
-            for func, names in iteritems(_cards):
-                if card_name in names:
-                    try:
-                        getattr(self, func)(_get_cls(card_name))
-                    except Exception as e:
-                        if not e.args:
-                            e.args = ('',)
-                        e.args = ('%s' % e.args[0] + "\ncard = %s" % card,) + e.args[1:]
-                        raise
-                    return card_obj
-
-            # card that requires more careful processing, elements
-            _dct = {'CTETRA': (7, CTETRA4, CTETRA10), 'CHEXA': (11, CHEXA8,
-                    CHEXA20), 'CPENTA': (9, CPENTA6, CPENTA15)}
-            if card_name in _dct:
-                d = _dct[card_name]
-                self.add_element((d[1] if card_obj.nFields() == d[0]
-                                       else d[2])(card_obj, comment=comment))
-                return card_obj
-
-            # dampers
-            _dct = {'PELAS': (5,), 'PVISC': (5,), 'PDAMP': (3, 5)}
-            if card_name in _dct:
-                try:
-                    self.add_property(_get_cls(card_name))
-                except Exception as e:
-                    if not e.args:
-                        e.args = ('',)
-                    e.args = ('%s' % e.args[0] + "\ncard = %s" % card,) + e.args[1:]
-                    raise
-                for i in _dct[card_name]:
-                    if card_obj.field(i):
-                        self.add_property(_cls(card_name)(card_obj, 1, comment=comment))
+            # cards that only create objects and add them with add_xxx
+            objects = _build_card_objects(card_name, card_obj, comment)
+            if objects is not None:
+                self._add_card_objects(objects, card)
                 return card_obj
 
             if card_name in ['DEQATN']:  # buggy for commas
@@ -290,6 +290,7 @@ class AddMethods(object):
     def add_load(self, load):
         key = load.sid
         if key in self.loads:
+            self.loads.mark_dirty(key)
             self.loads[key].append(load)
         else:
             self.loads[key] = [load]
@@ -297,6 +298,7 @@ class AddMethods(object):
     def add_LSEQ(self, load):
         key = load.sid
         if key in self.loads:
+            self.loads.mark_dirty(key)
             self.loads[key].append(load)
         else:
             self.loads[key] = [load]
@@ -305,6 +307,7 @@ class AddMethods(object):
         key = load.sid
         assert key > 0
         if key in self.loads:
+            self.loads.mark_dirty(key)
             self.loads[key].append(load)
         else:
             self.loads[key] = [load]
@@ -339,6 +342,7 @@ class AddMethods(object):
     def add_constraint_MPC(self, constraint):
         #self.mpcObject.append(constraint)
         if constraint.conid in self.mpcs:
+            self.mpcs.mark_dirty(constraint.conid)
             self.mpcs[constraint.conid].append(constraint)
         else:
             self.mpcs[constraint.conid] = [constraint]
@@ -352,6 +356,7 @@ class AddMethods(object):
     def add_constraint_SPC(self, constraint):
         #self.spcObject.append(constraint)
         if constraint.conid in self.spcs:
+            self.spcs.mark_dirty(constraint.conid)
             self.spcs[constraint.conid].append(constraint)
         else:
             self.spcs[constraint.conid] = [constraint]
@@ -366,6 +371,7 @@ class AddMethods(object):
         key = constraint.conid
 
         if constraint.conid in self.spcs:
+            self.spcs.mark_dirty(key)
             self.spcs[key].append(constraint)
         else:
             self.spcs[key] = [constraint]
@@ -638,4 +644,4 @@ class AddMethods(object):
             self.cMethods[key] = cMethod
 
     def add_MKAERO(self, mkaero):
-        self.mkaeros.append(mkaero)
\ No newline at end of file
+        self.mkaeros.append(mkaero)
@@ -8,13 +8,136 @@ from __future__ import (nested_scopes, generators, division, absolute_import,
                         print_function, unicode_literals)
 from six import string_types, iteritems, itervalues, PY2
 from codecs import open
+import os
+import gzip
 import warnings
+import multiprocessing
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:  # python 2 without the futures backport
+    ProcessPoolExecutor = None
 
 from pyNastran.bdf.utils import print_filename
 from pyNastran.utils.gui_io import save_file_dialog
 from pyNastran.bdf.fieldWriter import print_card, print_card_8
 from pyNastran.bdf.fieldWriter16 import print_card_16
 from pyNastran.bdf.field_writer_double import print_card_double
+from pyNastran.bdf.field_writer_bulk import write_cards_8
+
+#: the number of cards that are formatted (and written) at a time
+WRITE_CHUNK_SIZE = 20000
+
+#: the card families that write_bdf(..., include_families=True) writes
+#: to INCLUDE files
+INCLUDE_FAMILIES = ['nodes', 'elements', 'materials', 'masses', 'loads']
+
+#: the gzip compression level; 9 (the gzip default) is ~20x slower than 6
+#: for ~10% smaller files
+GZIP_COMPRESSLEVEL = 6
+
+#: the (format_chunk, cards) of _format_chunks_parallel; the forked
+#: workers inherit it, so the cards don't need to be pickled
+_FORK_TASK = None
+
+
+def _open_bdf_file(bdf_filename):
+    """opens a file for writing; a file that ends in .gz is gzipped"""
+    if bdf_filename.lower().endswith('.gz'):
+        if PY2:
+            return gzip.open(bdf_filename, 'wb', compresslevel=GZIP_COMPRESSLEVEL)
+        return gzip.open(bdf_filename, 'wt', compresslevel=GZIP_COMPRESSLEVEL)
+    if PY2:
+        return open(bdf_filename, 'wb')
+    return open(bdf_filename, 'w')
+
+
+def get_family_filename(out_filename, family):
+    """
+    Gets the INCLUDE file for a card family
+
+    :param out_filename: the main bdf (e.g. 'model.bdf', 'model.bdf.gz')
+    :param family: the card family (see INCLUDE_FAMILIES)
+    :returns include_filename: e.g. 'model.nodes.bdf', 'model.nodes.bdf.gz'
+    """
+    root, ext = os.path.splitext(out_filename)
+    if ext.lower() == '.gz':
+        root, ext2 = os.path.splitext(root)
+        ext = ext2 + ext
+    return '%s.%s%s' % (root, family, ext)
+
+
+class _IncludeFile(object):
+    """
+    A file for the cards of a family.  The file is opened (and the
+    INCLUDE card is written to the main file) on the first write, so
+    empty families don't get a file.
+    """
+    def __init__(self, outfile, include_filename):
+        """
+        :param outfile: the main file
+        :param include_filename: the INCLUDE file
+        """
+        self.outfile = outfile
+        self.include_filename = include_filename
+        self.include_file = None
+
+    def write(self, msg):
+        if self.include_file is None:
+            self.outfile.write("INCLUDE '%s'\n" % os.path.basename(self.include_filename))
+            self.include_file = _open_bdf_file(self.include_filename)
+        self.include_file.write(msg)
+
+    def close(self):
+        if self.include_file is not None:
+            self.include_file.close()
+
+
+def _format_fork_chunk(i0, i1):
+    """formats cards[i0:i1] of _FORK_TASK in a worker process"""
+    format_chunk, cards = _FORK_TASK
+    return format_chunk(cards[i0:i1])
+
+
+def _format_chunks_parallel(format_chunk, cards, num_workers):
+    """
+    Formats chunks of cards in a process pool and yields the strings in
+    order.  The workers are forked, so they inherit the cards instead of
+    getting a pickled copy (which is slower than formatting them).  Only
+    2 chunks per worker are in flight, so the output isn't held in
+    memory.
+
+    :param format_chunk: the function that formats a list of cards
+    :param cards: the card objects in the order they should be written
+    :param num_workers: the number of processes
+    """
+    global _FORK_TASK
+    ncards = len(cards)
+    chunks = [(i0, min(i0 + WRITE_CHUNK_SIZE, ncards))
+              for i0 in range(0, ncards, WRITE_CHUNK_SIZE)]
+    _FORK_TASK = (format_chunk, cards)
+    try:
+        context = multiprocessing.get_context('fork')
+        with ProcessPoolExecutor(max_workers=num_workers, mp_context=context) as executor:
+            futures = []
+            for i0, i1 in chunks:
+                futures.append(executor.submit(_format_fork_chunk, i0, i1))
+                if len(futures) > 2 * num_workers:
+                    yield futures.pop(0).result()
+            for future in futures:
+                yield future.result()
+    finally:
+        _FORK_TASK = None
+
+
+def _can_fork():
+    """can _format_chunks_parallel be used"""
+    if ProcessPoolExecutor is None or not hasattr(multiprocessing, 'get_context'):
+        return False
+    try:
+        multiprocessing.get_context('fork')
+    except ValueError:  # windows
+        return False
+    return True
 
 
 class WriteMesh(object):
@@ -28,6 +151,9 @@ class WriteMesh(object):
         self._auto_reject = True
         self.cards_to_read = set([])
 
+        #: the number of processes write_bdf formats the cards in
+        self._write_num_workers = None
+
     def echo_bdf(self, infile_name):
         """
         This method removes all comment lines from the bdf
@@ -83,7 +209,8 @@ class WriteMesh(object):
         return out_filename, card_writer
 
     def write_bdf(self, out_filename=None, interspersed=True,
-                  size=8, precision=None, is_double=False, enddata=None):
+                  size=8, precision=None, is_double=False, enddata=None,
+                  num_workers=None, include_families=False):
         """
         Writes the BDF.
 
@@ -99,6 +226,17 @@ class WriteMesh(object):
         :param precision:  'single', 'double', None (None -> )
         :param enddata:  Flag to enable/disable writing ENDDATA
                          (default=None -> depends on input BDF)
+        :param num_workers:  the number of processes the nodes, elements,
+                         masses and loads are formatted in.  The chunks
+                         are written in order as they finish.  Requires
+                         fork (i.e. not Windows); otherwise, the cards are
+                         formatted serially (default=None -> 1)
+        :param include_families:  write the nodes, elements/properties,
+                         materials, masses and loads to INCLUDE files next
+                         to out_filename (e.g. 'model.nodes.bdf'), which
+                         are referenced by the main file (default=False)
+
+        If out_filename ends in '.gz', the files are gzipped.
         """
         if precision is not None:
             if precision == 'double':
@@ -112,26 +250,42 @@ class WriteMesh(object):
         out_filename, card_writer = self._output_helper(out_filename,
                                             interspersed, size, is_double)
 
-        if PY2:
-            outfile = open(out_filename, 'wb')
-        else:
-            outfile = open(out_filename, 'w')
-        self._write_header(outfile)
-        self._write_params(outfile, size, card_writer)
-        self._write_nodes(outfile, size, card_writer, is_double)
+        if num_workers is not None and num_workers > 1 and not _can_fork():
+            self.log.debug('num_workers=%s requires fork; the cards are '
+                           'formatted serially' % num_workers)
+            num_workers = None
+
+        outfile = _open_bdf_file(out_filename)
+        family_files = {}
+        for family in INCLUDE_FAMILIES:
+            if include_families:
+                family_files[family] = _IncludeFile(
+                    outfile, get_family_filename(out_filename, family))
+            else:
+                family_files[family] = outfile
 
-        if interspersed:
-            self._write_elements_properties(outfile, size, card_writer)
-        else:
-            self._write_elements(outfile, size, card_writer)
-            self._write_properties(outfile, size, card_writer)
-        self._write_materials(outfile, size, card_writer)
+        self._write_num_workers = num_workers
+        try:
+            self._write_header(outfile)
+            self._write_params(outfile, size, card_writer)
+            self._write_nodes(family_files['nodes'], size, card_writer, is_double)
 
-        self._write_masses(outfile, size, card_writer)
-        self._write_common(outfile, size, is_double, card_writer)
-        if (enddata is None and 'ENDDATA' in self.card_count) or enddata:
-            outfile.write('ENDDATA\n')
-        outfile.close()
+            if interspersed:
+                self._write_elements_properties(family_files['elements'], size, card_writer)
+            else:
+                self._write_elements(family_files['elements'], size, card_writer)
+                self._write_properties(family_files['elements'], size, card_writer)
+            self._write_materials(family_files['materials'], size, card_writer)
+
+            self._write_masses(family_files['masses'], size, card_writer)
+            self._write_common(outfile, size, is_double, card_writer,
+                               loads_file=family_files['loads'])
+            if (enddata is None and 'ENDDATA' in self.card_count) or enddata:
+                outfile.write('ENDDATA\n')
+        finally:
+            self._write_num_workers = None
+            for family_file in itervalues(family_files):
+                family_file.close()
 
     def _write_header(self, outfile):
         """
@@ -174,6 +328,42 @@ class WriteMesh(object):
             assert 'BEGIN BULK' in msg, msg
             outfile.write(''.join(msg))
 
+    def _write_cards(self, outfile, cards, size, card_writer, card_type, write_card=None):
+        """
+        Writes a series of cards in chunks of WRITE_CHUNK_SIZE cards.  For
+        small field, the heavy cards (e.g. GRID, CQUAD4) are formatted in
+        blocks (see ``write_cards_8``).
+
+        :param self: the BDF object
+        :param outfile: the file to write to
+        :param cards: the card objects in the order they should be written
+        :param size: the field size (8/16)
+        :param card_writer: the function that writes the fields of a card
+        :param card_type: the kind of card for the error message (e.g. 'element')
+        :param write_card: the card by card writer
+                           (default=None -> card.write_bdf(size, card_writer))
+        """
+        if write_card is None:
+            def write_card(card):
+                try:
+                    return card.write_bdf(size, card_writer)
+                except:
+                    print('failed printing %s...type=%s' % (card_type, card.type))
+                    raise
+
+        if size == 8:
+            format_chunk = lambda chunk: write_cards_8(chunk, write_card)
+        else:
+            format_chunk = lambda chunk: ''.join([write_card(card) for card in chunk])
+
+        num_workers = self._write_num_workers
+        if num_workers is not None and num_workers > 1 and len(cards) > WRITE_CHUNK_SIZE:
+            for msg in _format_chunks_parallel(format_chunk, cards, num_workers):
+                outfile.write(msg)
+        else:
+            for i0 in range(0, len(cards), WRITE_CHUNK_SIZE):
+                outfile.write(format_chunk(cards[i0:i0 + WRITE_CHUNK_SIZE]))
+
     def _write_elements(self, outfile, size, card_writer):
         """
         Writes the elements in a sorted order
@@ -182,13 +372,8 @@ class WriteMesh(object):
         """
         if self.elements:
             outfile.write('$ELEMENTS\n')
-            for (eid, element) in sorted(iteritems(self.elements)):
-                try:
-                    outfile.write(element.write_bdf(size, card_writer))
-                except:
-                    print('failed printing element...'
-                          'type=%s eid=%s' % (element.type, eid))
-                    raise
+            elements = [element for (eid, element) in sorted(iteritems(self.elements))]
+            self._write_cards(outfile, elements, size, card_writer, 'element')
 
     def _write_elements_properties(self, outfile, size, card_writer):
         """
@@ -202,39 +387,24 @@ class WriteMesh(object):
         pids = sorted(self.properties.keys())
         pid_eids = self.getElementIDsWithPIDs(pids, mode='dict')
 
-        msg = []
         #failed_element_types = set([])
         for (pid, eids) in sorted(iteritems(pid_eids)):
             prop = self.properties[pid]
             if eids:
-                msg.append(prop.write_bdf(size, card_writer))
+                outfile.write(prop.write_bdf(size, card_writer))
                 eids.sort()
-                for eid in eids:
-                    element = self.Element(eid)
-                    try:
-                        msg.append(element.write_bdf(size, card_writer))
-                    except:
-                        print('failed printing element...' 'type=%r eid=%s'
-                              % (element.type, eid))
-                        raise
+                elements = [self.Element(eid) for eid in eids]
+                self._write_cards(outfile, elements, size, card_writer, 'element')
                 eids_written += eids
             else:
                 missing_properties.append(prop.write_bdf(size, card_writer))
-        outfile.write(''.join(msg))
 
         eids_missing = set(self.elements.keys()).difference(set(eids_written))
         if eids_missing:
-            msg = ['$ELEMENTS_WITH_NO_PROPERTIES '
-                   '(PID=0 and unanalyzed properties)\n']
-            for eid in sorted(eids_missing):
-                element = self.Element(eid, msg='')
-                try:
-                    msg.append(element.write_bdf(size, card_writer))
-                except:
-                    print('failed printing element...'
-                          'type=%s eid=%s' % (element.type, eid))
-                    raise
-            outfile.write(''.join(msg))
+            outfile.write('$ELEMENTS_WITH_NO_PROPERTIES '
+                          '(PID=0 and unanalyzed properties)\n')
+            elements = [self.Element(eid, msg='') for eid in sorted(eids_missing)]
+            self._write_cards(outfile, elements, size, card_writer, 'element')
 
         if missing_properties or self.pdampt or self.pbusht or self.pelast:
             msg = ['$UNASSOCIATED_PROPERTIES\n']
@@ -294,16 +464,20 @@ class WriteMesh(object):
                 msg.append(aefact.write_bdf(size, card_writer))
             outfile.write(''.join(msg))
 
-    def _write_common(self, outfile, size, is_double, card_writer):
+    def _write_common(self, outfile, size, is_double, card_writer, loads_file=None):
         """
         Write the common outputs so none get missed...
 
         :param self: the BDF object
+        :param loads_file: the file to write the loads to
+                           (default=None -> outfile)
         :returns msg: part of the bdf
         """
+        if loads_file is None:
+            loads_file = outfile
         self._write_rigid_elements(outfile, size, card_writer)
         self._write_dmigs(outfile, size, card_writer)
-        self._write_loads(outfile, size, card_writer)
+        self._write_loads(loads_file, size, card_writer)
         self._write_dynamic(outfile, size, card_writer)
         self._write_aero(outfile, size, card_writer)
         self._write_aero_control(outfile, size, card_writer)
@@ -440,16 +614,11 @@ class WriteMesh(object):
     def _write_loads(self, outfile, size, card_writer):
         """Writes the load cards sorted by ID"""
         if self.loads:
-            msg = ['$LOADS\n']
+            outfile.write('$LOADS\n')
+            loads = []
             for (key, loadcase) in sorted(iteritems(self.loads)):
-                for load in loadcase:
-                    try:
-                        msg.append(load.write_bdf(size, card_writer))
-                    except:
-                        print('failed printing load...type=%s key=%r'
-                              % (load.type, key))
-                        raise
-            outfile.write(''.join(msg))
+                loads += loadcase
+            self._write_cards(outfile, loads, size, card_writer, 'load')
 
     def _write_masses(self, outfile, size, card_writer):
         if self.properties_mass:
@@ -464,13 +633,8 @@ class WriteMesh(object):
 
         if self.masses:
             outfile.write('$MASSES\n')
-            for (eid, mass) in sorted(iteritems(self.masses)):
-                try:
-                    outfile.write(mass.write_bdf(size, card_writer))
-                except:
-                    print('failed printing masses...'
-                          'type=%s eid=%s' % (mass.type, eid))
-                    raise
+            masses = [mass for (eid, mass) in sorted(iteritems(self.masses))]
+            self._write_cards(outfile, masses, size, card_writer, 'masses')
 
     def _write_materials(self, outfile, size, card_writer):
         """Writes the materials in a sorted order"""
@@ -522,13 +686,12 @@ class WriteMesh(object):
             outfile.write(''.join(msg))
 
         if self.nodes:
-            msg = []
-            msg.append('$NODES\n')
+            outfile.write('$NODES\n')
             if self.gridSet:
-                msg.append(self.gridSet.print_card(size))
-            for (nid, node) in sorted(iteritems(self.nodes)):
-                msg.append(node.write_bdf2(size, is_double))
-            outfile.write(''.join(msg))
+                outfile.write(self.gridSet.print_card(size))
+            nodes = [node for (nid, node) in sorted(iteritems(self.nodes))]
+            self._write_cards(outfile, nodes, size, card_writer, 'node',
+                              lambda node: node.write_bdf2(size, is_double))
         if 0:  # not finished
             self._write_nodes_associated(outfile, size, card_writer)
 
@@ -6,8 +6,161 @@ Links up the various cards in the BDF.
 from __future__ import print_function
 from six import iteritems, itervalues
 import warnings
+from pyNastran.bdf.cards.constraints import ConstraintObject
 #from pyNastran.bdf.cards.constraints import constraintObject2
 
+#: the card dictionaries that are linked by cross_reference (in order)
+_XREF_CARD_DICTS = [
+    'nodes', 'coords', 'elements', 'properties', 'masses', 'properties_mass',
+    'materials',
+    'MATS1', 'MATS3', 'MATS8',
+    'MATT1', 'MATT2', 'MATT3', 'MATT4', 'MATT5', 'MATT8', 'MATT9',
+    'caeros', 'splines',
+]
+#: the card dictionaries that are referenced, but aren't linked
+_REFERENCED_CARD_DICTS = ['thermalMaterials', 'hyperelasticMaterials', 'creepMaterials']
+#: the constraint dictionaries that are collected into the spc/mpcObject
+_CONSTRAINT_CARD_DICTS = ['spcs', 'spcadds', 'mpcs', 'mpcadds']
+#: every card dictionary with dirty tracking
+TRACKED_CARD_DICTS = (_XREF_CARD_DICTS + _REFERENCED_CARD_DICTS + ['loads'] +
+                      _CONSTRAINT_CARD_DICTS)
+
+
+class CardDict(dict):
+    """
+    A dictionary of cards that keeps track of the keys that were added,
+    replaced or deleted since ``track`` was called (cross_reference calls
+    it), so ``cross_reference(incremental=True)`` only needs to link those
+    cards.
+
+    A card that was modified in place can be marked by assigning it again
+    (``model.coords[cid] = coord``) or with ``mark_dirty``.
+
+    ``version`` is increased by every change (tracked or not), so caches
+    (e.g. ``BDF.get_topology``) can tell that the dictionary changed.
+    """
+    #: class level, so the dictionary can be unpickled
+    is_tracked = False
+    version = 0
+
+    def track(self):
+        """starts (or restarts) the dirty tracking"""
+        self.is_tracked = True
+        self.clear_dirty()
+
+    def clear_dirty(self):
+        """forgets the dirty keys"""
+        #: the keys that were added, replaced or deleted
+        self.dirty_keys = set()
+        #: the value of a dirty key when it was first changed
+        #: (a copy for the load/constraint lists)
+        self.old_values = {}
+
+    def mark_dirty(self, key):
+        """
+        Marks a key as modified.  A list of cards (e.g. loads) must be
+        marked before a card is appended to it.
+        """
+        self.version += 1
+        if self.is_tracked and key not in self.dirty_keys:
+            self.dirty_keys.add(key)
+            if dict.__contains__(self, key):
+                value = dict.__getitem__(self, key)
+                if isinstance(value, list):
+                    value = list(value)
+                self.old_values[key] = value
+
+    def __setitem__(self, key, value):
+        self.version += 1
+        if self.is_tracked:
+            self.mark_dirty(key)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key):
+        self.version += 1
+        if self.is_tracked:
+            self.mark_dirty(key)
+        dict.__delitem__(self, key)
+
+    def pop(self, key, *default):
+        self.version += 1
+        if self.is_tracked and dict.__contains__(self, key):
+            self.mark_dirty(key)
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        key, value = dict.popitem(self)
+        self.version += 1
+        if self.is_tracked:
+            self.dirty_keys.add(key)
+            self.old_values.setdefault(key, value)
+        return key, value
+
+    def setdefault(self, key, default=None):
+        if not dict.__contains__(self, key):
+            self[key] = default
+        return dict.__getitem__(self, key)
+
+    def update(self, *args, **kwargs):
+        for key, value in iteritems(dict(*args, **kwargs)):
+            self[key] = value
+
+    def clear(self):
+        for key in list(self.keys()):
+            del self[key]
+
+
+def _replace_reference(card, old, new):
+    """
+    points the attributes of card that are old (or nested lists/tuples
+    with old, e.g. the PCOMP plies) at new
+    """
+    for name, value in iteritems(card.__dict__):
+        card.__dict__[name] = _replace_value(value, old, new)
+
+
+def _replace_value(value, old, new):
+    """gets value with old replaced by new; lists are updated in place"""
+    if value is old:
+        return new
+    if isinstance(value, list):
+        for i, valuei in enumerate(value):
+            value[i] = _replace_value(valuei, old, new)
+    elif isinstance(value, tuple):
+        values = tuple([_replace_value(valuei, old, new) for valuei in value])
+        if any([valuei is not valuej for valuei, valuej in zip(values, value)]):
+            return values
+    return value
+
+
+def _get_references(card, keys):
+    """
+    Gets the (dict_name, key) of the cards a card references, including
+    the ones in nested lists/tuples (e.g. the PCOMP plies)
+
+    :param card: the cross-referenced card
+    :param keys: {id(card) : (dict_name, key)} for the referenced cards
+    """
+    refs = []
+    values = list(itervalues(card.__dict__))
+    while values:
+        value = values.pop()
+        if isinstance(value, (list, tuple)):
+            values.extend(value)
+        else:
+            ref = keys.get(id(value))
+            if ref is not None:
+                refs.append(ref)
+    return refs
+
+
+def _get_coord_references(coord):
+    """gets the coordinate systems a coordinate system depends on"""
+    if coord.type in ['CORD1R', 'CORD1C', 'CORD1S']:
+        return [node.cp for node in [coord.g1, coord.g2, coord.g3]
+                if hasattr(node, 'cp')]
+    return [coord.rid]
+
 
 class XrefMesh(object):
     """
@@ -19,11 +172,22 @@ class XrefMesh(object):
         """
         pass
 
-    def cross_reference(self, xref=True, xref_loads=True, xref_constraints=True):
+    def cross_reference(self, xref=True, xref_loads=True, xref_constraints=True,
+                        incremental=False):
         """
         Links up all the cards to the cards they reference
+
+        :param xref: should the cards be cross-referenced
+        :param xref_loads: should the loads be cross-referenced
+        :param xref_constraints: should the constraints be collected
+        :param incremental: only link the cards that were added, replaced
+            or deleted since the last cross_reference (and the cards that
+            reference them) instead of the whole model (default=False).
+            The first cross_reference is always a full one.
         """
-        if xref:
+        if xref and incremental and self._is_dirty_tracked():
+            self._cross_reference_incremental(xref_loads, xref_constraints)
+        elif xref:
             self.log.debug("Cross Referencing...")
             #for key,e in iteritems(self.elements):
                 #print(e)
@@ -42,6 +206,7 @@ class XrefMesh(object):
             if xref_loads:
                 self._cross_reference_loads()
             #self.caseControlDeck.cross_reference(self)
+            self._track_card_dicts()
 
     def _cross_reference_constraints(self):
         """
@@ -189,4 +354,232 @@ class XrefMesh(object):
                     self.log.error("lid=%s sid=%s" % (lid, sid))
                     msg = "Couldn't cross reference Load\n%s" % (str(load))
                     self.log.error(msg)
-                    raise
\ No newline at end of file
+                    raise
+
+    def _get_card_dicts(self, names):
+        """gets the (name, card_dict) of the card dictionaries with dirty tracking"""
+        return [(name, getattr(self, name)) for name in names
+                if isinstance(getattr(self, name, None), CardDict)]
+
+    def _is_dirty_tracked(self):
+        """has the dirty tracking been started by a full cross_reference"""
+        card_dicts = self._get_card_dicts(TRACKED_CARD_DICTS)
+        return (len(card_dicts) == len(TRACKED_CARD_DICTS) and
+                all([card_dict.is_tracked for unused_name, card_dict in card_dicts]))
+
+    def _track_card_dicts(self):
+        """starts the dirty tracking after a full cross_reference"""
+        for unused_name, card_dict in self._get_card_dicts(TRACKED_CARD_DICTS):
+            card_dict.track()
+        self._xref_index = None
+
+    def _get_xref_index(self):
+        """
+        Gets the reverse-dependency index of the cross-referenced cards.
+        It's built the first time an incremental cross_reference is done
+        and is updated after that.
+
+        :returns keys: {id(card) : (dict_name, key)} for the linked cards
+        :returns dependents: {(dict_name, key) : [card, ...]} the cards
+            that reference a card (cards that were removed from the model
+            are skipped by ``_get_dependents``)
+        """
+        if self._xref_index is not None:
+            return self._xref_index
+
+        # the replaced cards are still referenced, so they're indexed
+        # using the old_values
+        keys = {}
+        for name, card_dict in self._get_card_dicts(_XREF_CARD_DICTS + _REFERENCED_CARD_DICTS):
+            dirty_keys = card_dict.dirty_keys
+            for key, card in iteritems(card_dict):
+                if key not in dirty_keys:
+                    keys[id(card)] = (name, key)
+            for key, card in iteritems(card_dict.old_values):
+                keys[id(card)] = (name, key)
+
+        for sid, loads in iteritems(self.loads):
+            if sid in self.loads.dirty_keys:
+                continue
+            for load in loads:
+                keys[id(load)] = ('loads', sid)
+        for sid, loads in iteritems(self.loads.old_values):
+            for load in loads:
+                keys[id(load)] = ('loads', sid)
+
+        cards = dict([(id(card), card) for card in self._iter_indexed_cards()])
+        dependents = {}
+        for card_id, card in iteritems(cards):
+            if card_id in keys:
+                for ref in _get_references(card, keys):
+                    dependents.setdefault(ref, []).append(card)
+        self._xref_index = (keys, dependents)
+        return self._xref_index
+
+    def _iter_indexed_cards(self):
+        """yields the cards that were linked by the last cross_reference"""
+        for unused_name, card_dict in self._get_card_dicts(_XREF_CARD_DICTS + ['loads']):
+            for card in itervalues(card_dict.old_values):
+                if isinstance(card, list):
+                    for cardi in card:
+                        yield cardi
+                else:
+                    yield card
+            for card in itervalues(card_dict):
+                if isinstance(card, list):
+                    for cardi in card:
+                        yield cardi
+                else:
+                    yield card
+
+    def _get_dependents(self, ref):
+        """
+        Gets the cards in the model that reference a card
+
+        :param ref: the (dict_name, key) of the card
+        """
+        keys, dependents = self._xref_index
+        cards = dependents.get(ref)
+        if not cards:
+            return []
+        live_cards = [card for card in cards if id(card) in keys]
+        if len(live_cards) != len(cards):
+            dependents[ref] = live_cards
+        return live_cards
+
+    def _cross_reference_card(self, name, card):
+        """links a single card"""
+        try:
+            if name == 'nodes':
+                card.cross_reference(self, self.gridSet)
+            else:
+                card.cross_reference(self)
+        except:
+            msg = "Couldn't cross reference %s.\n%s" % (card.type, str(card))
+            self.log.error(msg)
+            raise
+
+    def _cross_reference_incremental(self, xref_loads, xref_constraints):
+        """
+        Links the cards that were added, replaced or deleted since the last
+        cross_reference.  The cards that referenced a replaced card are
+        pointed at the new card and the coordinate systems that depend on
+        a modified node/coordinate system are set up again.
+        """
+        keys, dependents = self._get_xref_index()
+        card_dicts = self._get_card_dicts(_XREF_CARD_DICTS + _REFERENCED_CARD_DICTS)
+        xref_names = set(_XREF_CARD_DICTS)
+
+        # update the index; the replaced cards are removed before the
+        # dependents are looked up, so they're skipped
+        replaced = []
+        new_cards = []
+        modified = []
+        for name, card_dict in card_dicts:
+            for key in card_dict.dirty_keys:
+                old = card_dict.old_values.get(key)
+                new = card_dict.get(key)
+                if old is new:
+                    # modified in place
+                    if new is not None:
+                        modified.append((name, key))
+                    continue
+                if old is not None:
+                    keys.pop(id(old), None)
+                    replaced.append((name, key, old, new))
+                if new is not None:
+                    keys[id(new)] = (name, key)
+                    modified.append((name, key))
+                    if name in xref_names:
+                        new_cards.append((name, new))
+
+        new_loads = []
+        for sid in self.loads.dirty_keys:
+            old_ids = set([id(load) for load in self.loads.old_values.get(sid, [])])
+            new_ids = set()
+            for load in self.loads.get(sid, []):
+                new_ids.add(id(load))
+                if id(load) not in old_ids:
+                    keys[id(load)] = ('loads', sid)
+                    new_loads.append(load)
+            for load in self.loads.old_values.get(sid, []):
+                if id(load) not in new_ids:
+                    keys.pop(id(load), None)
+
+        ncards = len(new_cards) + len(new_loads) if xref_loads else len(new_cards)
+        self.log.debug("Cross Referencing %i new cards..." % ncards)
+
+        # the cards that reference a replaced card are linked to the new card
+        for name, key, old, new in replaced:
+            cards = self._get_dependents((name, key))
+            if new is None:
+                if cards:
+                    msg = '%s[%r] was deleted, but is referenced by:\n%s' % (
+                        name, key, ''.join([str(card) for card in cards[:10]]))
+                    raise KeyError(msg)
+                dependents.pop((name, key), None)
+                continue
+            for card in cards:
+                _replace_reference(card, old, new)
+
+        # link the new cards
+        for name, card in new_cards:
+            self._cross_reference_card(name, card)
+        if xref_loads:
+            for load in new_loads:
+                self._cross_reference_card('loads', load)
+            new_cards += [('loads', load) for load in new_loads]
+        for unused_name, card in new_cards:
+            for ref in _get_references(card, keys):
+                dependents.setdefault(ref, []).append(card)
+
+        self._setup_modified_coords(modified)
+
+        if xref_constraints:
+            is_dirty = any([card_dict.dirty_keys for unused_name, card_dict
+                            in self._get_card_dicts(_CONSTRAINT_CARD_DICTS)])
+            if is_dirty:
+                self.spcObject = ConstraintObject()
+                self.mpcObject = ConstraintObject()
+                self._cross_reference_constraints()
+
+        for unused_name, card_dict in self._get_card_dicts(TRACKED_CARD_DICTS):
+            card_dict.clear_dirty()
+
+    def _setup_modified_coords(self, modified):
+        """
+        Sets up the coordinate systems that are new or depend on a
+        modified node/coordinate system (e.g. CORD2R -> CORD2R,
+        GRID -> CORD1R, CORD2R -> GRID -> CORD1R)
+
+        :param modified: the (dict_name, key) of the new/modified cards
+        """
+        keys = self._xref_index[0]
+        refs = [ref for ref in modified if ref[0] in ['nodes', 'coords']]
+        refs_checked = set(refs)
+        coords = {}
+        while refs:
+            ref = refs.pop()
+            if ref[0] == 'coords':
+                coord = self.coords[ref[1]]
+                coords[id(coord)] = coord
+            for card in self._get_dependents(ref):
+                dep_ref = keys[id(card)]
+                if dep_ref[0] in ['nodes', 'coords'] and dep_ref not in refs_checked:
+                    refs_checked.add(dep_ref)
+                    refs.append(dep_ref)
+
+        # a coordinate system is set up after the ones it depends on
+        while coords:
+            coords_ready = [coord for coord in itervalues(coords)
+                            if not any([id(coordi) in coords
+                                        for coordi in _get_coord_references(coord)
+                                        if coordi is not coord])]
+            if not coords_ready:
+                cids = sorted([coord.cid for coord in itervalues(coords)])
+                raise RuntimeError('cids=%s have a circular reference' % cids)
+            for coord in coords_ready:
+                if coord.type in ['CORD1R', 'CORD1C', 'CORD1S']:
+                    coord.isResolved = False
+                coord.setup()
+                del coords[id(coord)]
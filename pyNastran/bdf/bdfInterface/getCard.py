@@ -7,6 +7,7 @@ from numpy import ndarray
 
 from pyNastran.bdf.deprecated import GetMethodsDeprecated
 from pyNastran.bdf.cards.nodes import SPOINT
+from pyNastran.bdf.bdf_topology import TopologyIndex
 
 
 class GetMethods(GetMethodsDeprecated):
@@ -233,30 +234,53 @@ class GetMethods(GetMethodsDeprecated):
                     pass
         return eids2
 
+    def _get_topology_key(self):
+        """
+        Gets the state of the element/node dictionaries that the topology
+        index depends on (None if it can't be tracked)
+        """
+        versions = []
+        for cards in [self.elements, self.nodes]:
+            version = getattr(cards, 'version', None)
+            if version is None:  # a plain dict
+                return None
+            versions += [id(cards), version]
+        if self.spoints:
+            versions.append(len(self.spoints.spoints))
+        return tuple(versions)
+
+    def get_topology(self):
+        """
+        Gets the node/edge/face -> element connectivity as CSR arrays
+        (see bdf_topology.py).  The index is cached until an element or
+        node is added, replaced or deleted.  An element that's modified
+        in place can be marked by assigning it again
+        (``model.elements[eid] = element``).
+
+        :param self: the BDF object
+        :returns topology: the TopologyIndex
+        """
+        key = self._get_topology_key()
+        if self._topology is None or key is None or self._topology[0] != key:
+            nids = list(self.nodes.keys())
+            if self.spoints:
+                nids += list(self.spoints.spoints)
+            self._topology = (key, TopologyIndex(self.elements, nids))
+        return self._topology[1]
+
     def get_node_id_to_element_ids_map(self):
         """
         Returns a dictionary that maps a node ID to a list of elemnents
+        (sorted by element ID)
 
-        .. todo:: support 0d or 1d elements
-        .  todo:: support elements with missing nodes
-                  (e.g. CQUAD8 with missing nodes)
+        .. note:: the blank nodes (e.g. CQUAD8 with missing nodes) are skipped
         """
+        topology = self.get_topology()
+        indptr = topology.node_element_indptr.tolist()
+        eids = topology.node_element_ids.tolist()
         nidToElementsMap = {}
-        for nid in self.nodes:  # initalize the mapper
-            nidToElementsMap[nid] = []
-
-        if self.spoints:  # SPOINTs
-            for nid in sorted(self.spoints.spoints):  # SPOINTs
-                nidToElementsMap[nid] = []
-
-        for (eid, element) in iteritems(self.elements):  # load the mapper
-            try:
-                # not supported for 0-D and 1-D elements
-                nids = element.nodeIDs()
-                for nid in nids:  # (e.g. CQUAD8 with missing node)
-                    nidToElementsMap[nid].append(eid)
-            except:
-                pass
+        for inode, nid in enumerate(topology.nids.tolist()):
+            nidToElementsMap[nid] = eids[indptr[inode]:indptr[inode + 1]]
         return nidToElementsMap
 
     def get_property_id_to_element_ids_map(self):
@@ -17,15 +17,20 @@ reading/writing/accessing of BDF data.  Such methods include:
 # pylint: disable=R0904,R0902
 from __future__ import (nested_scopes, generators, division, absolute_import,
                         print_function, unicode_literals)
-from six import iteritems
+from six import iteritems, string_types
 from six.moves import zip, range
 import multiprocessing as mp
 
-from numpy import array, cross, zeros, dot, allclose
+from numpy import (array, cross, zeros, dot, allclose, vstack, hstack,
+                   argsort, unique, asarray, empty)
 from numpy.linalg import norm
 
 
 from pyNastran.bdf.deprecated import BDFMethodsDeprecated
+from pyNastran.bdf.bdf_load_sum import compile_loadcase
+from pyNastran.bdf.bdf_geometry import (SHELL_TYPES, SOLID_TYPES,
+                                        shell_area_centroid_normal,
+                                        solid_volume_centroid)
 from pyNastran.bdf.cards.loads.staticLoads import Moment, Force, LOAD
 #from pyNastran.bdf.cards.elements.shell import ShellElement
 
@@ -40,12 +45,129 @@ def _mass_properties_mass_mp_func(element):
     return mass, cg
 
 
+#: element class -> (the number of nodes used, the mass/measure method of the property)
+_VECTORIZED_MASS_ELEMENTS = {
+    'CTRIA3' : (3, 'MassPerArea'),
+    'CTRIAR' : (3, 'MassPerArea'),
+    'CQUAD4' : (4, 'MassPerArea'),
+    'CQUADR' : (4, 'MassPerArea'),
+    'CBAR' : (2, 'MassPerLength'),
+    'CBEAM' : (2, 'MassPerLength'),
+    'CROD' : (2, 'MassPerLength'),
+    'CONROD' : (2, 'MassPerLength'),
+    'CTETRA4' : (4, 'Rho'),
+    'CPENTA6' : (6, 'Rho'),
+    'CHEXA8' : (8, 'Rho'),
+}
+
+
+def _get_mass_element_nodes(element, nnodes):
+    """gets the first nnodes cross-referenced nodes of an element (None if not xref'd)"""
+    if element.type in ['CBAR', 'CBEAM']:
+        nodes = [element.ga, element.gb]
+    else:
+        nodes = element.nodes[:nnodes]
+    if len(nodes) != nnodes:
+        return None
+    for node in nodes:
+        if not hasattr(node, 'Position'):
+            return None
+    return nodes
+
+
+def _get_mass_factor(element, method):
+    """
+    Gets the mass per unit area/length/volume of an element.  This is
+    the same as the element's Mass() method without the geometry.
+    """
+    if element.type == 'CONROD':
+        return element.MassPerLength()
+    pid = element.pid
+    if method == 'MassPerArea':
+        return pid.MassPerArea()
+    elif method == 'Rho':
+        return pid.mid.rho
+    if element.type == 'CROD':
+        return pid.mid.rho * pid.A + pid.nsm
+    return pid.MassPerLength()
+
+
+#: the class names of the vectorized mass elements that aren't card types
+_MASS_CARD_TYPES = {
+    'CTETRA4' : 'CTETRA',
+    'CPENTA6' : 'CPENTA',
+    'CHEXA8' : 'CHEXA',
+}
+
+
+def _get_measure_centroid(element_type, xyz, nodes):
+    """
+    Gets the area/length/volume and centroid of a series of elements
+    of the same type
+
+    :param element_type: the element class name (e.g. 'CQUAD4', 'CHEXA8')
+    :param xyz: the (nnodes, 3) global node locations
+    :param nodes: the (nelements, nnodes_per_element) rows in xyz of the
+                  element nodes
+    :returns measure: the (nelements,) area/length/volume
+    :returns centroid: the (nelements, 3) centroids
+    """
+    if element_type in ['CBAR', 'CBEAM', 'CROD', 'CONROD']:
+        n1 = xyz[nodes[:, 0], :]
+        n2 = xyz[nodes[:, 1], :]
+        return norm(n2 - n1, axis=1), (n1 + n2) / 2.
+
+    card_type = _MASS_CARD_TYPES.get(element_type, element_type)
+    if card_type in SOLID_TYPES:
+        return solid_volume_centroid(card_type, xyz, nodes)
+    measure, centroid = shell_area_centroid_normal(card_type, xyz, nodes)[:2]
+    return measure, centroid
+
+
+def _transform_to_global(coords, xyz, cids, is_vector):
+    """
+    Transforms a series of points/vectors from their coordinate systems
+    to the global frame.  The points are grouped by coordinate system, so
+    each system's transformation is only set up once.
+
+    :param coords: the coordinate systems (cid -> Coord)
+    :param xyz: the (n, 3) points/vectors in their local frames
+    :param cids: the (n,) coordinate system ids
+    :param is_vector: transform vectors (no origin shift) instead of points
+    :returns xyz_global: the (n, 3) points/vectors in the global frame
+    """
+    xyz = asarray(xyz, dtype='float64')
+    cids = asarray(cids)
+    if xyz.ndim != 2 or xyz.shape[1] != 3 or cids.shape != (xyz.shape[0],):
+        raise ValueError('xyz must be (n, 3) and cids must be (n,); xyz.shape=%s cids.shape=%s'
+                         % (str(xyz.shape), str(cids.shape)))
+    xyz_global = empty(xyz.shape, dtype='float64')
+    isort = argsort(cids, kind='mergesort')
+    ucids, istart = unique(cids[isort], return_index=True)
+    iend = list(istart[1:]) + [len(cids)]
+    for cid, i0, i1 in zip(ucids, istart, iend):
+        i = isort[i0:i1]
+        if cid == 0:
+            xyz_global[i, :] = xyz[i, :]
+            continue
+        coord = coords[cid]
+        if not hasattr(coord, 'coord_to_xyz_array'):
+            # CORD3G
+            func = coord.transform_vector_to_global if is_vector else coord.transform_node_to_global
+            xyz_global[i, :] = [func(xyzi) for xyzi in xyz[i, :]]
+        elif is_vector:
+            xyz_global[i, :] = coord.transform_vectors_to_global(xyz[i, :])
+        else:
+            xyz_global[i, :] = coord.transform_nodes_to_global(xyz[i, :])
+    return xyz_global
+
+
 class BDFMethods(BDFMethodsDeprecated):
     def __init__(self):
         pass
 
     def mass_properties(self, element_ids=None, reference_point=None,
-                        sym_axis=None, num_cpus=1, scale=None):
+                        sym_axis=None, num_cpus=1, scale=None, vectorized=False):
         """
         Caclulates mass properties in the global system about the
         reference point.
@@ -60,6 +182,11 @@ class BDFMethods(BDFMethodsDeprecated):
         :param scale: the WTMASS scaling value
                       default=None -> PARAM, WTMASS is used
                       float > 0.0
+        :param vectorized: calculate the mass/centroid of the CTRIA3, CQUAD4,
+                      CBAR, CBEAM, CROD, CONROD, CTETRA4, CPENTA6, CHEXA8 and
+                      CONM2 cards with array operations (default=False).
+                      The other cards use their Mass()/Centroid() methods.
+                      num_cpus is ignored.
         :returns mass: the mass of the model
         :returns cg: the cg of the model as an array.
         :returns I: moment of inertia array([Ixx, Iyy, Izz, Ixy, Ixz, Iyz]) or None
@@ -94,7 +221,10 @@ class BDFMethods(BDFMethodsDeprecated):
             nelements = len(element_ids)
 
         #num_cpus = 1
-        if num_cpus > 1:
+        if vectorized:
+            mass, cg, I = self._mass_properties_vectorized(elements, masses,
+                                                           reference_point=reference_point)
+        elif num_cpus > 1:
             # doesn't support calculate_cg = False
             # must use num_cpus = 1
             mass, cg, I = self._mass_properties_mp(num_cpus, elements, masses,
@@ -161,6 +291,145 @@ class BDFMethods(BDFMethodsDeprecated):
             cg = cg / mass
         return (mass, cg, I)
 
+    def _mass_properties_vectorized(self, elements, masses, reference_point):
+        """
+        Caclulates mass properties in the global system about the
+        reference point by packing the node locations, the connectivity
+        and the mass per unit area/length/volume of each element type
+        into arrays.
+
+        :param self: the BDF object
+        :param elements: the elements to sum
+        :param masses: the mass elements to sum
+        :param reference_point: an array that defines the origin of the
+            frame or 'cg'
+        :returns mass: the mass of the model
+        :returns cg: the cg of the model as an array.
+        :returns I: moment of inertia array([Ixx, Iyy, Izz, Ixy, Ixz, Iyz])
+
+        .. seealso:: self.mass_properties
+        """
+        # element type -> ([node lists], [mass/measure])
+        groups = {}
+        # mass/measure by property object (id -> value); None if it fails
+        factors = {}
+        others = []
+        for element in elements:
+            element_type = element.__class__.__name__
+            if element_type not in _VECTORIZED_MASS_ELEMENTS:
+                others.append(element)
+                continue
+            nnodes, method = _VECTORIZED_MASS_ELEMENTS[element_type]
+            nodes = _get_mass_element_nodes(element, nnodes)
+            if nodes is None:
+                others.append(element)
+                continue
+
+            if element_type == 'CONROD':
+                try:
+                    factor = _get_mass_factor(element, method)
+                except:
+                    factor = None
+            else:
+                key = id(element.pid)
+                try:
+                    factor = factors[key]
+                except KeyError:
+                    try:
+                        factor = _get_mass_factor(element, method)
+                    except:
+                        factor = None
+                    factors[key] = factor
+            if factor is None:
+                # let the element raise/warn
+                others.append(element)
+                continue
+            group = groups.setdefault(element_type, ([], []))
+            group[0].append(nodes)
+            group[1].append(factor)
+
+        # CONM2s in the global frame
+        conm2_mass = []
+        conm2_nodes = []
+        conm2_offset = []
+        for element in masses:
+            if element.type == 'CONM2' and element.Cid() == 0 and hasattr(element.nid, 'Position'):
+                conm2_mass.append(element.mass)
+                conm2_nodes.append([element.nid])
+                conm2_offset.append(element.X)
+            else:
+                others.append(element)
+
+        # the global xyz of every node that's used
+        node_index = {}
+        node_list = []
+        for nodes_list in [conm2_nodes] + [group[0] for group in groups.values()]:
+            for nodes in nodes_list:
+                for node in nodes:
+                    if id(node) not in node_index:
+                        node_index[id(node)] = len(node_list)
+                        node_list.append(node)
+        xyz = self._get_node_positions(node_list)
+
+        mass = [zeros(0, dtype='float64')]
+        centroid = [zeros((0, 3), dtype='float64')]
+        for element_type, (nodes_list, factor) in sorted(iteritems(groups)):
+            inodes = array([[node_index[id(node)] for node in nodes] for nodes in nodes_list])
+            measure, centroidi = _get_measure_centroid(element_type, xyz, inodes)
+            mass.append(array(factor, dtype='float64') * measure)
+            centroid.append(centroidi)
+
+        if conm2_nodes:
+            inodes = array([node_index[id(nodes[0])] for nodes in conm2_nodes])
+            mass.append(array(conm2_mass, dtype='float64'))
+            centroid.append(xyz[inodes, :] + array(conm2_offset, dtype='float64'))
+
+        # the elements that aren't vectorized
+        massi = []
+        centroidi = []
+        for element in others:
+            try:
+                p = element.Centroid()
+            except:
+                continue
+            try:
+                m = float(element.Mass())
+                p = array(p, dtype='float64').reshape(3)
+            except:
+                self.log.warning("could not get the inertia for element\n%s" % element)
+                continue
+            massi.append(m)
+            centroidi.append(p)
+        if massi:
+            mass.append(array(massi, dtype='float64'))
+            centroid.append(vstack(centroidi))
+
+        mass = hstack(mass)
+        centroid = vstack(centroid)
+        massi = mass.sum()
+        if massi == 0.0:
+            return massi, array([0., 0., 0.]), array([0., 0., 0., 0., 0., 0.])
+
+        cg = dot(mass, centroid) / massi
+        if isinstance(reference_point, string_types) and reference_point == 'cg':
+            reference_point = cg
+        dxyz = centroid - reference_point
+        x = dxyz[:, 0]
+        y = dxyz[:, 1]
+        z = dxyz[:, 2]
+        x2 = x * x
+        y2 = y * y
+        z2 = z * z
+        I = array([
+            dot(mass, y2 + z2),  # Ixx
+            dot(mass, x2 + z2),  # Iyy
+            dot(mass, x2 + y2),  # Izz
+            dot(mass, x * y),    # Ixy
+            dot(mass, x * z),    # Ixz
+            dot(mass, y * z),    # Iyz
+        ])
+        return (massi, cg, I)
+
     def _apply_mass_symmetry(self, sym_axis, scale, mass, cg, I):
         """
         Scales the mass & moement of inertia based on the symmetry axes
@@ -305,6 +574,124 @@ class BDFMethods(BDFMethodsDeprecated):
 
         return (massi, cg, I)
 
+    def transform_xyz_to_global(self, xyz, cids):
+        """
+        Transforms a series of points from their coordinate systems to
+        the global frame.  This is the array version of
+        ``Coord.transform_node_to_global``.
+
+        :param self: the BDF object
+        :param xyz: the (n, 3) points in their local frames (e.g. R, theta, z
+                    for a CORD2C)
+        :param cids: the (n,) coordinate system ids
+        :returns xyz_global: the (n, 3) points in the global frame
+
+        .. warning:: make sure you cross-reference before calling this
+        """
+        return _transform_to_global(self.coords, xyz, cids, is_vector=False)
+
+    def transform_vectors_to_global(self, vectors, cids):
+        """
+        Transforms a series of generalized vectors (e.g. forces,
+        displacements) from their coordinate systems to the global frame.
+        This is the array version of ``Coord.transform_vector_to_global``.
+
+        :param self: the BDF object
+        :param vectors: the (n, 3) vectors in their local frames
+        :param cids: the (n,) coordinate system ids
+        :returns vectors_global: the (n, 3) vectors in the global frame
+
+        .. warning:: make sure you cross-reference before calling this
+        """
+        return _transform_to_global(self.coords, vectors, cids, is_vector=True)
+
+    def get_area_centroid_normal(self, element_type):
+        """
+        Gets the area, centroid and unit normal of every shell element of
+        a type at once.  This is the array version of the element's
+        Area(), Centroid() and Normal() methods.
+
+        :param self: the BDF object
+        :param element_type: the card type (e.g. 'CTRIA3', 'CQUAD8'; see
+                             bdf_geometry.SHELL_TYPES)
+        :returns eids: the (n,) sorted element ids
+        :returns area: the (n,) areas
+        :returns centroid: the (n, 3) global centroids
+        :returns normal: the (n, 3) global unit normals
+
+        .. note:: the elements don't need to be cross-referenced, but
+                  the coordinate systems do
+        """
+        if element_type not in SHELL_TYPES:
+            raise NotImplementedError('element_type=%r is not supported' % element_type)
+        eids, xyz, nodes = self._get_element_xyz(element_type)
+        area, centroid, normal = shell_area_centroid_normal(element_type, xyz, nodes)
+        return eids, area, centroid, normal
+
+    def get_volume_centroid(self, element_type):
+        """
+        Gets the volume and centroid of every solid element of a type at
+        once.  This is the array version of the element's Volume() and
+        Centroid() methods.
+
+        :param self: the BDF object
+        :param element_type: the card type ('CTETRA', 'CPENTA', 'CHEXA')
+        :returns eids: the (n,) sorted element ids
+        :returns volume: the (n,) volumes
+        :returns centroid: the (n, 3) global centroids
+
+        .. note:: the elements don't need to be cross-referenced, but
+                  the coordinate systems do
+        """
+        if element_type not in SOLID_TYPES:
+            raise NotImplementedError('element_type=%r is not supported' % element_type)
+        eids, xyz, nodes = self._get_element_xyz(element_type)
+        volume, centroid = solid_volume_centroid(element_type, xyz, nodes)
+        return eids, volume, centroid
+
+    def _get_element_xyz(self, element_type):
+        """
+        Gets the packed global node locations and the connectivity of
+        the corner nodes of the elements of a type
+
+        :param self: the BDF object
+        :param element_type: the card type
+        :returns eids: the (n,) sorted element ids
+        :returns xyz: the (nnodes, 3) global locations of the nodes used
+        :returns nodes: the (n, ncorners) rows in xyz of the corner nodes
+        """
+        eids, corners = self.get_topology().get_corner_nodes(element_type)
+        nids, nodes = unique(corners, return_inverse=True)
+        nodes = nodes.reshape(corners.shape)
+        xyz = self._get_node_positions([self.nodes[nid] for nid in nids.tolist()])
+        return eids, xyz, nodes
+
+    def get_xyz_in_global(self, nids=None):
+        """
+        Gets the global locations of the nodes using the batched
+        coordinate transforms (see transform_xyz_to_global).
+
+        :param self: the BDF object
+        :param nids: the node ids (default=None -> all sorted nodes)
+        :returns nids: the node ids
+        :returns xyz: the (nnodes, 3) locations in the global frame
+        """
+        if nids is None:
+            nids = sorted(self.nodes)
+        nodes = [self.nodes[nid] for nid in nids]
+        return nids, self._get_node_positions(nodes)
+
+    def _get_node_positions(self, nodes):
+        """
+        Gets the global locations of a list of node objects; the array
+        version of node.Position()
+        """
+        if not nodes:
+            return zeros((0, 3), dtype='float64')
+        xyz = array([node.xyz for node in nodes], dtype='float64')
+        cps = array([node.Cp() for node in nodes], dtype='int32')
+        return _transform_to_global(self.coords, xyz, cps, is_vector=False)
+
     def resolve_grids(self, cid=0):
         """
         Puts all nodes in a common coordinate system (mainly for cid testing)
@@ -714,7 +1101,8 @@ class BDFMethods(BDFMethodsDeprecated):
         #self.log.info("case=%s F=%s M=%s\n" % (loadcase_id, F, M))
         return (F, M)
 
-    def sum_forces_moments(self, p0, loadcase_id, include_grav=False):
+    def sum_forces_moments(self, p0, loadcase_id, include_grav=False,
+                           vectorized=False):
         """
         Sums applied forces & moments about a reference point p0 for all
         load cases.
@@ -730,6 +1118,9 @@ class BDFMethods(BDFMethodsDeprecated):
           the LOAD=? ID to analyze
         :param include_grav:
           includes gravity in the summation (not supported)
+        :param vectorized:
+          use the compiled load case, which is cached until a load, node,
+          element or coordinate system changes (see get_load_sum)
         :returns Forces:
           the forces
         :returns Moments:
@@ -756,15 +1147,91 @@ class BDFMethods(BDFMethodsDeprecated):
         if not isinstance(loadcase_id, int):
             raise RuntimeError('loadcase_id must be an integer; loadcase_id=%r' % loadcase_id)
         if isinstance(p0, int):
-            p = self.model.nodes[p0].Position()
+            p = self.nodes[p0].Position()
         else:
             p = array(p0)
 
-        loadCase = self.loads[loadcase_id]
-        #for (key, loadCase) in iteritems(self.loads):
-            #if key != loadcase_id:
-                #continue
+        if vectorized:
+            return self.get_load_sum(loadcase_id, include_grav).sum_forces_moments(p)
+        scale_factors2, loads2 = self._get_reduced_loads(loadcase_id)
+        return self._sum_forces_moments_loads(p, loadcase_id, loads2, scale_factors2,
+                                              include_grav=include_grav)
+
+    def sum_forces_moments_loadcases(self, p0, loadcase_ids, include_grav=False):
+        """
+        Sums the applied forces & moments of many load cases about a
+        reference point with the compiled load cases (see get_load_sum)
+
+        :param self: the BDF object
+        :param p0: the reference point; an integer (node ID) or
+                   a (3,) array
+        :param loadcase_ids: the LOAD=? IDs to analyze
+        :param include_grav: includes gravity in the summation
+        :returns Forces: the (nloadcases, 3) forces
+        :returns Moments: the (nloadcases, 3) moments about p0
+        """
+        if isinstance(p0, int):
+            p = self.nodes[p0].Position()
+        else:
+            p = array(p0, dtype='float64')
+        forces = zeros((len(loadcase_ids), 3), dtype='float64')
+        moments = zeros((len(loadcase_ids), 3), dtype='float64')
+        for i, loadcase_id in enumerate(loadcase_ids):
+            forces[i, :], moments[i, :] = self.get_load_sum(
+                loadcase_id, include_grav).get_resultant()
+        moments -= cross(p, forces)
+        return forces, moments
+
+    def get_load_sum(self, loadcase_id, include_grav=False):
+        """
+        Gets the load case compiled to arrays (see bdf_load_sum.py).  The
+        compiled load cases are cached until a load, node, element,
+        coordinate system, property or material is added, replaced or
+        deleted.  A card that's modified in place can be marked by
+        assigning it again (e.g. ``model.nodes[nid] = node``).
+
+        :param self: the BDF object
+        :param loadcase_id: the LOAD=? ID
+        :param include_grav: includes gravity in the summation
+        :returns load_sum: the LoadSum
+        """
+        if not isinstance(loadcase_id, int):
+            raise RuntimeError('loadcase_id must be an integer; loadcase_id=%r' % loadcase_id)
+        key = self._get_load_sum_key()
+        cache_key = (loadcase_id, include_grav)
+        try:
+            load_key, load_sum = self._load_sums[cache_key]
+        except KeyError:
+            load_key = load_sum = None
+        if load_sum is None or key is None or load_key != key:
+            load_sum = compile_loadcase(self, loadcase_id, include_grav=include_grav)
+            self._load_sums[cache_key] = (key, load_sum)
+        return load_sum
+
+    def _get_load_sum_key(self):
+        """
+        Gets the state of the dictionaries that a compiled load case
+        depends on (None if it can't be tracked)
+        """
+        versions = []
+        for cards in [self.loads, self.nodes, self.elements, self.coords,
+                      self.properties, self.materials]:
+            version = getattr(cards, 'version', None)
+            if version is None:  # a plain dict
+                return None
+            versions += [id(cards), version]
+        return tuple(versions)
+
+    def _get_reduced_loads(self, loadcase_id):
+        """
+        Gets the loads of a load case with the LOAD cards expanded
 
+        :param self: the BDF object
+        :param loadcase_id: the LOAD=? ID
+        :returns scale_factors: the scale factor of each load
+        :returns loads: the load cards (FORCE, PLOAD4, ...)
+        """
+        loadCase = self.loads[loadcase_id]
         scale_factors2 = []
         loads2 = []
         for load in loadCase:
@@ -775,7 +1242,23 @@ class BDFMethods(BDFMethodsDeprecated):
             else:
                 scale_factors2.append(1.)
                 loads2.append(load)
+        return scale_factors2, loads2
+
+    def _sum_forces_moments_loads(self, p, loadcase_id, loads2, scale_factors2,
+                                  include_grav=False):
+        """
+        Sums the forces & moments of a series of load cards one at a time
 
+        :param self: the BDF object
+        :param p: the (3,) reference point
+        :param loadcase_id: the LOAD=? ID (for the log)
+        :param loads2: the load cards (no LOAD cards)
+        :param scale_factors2: the scale factor of each load
+        :param include_grav: includes gravity in the summation
+        :returns Forces, Moments: the (3,) force and moment
+
+        .. seealso:: sum_forces_moments
+        """
         F = array([0., 0., 0.])
         M = array([0., 0., 0.])
 
@@ -0,0 +1,196 @@
+"""
+Defines a snapshot cache for parsed BDF models, so an unchanged deck
+doesn't need to be parsed (and cross-referenced) again.
+
+A snapshot is a pickle file with three records:
+
+    header: the cache version, the read options and a (path, mtime,
+            size, md5) stamp for the main file and every INCLUDE file
+    state:  the BDF.__dict__ after read_bdf (without the logger)
+    xyz:    the node ids and a single (nnodes, 3) array of the GRID
+            locations; pickling one small array per node is slow
+
+The snapshot is only used if every stamp still matches, so changing any
+of the input files invalidates it.
+"""
+from __future__ import print_function
+import os
+import hashlib
+from six import PY2, iteritems
+from numpy import array, ndarray, float64
+
+if PY2:
+    from cPickle import Pickler, Unpickler, HIGHEST_PROTOCOL
+else:
+    from pickle import Pickler, Unpickler, HIGHEST_PROTOCOL
+
+import pyNastran
+
+#: bump this if the layout of the BDF/card objects changes
+CACHE_VERSION = 1
+
+#: the BDF attributes that are tied to the file streams of a read
+_SKIP_ATTRIBUTES = set(['log', '_line_streams', '_card_streams',
+                        '_stored_Is', '_stored_lines', '_stored_comments',
+                        '_xref_index', '_topology', '_load_sums'])
+
+
+def _hash_file(filename, block_size=1024 * 1024):
+    """gets the md5 of the contents of a file"""
+    md5 = hashlib.md5()
+    with open(filename, 'rb') as bdf_file:
+        while True:
+            data = bdf_file.read(block_size)
+            if not data:
+                break
+            md5.update(data)
+    return md5.hexdigest()
+
+
+def get_file_stamps(filenames):
+    """
+    Gets the (path, mtime, size, md5) of a series of files
+
+    :param filenames: the files (e.g. the main bdf and its INCLUDE files)
+    """
+    stamps = []
+    for filename in filenames:
+        filename = os.path.abspath(filename)
+        stat = os.stat(filename)
+        stamps.append((filename, stat.st_mtime, stat.st_size, _hash_file(filename)))
+    return stamps
+
+
+def _is_stamp_valid(stamp):
+    """is a file unchanged since get_file_stamps was called"""
+    filename, mtime, size, md5 = stamp
+    if not os.path.exists(filename):
+        return False
+    stat = os.stat(filename)
+    if stat.st_mtime != mtime or stat.st_size != size:
+        return False
+    return _hash_file(filename) == md5
+
+
+def get_cache_filename(cache_dir, bdf_filename):
+    """
+    Gets the snapshot filename for a bdf
+
+    :param cache_dir: the directory the snapshots are stored in
+    :param bdf_filename: the main bdf
+    """
+    bdf_filename = os.path.abspath(bdf_filename)
+    key = hashlib.sha1(bdf_filename.encode('utf8')).hexdigest()[:16]
+    basename = os.path.basename(bdf_filename)
+    return os.path.join(cache_dir, '%s.%s.pkl' % (basename, key))
+
+
+def _get_header(options, filenames):
+    return {
+        'cache_version' : CACHE_VERSION,
+        'version' : pyNastran.__version__,
+        'options' : options,
+        'files' : get_file_stamps(filenames),
+    }
+
+
+def _pop_node_xyz(model):
+    """
+    Removes the xyz arrays from the nodes, so they can be stored as a
+    single array.  Use _set_node_xyz to put them back.
+    """
+    nids = []
+    xyz = []
+    for nid, node in iteritems(model.nodes):
+        xyzi = getattr(node, 'xyz', None)
+        if isinstance(xyzi, ndarray) and xyzi.shape == (3,) and xyzi.dtype == float64:
+            nids.append(nid)
+            xyz.append(xyzi)
+            node.xyz = None
+    if xyz:
+        return nids, xyz, array(xyz, dtype='float64')
+    return nids, xyz, array([], dtype='float64').reshape(0, 3)
+
+
+def _set_node_xyz(model, nids, xyz):
+    """puts the node xyz arrays back"""
+    nodes = model.nodes
+    for nid, xyzi in zip(nids, xyz):
+        nodes[nid].xyz = xyzi
+
+
+def save_cache(model, cache_filename, options):
+    """
+    Writes a snapshot of a BDF that was just read
+
+    :param model: the BDF object
+    :param cache_filename: the snapshot file (see ``get_cache_filename``)
+    :param options: the read_bdf options that change the model (e.g. xref)
+    """
+    cache_dir = os.path.dirname(cache_filename)
+    if cache_dir and not os.path.exists(cache_dir):
+        os.makedirs(cache_dir)
+
+    state = dict([(key, value) for key, value in model.__dict__.items()
+                  if key not in _SKIP_ATTRIBUTES])
+    log = model.log
+    header = _get_header(options, model.bdf_filenames)
+
+    # write to a temporary file, so a crash doesn't leave a partial snapshot
+    tmp_filename = cache_filename + '.tmp'
+    nids, xyz_list, xyz = _pop_node_xyz(model)
+    try:
+        with open(tmp_filename, 'wb') as cache_file:
+            pickler = Pickler(cache_file, HIGHEST_PROTOCOL)
+            pickler.persistent_id = lambda obj: 'log' if obj is log else None
+            pickler.dump(header)
+            pickler.dump(state)
+            pickler.dump((nids, xyz))
+    finally:
+        _set_node_xyz(model, nids, xyz_list)
+    if os.path.exists(cache_filename):
+        os.remove(cache_filename)
+    os.rename(tmp_filename, cache_filename)
+    model.log.debug('wrote the model cache %r' % cache_filename)
+
+
+def load_cache(model, cache_filename, options):
+    """
+    Loads a snapshot written by ``save_cache`` if none of the input files
+    have changed
+
+    :param model: the BDF object to load the snapshot into
+    :param cache_filename: the snapshot file (see ``get_cache_filename``)
+    :param options: the read_bdf options that change the model (e.g. xref)
+    :returns is_loaded: was the snapshot used
+    """
+    if not os.path.exists(cache_filename):
+        return False
+
+    log = model.log
+    with open(cache_filename, 'rb') as cache_file:
+        unpickler = Unpickler(cache_file)
+        unpickler.persistent_load = lambda pid: log
+        try:
+            header = unpickler.load()
+        except Exception:
+            log.debug('the model cache %r is invalid' % cache_filename)
+            return False
+
+        if(header.get('cache_version') != CACHE_VERSION or
+           header.get('version') != pyNastran.__version__ or
+           header.get('options') != options):
+            log.debug('the model cache %r is out of date' % cache_filename)
+            return False
+        for stamp in header['files']:
+            if not _is_stamp_valid(stamp):
+                log.debug('the model cache %r is out of date; %r changed' % (
+                    cache_filename, stamp[0]))
+                return False
+        state = unpickler.load()
+        nids, xyz = unpickler.load()
+
+    model.__dict__.update(state)
+    _set_node_xyz(model, nids, xyz)
+    log.debug('loaded the model cache %r' % cache_filename)
+    return True
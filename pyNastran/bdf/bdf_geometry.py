@@ -0,0 +1,166 @@
+"""
+Defines the array versions of the element geometry methods:
+
+    shells:  Area(), Centroid(), Normal()  (shell.py)
+    solids:  Volume(), Centroid()          (solid.py)
+
+The kernels work on a packed set of node locations and a connectivity
+array, so every element of a type is calculated at once:
+
+    xyz:    (nnodes, 3) float array of the global node locations
+    nodes:  (nelements, n) int array of the rows in xyz of the nodes of
+            each element (in nodeIDs() order); only the corner nodes are
+            used, so the midside nodes of a CTRIA6, CQUAD8, CHEXA20, ...
+            may be left out
+
+The formulas are the same as the per-element methods, so the midside
+nodes don't change the geometry (the edges are straight).
+
+Use ``BDF.get_area_centroid_normal`` and ``BDF.get_volume_centroid`` to
+get the geometry of a model.
+"""
+from __future__ import (nested_scopes, generators, division, absolute_import,
+                        print_function, unicode_literals)
+from numpy import cross, errstate
+from numpy.linalg import norm
+
+#: card type -> (the number of corner nodes, the centroid method)
+#: where 'mean' is the average of the corner nodes and 'split' is the
+#: area weighted centroid of the 2 triangles of a quad
+SHELL_TYPES = {
+    'CTRIA3' : (3, 'mean'),
+    'CTRIA6' : (3, 'mean'),
+    'CTRIAR' : (3, 'mean'),
+    'CQUAD4' : (4, 'mean'),
+    'CQUADR' : (4, 'mean'),
+    'CQUAD' : (4, 'mean'),
+    'CQUAD8' : (4, 'split'),
+    'CSHEAR' : (4, 'split'),
+}
+
+#: card type -> the number of corner nodes
+SOLID_TYPES = {
+    'CTETRA' : 4,
+    'CPENTA' : 6,
+    'CHEXA' : 8,
+}
+
+
+def _get_corners(xyz, nodes, ncorners):
+    """gets the (nelements, 3) locations of each corner node"""
+    if nodes.ndim != 2 or nodes.shape[1] < ncorners:
+        raise ValueError('nodes must be (nelements, %i+); nodes.shape=%s'
+                         % (ncorners, str(nodes.shape)))
+    return [xyz[nodes[:, i], :] for i in range(ncorners)]
+
+
+def _unit_vectors(vectors):
+    """
+    Gets the length and the unit vector of a series of vectors; the
+    unit vector of a zero length vector is nan
+    """
+    length = norm(vectors, axis=1)
+    with errstate(divide='ignore', invalid='ignore'):
+        normal = vectors / length[:, None]
+    return length, normal
+
+
+def quad_area_centroid(n1, n2, n3, n4):
+    """
+    Gets the area and the area weighted centroid of a series of quads by
+    splitting them into 2 triangles (the array version of
+    solid.area_centroid).::
+
+      1-----2
+      |   / |
+      | /   |
+      4-----3
+
+    :param n1, n2, n3, n4: the (n, 3) corner locations
+    :returns area: the (n,) areas
+    :returns centroid: the (n, 3) centroids
+    """
+    area1 = 0.5 * norm(cross(n1 - n2, n2 - n4), axis=1)
+    c1 = (n1 + n2 + n4) / 3.
+    area2 = 0.5 * norm(cross(n2 - n4, n2 - n3), axis=1)
+    c2 = (n2 + n3 + n4) / 3.
+    area = area1 + area2
+    with errstate(divide='ignore', invalid='ignore'):
+        centroid = (c1 * area1[:, None] + c2 * area2[:, None]) / area[:, None]
+    return area, centroid
+
+
+def shell_area_centroid_normal(element_type, xyz, nodes):
+    """
+    Gets the area, centroid and unit normal of a series of shell
+    elements of the same type
+
+    :param element_type: the card type (see SHELL_TYPES)
+    :param xyz: the (nnodes, 3) node locations
+    :param nodes: the (nelements, n) rows in xyz of the element nodes
+    :returns area: the (nelements,) areas
+    :returns centroid: the (nelements, 3) centroids
+    :returns normal: the (nelements, 3) unit normals (nan for a zero
+        area element)
+
+    ::
+
+      tri:   n = (n1 - n2) x (n1 - n3)
+      quad:  n = (n1 - n3) x (n2 - n4)
+      A = 1/2 |n|
+    """
+    try:
+        ncorners, centroid_method = SHELL_TYPES[element_type]
+    except KeyError:
+        raise NotImplementedError('element_type=%r is not supported' % element_type)
+    corners = _get_corners(xyz, nodes, ncorners)
+    if ncorners == 3:
+        n1, n2, n3 = corners
+        length, normal = _unit_vectors(cross(n1 - n2, n1 - n3))
+        centroid = (n1 + n2 + n3) / 3.
+    else:
+        n1, n2, n3, n4 = corners
+        length, normal = _unit_vectors(cross(n1 - n3, n2 - n4))
+        if centroid_method == 'split':
+            centroid = quad_area_centroid(n1, n2, n3, n4)[1]
+        else:
+            centroid = (n1 + n2 + n3 + n4) / 4.
+    return 0.5 * length, centroid, normal
+
+
+def solid_volume_centroid(element_type, xyz, nodes):
+    """
+    Gets the volume and centroid of a series of solid elements of the
+    same type
+
+    :param element_type: the card type (see SOLID_TYPES)
+    :param xyz: the (nnodes, 3) node locations
+    :param nodes: the (nelements, n) rows in xyz of the element nodes
+    :returns volume: the (nelements,) volumes
+    :returns centroid: the (nelements, 3) centroids
+
+    .. note:: like CTETRA4.Volume, the volume of a CTETRA is signed
+    .. note:: the CPENTA/CHEXA volume is the average area of the end
+              faces times the distance between their centroids
+    """
+    try:
+        ncorners = SOLID_TYPES[element_type]
+    except KeyError:
+        raise NotImplementedError('element_type=%r is not supported' % element_type)
+    corners = _get_corners(xyz, nodes, ncorners)
+    if element_type == 'CTETRA':
+        n1, n2, n3, n4 = corners
+        volume = -(cross(n2 - n4, n3 - n4) * (n1 - n4)).sum(axis=1) / 6.
+        return volume, (n1 + n2 + n3 + n4) / 4.
+
+    if element_type == 'CPENTA':
+        n1, n2, n3, n4, n5, n6 = corners
+        area1 = 0.5 * norm(cross(n3 - n1, n2 - n1), axis=1)
+        area2 = 0.5 * norm(cross(n6 - n4, n5 - n4), axis=1)
+        c1 = (n1 + n2 + n3) / 3.
+        c2 = (n4 + n5 + n6) / 3.
+    else:
+        area1, c1 = quad_area_centroid(*corners[:4])
+        area2, c2 = quad_area_centroid(*corners[4:])
+    volume = abs((area1 + area2) / 2. * norm(c1 - c2, axis=1))
+    return volume, (c1 + c2) / 2.
@@ -0,0 +1,379 @@
+"""
+Defines the compiled version of a load case for summing the applied
+forces and moments (see ``BDF.sum_forces_moments``).
+
+A load case (with its LOAD cards expanded) is converted into arrays once:
+
+    forces:   the application point, the force per unit scale and the
+              scale factor of every FORCE, FORCE1, FORCE2 card and of
+              every element/face of a PLOAD, PLOAD2, PLOAD4 card
+    moments:  the moment and scale factor of every MOMENT, MOMENT1,
+              MOMENT2 card
+
+so the resultant about any reference point is a few array operations:
+
+    F = sum(scale * force)
+    M = sum(xyz x (scale * force)) + sum(scale * moment) - p0 x F
+
+The pressure loads use the element geometry kernels (bdf_geometry.py).
+A PLOAD4 on a CTETRA/CPENTA/CHEXA face is a triangle/quad face (picked by
+G1 and G3/G4) that's oriented out of the element; a positive pressure
+acts into the element.
+The loads that aren't vectorized (PLOAD1, GRAV) are summed one at a time
+when the load case is compiled.
+
+Use ``BDF.get_load_sum(loadcase_id)`` to get the cached LoadSum.
+"""
+from __future__ import (nested_scopes, generators, division, absolute_import,
+                        print_function, unicode_literals)
+from six import iteritems, integer_types
+from six.moves import zip
+from numpy import (array, zeros, full, arange, cross, unique, searchsorted, isfinite,
+                   concatenate, hstack, vstack, einsum, flatnonzero)
+
+from pyNastran.bdf.bdf_geometry import shell_area_centroid_normal
+from pyNastran.bdf.cards.loads.staticLoads import Force, Moment
+
+#: load type -> element type -> the kernel (see bdf_geometry.SHELL_TYPES)
+#: that matches sum_forces_moments
+PRESSURE_ELEMENT_TYPES = {
+    'PLOAD2' : {
+        'CTRIA3' : 'CTRIA3', 'CQUAD4' : 'CQUAD4', 'CSHEAR' : 'CSHEAR',
+    },
+    'PLOAD4' : {
+        'CTRIA3' : 'CTRIA3', 'CTRIA6' : 'CTRIA3', 'CTRIAR' : 'CTRIA3',
+        'CQUAD4' : 'CQUAD4', 'CQUAD8' : 'CQUAD4', 'CQUAD' : 'CQUAD4',
+        'CQUADR' : 'CQUAD4', 'CSHEAR' : 'CQUAD4',
+        'CTETRA' : 'SOLID', 'CPENTA' : 'SOLID', 'CHEXA' : 'SOLID',
+    },
+}
+
+#: the corners (in order around the face) of the faces of the solid
+#: elements; the faces are pointed out of the element when they're used
+SOLID_FACES = {
+    'CTETRA' : [(1, 2, 3), (0, 2, 3), (0, 1, 3), (0, 1, 2)],
+    'CPENTA' : [(0, 1, 2), (3, 4, 5), (0, 1, 4, 3), (1, 2, 5, 4), (2, 0, 3, 5)],
+    'CHEXA' : [(0, 1, 2, 3), (4, 5, 6, 7), (0, 1, 5, 4), (1, 2, 6, 5),
+               (2, 3, 7, 6), (3, 0, 4, 7)],
+}
+
+
+def _get_face_lookup(element_type):
+    """
+    Gets the face of a solid element from the local G1 and G3/G4 corners
+
+    :param element_type: 'CTETRA', 'CPENTA', 'CHEXA'
+    :returns lookup: the (ncorners, ncorners + 1) face index (-1 is an
+        invalid G1/G3/G4 pair); the last column is a blank G3/G4
+
+    ::
+
+      CTETRA:          G1 is on the face; G4 is the corner that's not
+      CPENTA triangle: G1 is on the face; G3/G4 is blank
+      quad:            G1 and G3 are diagonal corners of the face
+    """
+    faces = SOLID_FACES[element_type]
+    ncorners = max([max(face) for face in faces]) + 1
+    lookup = full((ncorners, ncorners + 1), -1, dtype='int32')
+    for iface, face in enumerate(faces):
+        if element_type == 'CTETRA':
+            iopposite = (set(range(ncorners)) - set(face)).pop()
+            for i in face:
+                lookup[i, iopposite] = iface
+        elif len(face) == 3:
+            lookup[face, ncorners] = iface
+        else:
+            (i1, i2, i3, i4) = face
+            lookup[[i1, i3, i2, i4], [i3, i1, i4, i2]] = iface
+    return lookup
+
+
+def _get_id(obj, name='nid'):
+    """gets the id of an integer or a cross-referenced card"""
+    if isinstance(obj, integer_types):
+        return obj
+    return getattr(obj, name)
+
+
+class LoadSum(object):
+    """
+    The forces/moments of a load case as arrays
+    (see the module docstring)
+    """
+    def __init__(self, loadcase_id, nids, eids, xyz, forces, scales,
+                 moment_nids, moments, moment_scales, force0=None, moment0=None):
+        """
+        :param loadcase_id: the LOAD=? ID
+        :param nids: the (n,) node of each force (0 for a pressure)
+        :param eids: the (n,) element of each force (0 for a FORCE/PLOAD)
+        :param xyz: the (n, 3) global application points
+        :param forces: the (n, 3) forces per unit scale
+        :param scales: the (n,) scale factors (LOAD scale * pressure)
+        :param moment_nids: the (m,) node of each moment
+        :param moments: the (m, 3) moments per unit scale
+        :param moment_scales: the (m,) scale factors
+        :param force0, moment0: the (3,) force and moment about the
+            origin of the loads that aren't vectorized (default=None -> 0)
+        """
+        self.loadcase_id = loadcase_id
+        self.nids = nids
+        self.eids = eids
+        self.xyz = xyz
+        self.forces = forces
+        self.scales = scales
+        self.moment_nids = moment_nids
+        self.moments = moments
+        self.moment_scales = moment_scales
+        self.force0 = zeros(3, dtype='float64') if force0 is None else array(force0)
+        self.moment0 = zeros(3, dtype='float64') if moment0 is None else array(moment0)
+        self._resultant = None
+
+    def get_resultant(self):
+        """
+        Gets the resultant force and the moment about the origin
+
+        :returns force, moment: the (3,) force and moment
+        """
+        if self._resultant is None:
+            forces = self.forces * self.scales[:, None]
+            force = forces.sum(axis=0) + self.force0
+            moment = (cross(self.xyz, forces).sum(axis=0) +
+                      (self.moments * self.moment_scales[:, None]).sum(axis=0) +
+                      self.moment0)
+            self._resultant = (force, moment)
+        force, moment = self._resultant
+        return force.copy(), moment.copy()
+
+    def sum_forces_moments(self, p0):
+        """
+        Sums the forces & moments about a reference point
+
+        :param p0: the (3,) reference point
+        :returns force, moment: the (3,) force and moment about p0
+        """
+        force, moment = self.get_resultant()
+        return force, moment - cross(p0, force)
+
+    def __repr__(self):
+        return 'LoadSum(loadcase_id=%s, nforces=%i, nmoments=%i)' % (
+            self.loadcase_id, len(self.scales), len(self.moment_scales))
+
+
+def compile_loadcase(model, loadcase_id, include_grav=False):
+    """
+    Converts a load case into a LoadSum
+
+    :param model: the BDF object (cross-referenced)
+    :param loadcase_id: the LOAD=? ID
+    :param include_grav: includes gravity in the summation
+    :returns load_sum: the LoadSum
+    """
+    scale_factors, loads = model._get_reduced_loads(loadcase_id)
+
+    force_nids = []
+    force_vectors = []
+    force_scales = []
+    moment_nids = []
+    moment_vectors = []
+    moment_scales = []
+    # number of nodes -> ([nodes], [scales])
+    ploads = {3: ([], []), 4: ([], [])}
+    # load type -> ([eids], [scales], [G1], [G3/G4]); 0 is a blank node
+    pressures = {'PLOAD2' : ([], [], [], []), 'PLOAD4' : ([], [], [], [])}
+    other_loads = []
+    other_scales = []
+    unsupported_types = set([])
+    for load, scale in zip(loads, scale_factors):
+        if isinstance(load, Force):  # FORCE, FORCE1, FORCE2
+            force_nids.append(_get_id(load.node))
+            force_vectors.append(load.mag * load.xyz)
+            force_scales.append(scale)
+        elif isinstance(load, Moment):  # MOMENT, MOMENT1, MOMENT2
+            moment_nids.append(_get_id(load.node))
+            moment_vectors.append(load.mag * load.xyz)
+            moment_scales.append(scale)
+        elif load.type == 'PLOAD':
+            nodes = load.nodeIDs()
+            if len(nodes) not in ploads:
+                raise RuntimeError('invalid number of nodes on PLOAD card; nodes=%s' % str(nodes))
+            ploads[len(nodes)][0].append(nodes)
+            ploads[len(nodes)][1].append(load.p * scale)
+        elif load.type == 'PLOAD2':
+            eids, pressure_scales, g1s, g34s = pressures['PLOAD2']
+            eids += [_get_id(eid, 'eid') for eid in load.eids]
+            pressure_scales += [load.p * scale] * len(load.eids)
+            g1s += [0] * len(load.eids)
+            g34s += [0] * len(load.eids)
+        elif load.type == 'PLOAD4':
+            assert load.Cid() == 0, 'Cid() = %s' % (load.Cid())
+            assert load.sorl == 'SURF', 'sorl = %s' % (load.sorl)
+            assert load.ldir == 'NORM', 'ldir = %s' % (load.ldir)
+            eids, pressure_scales, g1s, g34s = pressures['PLOAD4']
+            eids += [_get_id(eid, 'eid') for eid in load.eids]
+            pressure_scales += [load.pressures[0] * scale] * len(load.eids)
+            g1 = 0 if load.g1 is None else _get_id(load.g1)
+            g34 = 0 if load.g34 is None else _get_id(load.g34)
+            g1s += [g1] * len(load.eids)
+            g34s += [g34] * len(load.eids)
+        elif load.type == 'PLOAD1' or (load.type == 'GRAV' and include_grav):
+            other_loads.append(load)
+            other_scales.append(scale)
+        elif load.type != 'GRAV':
+            unsupported_types.add(load.type)
+
+    # the faces of the pressure loads: [(eids, kernel type, corner nodes, scales)]
+    faces = []
+    for nnodes, (nodes, pload_scales) in sorted(iteritems(ploads)):
+        if nodes:
+            kernel_type = 'CTRIA3' if nnodes == 3 else 'CQUAD4'
+            faces.append((zeros(len(nodes), dtype='int64'), kernel_type,
+                          array(nodes, dtype='int64'), array(pload_scales)))
+    for load_type, (eids, pressure_scales, g1s, g34s) in sorted(iteritems(pressures)):
+        faces += _get_pressure_faces(model, loadcase_id, load_type, eids, pressure_scales,
+                                     g1s, g34s)
+
+    # the global locations of the nodes that are used
+    nids = unique(hstack([array(force_nids, dtype='int64')] +
+                         [face[2].ravel() for face in faces]))
+    xyz = model._get_node_positions([model.nodes[nid] for nid in nids.tolist()])
+
+    row_nids = [array(force_nids, dtype='int64')]
+    row_eids = [zeros(len(force_nids), dtype='int64')]
+    row_xyz = [xyz[searchsorted(nids, force_nids), :]]
+    row_forces = [array(force_vectors, dtype='float64').reshape(len(force_nids), 3)]
+    row_scales = [array(force_scales, dtype='float64')]
+    for eids, kernel_type, corners, face_scales in faces:
+        area, centroid, normal = shell_area_centroid_normal(
+            kernel_type, xyz, searchsorted(nids, corners))
+        is_valid = isfinite(normal).all(axis=1)
+        if not is_valid.all():
+            msg = 'the normal of a pressure face is undefined (zero area)\n'
+            msg += 'case=%s eids=%s nodes=%s' % (
+                loadcase_id, eids[~is_valid][:10].tolist(),
+                corners[~is_valid][:10].tolist())
+            raise FloatingPointError(msg)
+        row_nids.append(zeros(len(eids), dtype='int64'))
+        row_eids.append(eids)
+        row_xyz.append(centroid)
+        row_forces.append(normal * area[:, None])
+        row_scales.append(face_scales)
+
+    force0 = moment0 = None
+    if other_loads:
+        force0, moment0 = model._sum_forces_moments_loads(
+            zeros(3, dtype='float64'), loadcase_id, other_loads, other_scales,
+            include_grav=include_grav)
+
+    for load_type in sorted(unsupported_types):
+        model.log.debug('case=%s loadtype=%r not supported' % (loadcase_id, load_type))
+
+    return LoadSum(loadcase_id,
+                   concatenate(row_nids), concatenate(row_eids), vstack(row_xyz),
+                   vstack(row_forces), concatenate(row_scales),
+                   array(moment_nids, dtype='int64'),
+                   array(moment_vectors, dtype='float64').reshape(len(moment_nids), 3),
+                   array(moment_scales, dtype='float64'),
+                   force0=force0, moment0=moment0)
+
+
+def _get_pressure_faces(model, loadcase_id, load_type, eids, scales, g1s, g34s):
+    """
+    Groups the elements of a pressure load by the geometry kernel
+
+    :param model: the BDF object
+    :param loadcase_id: the LOAD=? ID (for the error messages)
+    :param load_type: 'PLOAD2', 'PLOAD4'
+    :param eids: the element ids
+    :param scales: the pressure * scale factor of each element
+    :param g1s: the G1 node of each element (0 -> blank)
+    :param g34s: the G3/G4 node of each element (0 -> blank)
+    :returns faces: [(eids, kernel type, corner nodes, scales)]
+    """
+    if not eids:
+        return []
+    kernel_types = PRESSURE_ELEMENT_TYPES[load_type]
+    groups = {}
+    for i, eid in enumerate(eids):
+        element_type = model.elements[eid].type
+        groups.setdefault(element_type, []).append(i)
+
+    topology = model.get_topology()
+    eids = array(eids, dtype='int64')
+    scales = array(scales, dtype='float64')
+    g1s = array(g1s, dtype='int64')
+    g34s = array(g34s, dtype='int64')
+    faces = []
+    for element_type, irows in sorted(iteritems(groups)):
+        if element_type not in kernel_types:
+            # skipping the load would give the wrong total
+            raise NotImplementedError('case=%s etype=%r loadtype=%r is not supported; eids=%s' % (
+                loadcase_id, element_type, load_type, eids[irows][:10].tolist()))
+        irows = array(irows)
+        eids_type = eids[irows]
+        topology_eids, corners = topology.get_corner_nodes(element_type)
+        ielements = searchsorted(topology_eids, eids_type)
+        is_found = ielements < len(topology_eids)
+        is_found[is_found] = topology_eids[ielements[is_found]] == eids_type[is_found]
+        if not is_found.all():
+            raise KeyError('case=%s %s elements with a blank corner node; eids=%s' % (
+                loadcase_id, load_type, eids_type[~is_found][:10].tolist()))
+        if kernel_types[element_type] == 'SOLID':
+            faces += _get_solid_faces(model, loadcase_id, element_type, eids_type,
+                                      corners[ielements], scales[irows],
+                                      g1s[irows], g34s[irows])
+        else:
+            faces.append((eids_type, kernel_types[element_type], corners[ielements],
+                          scales[irows]))
+    return faces
+
+
+def _get_solid_faces(model, loadcase_id, element_type, eids, corners, scales, g1s, g34s):
+    """
+    Gets the loaded faces of a series of solid elements of the same type
+
+    :param model: the BDF object
+    :param loadcase_id: the LOAD=? ID (for the error messages)
+    :param element_type: 'CTETRA', 'CPENTA', 'CHEXA'
+    :param eids: the (n,) element ids
+    :param corners: the (n, ncorners) corner nodes
+    :param scales: the (n,) pressure * scale factor of each element
+    :param g1s, g34s: the (n,) G1 and G3/G4 nodes (0 -> blank)
+    :returns faces: [(eids, kernel type, corner nodes, scales)]; the face
+        normals point out of the element, so the scales are negated
+    """
+    nelements, ncorners = corners.shape
+    i1 = (corners == g1s[:, None]).argmax(axis=1)
+    i34 = (corners == g34s[:, None]).argmax(axis=1)
+    i34[g34s == 0] = ncorners
+    is_valid = (corners[arange(nelements), i1] == g1s) & (
+        (g34s == 0) | (corners[arange(nelements), i34 % ncorners] == g34s))
+    iface = _get_face_lookup(element_type)[i1, i34]
+    is_valid &= iface >= 0
+    if not is_valid.all():
+        raise ValueError('case=%s PLOAD4 G1/G34 is not a face of the %s; eids=%s' % (
+            loadcase_id, element_type, eids[~is_valid][:10].tolist()))
+
+    # the corners of every element are needed to point the faces out of
+    # the element (e.g. for a negative volume element)
+    nids = unique(corners)
+    xyz = model._get_node_positions([model.nodes[nid] for nid in nids.tolist()])
+    element_centroids = xyz[searchsorted(nids, corners), :].mean(axis=1)
+
+    # the local corners of each face (padded with -1 to 4 corners)
+    solid_faces = SOLID_FACES[element_type]
+    local_nodes = array([face + (-1,) * (4 - len(face)) for face in solid_faces])
+    nnodes_face = (local_nodes >= 0).sum(axis=1)[iface]
+
+    faces = []
+    for nnodes, kernel_type, reverse in [(3, 'CTRIA3', [0, 2, 1]),
+                                         (4, 'CQUAD4', [0, 3, 2, 1])]:
+        irows = flatnonzero(nnodes_face == nnodes)
+        if not len(irows):
+            continue
+        face_nodes = corners[irows[:, None], local_nodes[iface[irows], :nnodes]]
+        unused_area, centroid, normal = shell_area_centroid_normal(
+            kernel_type, xyz, searchsorted(nids, face_nodes))
+        is_inward = einsum('ij,ij->i', normal, centroid - element_centroids[irows, :]) < 0.
+        face_nodes[is_inward, :] = face_nodes[is_inward, :][:, reverse]
+        faces.append((eids[irows], kernel_type, face_nodes, -scales[irows]))
+    return faces
@@ -0,0 +1,342 @@
+"""
+Defines a bulk data tokenizer, which is an alternative to the line/card
+generators in BDF (``_stream_line``, ``_stream_card``, ``_get_line``).
+
+The file is read in large chunks and the cards are assembled in a single
+loop, so there's no per-line generator overhead.  Small field cards
+(the common case) are split into fields with slices; large field, CSV
+and tab separated cards use ``to_fields``.
+"""
+from __future__ import (nested_scopes, generators, division, absolute_import,
+                        print_function, unicode_literals)
+import os
+import locale
+from six import PY2
+
+from pyNastran.bdf.utils import to_fields, get_include_filename, _clean_comment
+
+#: the number of characters read at a time
+CHUNK_SIZE = 4 * 1024 * 1024
+
+#: the first character of a continuation line
+CONTINUATION_CHARS = ' *+,\t'
+
+#: cards that are stored as lines instead of fields
+RAW_CARDS = set(['DEQATN'])
+
+#: the number of bytes in a card chunk for parallel reading
+PARALLEL_CHUNK_BYTES = 16 * 1024 * 1024
+
+
+def _stream_blocks(bdf_filename, nskip=0, chunk_size=CHUNK_SIZE):
+    """
+    Reads a file in chunks and yields lists of lines
+
+    :param bdf_filename: the file to read
+    :param nskip: the number of lines to skip (e.g. the case control deck)
+    :param chunk_size: the number of characters to read at a time
+    """
+    with open(bdf_filename, 'r') as bdf_file:
+        tail = ''
+        while True:
+            chunk = bdf_file.read(chunk_size)
+            if not chunk:
+                break
+            chunk = tail + chunk
+            iend = chunk.rfind('\n')
+            if iend == -1:
+                tail = chunk
+                continue
+            tail = chunk[iend + 1:]
+            lines = chunk[:iend].split('\n')
+            if nskip:
+                nlines = len(lines)
+                lines = lines[nskip:]
+                nskip = max(0, nskip - nlines)
+            yield lines
+        if tail and not nskip:
+            yield [tail]
+
+
+def _read_byte_range(bdf_filename, byte_range):
+    """
+    Reads the lines in a range of bytes of a file (see ``get_card_chunks``)
+
+    :param bdf_filename: the file to read
+    :param byte_range: the (start, end) byte offsets (end=None -> end of file)
+    """
+    n0, n1 = byte_range
+    with open(bdf_filename, 'rb') as bdf_file:
+        bdf_file.seek(n0)
+        data = bdf_file.read() if n1 is None else bdf_file.read(n1 - n0)
+    if not PY2:
+        data = data.decode(locale.getpreferredencoding(False))
+    data = data.replace('\r\n', '\n').replace('\r', '\n')
+    if data.endswith('\n'):
+        data = data[:-1]
+    if data:
+        yield data.split('\n')
+
+
+def _stream_cards(bdf_filename, nskip=0, chunk_size=CHUNK_SIZE, byte_range=None):
+    """
+    Yields the (card_lines, comment) of the cards in a single file.
+
+    A comment belongs to the card it's in or the card after it.  Blank
+    lines inside a card are kept (same as ``BDF._stream_card``).
+    """
+    lines = []
+    comments = []
+    blank_lines = []
+    blank_comments = []
+    if byte_range is None:
+        blocks = _stream_blocks(bdf_filename, nskip, chunk_size)
+    else:
+        blocks = _read_byte_range(bdf_filename, byte_range)
+    for block in blocks:
+        for line in block:
+            line = line.rstrip('\t\r\n ')
+            comment = ''
+            if '$' in line:
+                i = line.index('$')
+                comment = _clean_comment(line[i:] + '\n')
+                line = line[:i].rstrip('\t ')
+
+            if not line:
+                blank_lines.append(line)
+                if comment:
+                    blank_comments.append(comment)
+            elif line[0] in CONTINUATION_CHARS and lines:
+                if blank_lines:
+                    lines += blank_lines
+                    comments += blank_comments
+                    blank_lines = []
+                    blank_comments = []
+                lines.append(line)
+                if comment:
+                    comments.append(comment)
+            else:
+                if lines:
+                    yield lines, ''.join(comments)
+                lines = [line]
+                comments = blank_comments
+                if comment:
+                    comments.append(comment)
+                blank_lines = []
+                blank_comments = []
+    if lines:
+        yield lines, ''.join(comments)
+
+
+def get_card_name(line, bdf_filename=None):
+    """
+    Returns the name of the card defined by the first line of a card
+
+    :param line: the first line of the card
+    :param bdf_filename: the file the line came from (for the error message)
+    :returns card_name: the uppercased name of the card (None if blank)
+    """
+    card_name = line[:8].rstrip('\t, ').split(',')[0].split('\t')[0].strip('*\t ')
+    if len(card_name) == 0:
+        return None
+    if ' ' in card_name:
+        msg = 'card_name=%r\nline=%r in filename=%r is invalid' \
+              % (card_name, line, bdf_filename)
+        raise RuntimeError(msg)
+    return card_name.upper()
+
+
+def lines_to_fields(card_lines, card_name):
+    """
+    Splits the lines of a card into fields.  Equivalent to ``to_fields``,
+    but small field cards are sliced without any per-line checks.
+
+    :param card_lines: the lines of the card
+    :param card_name: the card_name -> 'GRID'
+    :returns fields: the stripped string fields of the card
+    """
+    text = '\n'.join(card_lines)
+    if '\t' in text or ',' in text or '*' in text or '=' in text:
+        return to_fields(list(card_lines), card_name)
+
+    line = card_lines[0]
+    fields = [line[0:8], line[8:16], line[16:24], line[24:32],
+              line[32:40], line[40:48], line[48:56], line[56:64],
+              line[64:72]]
+    for line in card_lines[1:]:
+        fields += [line[8:16], line[16:24], line[24:32],
+                   line[32:40], line[40:48], line[48:56],
+                   line[56:64], line[64:72]]
+    return [field.strip() for field in fields]
+
+
+def _is_card_start(line):
+    """is a (bytes) line the first line of a card; None for blank/comment lines"""
+    line = line.split(b'$')[0].rstrip(b'\t\r\n ')
+    if not line:
+        return None
+    return line[:1] not in (b' ', b'*', b'+', b',', b'\t')
+
+
+def get_card_chunks(bdf_filename, nskip=0, chunk_bytes=None):
+    """
+    Splits the cards of a file into byte ranges that can be tokenized
+    independently.  The ranges start at the first line of a card or at
+    the comments in front of it, so the comments stay with their card.
+
+    :param bdf_filename: the file to split
+    :param nskip: the number of lines to skip (e.g. the case control deck)
+    :param chunk_bytes: the approximate number of bytes in a chunk
+        (default=None -> PARALLEL_CHUNK_BYTES)
+    :returns byte_ranges: a list of (start, end) byte offsets
+        (end=None -> end of file)
+    """
+    if chunk_bytes is None:
+        chunk_bytes = PARALLEL_CHUNK_BYTES
+    nbytes = os.path.getsize(bdf_filename)
+    byte_ranges = []
+    with open(bdf_filename, 'rb') as bdf_file:
+        for unused_i in range(nskip):
+            bdf_file.readline()
+        n0 = bdf_file.tell()
+
+        while n0 + chunk_bytes < nbytes:
+            bdf_file.seek(n0 + chunk_bytes)
+            bdf_file.readline()  # the end of a partial line
+
+            n1 = None
+            nstart = None  # the start of the current blank/comment lines
+            is_first_line = True
+            while n1 is None:
+                n = bdf_file.tell()
+                line = bdf_file.readline()
+                if not line:
+                    break
+                is_card_start = _is_card_start(line)
+                if is_card_start is None:
+                    if nstart is None:
+                        nstart = -1 if is_first_line else n
+                elif is_card_start and not is_first_line and nstart != -1:
+                    n1 = n if nstart is None else nstart
+                else:
+                    nstart = None
+                is_first_line = False
+
+            if n1 is None:
+                break
+            byte_ranges.append((n0, n1))
+            n0 = n1
+    byte_ranges.append((n0, None))
+    return byte_ranges
+
+
+def tokenize_file(bdf_filename, include_dir='', nskip=0, cards_to_read=None,
+                  chunk_size=CHUNK_SIZE, byte_range=None):
+    """
+    Yields the cards in a single file.  INCLUDE files aren't opened.
+
+    :param bdf_filename: the file to read
+    :param include_dir: the directory the INCLUDE files are relative to
+    :param nskip: the number of lines to skip in bdf_filename
+        (e.g. the executive/case control decks)
+    :param cards_to_read: the cards that will be split into fields
+        (default=None -> all)
+    :param chunk_size: the number of characters to read at a time
+    :param byte_range: only read the cards in a (start, end) range of
+        bytes (see ``get_card_chunks``; default=None -> nskip is used)
+    :returns card_name: the name of the card (e.g. 'GRID')
+    :returns fields: the string fields of the card;
+        None for the cards that aren't in cards_to_read, RAW_CARDS and
+        ENDDATA; [filename] for an INCLUDE
+    :returns comment: the comment for the card
+    :returns card_lines: the lines of the card
+
+    Reading stops at ENDDATA.
+    """
+    # the first 8 characters of a card -> card_name
+    card_names = {}
+    for card_lines, comment in _stream_cards(bdf_filename, nskip, chunk_size, byte_range):
+        line8 = card_lines[0][:8]
+        try:
+            card_name = card_names[line8]
+        except KeyError:
+            card_name = get_card_name(line8, bdf_filename)
+            card_names[line8] = card_name
+        if card_name is None:
+            msg = 'line=%r in filename=%r does not have a card name' % (
+                card_lines[0], bdf_filename)
+            raise RuntimeError(msg)
+
+        if card_name == 'INCLUDE':
+            filename = get_include_filename(card_lines, include_dir=include_dir)
+            yield card_name, [filename], comment, card_lines
+            continue
+        elif 'ENDDATA' in card_name:
+            yield card_name, None, comment, card_lines
+            return
+
+        if card_name in RAW_CARDS or (cards_to_read is not None and
+                                      card_name not in cards_to_read):
+            fields = None
+        else:
+            fields = lines_to_fields(card_lines, card_name)
+        yield card_name, fields, comment, card_lines
+
+
+def check_include_filename(bdf_filename, active_filenames):
+    """
+    Checks that an INCLUDE file exists and isn't already being read
+
+    :param bdf_filename: the INCLUDE file
+    :param active_filenames: the files that are being read
+    """
+    if not os.path.exists(bdf_filename):
+        msg = 'No such bdf_filename: %r\n' % bdf_filename
+        msg += 'cwd: %r' % os.getcwd()
+        raise IOError(msg)
+    if bdf_filename in active_filenames:
+        msg = 'bdf_filename=%s is already active.\nactive_filenames=%s' \
+            % (bdf_filename, active_filenames)
+        raise RuntimeError(msg)
+
+
+def tokenize_bulk_data(bdf_filename, include_dir='', nskip=0, cards_to_read=None,
+                       chunk_size=CHUNK_SIZE):
+    """
+    Yields the cards in the bulk data deck of a file and its INCLUDE files
+
+    :param bdf_filename: the file to read
+    :param include_dir: the directory the INCLUDE files are relative to
+    :param nskip: the number of lines to skip in bdf_filename
+        (e.g. the executive/case control decks)
+    :param cards_to_read: the cards that will be split into fields
+        (default=None -> all)
+    :param chunk_size: the number of characters to read at a time
+    :returns card_name, fields, comment, card_lines: see ``tokenize_file``
+
+    The cards of an INCLUDE file are yielded right after the INCLUDE
+    card.  Reading stops at ENDDATA.
+    """
+    active_filenames = [bdf_filename]
+    card_streams = [tokenize_file(bdf_filename, include_dir, nskip, cards_to_read,
+                                  chunk_size)]
+    while card_streams:
+        try:
+            card = next(card_streams[-1])
+        except StopIteration:
+            card_streams.pop()
+            active_filenames.pop()
+            continue
+
+        card_name = card[0]
+        if card_name == 'INCLUDE':
+            filename = card[1][0]
+            check_include_filename(filename, active_filenames)
+            yield card
+            active_filenames.append(filename)
+            card_streams.append(tokenize_file(filename, include_dir, 0, cards_to_read,
+                                              chunk_size))
+            continue
+        yield card
+        if 'ENDDATA' in card_name:
+            return
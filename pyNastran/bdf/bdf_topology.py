@@ -0,0 +1,375 @@
+"""
+Defines a topology index for the elements of a BDF, which stores the
+node/element, edge/element and face/element connectivity as CSR arrays:
+
+    indptr:  (n + 1,) int array; the entries of row i are
+             values[indptr[i]:indptr[i + 1]]
+    values:  the ids of the rows
+
+The element ids are sorted, so row i of an element array is ``eids[i]``.
+
+The edges and faces are built from the corner nodes of the elements:
+
+    edges:  the unique edges of the 1D, 2D and 3D elements
+    faces:  the unique faces of the 2D and 3D elements; a shell element
+            is a face.  Triangular faces are padded with -1.
+
+Use ``BDF.get_topology()`` to get the cached index.
+"""
+from __future__ import (nested_scopes, generators, division, absolute_import,
+                        print_function, unicode_literals)
+from six import iteritems
+from numpy import (array, asarray, zeros, ones, full, arange, argsort, lexsort,
+                   searchsorted, bincount, cumsum, repeat, diff, unique, sort,
+                   concatenate)
+
+_TRI_EDGES = [(0, 1), (1, 2), (2, 0)]
+_QUAD_EDGES = [(0, 1), (1, 2), (2, 3), (3, 0)]
+_TETRA_EDGES = [(0, 1), (1, 2), (2, 0), (0, 3), (1, 3), (2, 3)]
+_PENTA_EDGES = [(0, 1), (1, 2), (2, 0), (3, 4), (4, 5), (5, 3), (0, 3), (1, 4), (2, 5)]
+_HEXA_EDGES = [(0, 1), (1, 2), (2, 3), (3, 0), (4, 5), (5, 6), (6, 7), (7, 4),
+               (0, 4), (1, 5), (2, 6), (3, 7)]
+
+_TETRA_FACES = [(0, 1, 2), (0, 1, 3), (1, 2, 3), (2, 0, 3)]
+_PENTA_FACES = [(0, 1, 2), (3, 4, 5), (0, 1, 4, 3), (1, 2, 5, 4), (2, 0, 3, 5)]
+_HEXA_FACES = [(0, 1, 2, 3), (4, 5, 6, 7), (0, 1, 5, 4), (1, 2, 6, 5),
+               (2, 3, 7, 6), (3, 0, 4, 7)]
+
+_LINE = (1, [0, 1], [(0, 1)], [])
+_TRI = (2, [0, 1, 2], _TRI_EDGES, [(0, 1, 2)])
+_QUAD = (2, [0, 1, 2, 3], _QUAD_EDGES, [(0, 1, 2, 3)])
+_TETRA = (3, [0, 1, 2, 3], _TETRA_EDGES, _TETRA_FACES)
+_PENTA = (3, [0, 1, 2, 3, 4, 5], _PENTA_EDGES, _PENTA_FACES)
+_HEXA = (3, [0, 1, 2, 3, 4, 5, 6, 7], _HEXA_EDGES, _HEXA_FACES)
+
+#: element type -> (dimension, the corner nodes in nodeIDs(),
+#: the edges and faces in terms of the corner nodes)
+ELEMENT_TOPOLOGY = {
+    'CROD' : _LINE, 'CONROD' : _LINE, 'CTUBE' : _LINE,
+    'CBAR' : _LINE, 'CBEAM' : _LINE, 'CBEND' : _LINE,
+    'CTRIA3' : _TRI, 'CTRIA6' : _TRI, 'CTRIAR' : _TRI, 'CTRIAX' : _TRI,
+    'CTRIAX6' : (2, [0, 2, 4], _TRI_EDGES, [(0, 1, 2)]),
+    'CQUAD4' : _QUAD, 'CQUAD8' : _QUAD, 'CQUADR' : _QUAD, 'CQUAD' : _QUAD,
+    'CQUADX' : _QUAD, 'CSHEAR' : _QUAD,
+    'CTETRA' : _TETRA, 'CPENTA' : _PENTA, 'CHEXA' : _HEXA,
+}
+
+
+def _get_csr(rows, values, nrows):
+    """
+    Gets the CSR arrays of a series of (row, value) pairs
+
+    :param rows: the row of each value
+    :param values: the values
+    :param nrows: the number of rows
+    :returns indptr, values: the values sorted by row (stable)
+    """
+    rows = asarray(rows, dtype='int64')
+    indptr = zeros(nrows + 1, dtype='int64')
+    indptr[1:] = cumsum(bincount(rows, minlength=nrows))
+    return indptr, asarray(values)[argsort(rows, kind='mergesort')]
+
+
+def _unique_rows(rows):
+    """
+    Finds the unique rows of a 2D array
+
+    :param rows: an (n, m) int array
+    :returns ifirst: the index of the first occurrence of each unique row
+                     (the unique rows are in sorted order)
+    :returns inverse: the unique row of each row
+    """
+    nrows = rows.shape[0]
+    if nrows == 0:
+        return zeros(0, dtype='int64'), zeros(0, dtype='int64')
+    order = lexsort(rows.T[::-1])
+    sorted_rows = rows[order]
+    is_new = ones(nrows, dtype='bool')
+    is_new[1:] = (sorted_rows[1:] != sorted_rows[:-1]).any(axis=1)
+    inverse = zeros(nrows, dtype='int64')
+    inverse[order] = cumsum(is_new) - 1
+    return order[is_new], inverse
+
+
+def _get_neighbors(indptr, ielements, nelements):
+    """
+    Gets the elements that share an entity (e.g. a node)
+
+    :param indptr, ielements: the entity -> element index CSR arrays
+    :param nelements: the number of elements
+    :returns indptr, ielements: the element -> element index CSR arrays
+    """
+    counts = diff(indptr)
+    ientity = repeat(arange(len(counts)), counts)
+
+    # every pair of elements of an entity
+    npairs = counts[ientity]
+    left = repeat(ielements, npairs)
+    start = repeat(indptr[:-1][ientity], npairs)
+    offset = arange(len(left)) - repeat(cumsum(npairs) - npairs, npairs)
+    right = ielements[start + offset]
+
+    is_pair = left != right
+    keys = unique(left[is_pair] * nelements + right[is_pair])
+    return _get_csr(keys // nelements, keys % nelements, nelements)
+
+
+class TopologyIndex(object):
+    """
+    The node/edge/face -> element connectivity of a model
+    (see the module docstring for the array layout)
+    """
+    def __init__(self, elements, nids=None):
+        """
+        :param elements: the element dictionary (eid -> element)
+        :param nids: the node ids of the model; the element nodes that
+            aren't in nids are left out of the node -> element arrays
+            (default=None -> the element nodes)
+        """
+        #: the sorted element ids
+        self.eids = array(sorted(elements), dtype='int64')
+        nelements = len(self.eids)
+
+        # the element nodes are grouped by (type, number of nodes), so
+        # they can be converted to arrays a group at a time
+        element_types = []
+        groups = {}
+        for ielement, eid in enumerate(self.eids.tolist()):
+            element = elements[eid]
+            element_type = element.type
+            element_types.append(element_type)
+            try:
+                nodes = element.nodeIDs()
+            except (AttributeError, NotImplementedError):
+                nodes = []
+            try:
+                group = groups[(element_type, len(nodes))]
+            except KeyError:
+                group = groups[(element_type, len(nodes))] = ([], [])
+            group[0].append(ielement)
+            group[1].append(nodes)
+        #: the element types (e.g. 'CQUAD4')
+        self.element_types = element_types
+
+        # the nodes of each element (0 for a blank node)
+        nnodes_max = max([key[1] for key in groups] + [0])
+        element_nodes = zeros((nelements, nnodes_max), dtype='int64')
+        for (element_type, nnodes), (ielements, nodes) in iteritems(groups):
+            if nnodes:
+                nodes = array(nodes)
+                if nodes.dtype == object:
+                    nodes[nodes == None] = 0  # pylint: disable=C0121
+                element_nodes[ielements, :nnodes] = nodes
+
+        is_node = element_nodes != 0
+        #: the element -> node CSR arrays (in nodeIDs() order; the blank
+        #: nodes are skipped)
+        self.element_node_indptr = zeros(nelements + 1, dtype='int64')
+        self.element_node_indptr[1:] = cumsum(is_node.sum(axis=1))
+        self.element_node_ids = element_nodes[is_node]
+
+        if nids is None:
+            nids = self.element_node_ids
+        #: the sorted node ids
+        self.nids = unique(asarray(list(nids), dtype='int64'))
+        ielements = repeat(arange(nelements), diff(self.element_node_indptr))
+        inodes = searchsorted(self.nids, self.element_node_ids)
+        is_node = inodes < len(self.nids)
+        is_node[is_node] = self.nids[inodes[is_node]] == self.element_node_ids[is_node]
+
+        #: the node -> element CSR arrays
+        self.node_element_indptr, self._node_ielements = _get_csr(
+            inodes[is_node], ielements[is_node], len(self.nids))
+        self.node_element_ids = self.eids[self._node_ielements]
+
+        self._build_edges_faces(groups, element_nodes)
+        self._neighbors = {}
+
+    def _build_edges_faces(self, groups, element_nodes):
+        """
+        Builds the edge/face -> element arrays
+
+        :param groups: (type, number of nodes) -> (the element indices, ...)
+        :param element_nodes: the (nelements, nnodes_max) nodeIDs() of each
+            element (0 for a blank node); the elements with a blank corner
+            are skipped
+        """
+        edge_rows = []
+        edge_ielements = []
+        edge_dims = []
+        face_rows = []
+        face_ielements = []
+        face_dims = []
+        corner_groups = {}
+
+        for (element_type, nnodes), (ielements, unused_nodes) in sorted(iteritems(groups)):
+            if element_type not in ELEMENT_TOPOLOGY:
+                continue
+            dim, icorners, edges, faces = ELEMENT_TOPOLOGY[element_type]
+            if nnodes <= max(icorners):
+                continue
+            ielements = array(ielements, dtype='int64')
+            corners = element_nodes[ielements][:, icorners]
+            is_valid = (corners != 0).all(axis=1)
+            ielements = ielements[is_valid]
+            corners = corners[is_valid]
+            corner_groups.setdefault(element_type, []).append((ielements, corners))
+
+            for edge in edges:
+                edge_rows.append(sort(corners[:, edge], axis=1))
+                edge_ielements.append(ielements)
+                edge_dims.append(full(len(ielements), dim, dtype='int64'))
+            for face in faces:
+                face_nodes = full((len(ielements), 4), -1, dtype='int64')
+                face_nodes[:, :len(face)] = corners[:, face]
+                face_rows.append(face_nodes)
+                face_ielements.append(ielements)
+                face_dims.append(full(len(ielements), dim, dtype='int64'))
+
+        # element type -> (the element indices, the corner nodes)
+        self._corners = {}
+        for element_type, corner_group in iteritems(corner_groups):
+            ielements = concatenate([group[0] for group in corner_group])
+            corners = concatenate([group[1] for group in corner_group])
+            isort = argsort(ielements, kind='mergesort')
+            self._corners[element_type] = (ielements[isort], corners[isort])
+
+        #: the (nedges, 2) unique edges (sorted node ids)
+        #: and the edge -> element CSR arrays
+        (self.edges, self.edge_element_indptr, self._edge_ielements,
+         self._edge_dims) = self._get_entities(edge_rows, edge_ielements, edge_dims, 2)
+        self.edge_element_ids = self.eids[self._edge_ielements]
+
+        if face_rows:
+            face_rows = concatenate(face_rows)
+            face_keys = sort(face_rows, axis=1)
+        else:
+            face_rows = face_keys = zeros((0, 4), dtype='int64')
+
+        #: the (nfaces, 4) unique faces (in the node order of the first
+        #: element that uses the face; -1 for a triangle)
+        #: and the face -> element CSR arrays
+        (unused_keys, self.face_element_indptr, self._face_ielements,
+         self._face_dims) = self._get_entities([face_keys], face_ielements, face_dims, 4)
+        ifirst = _unique_rows(face_keys)[0]
+        self.faces = face_rows[ifirst]
+        self.face_element_ids = self.eids[self._face_ielements]
+
+    def _get_entities(self, rows, ielements, dims, ncolumns):
+        """gets the unique rows (e.g. edges) and their element CSR arrays"""
+        if not ielements:
+            return (zeros((0, ncolumns), dtype='int64'), zeros(1, dtype='int64'),
+                    zeros(0, dtype='int64'), zeros(0, dtype='int64'))
+        rows = concatenate(rows)
+        ielements = concatenate(ielements)
+        dims = concatenate(dims)
+        ifirst, inverse = _unique_rows(rows)
+        indptr, order = _get_csr(inverse, arange(len(inverse)), len(ifirst))
+        return rows[ifirst], indptr, ielements[order], dims[order]
+
+    def get_element_ids(self, nid):
+        """
+        Gets the elements that use a node
+
+        :param nid: the node id
+        :returns eids: the sorted element ids
+        """
+        inode = searchsorted(self.nids, nid)
+        if inode == len(self.nids) or self.nids[inode] != nid:
+            raise KeyError('nid=%s is not in the topology' % nid)
+        i0, i1 = self.node_element_indptr[inode:inode + 2]
+        return self.node_element_ids[i0:i1]
+
+    def get_node_ids(self, eid):
+        """
+        Gets the nodes of an element (in nodeIDs() order, without the
+        blank nodes)
+
+        :param eid: the element id
+        """
+        ielement = searchsorted(self.eids, eid)
+        if ielement == len(self.eids) or self.eids[ielement] != eid:
+            raise KeyError('eid=%s is not in the topology' % eid)
+        i0, i1 = self.element_node_indptr[ielement:ielement + 2]
+        return self.element_node_ids[i0:i1]
+
+    def get_corner_nodes(self, element_type):
+        """
+        Gets the corner nodes of the elements of a type (e.g. the first
+        8 nodes of a CHEXA20); the elements with a blank corner are
+        skipped
+
+        :param element_type: the card type (e.g. 'CQUAD4', 'CHEXA')
+        :returns eids: the (n,) sorted element ids
+        :returns nids: the (n, ncorners) corner node ids
+        """
+        try:
+            ielements, corners = self._corners[element_type]
+        except KeyError:
+            if element_type not in ELEMENT_TOPOLOGY:
+                raise KeyError('element_type=%r is not supported' % element_type)
+            ncorners = len(ELEMENT_TOPOLOGY[element_type][1])
+            return zeros(0, dtype='int64'), zeros((0, ncorners), dtype='int64')
+        return self.eids[ielements], corners
+
+    def get_element_neighbors(self, mode='node'):
+        """
+        Gets the elements that share a node, edge or face with an element
+
+        :param mode: 'node', 'edge', 'face'
+        :returns indptr, eids: the element -> element CSR arrays (row i
+            is for self.eids[i]; an element isn't its own neighbor)
+        """
+        if mode not in self._neighbors:
+            if mode == 'node':
+                indptr, ielements = self.node_element_indptr, self._node_ielements
+            elif mode == 'edge':
+                indptr, ielements = self.edge_element_indptr, self._edge_ielements
+            elif mode == 'face':
+                indptr, ielements = self.face_element_indptr, self._face_ielements
+            else:
+                raise ValueError("mode=%r is not supported; use 'node', 'edge', 'face'" % mode)
+            indptr, ineighbors = _get_neighbors(indptr, ielements, len(self.eids))
+            self._neighbors[mode] = (indptr, self.eids[ineighbors])
+        return self._neighbors[mode]
+
+    def _count(self, indptr, dims, dim):
+        """the number of elements of a dimension that use each entity"""
+        nentities = len(indptr) - 1
+        irows = repeat(arange(nentities), diff(indptr))
+        return bincount(irows[dims == dim], minlength=nentities)
+
+    def get_free_edges(self):
+        """
+        Gets the edges that are used by a single shell element (the
+        boundary of a shell mesh)
+
+        :returns edges: (n, 2) node ids
+        """
+        return self.edges[self._count(self.edge_element_indptr, self._edge_dims, 2) == 1]
+
+    def get_shared_edges(self):
+        """
+        Gets the edges that are used by more than one element
+
+        :returns edges: (n, 2) node ids
+        """
+        return self.edges[diff(self.edge_element_indptr) > 1]
+
+    def get_free_faces(self):
+        """
+        Gets the faces that are used by a single solid element (the skin
+        of a solid mesh)
+
+        :returns faces: (n, 4) node ids (-1 for the 4th node of a triangle)
+        """
+        return self.faces[self._count(self.face_element_indptr, self._face_dims, 3) == 1]
+
+    def get_shared_faces(self):
+        """
+        Gets the faces that are used by more than one element (e.g. the
+        interior faces of a solid mesh or a shell on a solid)
+
+        :returns faces: (n, 4) node ids (-1 for the 4th node of a triangle)
+        """
+        return self.faces[diff(self.face_element_indptr) > 1]
@@ -14,7 +14,9 @@ from __future__ import (nested_scopes, generators, division, absolute_import,
 from math import sqrt, degrees, radians, atan2, acos, sin, cos
 from six.moves import zip, range
 
-from numpy import array, cross, dot, transpose, zeros, vstack, ndarray
+from numpy import (array, cross, dot, transpose, zeros, vstack, ndarray,
+                   radians as aradians, degrees as adegrees, sin as asin, cos as acos_,
+                   arctan2, arccos, sqrt as asqrt, column_stack, where, asarray)
 from numpy.linalg import norm
 
 from pyNastran.bdf.deprecated import CoordDeprecated
@@ -293,6 +295,73 @@ class Coord(BaseCard, CoordDeprecated):
             return p
         return self.transform_vector_to_global(p) + self.origin
 
+    def _check_resolved(self):
+        """makes sure the ijk axes have been set up"""
+        if not self.isResolved:
+            if isinstance(self.rid, int) and self.rid != 0:
+                raise RuntimeError("BDF has not been cross referenced.")
+            self.rid.setup()
+        if self.i is None:
+            msg = "Local unit vectors haven't been set.\nType=%r cid=%s rid=%s" % (
+                self.type, self.cid, self.rid)
+            raise RuntimeError(msg)
+
+    def transform_vectors_to_global(self, p):
+        """
+        Transforms a series of generalized vectors from the local frame
+        to the global frame (see transform_vector_to_global)
+
+        :param self: the coordinate system object
+        :param p:    the (n, 3) vectors in the local frame
+        :returns p3: the (n, 3) vectors in the global frame
+        """
+        p = asarray(p, dtype='float64')
+        if self.cid == 0:
+            return p
+        self._check_resolved()
+        p2 = self.coord_to_xyz_array(p)
+        return dot(p2, self.beta())
+
+    def transform_nodes_to_global(self, p):
+        """
+        Transforms a series of points from the local frame to the global
+        frame (see transform_node_to_global)
+
+        :param self: the coordinate system object
+        :param p:    the (n, 3) points in the local frame
+        :returns p3: the (n, 3) points in the global frame
+        """
+        p = asarray(p, dtype='float64')
+        if self.cid == 0:
+            return p
+        return self.transform_vectors_to_global(p) + self.origin
+
+    def transform_nodes_to_local(self, p):
+        """
+        Transforms a series of global points to the local frame
+        (see transform_node_to_local)
+
+        :param self: the coordinate system object
+        :param p:    the (n, 3) points in the global frame
+        :returns p3: the (n, 3) points in the local frame
+        """
+        p = asarray(p, dtype='float64')
+        if self.origin is None:
+            raise RuntimeError('Origin=%s; Cid=%s Rid=%s' % (self.origin, self.cid, self.Rid()))
+        return self.xyz_to_coord_array(dot(p - self.origin, transpose(self.beta())))
+
+    def transform_vectors_to_local(self, p):
+        """
+        Transforms a series of global vectors to the local frame
+        (see transform_vector_to_local)
+
+        :param self: the coordinate system object
+        :param p:    the (n, 3) vectors in the global frame
+        :returns p3: the (n, 3) vectors in the local frame
+        """
+        p = asarray(p, dtype='float64')
+        return self.xyz_to_coord_array(dot(p, transpose(self.beta())))
+
     def _transform_node_to_local(self, p, beta, debug=False):
         #betaT = hstack([self.i,self.j,self.k])  # verify
         #pGlobal = self.transform_node_to_global(p, debug=False)
@@ -637,6 +706,14 @@ class RectangularCoord(object):
         """
         return p
 
+    def coord_to_xyz_array(self, p):
+        """vectorized version of coordToXYZ for an (n, 3) array"""
+        return p
+
+    def xyz_to_coord_array(self, p):
+        """vectorized version of XYZtoCoord for an (n, 3) array"""
+        return p
+
 
 class CylindricalCoord(object):
     r"""
@@ -686,6 +763,20 @@ class CylindricalCoord(object):
         R = sqrt(x * x + y * y)
         return array([R, theta, z], dtype='float64')
 
+    def coord_to_xyz_array(self, p):
+        """vectorized version of coordToXYZ for an (n, 3) array"""
+        R = p[:, 0]
+        theta = aradians(p[:, 1])
+        return column_stack([R * acos_(theta), R * asin(theta), p[:, 2]])
+
+    def xyz_to_coord_array(self, p):
+        """vectorized version of XYZtoCoord for an (n, 3) array"""
+        x = p[:, 0]
+        y = p[:, 1]
+        theta = adegrees(arctan2(y, x))
+        R = asqrt(x * x + y * y)
+        return column_stack([R, theta, p[:, 2]])
+
 
 class SphericalCoord(object):
     r"""
@@ -734,6 +825,27 @@ class SphericalCoord(object):
         z = R * cos(theta)
         return array([x, y, z], dtype='float64')
 
+    def coord_to_xyz_array(self, p):
+        """vectorized version of coordToXYZ for an (n, 3) array"""
+        R = p[:, 0]
+        theta = aradians(p[:, 1])
+        phi = aradians(p[:, 2])
+        x = R * asin(theta) * acos_(phi)
+        y = R * asin(theta) * asin(phi)
+        z = R * acos_(theta)
+        return column_stack([x, y, z])
+
+    def xyz_to_coord_array(self, p):
+        """vectorized version of XYZtoCoord for an (n, 3) array"""
+        x = p[:, 0]
+        y = p[:, 1]
+        z = p[:, 2]
+        R = asqrt(x * x + y * y + z * z)
+        phi = adegrees(arctan2(y, x))
+        is_zero = R == 0.
+        theta = where(is_zero, 0., adegrees(arccos(z / where(is_zero, 1., R))))
+        return column_stack([R, theta, phi])
+
 
 class Cord2x(Coord):
     def __init__(self, card, data, comment):
@@ -2,11 +2,14 @@
 from __future__ import (nested_scopes, generators, division, absolute_import,
                         print_function, unicode_literals)
 from six.moves import zip, range
-from math import log, sin, cos, radians, atan2
+from math import log
 #from math import (sin,sinh,cos,cosh,tan,tanh,sqrt,atan,atan2,acosh,acos,asin,
 #                  asinh,atanh) #,atanh2   # going to be used by DEQATN
+from array import array
 
-from numpy import zeros  # average
+from numpy import (zeros, empty, arange, argsort, unique, concatenate, column_stack,
+                   repeat, radians, cos, sin, flatnonzero, cumsum, minimum, diff, append,
+                   array as np_array)
 from scipy.sparse import coo_matrix
 
 from pyNastran.bdf.deprecated import DeprecatedNastranMatrix
@@ -112,9 +115,67 @@ class DEQATN(BaseCard):  # needs work...
         return ''.join(list_fields)
 
 
+def _get_dof_index(GC):
+    """
+    Finds the unique (grid, component) pairs in the order they're first used
+
+    :param GC: the (n, 2) (grid, component) pairs
+    :returns dofs: the (ndofs, 2) unique (grid, component) pairs
+    :returns index: the (n,) index of each pair in dofs
+    """
+    n = len(GC)
+    if n == 0:
+        return GC, zeros(0, dtype='int32')
+
+    # the pairs come in runs (e.g. the GCj of a column), so only the first
+    # pair of each run is sorted
+    is_run = empty(n, dtype='bool')
+    is_run[0] = True
+    is_run[1:] = (GC[1:, :] != GC[:-1, :]).any(axis=1)
+    irun = flatnonzero(is_run)
+    if len(irun) < n:
+        (dofs, index) = _get_dof_index(GC[irun, :])
+        return dofs, repeat(index, diff(append(irun, n)))
+
+    key = (GC[:, 0].astype('int64') << 32) + GC[:, 1]
+    isort = key.argsort()
+    key_sorted = key[isort]
+    is_first = empty(n, dtype='bool')
+    is_first[0] = True
+    is_first[1:] = key_sorted[1:] != key_sorted[:-1]
+
+    # the first use of each pair is the smallest index of its group
+    ifirst = minimum.reduceat(isort, flatnonzero(is_first))
+    order = argsort(ifirst)
+    rank = empty(len(order), dtype='int32')
+    rank[order] = arange(len(order), dtype='int32')
+
+    index = empty(n, dtype='int32')
+    index[isort] = rank[cumsum(is_first) - 1]
+    return GC[ifirst[order], :], index
+
+
+def _get_last_terms(i, j, values, ncols):
+    """removes the terms that are defined again later"""
+    key = i.astype('int64') * ncols + j
+    ilast = len(key) - 1 - unique(key[::-1], return_index=True)[1]
+    return i[ilast], j[ilast], values[ilast]
+
+
 class NastranMatrix(BaseCard, DeprecatedNastranMatrix):
     """
     Base class for the DMIG, DMIJ, DMIJI, DMIK matrices
+
+    The terms are stored in arrays as the columns are read, so a matrix
+    with millions of terms doesn't have millions of tuples/floats:
+
+      - _GCi, _GCj: the (grid, component) of the row/column of each term;
+                    the pairs are flattened (G1, C1, G2, C2, ...)
+      - _A, _B:     the Ai/Bi fields of each term (real/imaginary or
+                    magnitude/phase if polar); _B is empty for a real matrix
+
+    GCi, GCj, Real and Complex are the lists of the terms; use get_terms
+    to get the terms as numpy arrays.
     """
     def __init__(self, card=None, data=None, comment=''):
         if comment:
@@ -141,11 +202,37 @@ class NastranMatrix(BaseCard, DeprecatedNastranMatrix):
         else:
             raise NotImplementedError(data)
 
-        self.GCj = []
-        self.GCi = []
-        self.Real = []
-        if self.is_complex():
-            self.Complex = []
+        self.is_complex()  # checks TIN
+        self._GCj = array(str('i'))
+        self._GCi = array(str('i'))
+        self._A = array(str('d'))
+        self._B = array(str('d'))
+
+    @property
+    def GCi(self):
+        """the (grid, component) of the row of each term"""
+        return list(zip(self._GCi[0::2], self._GCi[1::2]))
+
+    @property
+    def GCj(self):
+        """the (grid, component) of the column of each term"""
+        return list(zip(self._GCj[0::2], self._GCj[1::2]))
+
+    @property
+    def Real(self):
+        """the real part of each term"""
+        if self.is_complex() and self.is_polar():
+            return self.get_terms()[2].real.tolist()
+        return self._A.tolist()
+
+    @property
+    def Complex(self):
+        """the imaginary part of each term (complex matrices only)"""
+        if not self.is_complex():
+            raise AttributeError('Matrix %r is real and has no Complex terms' % self.name)
+        if self.is_polar():
+            return self.get_terms()[2].imag.tolist()
+        return self._B.tolist()
 
     def write_code_aster(self):
         """
@@ -187,68 +274,113 @@ class NastranMatrix(BaseCard, DeprecatedNastranMatrix):
         #assert nFields <= 8,'nFields=%s' % nFields
 
         #print("nloops   = ",nloops)
+        self._GCj.extend([Gj, Cj] * nloops)
+
+        # the polar terms are converted in get_terms
+        is_complex = self.is_complex()
+        if is_complex and self.is_polar():
+            (a_name, b_name) = ('ai', 'bi')
+        else:
+            (a_name, b_name) = ('real', 'complex')
+
         for i in range(nloops):
-            self.GCj.append((Gj, Cj))
+            n = 5 + 4 * i
+            Gi = integer(card, n, 'Gi')
+            Ci = integer(card, n + 1, 'Ci')
+            #Ci = components(card, n + 1, 'Ci')
+            #assert isinstance(Cj, int), 'type(Ci)=%s not int; Ci=%s' % (type(Ci), Ci)
+            self._GCi.extend((Gi, Ci))
+            self._A.append(double(card, n + 2, a_name))
+            if is_complex:
+                self._B.append(double(card, n + 3, b_name))
+            #print("GC=%s,%s real=%s" % (Gi, Ci, reali))
+
+        msg = '(len(GCj)=%s len(GCi)=%s' % (len(self._GCj) // 2, len(self._GCi) // 2)
+        assert len(self._GCj) == len(self._GCi), msg
+
+    def get_terms(self):
+        """
+        Gets the terms of the matrix as arrays
 
-        if self.is_complex():
-            if self.is_polar():
-                for i in range(nloops):
-                    n = 5 + 4 * i
-                    Gi = integer(card, n, 'Gi')
-                    Ci = integer(card, n + 1, 'Ci')
-                    #Ci = components(card, n + 1, 'Ci')
-                    #assert isinstance(Cj, int), 'type(Ci)=%s not int; Ci=%s' % (type(Ci), Ci)
-                    self.GCi.append((Gi, Ci))
-                    magi = double(card, n + 2, 'ai')
-                    phasei = double(card, n + 3, 'bi')
-                    reali = magi*cos(radians(phasei))
-                    complexi = magi*sin(radians(phasei))
-                    self.Real.append(reali)
-                    self.Complex.append(complexi)
-            else:
-                for i in range(nloops):
-                    n = 5 + 4 * i
-                    Gi = integer(card, n, 'Gi')
-                    Ci = integer(card, n + 1, 'Ci')
-                    #Ci = components(card, n + 1, 'Ci')
-                    #assert isinstance(Cj, int), 'type(Ci)=%s not int; Ci=%s' % (type(Ci), Ci)
-                    self.GCi.append((Gi, Ci))
-                    reali = double(card, n + 2, 'real')
-                    complexi = double(card, n + 3, 'complex')
-                    self.Real.append(reali)
-                    self.Complex.append(complexi)
+        :returns GCi: the (nterms, 2) (grid, component) of the row of each term
+        :returns GCj: the (nterms, 2) (grid, component) of the column of each term
+        :returns values: the (nterms, ) float64/complex128 value of each term;
+                         the polar terms (magnitude, phase in degrees) are
+                         converted to real/imaginary
+        """
+        GCi = np_array(self._GCi, dtype='int32').reshape(-1, 2)
+        GCj = np_array(self._GCj, dtype='int32').reshape(-1, 2)
+        A = np_array(self._A, dtype='float64')
+        if not self.is_complex():
+            return GCi, GCj, A
+
+        B = np_array(self._B, dtype='float64')
+        values = empty(len(A), dtype='complex128')
+        if self.is_polar():
+            phase = radians(B)
+            values.real = A * cos(phase)
+            values.imag = A * sin(phase)
         else:
-            for i in range(nloops):
-                n = 5 + 4 * i
-                Gi = integer(card, n, 'Gi')
-                Ci = integer(card, n + 1, 'Ci')
-                #Ci = components(card, n + 1, 'Ci')
-                reali = double(card, n + 2, 'real')
-                self.GCi.append((Gi, Ci))
-                self.Real.append(reali)
-                #print("GC=%s,%s real=%s" % (Gi, Ci, reali))
-
-        msg = '(len(GCj)=%s len(GCi)=%s' % (len(self.GCj), len(self.GCi))
-        assert len(self.GCj) == len(self.GCi), msg
-        #if self.is_complex():
-            #self.Complex(double(card, v, 'complex')
+            values.real = A
+            values.imag = B
+        return GCi, GCj, values
 
     def get_matrix(self, is_sparse=False, apply_symmetry=True):
         """
         Builds the Matrix
 
         :param self:     the object pointer
-        :param is_sparse: should the matrix be returned as a sparse matrix (default=True).
-                          Slower for dense matrices.
+        :param is_sparse: should the matrix be returned as a scipy.sparse
+                          CSR matrix (default=False)
         :param apply_symmetry: If the matrix is symmetric (ifo=6), returns a symmetric matrix.
                                Supported as there are symmetric matrix routines.
 
         :returns M:    the matrix
         :returns rows: dictionary of keys=rowID,    values=(Grid,Component) for the matrix
         :returns cols: dictionary of keys=columnID, values=(Grid,Component) for the matrix
-        .. warning:: isSparse WILL fail
+
+        The rows/columns are the GCi/GCj in the order they're first used.
+        If the symmetry is applied, the rows and columns are the same (the
+        GCi followed by the unused GCj), so M[j, i] = M[i, j].  If a term
+        is defined more than once, the last definition is used.
         """
-        return get_matrix(self, is_sparse=is_sparse, apply_symmetry=apply_symmetry)
+        GCi, GCj, values = self.get_terms()
+        nterms = len(values)
+        if self.ifo == 6 and apply_symmetry:  # symmetric
+            (row_dofs, index) = _get_dof_index(concatenate([GCi, GCj]))
+            col_dofs = row_dofs
+            i = index[:nterms]
+            j = index[nterms:]
+
+            # M[i, j] then M[j, i] (off the diagonal) for each term
+            is_used = empty(2 * nterms, dtype='bool')
+            is_used[0::2] = True
+            is_used[1::2] = i != j
+            (i, j) = (column_stack([i, j]).ravel()[is_used],
+                      column_stack([j, i]).ravel()[is_used])
+            values = repeat(values, 2)[is_used]
+        else:
+            (row_dofs, i) = _get_dof_index(GCi)
+            (col_dofs, j) = _get_dof_index(GCj)
+        nrows = len(row_dofs)
+        ncols = len(col_dofs)
+
+        # the dense and sparse matrices are float64/complex128 for any TIN
+        dtype = values.dtype
+        if is_sparse:
+            M = coo_matrix((values, (i, j)), shape=(nrows, ncols), dtype=dtype).tocsr()
+            if M.nnz != len(values):
+                # the duplicate terms were summed
+                (i, j, values) = _get_last_terms(i, j, values, ncols)
+                M = coo_matrix((values, (i, j)), shape=(nrows, ncols), dtype=dtype).tocsr()
+        else:
+            (i, j, values) = _get_last_terms(i, j, values, ncols)
+            M = zeros((nrows, ncols), dtype=dtype)
+            M[i, j] = values
+
+        rowsReversed = dict(enumerate(zip(row_dofs[:, 0].tolist(), row_dofs[:, 1].tolist())))
+        colsReversed = dict(enumerate(zip(col_dofs[:, 0].tolist(), col_dofs[:, 1].tolist())))
+        return (M, rowsReversed, colsReversed)
 
     def rename(self, new_name):
         self.name = new_name
@@ -306,34 +438,7 @@ class NastranMatrix(BaseCard, DeprecatedNastranMatrix):
         """
         .. todo:: support double precision
         """
-        msg = '\n$' + '-' * 80
-        msg += '\n$ %s Matrix %s\n' % (self.type, self.name)
-        list_fields = [self.type, self.name, 0, self.ifo, self.tin,
-                  self.tout, self.polar, None, self.ncol]
-        msg += print_card(list_fields)
-
-        if self.is_complex():
-            if self.is_polar():
-                for (GCi, GCj, reali, imagi) in zip(self.GCi, self.GCj, self.Real, self.Complex):
-                    magi = sqrt(reali**2 + complexi**2)
-                    if reali == 0.0:
-                        phasei = 0.0
-                    else:
-                        phasei = degrees(atan2(complexi, reali))
-                    list_fields = [self.type, self.name, GCj[0], GCj[1],
-                              None, GCi[0], GCi[1], magi, phasei]
-                    msg += print_card(list_fields)
-            else:
-                for (GCi, GCj, reali, imagi) in zip(self.GCi, self.GCj, self.Real, self.Complex):
-                    list_fields = [self.type, self.name, GCj[0], GCj[1],
-                              None, GCi[0], GCi[1], reali, imagi]
-                    msg += print_card(list_fields)
-        else:
-            for (GCi, GCj, reali) in zip(self.GCi, self.GCj, self.Real):
-                list_fields = [self.type, self.name, GCj[0], GCj[1],
-                          None, GCi[0], GCi[1], reali, None]
-                msg += print_card(list_fields)
-        return msg
+        return self.write_bdf(8, None)
 
     def write_bdf(self, size, card_writer):
         """
@@ -345,27 +450,17 @@ class NastranMatrix(BaseCard, DeprecatedNastranMatrix):
                   self.tout, self.polar, None, self.ncol]
         msg += print_card(list_fields)
 
+        # the Ai/Bi fields are written as they were read (e.g. polar)
+        GCi = self._GCi
+        GCj = self._GCj
         if self.is_complex():
-            if self.is_polar():
-                for (GCi, GCj, reali, imagi) in zip(self.GCi, self.GCj, self.Real, self.Complex):
-                    magi = sqrt(reali**2 + complexi**2)
-                    if reali == 0.0:
-                        phasei = 0.0
-                    else:
-                        phasei = degrees(atan2(complexi, reali))
-                    list_fields = [self.type, self.name, GCj[0], GCj[1],
-                              None, GCi[0], GCi[1], magi, phasei]
-                    msg += print_card(list_fields)
-            else:
-                for (GCi, GCj, reali, imagi) in zip(self.GCi, self.GCj, self.Real, self.Complex):
-                    list_fields = [self.type, self.name, GCj[0], GCj[1],
-                              None, GCi[0], GCi[1], reali, imagi]
-                    msg += print_card(list_fields)
+            B = self._B
         else:
-            for (GCi, GCj, reali) in zip(self.GCi, self.GCj, self.Real):
-                list_fields = [self.type, self.name, GCj[0], GCj[1],
-                          None, GCi[0], GCi[1], reali, None]
-                msg += print_card(list_fields)
+            B = [None] * len(self._A)
+        for (k, (ai, bi)) in enumerate(zip(self._A, B)):
+            list_fields = [self.type, self.name, GCj[2 * k], GCj[2 * k + 1],
+                           None, GCi[2 * k], GCi[2 * k + 1], ai, bi]
+            msg += print_card(list_fields)
         return msg
 
 
@@ -584,6 +679,10 @@ class DMIK(NastranMatrix):
 class DMI(NastranMatrix):
     type = 'DMI'
 
+    #: the DMI terms are lists of the row/column indices and values
+    #: (see _read_real), not the arrays of NastranMatrix
+    GCi = GCj = Real = Complex = None
+
     def __init__(self, card=None, data=None, comment=''):
         if comment:
             self._comment = comment
@@ -693,6 +792,12 @@ class DMI(NastranMatrix):
     #             else:
     #                 asdf
 
+    def get_matrix(self, is_sparse=False, apply_symmetry=True):
+        """
+        Builds the Matrix (see get_matrix)
+        """
+        return get_matrix(self, is_sparse=is_sparse, apply_symmetry=apply_symmetry)
+
     def rename(self, newName):
         self.name = newName
 
@@ -2080,6 +2080,10 @@ class CQUAD8(QuadShell):
         centroid = (c1 * area1 + c2 * area2) / area
         return(area, centroid)
 
+    def Centroid(self):
+        (area, centroid) = self.AreaCentroid()
+        return centroid
+
     def Area(self):
         r"""
         \f[ A = \frac{1}{2} \lvert (n_1-n_3) \times (n_2-n_4) \rvert \f]
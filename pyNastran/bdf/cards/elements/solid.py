@@ -631,7 +631,7 @@ class CPENTA15(SolidElement):
          n11, n12, n13, n14, n15) = self.nodePositions()
         c1 = (n1 + n2 + n3) / 3.
         c2 = (n4 + n5 + n6) / 3.
-        c = (c1 - c2) / 2.
+        c = (c1 + c2) / 2.
         return c
 
     def Volume(self):
@@ -304,6 +304,7 @@ class TestCoords(unittest.TestCase):
             a = array([30.,40.,50.])
             b = model.Node(nid).Position()
             self.assertTrue(allclose(array([30.,40.,50.]), model.Node(nid).Position()), str(a-b))
+        self._check_batched_transforms(model)
 
     def test_cord2_rcs_02(self):
         """
@@ -341,6 +342,7 @@ class TestCoords(unittest.TestCase):
             a = array([30.,40.,50.])
             b = model.Node(nid).Position()
             self.assertTrue(allclose(array([30.,40.,50.]), model.Node(nid).Position()), str(a-b))
+        self._check_batched_transforms(model)
 
     def test_cord2_rcs_03(self):
         """
@@ -378,6 +380,7 @@ class TestCoords(unittest.TestCase):
             a = array([30.,40.,50.])
             b = model.Node(nid).Position()
             self.assertTrue(allclose(array([30.,40.,50.]), model.Node(nid).Position()), str(a-b))
+        self._check_batched_transforms(model)
 
     def test_cord1c_01(self):
         lines = ['cord1c,2,1,4,3']
@@ -464,6 +467,26 @@ class TestCoords(unittest.TestCase):
             assert allclose(n, pos), msg
 
 
+    def _check_batched_transforms(self, model):
+        """the array transforms match the 1 point at a time transforms"""
+        nids, xyz = model.get_xyz_in_global()
+        for nid, xyzi in zip(nids, xyz):
+            self.assertTrue(allclose(model.Node(nid).Position(), xyzi), str(xyzi))
+
+        nodes = [model.nodes[nid] for nid in nids]
+        xyz_local = array([node.xyz for node in nodes])
+        cps = [node.Cp() for node in nodes]
+        self.assertTrue(allclose(model.transform_xyz_to_global(xyz_local, cps), xyz))
+
+        vectors = array([[1., 2., 3.]] * len(nodes))
+        vectors_global = model.transform_vectors_to_global(vectors, cps)
+        for node, vector in zip(nodes, vectors_global):
+            self.assertTrue(allclose(node.cp.transform_vector_to_global(vectors[0]), vector))
+
+        for node, xyzi in zip(nodes, xyz):
+            xyz_locali = node.cp.transform_nodes_to_local(xyzi.reshape(1, 3))
+            self.assertTrue(allclose(node.cp.transform_node_to_local(xyzi), xyz_locali[0]))
+
     def test_A(self):
         cid0 = CORD2R()
         Lx = 2.
@@ -128,6 +128,49 @@ class TestDMIG(unittest.TestCase):
         card.write_bdf(size, 'dummy')
         #card.rawFields()
 
+    def test_dmig_sparse(self):
+        """the sparse matrix is the dense matrix in CSR format"""
+        model = BDF(debug=False)
+        bdf_name = os.path.join(test_path, 'dmig.bdf')
+        model.read_bdf(bdf_name, xref=False, punch=True)
+        for name in ['REALS', 'REAL', 'IMAG', 'IMAGS', 'POLE']:
+            dmig = model.dmigs[name]
+            A, rows, cols = dmig.get_matrix(is_sparse=False)
+            B, rows2, cols2 = dmig.get_matrix(is_sparse=True)
+            self.assertEqual(B.format, 'csr', name)
+            self.assertEqual(A.dtype, B.dtype, name)
+            self.assertTrue(array_equal(A, B.toarray()), name)
+            self.assertEqual(rows, rows2)
+            self.assertEqual(cols, cols2)
+
+        # single precision matrices are double precision too
+        for tin, dtype, (b1, b2) in [(1, 'float64', (None, None)),
+                                     (3, 'complex128', (2.0, 4.0))]:
+            card = DMIG(BDFCard(['DMIG', 'SINGLE', 0, 6, tin, 0, None, None, 2]))
+            card._add_column(BDFCard(['DMIG', 'SINGLE', 1, 1, None,
+                                      1, 1, 1.0, b1,
+                                      2, 1, 3.0, b2]))
+            A = card.get_matrix(is_sparse=False)[0]
+            B = card.get_matrix(is_sparse=True)[0]
+            self.assertEqual(A.dtype, dtype)
+            self.assertEqual(B.dtype, dtype)
+            self.assertTrue(array_equal(A, B.toarray()))
+            self.assertTrue(array_equal(A, A.T))
+
+        # a repeated term uses the last value
+        card = DMIG(BDFCard(['DMIG', 'DUP', 0, 2, 1, 0]))
+        card._add_column(BDFCard(['DMIG', 'DUP', 1, 1, None,
+                                  1, 1, 1.0, None,
+                                  2, 1, 2.0, None,
+                                  1, 1, 3.0]))
+        for is_sparse in [False, True]:
+            A, rows, cols = card.get_matrix(is_sparse=is_sparse)
+            if is_sparse:
+                A = A.toarray()
+            self.assertEqual(A.tolist(), [[3.0], [2.0]])
+            self.assertEqual(rows, {0: (1, 1), 1: (2, 1)})
+            self.assertEqual(cols, {0: (1, 1)})
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
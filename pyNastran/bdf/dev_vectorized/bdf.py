@@ -1430,7 +1430,7 @@ class BDF(BDFMethods, GetMethods, AddCard, WriteMesh, XRefMesh):
         icard = 1
         while self.active_filename: # or self._stored_lines:
             try:
-                (lines, comment) = self._card_streams[self._ifile].next()
+                (lines, comment) = next(self._card_streams[self._ifile])
             except StopIteration:
                 self._close_file()
                 continue
@@ -1509,7 +1509,7 @@ class BDF(BDFMethods, GetMethods, AddCard, WriteMesh, XRefMesh):
         Gets the next line in the BDF from the current or sub-BDF
         """
         try:
-            return self._line_streams[self._ifile].next()
+            return next(self._line_streams[self._ifile])
         except StopIteration:
             self._close_file()
             return self._get_line()
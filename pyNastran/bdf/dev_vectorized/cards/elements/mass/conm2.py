@@ -93,6 +93,52 @@ class CONM2(VectorizedCard):
         else:
             return mass
 
+    def get_mass_matrix(self, i, model, positions, index0s):
+        """
+        Gets the 6x6 mass matrix about the node, including the offset
+        of the mass and the inertias
+
+        ::
+
+          [ m     0     0     0       m*x3    -m*x2  ]
+          [ 0     m     0    -m*x3    0        m*x1  ]
+          [ 0     0     m     m*x2   -m*x1     0     ]
+          [ 0    -m*x3  m*x2  I11    -I21     -I31   ]
+          [ m*x3  0    -m*x1 -I21     I22     -I32   ]
+          [-m*x2  m*x1  0    -I31    -I32      I33   ]
+
+        where I11, I22, ... include the m*r^2 terms from the offset
+        """
+        eid = self.element_id[i]
+        coord_id = self.coord_id[i]
+        assert coord_id == 0, 'CONM2 doesnt support coord_id != 0 for element %i; coord_id=%s' % (eid, coord_id)
+        nid = self.node_id[i]
+        m = self.mass[i]
+        x1, x2, x3 = self.x[i, :]
+        I11, I21, I22, I31, I32, I33 = self.I[i, :]
+
+        M = zeros((6, 6), 'float64')
+        M[0, 0] = M[1, 1] = M[2, 2] = m
+        M[0, 4] = M[4, 0] = m * x3
+        M[0, 5] = M[5, 0] = -m * x2
+        M[1, 3] = M[3, 1] = -m * x3
+        M[1, 5] = M[5, 1] = m * x1
+        M[2, 3] = M[3, 2] = m * x2
+        M[2, 4] = M[4, 2] = -m * x1
+
+        M[3, 3] = I11 + m * (x2 * x2 + x3 * x3)
+        M[4, 4] = I22 + m * (x1 * x1 + x3 * x3)
+        M[5, 5] = I33 + m * (x1 * x1 + x2 * x2)
+        M[3, 4] = M[4, 3] = -I21 - m * x1 * x2
+        M[3, 5] = M[5, 3] = -I31 - m * x1 * x3
+        M[4, 5] = M[5, 4] = -I32 - m * x2 * x3
+
+        i0 = index0s[nid]
+        dofs = arange(i0, i0 + 6)
+        nijv = [(nid, 1), (nid, 2), (nid, 3),
+                (nid, 4), (nid, 5), (nid, 6)]
+        return(M, dofs, nijv)
+
     def get_stats(self):
         msg = []
         if self.n:
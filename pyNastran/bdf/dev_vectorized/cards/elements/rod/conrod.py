@@ -1,6 +1,6 @@
 from six.moves import zip, range
 
-from numpy import arange, zeros, unique, asarray, dot, searchsorted, array, transpose
+from numpy import arange, zeros, unique, asarray, dot, searchsorted, array, transpose, kron, eye
 from numpy.linalg import norm
 
 from pyNastran.bdf.fieldWriter import print_card_8
@@ -264,8 +264,8 @@ class CONROD(RodElement):
         m = array([[2., 1.],
                    [1., 2.]])  # 1D rod
 
-        Lambda = _Lambda(v1, debug=False)
-        M = dot(dot(transpose(Lambda), m), Lambda)
+        # the rod mass acts in all 3 translational directions
+        M = mi * kron(m, eye(3))
 
         Mi, Mj = M.shape
         dofs = array([
@@ -290,8 +290,8 @@ class CONROD(RodElement):
         #print(mat)
         #print(mat.material_id[se])
         mat = self.model.materials.mat1[self.material_id[i]]
-        E = mat.E()
-        G = mat.G()
+        E = mat.E[0]
+        G = mat.G[0]
         #G = self.G()
         J = self.J[i]
         #J = self.J()
@@ -414,7 +414,7 @@ class CONROD(RodElement):
             p1 = positions[n1]
             p2 = positions[n2]
 
-            v1 = p1 - p2
+            v1 = p2 - p1
             L = norm(p1 - p2)
             if L == 0.0:
                 msg = 'invalid CONROD length=0.0\n%s' % (self.__repr__())
@@ -423,8 +423,8 @@ class CONROD(RodElement):
             A = self.get_area_from_index(i)
 
             mat = self.model.materials.mat1[self.material_id[i]]
-            E = mat.E()
-            G = mat.G()
+            E = mat.E[0]
+            G = mat.G[0]
             #mat = self.get_material_from_index(i)
             #jmat = searchsorted(mat.material_id, self.material_id[i])
 
@@ -1,5 +1,5 @@
 from six.moves import zip, range
-from numpy import array, dot, arange, zeros, unique, searchsorted, transpose, asarray, int64
+from numpy import array, dot, arange, zeros, unique, searchsorted, transpose, asarray, int64, kron, eye
 from numpy.linalg import norm
 
 from pyNastran.bdf.dev_vectorized.cards.elements.rod.conrod import _Lambda
@@ -178,8 +178,8 @@ class CROD(RodElement):
         m = array([[2., 1.],
                    [1., 2.]])  # 1D rod
 
-        Lambda = _Lambda(v1, debug=False)
-        M = dot(dot(transpose(Lambda), m), Lambda)
+        # the rod mass acts in all 3 translational directions
+        M = mi * kron(m, eye(3))
 
         Mi, Mj = M.shape
         dofs = array([
@@ -358,7 +358,7 @@ class CROD(RodElement):
             p1 = positions[n1]
             p2 = positions[n2]
 
-            v1 = p1 - p2
+            v1 = p2 - p1
             L = norm(p1 - p2)
             if L == 0.0:
                 msg = 'invalid CROD length=0.0\n%s' % (self.__repr__())
@@ -101,6 +101,9 @@ class VectorizedCardDict(object):
         for key, value in iteritems(self._objs):
             yield key, value
 
+    def items(self):
+        return self._objs.items()
+
     def __repr__(self):
         f = StringIO()
         f.write('<%s object> n=%s\n' % (self.type, self.n))
@@ -114,7 +117,7 @@ class LOADs(VectorizedCardDict):
         self._objs = defaultdict(list)
 
     def get_load_ids(self):
-        return array(self._objs.keys(), dtype='int32')
+        return array(list(self._objs.keys()), dtype='int32')
 
     def slice_by_load_id(self, load_id):
         return
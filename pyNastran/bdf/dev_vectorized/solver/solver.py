@@ -1,24 +1,27 @@
 # -*- coding: utf-8 -*-
 # pylint: disable=E0602,C0103
 from __future__ import print_function
-from six import iteritems
+from six import iteritems, PY2
 from six.moves import range
 import os
 import sys
 from datetime import date
 from six.moves import zip
-from struct import pack
+from struct import pack, Struct
 
 # 3rd party
 from numpy import (array, zeros, ones, radians, cos, sin, dot, vstack, hstack,
                    eye, searchsorted, array_equal, ndarray, diag, fill_diagonal, argsort,
-                   nan, nan_to_num)
-from numpy.linalg import solve, norm, eigh, eig
+                   nan, nan_to_num, isfinite, arange, sqrt, pi)
+from numpy.linalg import solve, norm, eigh, eig, LinAlgError
 
-from scipy.sparse import dok_matrix, coo_matrix
+from scipy.sparse import issparse
+from scipy.sparse.linalg import spsolve
 
 # pyNastran
-from pyNastran.bdf.dev_vectorized.solver.utils import triple, reverse_dict, partition_dense_symmetric, partition_dense_vector, remove_dofs
+from pyNastran.bdf.dev_vectorized.solver.utils import (
+    triple, reverse_dict, partition_sparse_symmetric, partition_dense_vector, remove_dofs,
+    element_triplets, assemble_sparse, solve_real_eigenvalues)
 from pyNastran.f06.f06Writer import sorted_bulk_data_header
 from pyNastran.utils.dev import list_print
 from pyNastran.utils.mathematics import print_matrix, print_annotated_matrix
@@ -29,6 +32,8 @@ from pyNastran.utils.log import get_logger
 
 # Tables
 from pyNastran.op2.tables.oug.oug_displacements import RealDisplacement
+from pyNastran.op2.tables.oug.oug_eigenvectors import Eigenvector
+from pyNastran.op2.tables.lama_eigenvalues.lama_objects import RealEigenvalues
 #from pyNastran.op2.tables.oqg_constraintForces.oqg_spcForces import SPCForcesObject
 #from pyNastran.op2.tables.oqg_constraintForces.oqg_mpcForces import MPCForcesObject
 from pyNastran.f06.tables.oload_resultant import OLOAD_Resultant
@@ -152,7 +157,7 @@ class Solver(F06, OP2):
     """
     def __init__(self, fargs, log=None):
         F06.__init_data__(self)
-        OP2.__init__(self, make_geom=False, debug=False, log=None, debug_file=None)
+        OP2.__init__(self, debug=False, log=None, debug_file=None)
         debug = True
         self.log = get_logger(log, 'debug' if debug else 'info')
 
@@ -166,6 +171,10 @@ class Solver(F06, OP2):
         # normalization of mass matrix
         self.mnorm = fargs['--m']
 
+        #: logs the element/global matrices and vectors; the matrices are
+        #: converted to dense, so this is only for small models
+        self.log_matrices = False
+
         self.iSubcases = []
         self.nU = 0
         self.nUs = 0
@@ -245,25 +254,32 @@ class Solver(F06, OP2):
         self.case_result_flags = {}
 
     def _solve(self, K, F, dofs):  # can be overwritten
-        r"""solves \f$ [K]{x} = {F}\f$ for \f${x}\f$"""
-        self.log.info("--------------")
-        self.log.info("Kaa_norm / %s = \n" % self.knorm + list_print(K / self.knorm))
-        self.log.info("--------------")
-        self.log.info("Fa/%g = %s" % (self.fnorm, F / self.fnorm))
+        r"""
+        solves \f$ [K]{x} = {F}\f$ for \f${x}\f$
+
+        :param K: the (n, n) dense or sparse stiffness matrix
+        :param F: the (n,) load vector
+        :param dofs: the (n,) global DOFs of K/F
+        """
+        if self.log_matrices:
+            Kdense = K.toarray() if issparse(K) else K
+            self.log.info("--------------")
+            self.log.info("Kaa_norm / %s = \n" % self.knorm + list_print(Kdense / self.knorm))
+            self.log.info("--------------")
+            self.log.info("Fa/%g = %s" % (self.fnorm, F / self.fnorm))
         if F[0] == 0.0:
             assert max(F) != min(F), 'no load is applied...'
-        self.log.info("--------------")
 
         try:
-            U = solve(K, F)
+            U = self._solve_linear(K, F)
         except:
             failed = []
             faileds = []
+            Kdiag = K.diagonal()
             for i, iu in enumerate(dofs):
-                absF = abs(F)
                 nid, dof = self.IDtoNidComponents[iu]
                 #if absF[iu] == 0.0 and ??:
-                if K[i, i] == 0.0:
+                if Kdiag[i] == 0.0:
                     failed.append([nid, dof])
                     faileds.append(i)
             msg = self.make_grid_point_singularity_table(failed)
@@ -284,7 +300,7 @@ class Solver(F06, OP2):
                     # remove the DOFs and solve
                     K2 = K[ilist, :][:, ilist]
                     F2 = F[ilist]
-                    U2 = solve(K2, F2)
+                    U2 = self._solve_linear(K2, F2)
 
                     # put the removed DOFs back in and set their displacement to 0.0
                     U = zeros(len(F), 'float64')
@@ -295,6 +311,20 @@ class Solver(F06, OP2):
 
         return U
 
+    def _solve_linear(self, K, F):
+        """
+        Solves a dense or sparse system; a singular sparse matrix raises
+        a LinAlgError like the dense solver
+        """
+        if not issparse(K):
+            return solve(K, F)
+        if (K.diagonal() == 0.0).any():
+            raise LinAlgError('Singular matrix')
+        U = spsolve(K.tocsc(), F)
+        if not isfinite(U).all():
+            raise LinAlgError('Singular matrix')
+        return U
+
     def run_solver(self):
         fargs = self.fargs
         bdf_filename = os.path.abspath(fargs['BDFNAME'])
@@ -303,14 +333,12 @@ class Solver(F06, OP2):
         #bdf_base, ext = os.path.splitext(bdfName)
         self.f06_name = bdf_base + '.f06'
         self.op2_name = bdf_base + '.op2'
-        self.op2_pack_name = bdf_base + '_pack.op2'
-
-        self.f06_file = open(self.f06_name, 'wb')
-        #self.op2_file = open(self.op2_name, 'wb')
-        #self.op2_pack_file = open(self.op2_pack_name, 'w')
-        self.op2_file = None
-        self.op2_pack_file = None
 
+        if PY2:
+            self.f06_file = open(self.f06_name, 'wb')
+        else:
+            self.f06_file = open(self.f06_name, 'w')
+        self.op2_file = open(self.op2_name, 'wb')
 
         self.f06_file.write(self.make_f06_header())
         #self.f06_file.write(sorted_bulk_data_header())
@@ -345,11 +373,14 @@ class Solver(F06, OP2):
         analysisCases = []
         for (isub, subcase) in sorted(iteritems(cc.subcases)):
             self.log.info(subcase)
-            if subcase.has_parameter('LOAD'):
+            if isub == 0 and len(cc.subcases) > 1:
+                # the global subcase is inherited by the other subcases
+                continue
+            if subcase.has_parameter('LOAD') or subcase.has_parameter('METHOD'):
                 analysisCases.append(subcase)
                 #print('analyzing subcase = \n%s' % subcase)
             #else:
-                #raise RuntimeError('A LOAD card was not set')
+                #raise RuntimeError('A LOAD or METHOD card was not set')
 
         self.write_summary(self.f06_file, card_count=self.model.card_count)
 
@@ -369,9 +400,8 @@ class Solver(F06, OP2):
             #sys.exit('starting case')
             self.run_case(self.model, case)
         self.f06_file.close()
-        if self.op2_file is not None:
-            self.op2_file.close()
-            self.op2_pack_file.close()
+        self.write_op2(self.op2_file)
+        self.op2_file.close()
 
     def run_case(self, model, case):
         sols = {
@@ -395,6 +425,9 @@ class Solver(F06, OP2):
             else:
                 self.label = ''
             self.iSubcaseNameMap[isubcase] = [self.Subtitle, self.label]
+            if (isubcase, self.Subtitle) not in self.labels:
+                self.subtitles[isubcase].append(self.Subtitle)
+                self.labels[(isubcase, self.Subtitle)] = self.label
 
             # really should be is_f06_stress, is_op2_stress, etc.
             # also should have SET support
@@ -529,7 +562,7 @@ class Solver(F06, OP2):
     def get_Mgg(self, model, ndofs, force_calcs=False):
         Mgg = None
         if force_calcs:
-            Mgg, Mgg_sparse = self.assemble_global_mass_matrix(model, ndofs, self.nidComponentToID)
+            Mgg = self.assemble_global_mass_matrix(model, ndofs, self.nidComponentToID)
             model.params['GRDPNT'] = 0
 
         if 'GRDPNT' in model.params:
@@ -577,34 +610,37 @@ class Solver(F06, OP2):
             coupled_mass = -1
             lumped_mass = True
 
-        if case.has_parameter('METHOD'):
-            imethod = model.subcase.get_parameter('METHOD')
-            self.eigb[imethod]
-            self.eigc[imethod]
-            self.eigr[imethod]
-            self.eigrl[imethod]
+        if not case.has_parameter('METHOD'):
+            raise RuntimeError('METHOD is required for SOL 103')
+        imethod = case.get_parameter('METHOD')[0]
+        method = model.methods[imethod]
+        if method.type != 'EIGRL':
+            raise NotImplementedError('METHOD=%s type=%r; only EIGRL is supported' % (
+                imethod, method.type))
 
-        Mgg = self.get_Mgg(model, ndofs, force_calcs=True)
         # analysis
-        (Kgg, Fg, n) = self.setup_sol_101(model, case)
+        (Kgg, Mgg, n) = self.setup_sol_103(model, case)
+        Mgg = Mgg * wtmass
 
         self.build_dof_sets()
-        Lambda, Ua = self.solve_sol_103(Kgg, Mgg)
+        eigenvalues, Ua, generalized_mass, generalized_stiffness = self.solve_sol_103(
+            Kgg, Mgg, method)
 
         dofsAll = set([i for i in range(n)])
         dofsA = remove_dofs(dofsAll, self.iUs)
         dofsA.sort()
-        U = zeros(n, 'float64')
 
         # TODO handle MPCs
-        for (i, iu) in enumerate(self.iUs):
-            U[iu] = self.Us[i]
-        for (i, iu) in enumerate(dofsA):
-            U[iu] = Ua[i]
+        # the SPCs are enforced displacements, so they aren't in the modes
+        U = zeros((n, len(eigenvalues)), 'float64')
+        U[dofsA, :] = Ua
 
+        self._store_eigenvalues(eigenvalues, generalized_mass, generalized_stiffness)
         if self.is_displacement:
-            self._store_displacements(model, U, case)
-        q = U
+            self._store_eigenvectors(model, U, eigenvalues, case)
+
+        self.write_f06(self.f06_file, end_flag=True)
+        self.log.info('finished SOL 103')
 
 
     def run_sol_101(self, model, case):
@@ -652,26 +688,24 @@ class Solver(F06, OP2):
             self.log.info("------------------------\n")
             self.log.info("solving...")
             Ua = self.solve_sol_101(Kgg, Fg)
-            self.log.info("Ua =\n%s" % Ua)
-            self.log.info("Us =\n%s" % self.Us)
+            if self.log_matrices:
+                self.log.info("Ua =\n%s" % Ua)
+                self.log.info("Us =\n%s" % self.Us)
 
             dofsAll = set([i for i in range(n)])
             #dofsA = remove_dofs(remove_dofs(dofsAll, self.iUs), self.iUm))
             dofsA = remove_dofs(dofsAll, self.iUs)
             dofsA.sort()
             U = zeros(n, 'float64')
-            self.log.info("U   =\n%s" % U)
-            self.log.info("iUs =\n%s" % self.iUs)
             #print("iUm = ", self.iUm)
 
             # TODO handle MPCs
-            for (i, iu) in enumerate(self.iUs):
-                U[iu] = self.Us[i]
-            for (i, iu) in enumerate(dofsA):
-                U[iu] = Ua[i]
+            U[self.iUs] = self.Us
+            U[dofsA] = Ua
 
-            self.log.info("*U = \n%s" % U)
-            self.log.info("dofsA = %s" % dofsA)
+            if self.log_matrices:
+                self.log.info("*U = \n%s" % U)
+                self.log.info("dofsA = %s" % dofsA)
 
             if self.is_displacement:
                 self._store_displacements(model, U, case)
@@ -845,7 +879,7 @@ class Solver(F06, OP2):
                 strain = zeros((nctria3s+ncquad4s, 3), 'float64')
                 force  = zeros((nctria3s+ncquad4s, 3), 'float64')
 
-            i0 = i
+            i0 = 0
             if nctria3s:
                 for i, eid in enumerate(ctria3s):
                     element = elements[eid]
@@ -875,51 +909,50 @@ class Solver(F06, OP2):
             # SOLIDS
         #=========================
         self.write_f06(self.f06_file, end_flag=True)
-        self.write_op2(self.op2_file, packing=True)
-        self.write_op2(self.op2_pack_file, packing=False)
         self.log.info('finished SOL 101')
 
-    def _op2_header(self, f, packing=True):
-        data = [4,3,4,
-         1,28,12,
-         4,7,4,   # 7
-         'NASTRAN FORT TAPE ID CODE - ',   # 28 = 7*4
-         4,2,4,   # 7
-         4,-1,4,
-         4,0,4,
-
-         4,2,4,
-         4,0,4,
-         4,2,4]
-        if packing:
-            f.write(pack('9i28s18i', *data))
-        if not packing:
-            f.write(str(data)+'\n')
-
-    def write_op2(self, f, packing=False):
-        return
-        results = [self.displacements]
-        header = None
-        pageStamp = None
-
-        self._op2_header(f, packing=packing)
-
-        for result in results:
-            for subcase, case in sorted(iteritems(result)):
-                case.write_op2(header, pageStamp, f, is_mag_phase=False, packing=packing)
-                if not packing:
-                    f.write('\n')
-        marker1 = [4, 0, 4]
-        marker2 = [4, 0, 4]
-        marker3 = [4, 0, 4]
-        marker = marker1 + marker2 + marker3
-        if packing:
-            nmarker = len(marker)
-            p = pack('%ii' % nmarker, *marker)
-            f.write(p)
-        else:
-            f.write(str(marker)+'\n')
-        f.close()
+    def write_op2(self, f):
+        """
+        Writes the LAMA eigenvalues and the OUGV1 displacements/eigenvectors
+        using the PARAM,POST,-2 layout (there is no header)
+
+        :param f: the OP2 file opened in binary mode
+        """
+        grid_type_map = {'G': 1, 'S': 2}
+        s4 = Struct('2i6f')
+        for title, eigs in sorted(iteritems(self.eigenvalues)):
+            modes = sorted(eigs.eigenvalues)
+            table3 = _pack_table3({1: 21, 2: 6, 10: 7}, title)
+            table4 = b''.join([pack('ii5f', mode, eigs.extractionOrder[mode],
+                                    eigs.eigenvalues[mode], eigs.radians[mode],
+                                    eigs.cycles[mode], eigs.generalizedMass[mode],
+                                    eigs.generalizedStiffness[mode])
+                               for mode in modes])
+            _write_table(f, b'LAMA    ', [(table3, table4)])
+
+        for isubcase, disp in sorted(iteritems(self.displacements)):
+            nids = sorted(disp.translations)
+            table3 = _pack_table3({1: 11, 2: 1, 4: isubcase, 5: isubcase, 9: 1, 10: 8},
+                                  disp.Title, disp.subtitle, disp.label)
+            table4 = b''.join([s4.pack(nid * 10 + 1, grid_type_map[disp.gridTypes[nid]],
+                                       *(list(disp.translations[nid]) + list(disp.rotations[nid])))
+                               for nid in nids])
+            _write_table(f, b'OUGV1   ', [(table3, table4)])
+
+        for isubcase, vector in sorted(iteritems(self.eigenvectors)):
+            tables = []
+            for mode, eigr in zip(sorted(vector.translations), vector.eigrs):
+                translations = vector.translations[mode]
+                rotations = vector.rotations[mode]
+                table3 = _pack_table3({1: 21, 2: 7, 4: isubcase, 5: mode, 6: float(eigr),
+                                       9: 1, 10: 8},
+                                      vector.Title, vector.subtitle, vector.label)
+                table4 = b''.join([s4.pack(nid * 10 + 1, grid_type_map[vector.gridTypes[nid]],
+                                           *(list(translations[nid]) + list(rotations[nid])))
+                                   for nid in sorted(translations)])
+                tables.append((table3, table4))
+            _write_table(f, b'OUGV1   ', tables)
+        _write_markers(f, [0])
 
     def _store_beam_oes(self, model, eids, axial, case, elementType='CBEAM', Type='strain'):
         #print('eids =', eids)
@@ -1225,11 +1258,11 @@ class Solver(F06, OP2):
         forces.add_f06_data(data, dt)
 
         if elementType == 'CROD':
-            self.rodForces[isubcase] = forces
+            self.crod_force[isubcase] = forces
         elif elementType == 'CONROD':
-            self.conrodForces[isubcase] = forces
+            self.conrod_force[isubcase] = forces
         elif elementType == 'CTUBE':
-            self.ctubeForces[isubcase] = forces
+            self.ctube_force[isubcase] = forces
         else:
             raise NotImplementedError(elementType)
         #stress.dt = None
@@ -1306,6 +1339,7 @@ class Solver(F06, OP2):
         data_code = {'log': self.log, 'analysis_code': analysis_code,
                     'device_code': 1, 'table_code': 1, 'sort_code': 0,
                     'sort_bits': [0, 0, 0], 'num_wide': 8, 'table_name': 'OUG',
+                    'Title': self.Title, 'subtitle': self.Subtitle, 'label': self.label,
                     'nonlinear_factor': None, 'dataNames':['lsdvmn']}
         disp = RealDisplacement(data_code, is_sort1, isubcase, dt=None)
 
@@ -1318,14 +1352,70 @@ class Solver(F06, OP2):
             line = [nid, 'G']
             xyz = U[i:i + 6]  # 1,2,3,4,5,6
             self.log.info("nid=%s txyz,rxyz=%s" % ( nid, xyz))
-            line += xyz
+            line += xyz.tolist()
             i += 6
             data.append(line)
         disp.add_f06_data(data, dt)
         self.displacements[isubcase] = disp
         self.iSubcases.append(isubcase)
 
+    def _store_eigenvalues(self, eigenvalues, generalized_mass, generalized_stiffness):
+        """
+        fills the LAMA eigenvalue object
+        """
+        data = []
+        for imode, (eigenvalue, genm, genk) in enumerate(zip(
+                eigenvalues, generalized_mass, generalized_stiffness)):
+            omega = sqrt(abs(eigenvalue))
+            data.append([imode + 1, imode + 1, eigenvalue, omega, omega / (2. * pi),
+                         genm, genk])
+        eigs = RealEigenvalues(self.Title)
+        eigs.add_f06_data(data)
+        self.eigenvalues[self.Title] = eigs
+
+    def _store_eigenvectors(self, model, U, eigenvalues, case):
+        """
+        fills the OUG eigenvector object
+
+        :param U: the (ndofs, nmodes) eigenvectors
+        :param eigenvalues: the (nmodes,) eigenvalues
+        """
+        isubcase = case.id
+        is_sort1 = True
+        nids = model.grid.node_id
+        vector = None
+        for imode, eigenvalue in enumerate(eigenvalues):
+            mode = imode + 1
+            data_code = {
+                'log': self.log, 'analysis_code': 2,
+                'device_code': 1, 'table_code': 7, 'sort_code': 0,
+                'sort_bits': [0, 0, 0], 'num_wide': 8, 'format_code': 1,
+                'mode': mode, 'eigr': eigenvalue,
+                'mode_cycle': sqrt(abs(eigenvalue)) / (2. * pi),
+                'dataNames': ['mode', 'eigr', 'mode_cycle'],
+                'name': 'mode', 'table_name': 'OUGV1',
+                'Title': self.Title, 'subtitle': self.Subtitle, 'label': self.label,
+                'nonlinear_factor': mode,
+            }
+            Ui = U[:6 * model.grid.n, imode].reshape(model.grid.n, 6)
+            data = [[nid, 'G'] + Uii for nid, Uii in zip(nids.tolist(), Ui.tolist())]
+            if vector is None:
+                vector = Eigenvector(data_code, is_sort1, isubcase, mode)
+            vector.read_f06_data(data_code, data)
+        if vector is not None:
+            self.eigenvectors[isubcase] = vector
+        self.iSubcases.append(isubcase)
+
     def setup_sol_101(self, model, case):
+        (Kgg, Mgg, ndofs) = self.setup_sol_103(model, case)
+        Fg = self.assemble_forces(model, ndofs, case, self.nidComponentToID)
+        return Kgg, Fg, ndofs
+
+    def setup_sol_103(self, model, case):
+        """
+        Builds the DOF map, applies the SPCs/MPCs and assembles Kgg/Mgg;
+        the loads aren't assembled, so a LOAD isn't required
+        """
         # the (GridID,componentID) -> internalID
         (self.nidComponentToID, ndofs) = self.build_nid_component_to_id(model)
         self.apply_SPCs(model, case, self.nidComponentToID)
@@ -1335,10 +1425,8 @@ class Solver(F06, OP2):
         #mpcDOFs = self.iUm
 
         Mgg = self.get_Mgg(model, ndofs, force_calcs=True)
-        Kgg, Kgg_sparse = self.assemble_global_stiffness_matrix(model, ndofs, self.nidComponentToID)
-
-        Fg = self.assemble_forces(model, ndofs, case, self.nidComponentToID)
-        return Kgg, Fg, ndofs
+        Kgg = self.assemble_global_stiffness_matrix(model, ndofs, self.nidComponentToID)
+        return Kgg, Mgg, ndofs
 
     def make_gpwg(self, grid_point, Mgg):
         """
@@ -1402,7 +1490,8 @@ class Solver(F06, OP2):
         # translati
 
         Mo = triple(D, Mgg)
-        self.log.info('Mgg=\n%s\n' % Mgg)
+        if self.log_matrices:
+            self.log.info('Mgg=\n%s\n' % Mgg.toarray())
         self.log.info('Mo=\n%s\n' % Mo)
 
         # t-translation; r-rotation
@@ -1418,14 +1507,16 @@ class Solver(F06, OP2):
                         Mt_bar[0, 2],
                         Mt_bar[1, 2],
                         ])
-        if epsilon / delta > 0.001:
+        # a massless model (e.g. a static rod/truss deck) has delta=0
+        ratio = epsilon / delta if delta != 0. else 0.
+        if ratio > 0.001:
             # user warning 3042
             pass
 
         self.log.info('Mt_bar (correct) =\n%s\n' % Mt_bar)
         self.log.info('delta=%s' % delta)
         self.log.info('epsilon=%s' % epsilon)
-        self.log.info('e/d=%s\n' % (epsilon/delta))
+        self.log.info('e/d=%s\n' % ratio)
 
         # hermitian eigenvectors
         omega, S = eigh(Mt_bar)
@@ -1509,30 +1600,43 @@ class Solver(F06, OP2):
 
 
     def solve_sol_101(self, Kgg, Fg):
-        for (i, j, a) in zip(self.iUm, self.jUm, self.Um):
-            self.log.info("Kgg[%s, %s] = %s" % (i, j, a))
-            Kgg[i, j] = a
+        """
+        :param Kgg: the (ndofs, ndofs) sparse stiffness matrix
+        :param Fg: the (ndofs,) load vector
+        :returns Ua: the displacements of the a-set
+        """
+        if self.iUm is not None and len(self.iUm):
+            # the MPC terms replace the stiffness; that's slow for a CSR matrix
+            Kgg = Kgg.tolil()
+            for (i, j, a) in zip(self.iUm, self.jUm, self.Um):
+                Kgg[i, j] = a
+            Kgg = Kgg.tocsr()
 
         (self.IDtoNidComponents) = reverse_dict(self.nidComponentToID)
-        self.log.info("IDtoNidComponents = %s" % self.IDtoNidComponents)
-        self.log.info("Kgg =\n" + print_annotated_matrix(Kgg, self.IDtoNidComponents, self.IDtoNidComponents))
+        if self.log_matrices:
+            Kgg_dense = Kgg.toarray()
+            self.log.info("IDtoNidComponents = %s" % self.IDtoNidComponents)
+            self.log.info("Kgg =\n" + print_annotated_matrix(Kgg_dense, self.IDtoNidComponents, self.IDtoNidComponents))
         #print("Kgg = \n", Kgg)
         #print("iSize = ", i)
 
         #(Kaa, Fa) = self.Partition(Kgg)
         #sys.exit('verify Kgg')
 
-        self.log.info("Kgg/%g = \n%s" % (self.knorm, print_matrix(Kgg / self.knorm)))
-        Kaa, dofs2 = partition_dense_symmetric(Kgg, self.iUs)
-        self.log.info("Kaa/%g = \n%s" % (self.knorm, print_matrix(Kaa / self.knorm)))
+        if self.log_matrices:
+            self.log.info("Kgg/%g = \n%s" % (self.knorm, print_matrix(Kgg_dense / self.knorm)))
+        Kaa, dofs2 = partition_sparse_symmetric(Kgg, self.iUs)
+        if self.log_matrices:
+            self.log.info("Kaa/%g = \n%s" % (self.knorm, print_matrix(Kaa.toarray() / self.knorm)))
         #print("Kaa.shape = ",Kaa.shape)
 
         #sys.exit('verify Kaa')
         Fa, _dofs2 = partition_dense_vector(Fg, self.iUs)
         #print("Kaa = \n%s" % (print_matrix(Kaa)))
 
-        self.log.info("Fg/%g = \n%s" % (self.fnorm, Fg/self.fnorm))
-        self.log.info("Fa/%g = \n%s" % (self.fnorm, Fa/self.fnorm))
+        if self.log_matrices:
+            self.log.info("Fg/%g = \n%s" % (self.fnorm, Fg/self.fnorm))
+            self.log.info("Fa/%g = \n%s" % (self.fnorm, Fa/self.fnorm))
         #print("Us = ", self.Us)
 
         #self.Us = array(self.Us, 'float64')  # SPC
@@ -1579,6 +1683,30 @@ class Solver(F06, OP2):
 
         return Ua
 
+    def solve_sol_103(self, Kgg, Mgg, method):
+        """
+        Solves for the real modes with shift-invert Lanczos, so the
+        a-set matrices stay sparse
+
+        :param Kgg: the (ndofs, ndofs) sparse stiffness matrix
+        :param Mgg: the (ndofs, ndofs) sparse mass matrix
+        :param method: the EIGRL card (ND, V1, V2, NORM are used)
+        :returns eigenvalues: the (nmodes,) eigenvalues
+        :returns Ua: the (na, nmodes) eigenvectors of the a-set
+        :returns generalized_mass: the (nmodes,) generalized masses
+        :returns generalized_stiffness: the (nmodes,) generalized stiffnesses
+        """
+        (self.IDtoNidComponents) = reverse_dict(self.nidComponentToID)
+        Kaa, dofs2 = partition_sparse_symmetric(Kgg, self.iUs)
+        Maa, _dofs2 = partition_sparse_symmetric(Mgg, self.iUs)
+
+        norm = 'MASS' if method.norm is None else method.norm
+        self.log.info('solving for the modes; na=%s nd=%s v1=%s v2=%s norm=%s' % (
+            len(dofs2), method.nd, method.v1, method.v2, norm))
+        eigenvalues, Ua, generalized_mass, generalized_stiffness = solve_real_eigenvalues(
+            Kaa, Maa, nd=method.nd, v1=method.v1, v2=method.v2, norm=norm)
+        return eigenvalues, Ua, generalized_mass, generalized_stiffness
+
     def element_dof_start(self, elem, nids):
         node_ids = elem.nodeIDs()
         index0s = searchsorted(nids, node_ids)
@@ -1586,33 +1714,34 @@ class Solver(F06, OP2):
         return node_ids, index0s
 
     def add_stiffness(self, K, dofs, nijv):
-        Kgg = self.Kgg
-        #print(type(Kgg))
-        for i, dof1 in enumerate(dofs):
-            #dof1i = self.nidComponentToID[dof1]
-            for j, dof2 in enumerate(dofs):
-                if abs(K[i, j]) > 0.0:
-                    self.log.info('i=%s j=%s dof1=%s dof2=%s Ke[i,j]=%s' % (i, j, dof1, dof2, K[i,j]/self.knorm))
-                    #dof2i = self.nidComponentToID[dof2]
-                    #assert isinstance(dof1i, int), dof1i
-                    #assert isinstance(dof2i, int), dof2i
-                    Kgg[dof1, dof2] += K[i, j]
-                    #Kgg[dof1i, dof2i] += K[i, j]
-                    #print('Kgg[%i,%i]=%d' % (dof1i, dof2i, Kgg[dof1i, dof2i]) )
-        self.log.info('Kggi =\n%s' % Kgg)
+        """
+        Adds an element stiffness matrix to the Kgg COO triplets; Kgg is
+        built by assemble_global_stiffness_matrix
+        """
+        rows, cols, values = element_triplets(K, dofs)
+        self.Kgg_triplets.append((rows, cols, values))
+        if self.log_matrices:
+            for dof1, dof2, k in zip(rows, cols, values):
+                self.log.info('dof1=%s dof2=%s Ke=%s' % (dof1, dof2, k / self.knorm))
 
     def add_mass(self, M, dofs, nijv):
-        Mgg = self.Mgg
-        Mgg_sparse = self.Mgg_sparse
-        for i, dof1 in enumerate(dofs):
-            for j, dof2 in enumerate(dofs):
-                if abs(M[i, j]) > 0.0:
-                    Mgg[dof1, dof2] += M[i, j]
-                    Mgg_sparse[dof1, dof2] += M[i, j]
-
-    def assemble_global_stiffness_matrix(self, model, i, Dofs):
-        self.Kgg = zeros((i, i), 'float64')
-        self.log.info("Kgg.shape = %s" % str(self.Kgg.shape))
+        """
+        Adds an element mass matrix to the Mgg COO triplets; Mgg is built
+        by assemble_global_mass_matrix
+        """
+        self.Mgg_triplets.append(element_triplets(M, dofs))
+
+    def assemble_global_stiffness_matrix(self, model, ndofs, Dofs):
+        """
+        Assembles the stiffness matrix
+
+        :param model: the BDF object
+        :param ndofs: the number of DOFs in the g-set
+        :param Dofs: the (nid, component) -> DOF map
+        :returns Kgg: the (ndofs, ndofs) CSR matrix
+        """
+        self.Kgg_triplets = []
+        self.log.info("Kgg.shape = (%s, %s)" % (ndofs, ndofs))
 
         dof_mapper = []
 
@@ -1625,7 +1754,6 @@ class Solver(F06, OP2):
         i = 0
         nids = model.grid.node_id
         #nids.sort()
-        self.log.info('nids = %s %s' %(nids, i))
         #dof_ids = arange(0, 6*nnodes, 6)
 
         #dofs_0 = [nid=2, 1] -> searchsorted(nids, nid)[0]
@@ -1647,7 +1775,8 @@ class Solver(F06, OP2):
             self.log.info('start calculating Kcelas1')
             for i in range(model.elements_spring.celas1.n):
                 K, dofs, nijv = model.elements_spring.celas1.get_stiffness_matrix(i, model, self.positions, index0s)
-                self.log.info("Kcelas1 =\n%s" % K)
+                if self.log_matrices:
+                    self.log.info("Kcelas1 =\n%s" % K)
                 self.add_stiffness(K, dofs, nijv)
 
         if model.elements_spring.celas2.n:
@@ -1698,16 +1827,22 @@ class Solver(F06, OP2):
                 K, dofs, nijv = model.elements_shell.cquad4.get_stiffness_matrix(i, model, self.positions, index0s)
                 self.add_stiffness(K, dofs, nijv)
 
-        #Kgg_sparse = coo_matrix((entries, (rows, cols)), shape=(i, i))
-        Kgg_sparse = None
-        Kgg = self.Kgg
-        return Kgg, Kgg_sparse
+        self.Kgg = assemble_sparse(self.Kgg_triplets, ndofs)
+        self.Kgg_triplets = []
+        return self.Kgg
 
     #def assemble_global_damping_matrix(self, model, i, Dofs):
 
     def assemble_global_mass_matrix(self, model, ndofs, Dofs):
-        self.Mgg = zeros((ndofs, ndofs), 'float64')
-        self.Mgg_sparse = dok_matrix((ndofs, ndofs), dtype='float64')
+        """
+        Assembles the mass matrix
+
+        :param model: the BDF object
+        :param ndofs: the number of DOFs in the g-set
+        :param Dofs: the (nid, component) -> DOF map
+        :returns Mgg: the (ndofs, ndofs) CSR matrix
+        """
+        self.Mgg_triplets = []
 
         dof_mapper = []
 
@@ -1729,16 +1864,13 @@ class Solver(F06, OP2):
         conm1 = model.mass.conm1
         for i in range(conm1.n):
             M = conm1.get_mass_matrix(i)
-            i0 = index[conm1.node_id[i]]
+            i0 = index0s[conm1.node_id[i]]
             coord_id = conm1.coord_id[i]
-            assert coord_id == 0, 'CONM1 doesnt support coord_id != 0 for element %i' % (model.conm1.element_id[i], coord_id)
+            assert coord_id == 0, 'CONM1 doesnt support coord_id != 0 for element %i; coord_id=%s' % (conm1.element_id[i], coord_id)
             # CONM1 doesn't consider coord ID
-            self.Mgg[i0:i0+6, i0:i0+6] += M[:, :]
-            for ii1, i01 in arange(i0, i0+6):
-                for ii2, i02 in arange(i0, i0+6):
-                    self.Mgg_sparse[i01, i02] = M[ii1, ii2]
+            self.add_mass(M, arange(i0, i0+6), None)
         for i in range(model.mass.conm2.n):
-            M, dofs, nijv = model.conm1.get_mass_matrix(i, model, self.positions, index0s)
+            M, dofs, nijv = model.mass.conm2.get_mass_matrix(i, model, self.positions, index0s)
             self.add_mass(M, dofs, nijv)
 
         if 0:
@@ -1786,20 +1918,19 @@ class Solver(F06, OP2):
                 M, dofs, nijv = solid.ctetra4.get_mass_matrix(i, model, self.positions, index0s)
                 self.add_mass(M, dofs, nijv)
             for i in range(solid.cpenta6.n):
-                M, dofs, nijv = solid.ctetra4.get_mass_matrix(i, model, self.positions, index0s)
+                M, dofs, nijv = solid.cpenta6.get_mass_matrix(i, model, self.positions, index0s)
                 self.add_mass(M, dofs, nijv)
             for i in range(solid.chexa8.n):
-                M, dofs, nijv = solid.ctetra4.get_mass_matrix(i, model, self.positions, index0s)
+                M, dofs, nijv = solid.chexa8.get_mass_matrix(i, model, self.positions, index0s)
                 self.add_mass(M, dofs, nijv)
         # ctetra10
         # cpenta15
         # chexa20
 
-        #Mgg_sparse = coo_matrix((entries, (rows, cols)), shape=(i, i))
-        Mgg_sparse = None
-        Mgg = self.Mgg
+        self.Mgg = assemble_sparse(self.Mgg_triplets, ndofs)
+        self.Mgg_triplets = []
         self.log.info('returning Mgg')
-        return Mgg, Mgg_sparse
+        return self.Mgg
 
     def apply_SPCs(self, model, case, nidComponentToID):
         has_spcs = False
@@ -2134,6 +2265,56 @@ class Solver(F06, OP2):
                     #op2.write(result.write_op2(Title, Subtitle))
 
 
+def _write_markers(f, markers):
+    """writes a series of [4, marker, 4] markers"""
+    for marker in markers:
+        f.write(pack('3i', 4, marker, 4))
+
+
+def _write_record(f, data):
+    """writes the [4, nwords, 4] marker and the [nbytes, data, nbytes] block"""
+    nbytes = len(data)
+    _write_markers(f, [nbytes // 4])
+    f.write(pack('i', nbytes) + data + pack('i', nbytes))
+
+
+def _pack_table3(words, title, subtitle='', label=''):
+    """
+    Packs a 146 word table3 record
+
+    :param words: the {word: value} values of words 1-50 (1-based); the
+        rest of the words are 0
+    """
+    values = [words.get(i, 0) for i in range(1, 51)]
+    fmt = ''.join(['f' if isinstance(value, float) else 'i' for value in values])
+    strings = [('%-128s' % text)[:128].encode('latin1') for text in (title, subtitle, label)]
+    return pack(fmt, *values) + pack('128s128s128s', *strings)
+
+
+def _write_table(f, table_name, subtables):
+    """
+    Writes a table
+
+    :param table_name: the 8 character table name (e.g. b'OUGV1   ')
+    :param subtables: the [(table3, table4), ...] records
+    """
+    _write_record(f, table_name)
+    _write_markers(f, [-1])
+    _write_record(f, pack('7i', 101, 0, 0, 0, 0, 0, 0))
+    _write_markers(f, [-2, 1, 0])
+    _write_record(f, table_name)
+
+    isubtable = -3
+    for table3, table4 in subtables:
+        _write_markers(f, [isubtable, 1, 0])
+        _write_record(f, table3)
+        _write_markers(f, [isubtable - 1, 1, 0])
+        _write_record(f, table4)
+        isubtable -= 2
+    _write_markers(f, [isubtable, 1, 0])
+    _write_markers(f, [0])
+
+
 def get_cards():
     cards_to_read = set([
                       'PARAM',
@@ -2173,6 +2354,9 @@ def get_cards():
                       'MOMENT', 'MOMENT1', 'MOMENT2',
                       'GRAV',
 
+                      # methods
+                      'EIGRL',
+
                       # coords
                       'CORD1R', 'CORD1C', 'CORD1S',
                       'CORD2R', 'CORD2C', 'CORD2S',
@@ -1,6 +1,10 @@
 from six import iteritems
 from six.moves import zip, range
-from numpy import dot, ndarray, zeros
+from numpy import (dot, ndarray, zeros, ones, array, asarray, repeat, tile,
+                   hstack, abs as npabs, pi, inf, argsort, finfo)
+from scipy.linalg import eigh, eig
+from scipy.sparse import coo_matrix, issparse
+from scipy.sparse.linalg import eigsh
 
 def partition_sparse(Is, Js, Vs):
     I2 = []
@@ -24,6 +28,66 @@ def remove_dofs(dofsAll, dofs_remove):
     return dofs
 
 
+def element_triplets(K, dofs):
+    """
+    Gets the COO triplets of the nonzero terms of an element matrix
+
+    :param K: the (n, n) element stiffness/mass matrix
+    :param dofs: the (n,) global DOFs of the rows/columns of K
+    :returns rows, cols, values: the (m,) triplets
+    """
+    dofs = asarray(dofs, dtype='int32')
+    n = len(dofs)
+    if n == 0:
+        return array([], dtype='int32'), array([], dtype='int32'), array([], dtype='float64')
+    values = asarray(K, dtype='float64').ravel()
+    rows = repeat(dofs, n)
+    cols = tile(dofs, n)
+    i = values != 0.0
+    return rows[i], cols[i], values[i]
+
+
+def assemble_sparse(triplets, ndofs):
+    """
+    Sums a series of COO triplets (see element_triplets) into a sparse
+    matrix; duplicate terms are added
+
+    :param triplets: [(rows, cols, values), ...]
+    :param ndofs: the size of the matrix
+    :returns A: the (ndofs, ndofs) CSR matrix
+    """
+    if triplets:
+        rows, cols, values = [hstack(x) for x in zip(*triplets)]
+    else:
+        rows = cols = array([], dtype='int32')
+        values = array([], dtype='float64')
+    return coo_matrix((values, (rows, cols)), shape=(ndofs, ndofs)).tocsr()
+
+
+def _get_kept_dofs(nall, dofs_in):
+    """gets the sorted DOFs that aren't in dofs_in"""
+    is_kept = ones(nall, dtype='bool')
+    is_kept[asarray(list(dofs_in), dtype='int32')] = False
+    return is_kept.nonzero()[0]
+
+
+def partition_sparse_symmetric(A, dofs_in):
+    """
+    Removes a set of DOFs from a sparse matrix (the sparse version of
+    partition_dense_symmetric)
+
+    :param A: the (n, n) sparse matrix
+    :param dofs_in: the DOFs to remove
+    :returns A2: the (m, m) CSR matrix of the DOFs that are kept
+    :returns dofs: the (m,) sorted DOFs that are kept
+    """
+    dofs = _get_kept_dofs(A.shape[0], dofs_in)
+    A2 = A.tocsr()[dofs, :][:, dofs]
+    A2.data[npabs(A2.data) < 1e-8] = 0.0
+    A2.eliminate_zeros()
+    return (A2, dofs)
+
+
 def partition_dense_symmetric(A, dofs_in):
     nAll = A.shape[0]
     dofs = getDOF_Set(nAll, dofs_in)
@@ -39,18 +103,10 @@ def partition_dense_symmetric(A, dofs_in):
 
 
 def partition_dense_vector(F, dofs_in):
-    nAll = F.shape[0]
-    #print("partition_dense_vector:  dofs_in = %s" % sorted(dofs_in))
-    dofs = getDOF_Set(nAll, dofs_in)
-    dofs.sort()
-    #print("partition_dense_vector:  dofs = %s" % dofs)
-    n = len(dofs)
-    F2 = zeros(n, 'float64')
-    for (i, dofI) in enumerate(dofs):
-        v = F[dofI]
-        if abs(v) >= 1e-8:
-            F2[i] = v
-    return (F2, dofs)
+    dofs = _get_kept_dofs(F.shape[0], dofs_in)
+    F2 = F[dofs]
+    F2[npabs(F2) < 1e-8] = 0.0
+    return (F2, list(dofs))
 
 
 def partition_sparse_vector(F, dofs):
@@ -76,7 +132,7 @@ def departition_dense_vector(n, IsVs):
 
 
 def reverse_dict(A):
-    return {v: k for k, v in A.iteritems()}
+    return {v: k for k, v in iteritems(A)}
 
 
 def triple(A, B):
@@ -86,8 +142,104 @@ def triple(A, B):
     A   [n x m]
     A.T [m x n]
     T [m x m] = A.T [m x n] @ B [n x n] @ A [n x m]
+
+    B may be a dense or sparse matrix
     """
     assert isinstance(A, ndarray), type(A)
-    assert isinstance(A, ndarray), type(B)
-    return dot(A.T, dot(B, A))
+    return dot(A.T, B.dot(A))
+
 
+
+def _solve_dense_eigenvalues(K, M, sigma):
+    """
+    Solves the dense generalized eigenvalue problem about a shift, so M
+    may be singular::
+
+      [M]{phi} = theta [K - sigma*M]{phi}    lambda = sigma + 1/theta
+
+    The massless roots (theta=0 -> lambda=inf) are dropped and the rest
+    of the modes are made M-orthonormal with a Rayleigh-Ritz solve.
+
+    :param K: the (n, n) stiffness matrix
+    :param M: the (n, n) mass matrix
+    :param sigma: the shift (in eigenvalue units)
+    :returns eigenvalues: the (nmodes,) sorted eigenvalues
+    :returns eigenvectors: the (n, nmodes) eigenvectors
+    """
+    Kdense = K.toarray() if issparse(K) else asarray(K)
+    Mdense = M.toarray() if issparse(M) else asarray(M)
+    n = Kdense.shape[0]
+    theta, phi = eig(Mdense, Kdense - sigma * Mdense)
+    theta = theta.real
+    i = npabs(theta) > n * finfo('float64').eps * npabs(theta).max()
+    if not i.any():
+        return zeros(0, 'float64'), zeros((n, 0), 'float64')
+    phi = phi[:, i].real
+    eigenvalues, Q = eigh(triple(phi, Kdense), triple(phi, Mdense))
+    return eigenvalues, dot(phi, Q)
+
+
+def solve_real_eigenvalues(K, M, nd=None, v1=None, v2=None, norm='MASS',
+                           shift=-1.0, ndense=100):
+    """
+    Solves the generalized eigenvalue problem for the lowest modes
+    (the EIGRL method)::
+
+      [K]{phi} = lambda [M]{phi}
+
+    The sparse problem is solved with shift-invert Lanczos (eigsh), so
+    K/M are never converted to dense; small problems use a dense solve.
+    M may be singular (e.g. a massless DOF); the infinite roots aren't
+    returned.
+
+    :param K: the (n, n) sparse stiffness matrix (e.g. Kaa)
+    :param M: the (n, n) sparse mass matrix (e.g. Maa)
+    :param nd: the number of roots (default=None -> all the roots in [v1, v2])
+    :param v1: the lower frequency in Hz (default=None -> no limit)
+    :param v2: the upper frequency in Hz (default=None -> no limit)
+    :param norm: the eigenvector normalization ('MASS', 'MAX')
+    :param shift: the shift (in eigenvalue units) when v1 isn't
+        defined; the default of -1.0 lets K be singular (rigid body
+        modes)
+    :param ndense: the maximum size of a dense solve
+    :returns eigenvalues: the (nmodes,) sorted eigenvalues
+    :returns eigenvectors: the (n, nmodes) eigenvectors
+    :returns generalized_mass: the (nmodes,) phi.T @ M @ phi
+    :returns generalized_stiffness: the (nmodes,) phi.T @ K @ phi
+    """
+    n = K.shape[0]
+    if nd is None and v2 is None:
+        raise ValueError('nd or v2 must be defined')
+    lambda1 = -inf if v1 is None else (2. * pi * v1) ** 2
+    lambda2 = inf if v2 is None else (2. * pi * v2) ** 2
+    sigma = shift if v1 is None else lambda1 + shift
+
+    k = min(20 if nd is None else nd, n)
+    while 1:
+        if k >= n - 1 or n <= ndense:
+            eigenvalues, eigenvectors = _solve_dense_eigenvalues(K, M, sigma)
+            k = n
+        else:
+            eigenvalues, eigenvectors = eigsh(K, k=k, M=M, sigma=sigma, which='LM')
+        isort = argsort(eigenvalues)
+        eigenvalues = eigenvalues[isort]
+        eigenvectors = eigenvectors[:, isort]
+
+        # all the roots below v2 have been found (or there aren't any more)
+        if k == n or eigenvalues[-1] > lambda2 or (nd is not None and (
+                (eigenvalues >= lambda1) & (eigenvalues <= lambda2)).sum() >= nd):
+            break
+        k = min(2 * k, n)
+
+    i = (eigenvalues >= lambda1) & (eigenvalues <= lambda2)
+    eigenvalues = eigenvalues[i][:nd]
+    eigenvectors = eigenvectors[:, i][:, :nd]
+
+    if norm == 'MAX':
+        imax = npabs(eigenvectors).argmax(axis=0)
+        eigenvectors = eigenvectors / eigenvectors[imax, range(len(imax))]
+    elif norm != 'MASS':
+        raise NotImplementedError('norm=%r; expected MASS, MAX' % norm)
+    generalized_mass = (eigenvectors * M.dot(eigenvectors)).sum(axis=0)
+    generalized_stiffness = (eigenvectors * K.dot(eigenvectors)).sum(axis=0)
+    return eigenvalues, eigenvectors, generalized_mass, generalized_stiffness
@@ -1,5 +1,7 @@
 from pyNastran.bdf.dev_vectorized.test.test_coords import *
 from pyNastran.bdf.dev_vectorized.test.test_mass import *
+from pyNastran.bdf.dev_vectorized.test.test_solver import *
+from pyNastran.bdf.dev_vectorized.test.test_solver_utils import *
 
 from pyNastran.bdf.dev_vectorized.cards.elements.solid.test_solids import *
 from pyNastran.bdf.dev_vectorized.cards.elements.shell.test_shell import *
@@ -0,0 +1,112 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from numpy import allclose, array, sqrt, dot
+
+import pyNastran
+from pyNastran.f06.f06 import F06
+from pyNastran.op2.op2 import OP2
+from pyNastran.bdf.dev_vectorized.solver.solver import Solver
+
+root_path = pyNastran.__path__[0]
+solver_path = os.path.join(root_path, 'applications', 'solver')
+
+
+class TestSolver(unittest.TestCase):
+    def setUp(self):
+        self.dirname = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.dirname)
+
+    def run_sol_101(self, bdf_name, f06_expected):
+        """runs a SOL 101 deck and compares it to the MSC Nastran F06"""
+        fargs = {
+            'BDFNAME': os.path.join(solver_path, bdf_name),
+            'BDFBASE': os.path.join(self.dirname, os.path.splitext(bdf_name)[0]),
+            '--k': 1.0, '--f': 1.0, '--m': 1.0,
+        }
+        solver = Solver(fargs)
+        solver.run_solver()
+        self.assertTrue(os.path.exists(fargs['BDFBASE'] + '.f06'))
+
+        f06 = F06(debug=False)
+        f06.read_f06(os.path.join(solver_path, f06_expected))
+        compare_sol_101(self, solver, f06)
+        return solver
+
+    def test_sol_101_rod(self):
+        self.run_sol_101('rod.bdf', 'rod_expected.f06')
+
+    def test_sol_101_2dtruss(self):
+        self.run_sol_101('2dTruss.bdf', '2dtruss_expected.f06')
+
+    def test_sol_103_spring_mass(self):
+        """runs a 2 DOF spring-mass deck and reads the OP2 back"""
+        fargs = {
+            'BDFNAME': os.path.join(solver_path, 'spring_mass.bdf'),
+            'BDFBASE': os.path.join(self.dirname, 'spring_mass'),
+            '--k': 1.0, '--f': 1.0, '--m': 1.0,
+        }
+        solver = Solver(fargs)
+        solver.run_solver()
+
+        # lambda = k/m * (3 -/+ sqrt(5)) / 2
+        k = 1.0e6
+        m = 2.0
+        K = k * array([[2., -1.],
+                       [-1., 1.]])
+        eigenvalues_expected = k / m * array([3. - sqrt(5.), 3. + sqrt(5.)]) / 2.
+
+        eigs = solver.eigenvalues[solver.Title]
+        self.assertEqual(sorted(eigs.eigenvalues), [1, 2])
+        vector = solver.eigenvectors[1]
+        self.assertEqual(sorted(vector.translations), [1, 2])
+        for mode, eigenvalue in zip([1, 2], eigenvalues_expected):
+            self.assertTrue(allclose(eigs.eigenvalues[mode], eigenvalue), mode)
+            self.assertTrue(allclose(eigs.generalizedMass[mode], 1.0), mode)
+
+            translations = vector.translations[mode]
+            self.assertTrue(allclose(translations[1], [0., 0., 0.]), mode)
+            self.assertTrue(allclose(translations[2][1:], [0., 0.]), mode)
+            self.assertTrue(allclose(translations[3][1:], [0., 0.]), mode)
+            x = array([translations[2][0], translations[3][0]])
+            self.assertTrue(allclose(dot(K, x), eigenvalue * m * x), mode)
+            self.assertTrue(allclose(m * dot(x, x), 1.0), mode)
+
+        op2 = OP2(debug=False)
+        op2.read_op2(fargs['BDFBASE'] + '.op2')
+        eigs2 = op2.eigenvalues[solver.Title]
+        vector2 = op2.eigenvectors[1]
+        self.assertEqual(vector2.eigrs, [eigs2.eigenvalues[1], eigs2.eigenvalues[2]])
+        for mode in [1, 2]:
+            self.assertTrue(allclose(eigs2.eigenvalues[mode], eigs.eigenvalues[mode]), mode)
+            self.assertEqual(sorted(vector2.translations[mode]), [1, 2, 3])
+            for nid, translation in vector.translations[mode].items():
+                self.assertTrue(allclose(vector2.translations[mode][nid], translation,
+                                         atol=1e-7), nid)
+
+
+def compare_sol_101(self, solver, f06):
+    """compares the displacements and the CONROD stresses"""
+    disp = solver.displacements[1]
+    disp_expected = f06.displacements[1]
+    self.assertEqual(sorted(disp.translations), sorted(disp_expected.translations))
+    for nid, translation in disp_expected.translations.items():
+        self.assertTrue(allclose(disp.translations[nid], translation, rtol=1e-4, atol=1e-8), nid)
+        self.assertTrue(allclose(disp.rotations[nid], disp_expected.rotations[nid],
+                                 rtol=1e-4, atol=1e-8), nid)
+
+    stress = solver.conrod_stress[1]
+    stress_expected = f06.rodStress[1]
+    self.assertEqual(sorted(stress.axial), sorted(stress_expected.axial))
+    for eid, axial in stress_expected.axial.items():
+        self.assertTrue(allclose(stress.axial[eid], axial, rtol=1e-4, atol=1e-3), eid)
+        self.assertTrue(allclose(stress.torsion[eid], stress_expected.torsion[eid],
+                                 rtol=1e-4, atol=1e-3), eid)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
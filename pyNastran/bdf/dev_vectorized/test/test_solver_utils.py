@@ -0,0 +1,123 @@
+import unittest
+
+from numpy import array, allclose, zeros, arange, ones, pi, sqrt, diag, dot, outer
+from numpy.linalg import solve
+from numpy.random import RandomState
+from scipy.linalg import eigh
+from scipy.sparse import diags
+
+from pyNastran.bdf.dev_vectorized.solver.utils import (
+    element_triplets, assemble_sparse, partition_sparse_symmetric,
+    partition_dense_symmetric, partition_dense_vector, reverse_dict, triple,
+    solve_real_eigenvalues)
+
+
+class TestSolverUtils(unittest.TestCase):
+
+    def test_assemble_sparse(self):
+        """the COO assembly must match the dense scatter"""
+        random = RandomState(42)
+        ndofs = 12
+        Kdense = zeros((ndofs, ndofs), 'float64')
+        triplets = []
+        for dofs in [[0, 1, 2, 6, 7, 8], [6, 7, 8, 9, 10, 11], [3, 4], [4, 5]]:
+            K = random.uniform(-1., 1., (len(dofs), len(dofs)))
+            K[0, 1] = 0.0
+            for i, dof1 in enumerate(dofs):
+                for j, dof2 in enumerate(dofs):
+                    Kdense[dof1, dof2] += K[i, j]
+            triplets.append(element_triplets(K, dofs))
+        triplets.append(element_triplets([], []))
+
+        Kgg = assemble_sparse(triplets, ndofs)
+        self.assertEqual(Kgg.shape, (ndofs, ndofs))
+        self.assertTrue(allclose(Kgg.toarray(), Kdense))
+        self.assertEqual(assemble_sparse([], ndofs).nnz, 0)
+
+    def test_partition(self):
+        """the sparse partitioning must match the dense partitioning"""
+        random = RandomState(42)
+        A = random.uniform(-1., 1., (8, 8))
+        A[2, 3] = 1e-10
+        Kgg = assemble_sparse([element_triplets(A, arange(8))], 8)
+
+        Kaa, dofs = partition_sparse_symmetric(Kgg, [1, 5, 6])
+        Kaa_dense, dofs_dense = partition_dense_symmetric(A, [1, 5, 6])
+        self.assertEqual(list(dofs), dofs_dense)
+        self.assertTrue(allclose(Kaa.toarray(), Kaa_dense))
+
+        F = array([1., 2., 1e-10, 4., 5., 6., 7., 8.])
+        Fa, dofs = partition_dense_vector(F, [1, 5, 6])
+        self.assertEqual(dofs, [0, 2, 3, 4, 7])
+        self.assertTrue(allclose(Fa, [1., 0., 4., 5., 8.]))
+
+        M = triple(random.uniform(-1., 1., (8, 6)), Kgg)
+        self.assertEqual(M.shape, (6, 6))
+        self.assertEqual(reverse_dict({(1, 1): 0, (1, 2): 1}), {0: (1, 1), 1: (1, 2)})
+
+    def test_real_eigenvalues(self):
+        """the sparse and dense eigenvalues of a spring-mass chain"""
+        n = 300
+        K = diags([-ones(n-1), 2. * ones(n), -ones(n-1)], [-1, 0, 1], format='csr') * 1e6
+        M = diags([arange(n) % 3 + 1.], [0], format='csr')
+        eigenvalues_expected = eigh(K.toarray(), M.toarray(), eigvals_only=True)
+
+        eigenvalues, eigenvectors, mass, stiffness = solve_real_eigenvalues(K, M, nd=10)
+        self.assertTrue(allclose(eigenvalues, eigenvalues_expected[:10]))
+        self.assertEqual(eigenvectors.shape, (n, 10))
+        self.assertTrue(allclose(mass, 1.))
+        self.assertTrue(allclose(stiffness, eigenvalues))
+
+        # all the roots in [v1, v2]
+        freqs = sqrt(eigenvalues_expected) / (2. * pi)
+        eigenvalues = solve_real_eigenvalues(K, M, v1=freqs[5] - 1e-3,
+                                             v2=freqs[70] + 1e-3)[0]
+        self.assertTrue(allclose(eigenvalues, eigenvalues_expected[5:71]))
+
+        eigenvalues, eigenvectors, mass, stiffness = solve_real_eigenvalues(
+            K, M, nd=4, norm='MAX')
+        self.assertTrue(allclose(abs(eigenvectors).max(axis=0), 1.))
+        self.assertTrue(allclose(stiffness / mass, eigenvalues_expected[:4]))
+
+        # dense solve
+        eigenvalues = solve_real_eigenvalues(K[:20, :20], M[:20, :20], nd=3)[0]
+        self.assertTrue(allclose(
+            eigenvalues,
+            eigh(K[:20, :20].toarray(), M[:20, :20].toarray(), eigvals_only=True)[:3]))
+        with self.assertRaises(ValueError):
+            solve_real_eigenvalues(K, M)
+
+    def test_real_eigenvalues_massless(self):
+        """a singular mass matrix (massless DOFs) for the dense and sparse solves"""
+        K = array([[2., -1., 0.],
+                   [-1., 2., -1.],
+                   [0., -1., 1.]])
+        M = diag([1., 1., 0.])
+
+        # the massless DOF is condensed out exactly
+        Kr = K[:2, :2] - outer(K[:2, 2], K[2, :2]) / K[2, 2]
+        eigenvalues, eigenvectors, mass, stiffness = solve_real_eigenvalues(K, M, nd=3)
+        self.assertTrue(allclose(eigenvalues, eigh(Kr, eigvals_only=True)))
+        self.assertEqual(eigenvectors.shape, (3, 2))
+        self.assertTrue(allclose(mass, 1.))
+        self.assertTrue(allclose(stiffness, eigenvalues))
+
+        # a spring chain with every other DOF massless
+        n = 60
+        K = diags([-ones(n-1), 2. * ones(n), -ones(n-1)], [-1, 0, 1], format='csr') * 1e6
+        M = diags([(arange(n) % 2 == 0) * 1.0], [0], format='csr')
+        Kdense = K.toarray()
+        im = arange(0, n, 2)
+        io = arange(1, n, 2)
+        Kr = Kdense[im, :][:, im] - dot(Kdense[im, :][:, io], solve(
+            Kdense[io, :][:, io], Kdense[io, :][:, im]))
+        eigenvalues_expected = eigh(Kr, eigvals_only=True)[:5]
+        for ndense in [100, 10]:
+            eigenvalues, eigenvectors, mass, stiffness = solve_real_eigenvalues(
+                K, M, nd=5, ndense=ndense)
+            self.assertTrue(allclose(eigenvalues, eigenvalues_expected), ndense)
+            self.assertTrue(allclose(mass, 1.), ndense)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
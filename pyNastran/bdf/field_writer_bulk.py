@@ -0,0 +1,487 @@
+"""
+Defines a bulk writer for 8-character field cards.
+
+``print_card_8`` formats a card one field at a time and ``print_float_8``
+does up to three string formats per float.  The functions in this file
+format a whole column of fields (e.g. the x coordinate of every GRID) at
+once with numpy, so the heavy cards (GRID, CQUAD4, CTRIA3, CHEXA, CTETRA,
+CBAR, CONM2, FORCE, PLOAD4) can be written in blocks.
+
+The output is byte-identical to the card by card writers.  The floats
+that aren't fixed-point in ``print_float_8`` (e.g. 1.2e-9, 3.4+7) and
+the cards with unusual fields use ``print_float_8`` and the card's own
+writer.
+"""
+from __future__ import (nested_scopes, generators, division, absolute_import,
+                        print_function, unicode_literals)
+from six import integer_types, string_types
+from numpy import (array, asarray, full, zeros, arange, where, searchsorted, rint,
+                   floor, concatenate, cumsum, uint8, float32)
+
+from pyNastran.bdf.fieldWriter import print_float_8, print_card_8
+
+#: the value of a blank character
+_SPACE = ord(' ')
+
+#: the smallest value of a decade -> the number of decimals for a
+#: positive value in print_float_8 (1 -> 6, ..., 1e5 -> 1)
+_POSITIVE_DECADES = array([1., 10., 100., 1000., 10000., 100000.])
+#: the same as _POSITIVE_DECADES for the absolute value of a negative value
+_NEGATIVE_DECADES = array([1., 10., 100., 1000., 10000.])
+
+#: the print_float_8 fields of the values that can't be vectorized
+_FLOAT_CACHE = {}
+#: the size the float cache is limited to
+_FLOAT_CACHE_SIZE = 100000
+
+_POWERS_OF_10 = 10 ** arange(9, dtype='int64')
+
+
+def _get_digits_table():
+    """
+    Gets the 4 characters of 0000-9999 packed into integers (the first
+    character is the lowest byte)
+    """
+    digits = array(['%04i' % i for i in range(10000)], dtype='|S4')
+    return digits.view('<u4').astype('<u8')
+
+#: the precomputed characters of 0000-9999 (see _get_digits_table)
+_DIGITS_TABLE = _get_digits_table()
+#: masks for the first n characters of a packed field (n = 0-8)
+_CHAR_MASKS = array([(1 << (8 * i)) - 1 for i in range(8)] + [2 ** 64 - 1], dtype='<u8')
+#: 8 packed blanks
+_SPACES = array(b'        ', dtype='|S8').view('<u8')[()]
+
+
+def _pack_digits(values):
+    """packs the 8 zero-padded digits of integers (0 <= x < 1e8)"""
+    return _DIGITS_TABLE[values // 10000] | (_DIGITS_TABLE[values % 10000] << 32)
+
+
+def _shift_left(packed, nchars):
+    """moves packed characters right by nchars (0-8) in the field"""
+    return (packed << (8 * nchars.clip(0, 7)).astype('<u8')) & ~_CHAR_MASKS[nchars.clip(0, 8)]
+
+
+def _shift_right(packed, nchars):
+    """moves packed characters left by nchars (0-7) in the field"""
+    return packed >> (8 * nchars).astype('<u8')
+
+
+def _print_float_8_cached(value):
+    """print_float_8 with a cache for repeated values"""
+    try:
+        return _FLOAT_CACHE[value]
+    except KeyError:
+        field = print_float_8(value)
+        if len(_FLOAT_CACHE) > _FLOAT_CACHE_SIZE:
+            _FLOAT_CACHE.clear()
+        _FLOAT_CACHE[value] = field
+        return field
+
+
+def _strings_to_block(fields):
+    """converts a list of 8-character strings to an (n, 8) uint8 array"""
+    block = array([field.encode('ascii') for field in fields], dtype='|S8')
+    return block.view(uint8).reshape(len(fields), 8)
+
+
+def print_float_8_block(values):
+    """
+    Formats floats the same way as print_float_8
+
+    :param values: the floats to format
+    :returns block: an (n, 8) uint8 array of the characters of the fields
+    :returns is_valid: the fields that are 8 characters (print_float_8
+        writes 9 characters for a few large values)
+
+    The fixed-point values (0.001 <= x < 1e6 and -1e5 < x <= -0.01) are
+    vectorized; the rest use print_float_8.
+    """
+    values = asarray(values, dtype='float64').ravel()
+    nvalues = len(values)
+    is_valid = full(nvalues, True)
+    if nvalues == 0:
+        return zeros((0, 8), dtype=uint8), is_valid
+
+    # the number of decimals print_float_8 uses (-1 -> not vectorized)
+    ndecimals = full(nvalues, -1, dtype='int64')
+    ipositive = (values >= 0.001) & (values < 1e6)
+    ndecimals[ipositive] = 7 - searchsorted(_POSITIVE_DECADES, values[ipositive], side='right')
+    abs_values = -values
+    inegative = (abs_values >= 0.01) & (abs_values < 1e5)
+    ndecimals[inegative] = 6 - searchsorted(_NEGATIVE_DECADES, abs_values[inegative],
+                                            side='right')
+    abs_values[ipositive] = values[ipositive]
+
+    # the fixed-point digits; a value that's too close to a rounding
+    # boundary for floating point math isn't vectorized
+    ifixed = ndecimals >= 0
+    scaled = where(ifixed, abs_values, 0.) * (10. ** ndecimals)
+    remainder = scaled - floor(scaled)
+    ifixed &= abs(remainder - 0.5) > 1e-6
+    mantissa = where(ifixed, rint(scaled), 0.).astype('int64')
+    ndecimals[~ifixed] = 1
+
+    # the number of digits that are written (trailing zeros are stripped)
+    power = _POWERS_OF_10[ndecimals]
+    integer_part = mantissa // power
+    fraction = mantissa % power
+    nfraction = ndecimals.copy()
+    for i in range(1, 8):
+        nfraction -= (fraction % _POWERS_OF_10[i] == 0) & (i <= ndecimals)
+    ninteger = searchsorted(_POWERS_OF_10, integer_part, side='right')
+    isign = values < 0.
+    ifixed &= (isign + ninteger + 1 + nfraction) <= 8
+
+    # [blanks][sign][integer digits].[fraction digits]
+    digits = _pack_digits(mantissa)
+    idot = 8 - ndecimals
+    packed = _shift_left(_shift_right(digits, idot) & _CHAR_MASKS[nfraction], 8 - nfraction)
+    packed |= ord('.') << (8 * (7 - nfraction)).astype('<u8')
+    istart = 7 - nfraction - ninteger
+    packed |= _shift_left(_shift_right(digits, idot - ninteger) & _CHAR_MASKS[ninteger], istart)
+    istart -= isign
+    packed |= where(isign, ord('-') << (8 * istart.clip(0, 7)).astype('<u8'), 0).astype('<u8')
+    packed |= _SPACES & _CHAR_MASKS[istart.clip(0, 8)]
+
+    izero = values == 0.
+    packed[izero] = array(b'      0.', dtype='|S8').view('<u8')[()]
+
+    iother = where(~(ifixed | izero))[0]
+    if len(iother):
+        fields = [_print_float_8_cached(value) for value in values[iother].tolist()]
+        is_valid[iother] = [len(field) == 8 for field in fields]
+        packed[iother] = _strings_to_block(fields).view('<u8').ravel()
+    return packed.view(uint8).reshape(nvalues, 8), is_valid
+
+
+def print_floats_8(values):
+    """
+    Formats floats the same way as print_float_8
+
+    :param values: the floats to format
+    :returns fields: a list of 8-character strings
+    """
+    values = asarray(values, dtype='float64').ravel()
+    block, is_valid = print_float_8_block(values)
+    fields = [field.decode('ascii') for field in block.view('|S8').ravel()]
+    for i in where(~is_valid)[0]:
+        fields[i] = print_float_8(values[i])
+    return fields
+
+
+def print_int_8_block(values):
+    """
+    Formats integers the same way as print_field_8
+
+    :param values: the integers to format
+    :returns block: an (n, 8) uint8 array of the characters of the fields
+    :returns is_valid: the integers that fit in 8 characters
+    """
+    values = asarray(values, dtype='int64').ravel()
+    nvalues = len(values)
+    is_valid = (values < 100000000) & (values > -10000000)
+    abs_values = where(is_valid, abs(values), 0)
+    ndigits = searchsorted(_POWERS_OF_10, abs_values, side='right').clip(1, 8)
+
+    # [blanks][sign][digits]
+    istart = 8 - ndigits
+    packed = _pack_digits(abs_values) & ~_CHAR_MASKS[istart]
+    istart -= values < 0
+    packed |= where(values < 0, ord('-') << (8 * istart.clip(0, 7)).astype('<u8'), 0).astype('<u8')
+    packed |= _SPACES & _CHAR_MASKS[istart.clip(0, 8)]
+    return packed.view(uint8).reshape(nvalues, 8), is_valid
+
+
+def _get_field_kind(value):
+    """gets the print_field_8 type of a field"""
+    if isinstance(value, integer_types) and not isinstance(value, bool):
+        return 'i'
+    elif isinstance(value, (float, float32)):
+        return 'f'
+    elif value is None:
+        return 'n'
+    return 's'
+
+#: type -> the print_field_8 type of a field
+_FIELD_KINDS = {}
+
+
+def print_field_8_block(values):
+    """
+    Formats fields the same way as print_field_8
+
+    :param values: the fields (int/float/None/str) to format
+    :returns block: an (n, 8) uint8 array of the characters of the fields
+    :returns is_valid: the fields that fit in 8 characters
+    """
+    nvalues = len(values)
+    block = full((nvalues, 8), _SPACE, dtype=uint8)
+    is_valid = full(nvalues, True)
+
+    kinds = {'i' : [], 'f' : [], 's' : [], 'n' : []}
+    value_types = [type(value) for value in values]
+    for value_type in set(value_types):
+        try:
+            kind = _FIELD_KINDS[value_type]
+        except KeyError:
+            kind = _get_field_kind(values[value_types.index(value_type)])
+            _FIELD_KINDS[value_type] = kind
+        kinds[kind] += [i for i, typei in enumerate(value_types) if typei is value_type]
+
+    iints = kinds['i']
+    ifloats = kinds['f']
+    if len(iints) == nvalues:
+        return print_int_8_block(values)
+    elif len(ifloats) == nvalues:
+        return print_float_8_block(values)
+    elif iints:
+        block[iints, :], is_valid[iints] = print_int_8_block([values[i] for i in iints])
+
+    if ifloats:
+        block[ifloats, :], is_valid[ifloats] = print_float_8_block([values[i] for i in ifloats])
+
+    istrings = kinds['s']
+    if istrings:
+        fields = ['%8s' % values[i] for i in istrings]
+        is_valid[istrings] = [len(field) == 8 for field in fields]
+        fields = [field if len(field) == 8 else '        ' for field in fields]
+        block[istrings, :] = _strings_to_block(fields)
+    return block, is_valid
+
+
+def _join_lines(card_name, blocks, is_valid, strip_lines):
+    """
+    Joins the field blocks of a series of cards into lines
+
+    :param card_name: the name of the cards (e.g. 'GRID')
+    :param blocks: the (n, 8) field blocks in order (8 per line)
+    :param is_valid: the cards that can be written
+    :param strip_lines: True:  each line is stripped (print_card_8)
+                        False: only the end of the card is stripped
+                               (e.g. CTETRA.write_bdf2)
+    :returns data: the cards that are valid
+    :returns offsets: the start of each card in data (n + 1 values)
+    """
+    ncards = len(is_valid)
+    lines = []
+    for iline, i in enumerate(range(0, len(blocks), 8)):
+        prefix = full((ncards, 8), _SPACE, dtype=uint8)
+        if iline == 0:
+            prefix[:, :] = _strings_to_block(['%-8s' % card_name])
+        lines.append(concatenate([prefix] + list(blocks[i:i + 8]), axis=1))
+
+    # the number of characters in each line
+    nlines = len(lines)
+    nchars = zeros((ncards, nlines), dtype='int64')
+    for iline, line in enumerate(lines):
+        is_char = line != _SPACE
+        width = line.shape[1]
+        nchars[:, iline] = where(is_char.any(axis=1),
+                                 width - is_char[:, ::-1].argmax(axis=1), 0)
+
+    iline = arange(nlines)[None, :]
+    ilast = where(nchars > 0, iline, 0).max(axis=1)[:, None]
+    if strip_lines:
+        # print_card_8 writes a blank line in the middle of a card as '+'
+        is_blank = (nchars == 0) & (iline < ilast)
+        for iline2, line in enumerate(lines):
+            line[is_blank[:, iline2], 0] = ord('+')
+        nchars[is_blank] = 1
+    else:
+        widths = array([line.shape[1] for line in lines])[None, :]
+        nchars = where(iline < ilast, widths, nchars)
+    nchars[iline > ilast] = -1
+    nchars[~is_valid, :] = -1
+
+    # add the newlines and keep the characters in each line
+    newline = full((ncards, 1), ord('\n'), dtype=uint8)
+    chars = []
+    masks = []
+    for iline2, line in enumerate(lines):
+        width = line.shape[1]
+        chars += [line, newline]
+        nchars_line = nchars[:, iline2][:, None]
+        masks += [arange(width)[None, :] < nchars_line,
+                  nchars_line >= 0]
+    chars = concatenate(chars, axis=1)
+    mask = concatenate(masks, axis=1)
+    data = chars[mask].tobytes().decode('ascii')
+    offsets = concatenate([[0], cumsum(mask.sum(axis=1))])
+    return data, offsets
+
+
+def _get_fields_blocks(fields_list):
+    """
+    Formats the fields of a series of cards (e.g. from repr_fields)
+
+    :param fields_list: the fields of each card (without the card name)
+    :returns blocks: the (n, 8) field blocks
+    :returns is_valid: the cards where every field fits in 8 characters
+    """
+    nfields = max([len(fields) for fields in fields_list])
+    ncards = len(fields_list)
+    is_valid = full(ncards, True)
+    blocks = []
+    for ifield in range(nfields):
+        values = [fields[ifield] if ifield < len(fields) else None
+                  for fields in fields_list]
+        block, is_validi = print_field_8_block(values)
+        blocks.append(block)
+        is_valid &= is_validi
+    return blocks, is_valid
+
+
+def _grid_blocks(nodes):
+    """the GRID.write_bdf2 fields"""
+    blocks = [print_int_8_block([node.nid for node in nodes])[0]]
+    is_valid = full(len(nodes), True)
+    for values in [[node.Cp() for node in nodes]]:
+        block, is_validi = print_field_8_block([None if value == 0 else value
+                                                for value in values])
+        blocks.append(block)
+        is_valid &= is_validi
+    xyz = array([node.xyz for node in nodes], dtype='float64').reshape(len(nodes), 3)
+    for i in range(3):
+        block, is_validi = print_float_8_block(xyz[:, i])
+        blocks.append(block)
+        is_valid &= is_validi
+    for values in [[node.Cd() for node in nodes],
+                   ['%8s' % node.ps for node in nodes],
+                   [node.SEid() for node in nodes]]:
+        block, is_validi = print_field_8_block([None if value == 0 else value
+                                                for value in values])
+        blocks.append(block)
+        is_valid &= is_validi
+    is_valid &= array([isinstance(node.ps, string_types) for node in nodes], dtype='bool')
+    return blocks, is_valid
+
+
+def _shell_blocks(elements):
+    """
+    the CQUAD4/CTRIA3.write_bdf fields; the elements with a TFlag or
+    thicknesses use the card by card writer
+    """
+    fields_list = []
+    is_valid = []
+    for element in elements:
+        theta = element.thetaMcid
+        zoffset = element.zOffset
+        fields_list.append([element.eid, element.Pid()] + element.nodeIDs() + [
+            None if theta == 0.0 else theta, None if zoffset == 0.0 else zoffset])
+        is_valid.append(element.TFlag in (0, None) and
+                        element.T1 in (1.0, None) and element.T2 in (1.0, None) and
+                        element.T3 in (1.0, None) and getattr(element, 'T4', None) in (1.0, None))
+    blocks, is_valid2 = _get_fields_blocks(fields_list)
+    return blocks, is_valid2 & array(is_valid, dtype='bool')
+
+
+def _solid_blocks(elements):
+    """the CHEXA/CPENTA/CTETRA.write_bdf2 fields"""
+    fields_list = [[element.eid, element.Pid()] + element.nodeIDs()
+                   for element in elements]
+    blocks, is_valid = _get_fields_blocks(fields_list)
+    # %8i doesn't allow blank corner nodes
+    nnodes = {'CHEXA8' : 8, 'CHEXA20' : 8, 'CPENTA6' : 6, 'CPENTA15' : 6,
+              'CTETRA4' : 4, 'CTETRA10' : 4}[elements[0].__class__.__name__]
+    is_valid &= array([None not in fields[:2 + nnodes] for fields in fields_list],
+                      dtype='bool')
+    return blocks, is_valid
+
+
+def _repr_fields_blocks(cards):
+    """the print_card_8(repr_fields()) fields"""
+    return _get_fields_blocks([card.repr_fields()[1:] for card in cards])
+
+
+def _raw_fields_blocks(cards):
+    """the print_card_8(raw_fields()) fields"""
+    return _get_fields_blocks([card.raw_fields()[1:] for card in cards])
+
+
+#: class name -> (the function that gets the field blocks, strip_lines)
+_BULK_WRITERS = {
+    'GRID' : (_grid_blocks, True),
+    'CQUAD4' : (_shell_blocks, True),
+    'CTRIA3' : (_shell_blocks, True),
+    'CBAR' : (_repr_fields_blocks, True),
+    'CONM2' : (_repr_fields_blocks, True),
+    'FORCE' : (_raw_fields_blocks, True),
+    'PLOAD4' : (_raw_fields_blocks, True),
+    'CHEXA8' : (_solid_blocks, True),
+    'CHEXA20' : (_solid_blocks, False),
+    'CPENTA6' : (_solid_blocks, True),
+    'CPENTA15' : (_solid_blocks, False),
+    'CTETRA4' : (_solid_blocks, True),
+    'CTETRA10' : (_solid_blocks, False),
+}
+
+#: the number of cards that are formatted at a time
+BULK_CHUNK_SIZE = 100000
+
+
+def _write_card_8(card):
+    """the card by card writer"""
+    if card.__class__.__name__ == 'GRID':
+        return card.write_bdf2(8, False)
+    return card.write_bdf(8, print_card_8)
+
+
+def _write_bulk_cards_8(card_name, cards, get_blocks, strip_lines, write_card):
+    """writes a series of cards of the same type"""
+    blocks, is_valid = get_blocks(cards)
+    data, offsets = _join_lines(card_name, blocks, is_valid, strip_lines)
+
+    # the comments and the cards that use the card by card writer
+    comments = [card.comment() for card in cards]
+    msg = []
+    i0 = 0
+    for i in where(~is_valid | array([bool(comment) for comment in comments]))[0]:
+        msg.append(data[offsets[i0]:offsets[i]])
+        if is_valid[i]:
+            msg.append(comments[i])
+            i0 = i
+        else:
+            msg.append(write_card(cards[i]))
+            i0 = i + 1
+    msg.append(data[offsets[i0]:])
+    return ''.join(msg)
+
+
+def write_cards_8(cards, write_card=None):
+    """
+    Writes a series of cards in 8-character field format.  The output is
+    the same as writing the cards one at a time, but the GRID, CQUAD4,
+    CTRIA3, CHEXA, CPENTA, CTETRA, CBAR, CONM2, FORCE and PLOAD4 cards are
+    formatted in blocks.
+
+    :param cards: the card objects in the order they should be written
+    :param write_card: the card by card writer that's used for the other
+        cards (default=None -> card.write_bdf(8, print_card_8) and
+        GRID.write_bdf2(8))
+    :returns msg: the cards as a string
+    """
+    if write_card is None:
+        write_card = _write_card_8
+
+    msg = []
+    i = 0
+    ncards = len(cards)
+    while i < ncards:
+        card_class = cards[i].__class__
+        class_name = card_class.__name__
+        j = i + 1
+        while j < ncards and cards[j].__class__ is card_class and j - i < BULK_CHUNK_SIZE:
+            j += 1
+
+        if class_name in _BULK_WRITERS and j - i > 1:
+            get_blocks, strip_lines = _BULK_WRITERS[class_name]
+            card_name = cards[i].type
+            msg.append(_write_bulk_cards_8(card_name, cards[i:j], get_blocks,
+                                           strip_lines, write_card))
+        else:
+            for card in cards[i:j]:
+                msg.append(write_card(card))
+        i = j
+    return ''.join(msg)
@@ -1,6 +1,7 @@
 from __future__ import print_function
 
 from pyNastran.bdf.test.test_field_writer import TestFieldWriter
+from pyNastran.bdf.test.test_field_writer_bulk import TestFieldWriterBulk
 from pyNastran.bdf.test.bdf_unit_tests import TestBDF, BaseCard_Test
 from pyNastran.bdf.test.test_case_control_deck import CaseControlTest
 
@@ -11,6 +12,9 @@ from pyNastran.bdf.test.unit.test_mass import *
 from pyNastran.bdf.test.unit.test_assign_type import *
 from pyNastran.bdf.test.unit.test_read_write import *
 from pyNastran.bdf.test.unit.test_sum_loads import *
+from pyNastran.bdf.test.unit.test_xref import *
+from pyNastran.bdf.test.unit.test_topology import *
+from pyNastran.bdf.test.unit.test_geometry import *
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -66,6 +66,11 @@ class TestBDF(Tester):
         assert allclose(norm((cg1 - cg2)**2), 0.0), 'cg1-cg2=%s' % (cg1 - cg2)
         assert allclose(norm((I1  -  I2)**2), 0.0), 'I1-I2=%s' % (I1 - I2)
 
+        mass3, cg3, I3 = fem1.mass_properties(reference_point=reference_point, sym_axis=sym_axis, vectorized=True)
+        assert allclose(mass1, mass3), 'mass1_sp=%s mass3_vectorized=%s' % (mass1, mass3)
+        assert allclose(cg1, cg3), 'cg1-cg3=%s' % (cg1 - cg3)
+        assert allclose(I1, I3), 'I1-I3=%s' % (I1 - I3)
+
     def test_bdf_02(self):
         bdfFilename = os.path.join('plate_py', 'plate_py.dat')
         folder = os.path.abspath(os.path.join(pkg_path, '..', 'models'))
@@ -0,0 +1,113 @@
+from __future__ import (nested_scopes, generators, division, absolute_import,
+                        print_function, unicode_literals)
+import unittest
+
+from numpy import array, concatenate, linspace
+from numpy.random import RandomState
+
+from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.fieldWriter import print_float_8, print_field_8
+from pyNastran.bdf.field_writer_bulk import (print_floats_8, print_float_8_block,
+                                             print_int_8_block, print_field_8_block,
+                                             write_cards_8, _write_card_8)
+
+
+class TestFieldWriterBulk(unittest.TestCase):
+
+    def test_floats_8(self):
+        """the bulk float formatter must match print_float_8"""
+        random = RandomState(0)
+        values = [random.uniform(-1., 1., 2000) * 10. ** exponent
+                  for exponent in range(-10, 10)]
+        values += [random.randint(-20000, 20000, 2000) / 10. ** ndecimals
+                   for ndecimals in range(0, 9)]
+
+        # the decades and rounding boundaries
+        edges = []
+        for exponent in range(-9, 9):
+            value = 10. ** exponent
+            for eps in [0., 1e-12, -1e-12, 5e-8, -5e-8]:
+                edges += [value * (1. + eps), -value * (1. + eps)]
+        for ndecimals in range(0, 8):
+            edges += [(i + 0.5) / 10. ** ndecimals for i in range(-20, 20)]
+        edges += [0., -0., 1e6, 999999.95, 999999.94, -99999.95, -99999.94,
+                  0.001, 0.00099999, 0.01, -0.01, -0.0099999, 1e300, -1e-300]
+        values = concatenate(values + [array(edges), linspace(-1000., 1000., 20001)])
+
+        fields = print_floats_8(values)
+        for value, field in zip(values.tolist(), fields):
+            self.assertEqual(field, print_float_8(value), 'value=%r' % value)
+
+        # 9 character fields are flagged
+        block, is_valid = print_float_8_block([1., -999999.95])
+        self.assertEqual(list(is_valid), [True, False])
+
+    def test_fields_8(self):
+        """the bulk int/float/str/None formatter must match print_field_8"""
+        ints = [0, 1, -1, 12345678, -1234567, 99999999, -9999999]
+        block, is_valid = print_int_8_block(ints + [123456789, -12345678])
+        self.assertEqual(list(is_valid), [True] * len(ints) + [False, False])
+        fields = [field.decode('ascii') for field in block.view('|S8').ravel()]
+        self.assertEqual(fields[:len(ints)], [print_field_8(value) for value in ints])
+
+        values = [1, None, 2.5, 'ABC', -3, 1e-9, None, '12345678', 0.]
+        block, is_valid = print_field_8_block(values)
+        self.assertTrue(is_valid.all())
+        fields = [field.decode('ascii') for field in block.view('|S8').ravel()]
+        self.assertEqual(fields, [print_field_8(value) for value in values])
+
+        block, is_valid = print_field_8_block([1, 'ABCDEFGHI'])
+        self.assertEqual(list(is_valid), [True, False])
+
+    def test_write_cards_8(self):
+        """write_cards_8 must match the card by card writers"""
+        model = BDF(debug=False)
+        cards = [
+            (['GRID', 1, None, 0., 0., 0.], ''),
+            (['GRID', 2, 1, 1.25, -0.001, 1e-9], '$ grid 2\n'),
+            (['GRID', 3, None, 123456.7, 2., 3., 2, '123', 4], ''),
+            (['GRID', 4, None, -99999.95, 0.5, -1.5], ''),
+            (['GRID', 5, None, 1., 1., 1.], ''),
+            (['CQUAD4', 10, 1, 1, 2, 3, 4], ''),
+            (['CQUAD4', 11, 2, 1, 2, 3, 4, 45., 0.1], '$ quad 11\n'),
+            (['CQUAD4', 12, 2, 1, 2, 3, 4, 1, 0.1, None, 1, 0.5, 0.5, 0.5, 0.5], ''),
+            (['CQUAD4', 13, 2, 1, 2, 3, 4, None, -0.5], ''),
+            (['CTRIA3', 20, 1, 1, 2, 3], ''),
+            (['CTRIA3', 21, 1, 1, 2, 3, 30.], ''),
+            (['CHEXA', 30, 3, 1, 2, 3, 4, 5, 6, 7, 8], ''),
+            (['CHEXA', 31, 3, 1, 2, 3, 4, 5, 6, 7, 8], '$ hexa 31\n'),
+            (['CTETRA', 40, 4, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10], ''),
+            (['CTETRA', 41, 4, 1, 2, 3, 4, 5, None, 7, 8, 9, 10], ''),
+            (['CBAR', 50, 5, 1, 2, 0., 1., 0.], ''),
+            (['CBAR', 51, 5, 2, 3, 0., 0., 1.], ''),
+            (['CONM2', 60, 1, 0, 1.5], ''),
+            (['CONM2', 61, 2, 0, 2.5, 0.1, 0.2, 0.3], ''),
+            (['FORCE', 100, 1, 0, 1., 1., 0., 0.], ''),
+            (['FORCE', 100, 2, 0, 2., 0., -1., 0.], '$ force\n'),
+            (['PLOAD4', 100, 10, 1.], ''),
+            (['PLOAD4', 100, 11, 1., 2., 3., 4.], ''),
+        ]
+        for card, comment in cards:
+            model.add_card(card, card[0], comment=comment, is_list=True)
+
+        card_groups = [
+            [node for (nid, node) in sorted(model.nodes.items())],
+            [element for (eid, element) in sorted(model.elements.items())],
+            [mass for (eid, mass) in sorted(model.masses.items())],
+            model.loads[100],
+        ]
+        for card_objs in card_groups:
+            expected = ''.join([_write_card_8(card) for card in card_objs])
+            self.assertEqual(write_cards_8(card_objs), expected)
+
+        # the other writers are used for the unsupported cards
+        written = []
+        def write_card(card):
+            written.append(card)
+            return _write_card_8(card)
+        write_cards_8(card_groups[1], write_card)
+        self.assertEqual(sorted([card.eid for card in written]), [12])
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
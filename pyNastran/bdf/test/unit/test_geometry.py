@@ -0,0 +1,119 @@
+import unittest
+
+from numpy import allclose, array
+from numpy.random import RandomState
+
+from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.bdf_geometry import (shell_area_centroid_normal,
+                                        solid_volume_centroid)
+
+log = None
+class TestGeometry(unittest.TestCase):
+
+    def _get_model(self):
+        """
+        every supported shell/solid with and without its midside nodes on
+        (warped) random nodes, some of which are in a rotated system
+        """
+        model = BDF(log=log, debug=False)
+        random = RandomState(42)
+        cards = [
+            ['CORD2R', 1, 0, 1., 2., 3., 1., 2., 4., 2., 3., 3.],
+            ['MAT1', 1, 3.0e7, None, 0.3, 0.1],
+            ['PSHELL', 1, 1, 0.1],
+            ['PSHEAR', 3, 1, 0.1],
+            ['PSOLID', 2, 1],
+
+            ['CTRIA3', 1, 1, 1, 2, 3],
+            ['CTRIAR', 2, 1, 4, 5, 6],
+            ['CTRIA6', 3, 1, 1, 2, 3, 4, 5, 6],
+            ['CTRIA6', 4, 1, 7, 8, 9],
+            ['CQUAD4', 10, 1, 1, 2, 3, 4],
+            ['CQUAD4', 11, 1, 5, 6, 7, 8],
+            ['CQUADR', 12, 1, 9, 10, 11, 12],
+            ['CQUAD8', 13, 1, 1, 2, 3, 4, 5, 6, 7, 8],
+            ['CQUAD8', 14, 1, 9, 10, 11, 12, None, 14],
+            ['CSHEAR', 15, 3, 13, 14, 15, 16],
+
+            ['CTETRA', 20, 2, 1, 2, 3, 4],
+            ['CTETRA', 21, 2, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14],
+            ['CPENTA', 22, 2, 1, 2, 3, 4, 5, 6],
+            ['CPENTA', 23, 2, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18,
+             19, 20, 21],
+            ['CHEXA', 24, 2, 1, 2, 3, 4, 5, 6, 7, 8],
+            ['CHEXA', 25, 2, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20,
+             21, 22, 23, 24, 25, 26, 27, 28, 29, 30],
+        ]
+        for nid in range(1, 31):
+            cp = 1 if nid % 3 == 0 else 0
+            cards.append(['GRID', nid, cp] + random.uniform(-1., 1., 3).tolist())
+        for card in cards:
+            model.add_card(card, card[0], is_list=True)
+        model.cross_reference()
+        return model
+
+    def test_shells(self):
+        """the shell kernels must match Area(), Centroid() and Normal()"""
+        model = self._get_model()
+        expected_eids = {
+            'CTRIA3' : [1], 'CTRIAR' : [2], 'CTRIA6' : [3, 4],
+            'CQUAD4' : [10, 11], 'CQUADR' : [12], 'CQUAD8' : [13, 14],
+            'CSHEAR' : [15], 'CQUAD' : [],
+        }
+        for element_type, eids_expected in sorted(expected_eids.items()):
+            eids, area, centroid, normal = model.get_area_centroid_normal(element_type)
+            self.assertEqual(list(eids), eids_expected)
+            for i, eid in enumerate(eids):
+                element = model.elements[eid]
+                msg = '%s eid=%s' % (element_type, eid)
+                self.assertTrue(allclose(area[i], element.Area()), msg)
+                self.assertTrue(allclose(centroid[i], element.Centroid()), msg)
+                self.assertTrue(allclose(normal[i], element.Normal()), msg)
+
+        with self.assertRaises(NotImplementedError):
+            model.get_area_centroid_normal('CHEXA')
+
+    def test_solids(self):
+        """the solid kernels must match Volume() and Centroid()"""
+        model = self._get_model()
+        for element_type, eids_expected in [('CTETRA', [20, 21]),
+                                            ('CPENTA', [22, 23]),
+                                            ('CHEXA', [24, 25])]:
+            eids, volume, centroid = model.get_volume_centroid(element_type)
+            self.assertEqual(list(eids), eids_expected)
+            for i, eid in enumerate(eids):
+                element = model.elements[eid]
+                msg = '%s eid=%s' % (element_type, eid)
+                self.assertTrue(allclose(volume[i], element.Volume()), msg)
+                self.assertTrue(allclose(centroid[i], element.Centroid()), msg)
+
+        with self.assertRaises(NotImplementedError):
+            model.get_volume_centroid('CQUAD4')
+
+    def test_kernels(self):
+        """the kernels on a unit square/cube"""
+        xyz = array([[0., 0., 0.], [1., 0., 0.], [1., 1., 0.], [0., 1., 0.],
+                     [0., 0., 1.], [1., 0., 1.], [1., 1., 1.], [0., 1., 1.]])
+        area, centroid, normal = shell_area_centroid_normal(
+            'CQUAD4', xyz, array([[0, 1, 2, 3], [0, 3, 2, 1]]))
+        self.assertTrue(allclose(area, [1., 1.]))
+        self.assertTrue(allclose(centroid, [[0.5, 0.5, 0.], [0.5, 0.5, 0.]]))
+        self.assertTrue(allclose(normal, [[0., 0., 1.], [0., 0., -1.]]))
+
+        area, centroid, normal = shell_area_centroid_normal(
+            'CTRIA3', xyz, array([[0, 1, 2], [0, 1, 1]]))
+        self.assertTrue(allclose(area, [0.5, 0.]))
+        self.assertTrue(allclose(normal[0], [0., 0., 1.]))
+
+        volume, centroid = solid_volume_centroid('CHEXA', xyz, array([list(range(8))]))
+        self.assertTrue(allclose(volume, [1.]))
+        self.assertTrue(allclose(centroid, [[0.5, 0.5, 0.5]]))
+        volume, centroid = solid_volume_centroid('CPENTA', xyz, array([[0, 1, 2, 4, 5, 6]]))
+        self.assertTrue(allclose(volume, [0.5]))
+
+        with self.assertRaises(ValueError):
+            solid_volume_centroid('CHEXA', xyz, array([[0, 1, 2, 3]]))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -1,7 +1,7 @@
 import unittest
 
 import os
-from numpy import array
+from numpy import array, allclose
 import pyNastran
 from pyNastran.bdf.bdf import BDF
 from pyNastran.utils import object_methods
@@ -148,6 +148,25 @@ class TestMass(unittest.TestCase):
         centroid = array([2/3., 1/3., 1.])
         self.verify_psolid_element(penta, mass, volume, centroid, rho, E, G, nu)
 
+    def test_mass_properties_vectorized(self):
+        model = BDF(debug=False, log=None)
+        bdfname = os.path.join(testpath, 'test_mass.dat')
+        model.read_bdf(bdfname, include_dir=None, xref=True)
+
+        for reference_point in [None, array([1., 2., 3.]), 'cg']:
+            mass1, cg1, I1 = model.mass_properties(reference_point=reference_point)
+            mass2, cg2, I2 = model.mass_properties(reference_point=reference_point,
+                                                   vectorized=True)
+            self.assertAlmostEqual(mass1, mass2)
+            self.assertTrue(allclose(cg1, cg2), msg='cg1=%s cg2=%s' % (cg1, cg2))
+            self.assertTrue(allclose(I1, I2), msg='I1=%s I2=%s' % (I1, I2))
+
+        mass1, cg1, I1 = model.mass_properties(element_ids=[7, 8], scale=1.0)
+        mass2, cg2, I2 = model.mass_properties(element_ids=[7, 8], scale=1.0, vectorized=True)
+        self.assertAlmostEqual(mass1, 0.2 + 1/30.)
+        self.assertAlmostEqual(mass2, 0.2 + 1/30.)
+        self.assertTrue(allclose(cg1, cg2), msg='cg1=%s cg2=%s' % (cg1, cg2))
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
\ No newline at end of file
@@ -1,8 +1,11 @@
 import unittest
 
 import os
+import gzip
 import pyNastran
 from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf import bdf_tokenizer
+from pyNastran.bdf.bdfInterface import bdf_writeMesh
 
 root_path = pyNastran.__path__[0]
 test_path = os.path.join(root_path, 'bdf', 'test', 'unit')
@@ -129,6 +132,169 @@ class TestReadWrite(unittest.TestCase):
         #print('nodes =', model.nodes)
         self.assertEquals(len(model.nodes), 3)
 
+    def test_bulk_tokenizer(self):
+        """
+        Tests the chunked bulk data tokenizer and the parallel reader
+        against the line streams
+        """
+        bdf_filename = os.path.join(test_path, 'tokenizer.bdf')
+        include_filename = os.path.join(test_path, 'tokenizer.inc')
+        with open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write('SOL 101\n'
+                           'CEND\n'
+                           'BEGIN BULK\n'
+                           '$ small field\n'
+                           'GRID           1       0      0.      0.      0.\n'
+                           'GRID*                  2               0              1.              0.\n'
+                           '*                     0.\n'
+                           'GRID,3,,2.,0.,0.   $ csv\n'
+                           'GRID\t4\t\t3.\t0.\t0.\n'
+                           "INCLUDE 'tokenizer.inc'\n"
+                           '$ rod\n'
+                           'CROD,10,1,1,2\n'
+                           'PROD,1,1,0.1\n'
+                           'MAT1,1,3.0e7,,0.3\n'
+                           'FAKECARD,1,2\n'
+                           'ENDDATA\n'
+                           'GRID,100\n')
+        with open(include_filename, 'w') as include_file:
+            include_file.write('$ included\n'
+                               'CONROD,11,3,4,1,0.1\n'
+                               '+,1.0\n')
+
+        model = BDF(log=log, debug=False)
+        model.read_bdf(bdf_filename, xref=False)
+        model2 = BDF(log=log, debug=False)
+        model2.read_bdf(bdf_filename, xref=False, use_bulk_tokenizer=True)
+
+        # small chunks, so the cards are split across the workers
+        chunk_bytes = bdf_tokenizer.PARALLEL_CHUNK_BYTES
+        bdf_tokenizer.PARALLEL_CHUNK_BYTES = 40
+        try:
+            model3 = BDF(log=log, debug=False)
+            model3.read_bdf(bdf_filename, xref=False, num_workers=2)
+        finally:
+            bdf_tokenizer.PARALLEL_CHUNK_BYTES = chunk_bytes
+        os.remove(bdf_filename)
+        os.remove(include_filename)
+
+        for modeli in [model2, model3]:
+            self.assertEqual(sorted(modeli.nodes), [1, 2, 3, 4])
+            self.assertEqual(sorted(modeli.elements), [10, 11])
+            self.assertEqual(model.card_count, modeli.card_count)
+            self.assertEqual(model.rejects, modeli.rejects)
+            for nid, node in model.nodes.items():
+                node2 = modeli.nodes[nid]
+                self.assertEqual(str(node), str(node2))
+                self.assertEqual(node.comment(), node2.comment())
+            for eid, elem in model.elements.items():
+                self.assertEqual(str(elem), str(modeli.elements[eid]))
+
+    def test_read_cache(self):
+        """
+        Tests that the model cache is used until an INCLUDE file changes
+        """
+        bdf_filename = os.path.join(test_path, 'cache.bdf')
+        include_filename = os.path.join(test_path, 'cache.inc')
+        cache_dir = os.path.join(test_path, 'cache_dir')
+        with open(bdf_filename, 'w') as bdf_file:
+            bdf_file.write('SOL 101\n'
+                           'CEND\n'
+                           'BEGIN BULK\n'
+                           '$ node 1\n'
+                           'GRID,1,,0.,0.,0.\n'
+                           'GRID,2,,1.,0.,0.\n'
+                           "INCLUDE 'cache.inc'\n"
+                           'CROD,10,1,1,2\n'
+                           'PROD,1,1,0.1\n'
+                           'MAT1,1,3.0e7,,0.3\n'
+                           'ENDDATA\n')
+        with open(include_filename, 'w') as include_file:
+            include_file.write('GRID,3,,2.,0.,0.\n')
+
+        model = BDF(log=log, debug=False)
+        model.read_bdf(bdf_filename, xref=True, cache_dir=cache_dir)
+        cache_filenames = os.listdir(cache_dir)
+        self.assertEqual(len(cache_filenames), 1)
+        self.assertEqual(len(model.bdf_filenames), 2)
+
+        model2 = BDF(log=log, debug=False)
+        model2.read_bdf(bdf_filename, xref=True, cache_dir=cache_dir)
+        self.assertEqual(sorted(model2.nodes), [1, 2, 3])
+        self.assertEqual(model.card_count, model2.card_count)
+        self.assertEqual(model.rejects, model2.rejects)
+        self.assertEqual(model2.nodes[1].comment(), '$ node 1\n')
+        self.assertEqual(list(model2.nodes[3].Position()), [2., 0., 0.])
+        self.assertEqual(model2.elements[10].Length(), 1.0)
+        self.assertTrue(model2.log is not model.log)
+
+        # changing the INCLUDE file invalidates the cache
+        with open(include_filename, 'w') as include_file:
+            include_file.write('GRID,3,,2.,0.,0.\n'
+                               'GRID,4,,3.,0.,0.\n')
+        model3 = BDF(log=log, debug=False)
+        model3.read_bdf(bdf_filename, xref=True, cache_dir=cache_dir)
+        self.assertEqual(sorted(model3.nodes), [1, 2, 3, 4])
+
+        # a second read only uses the files of that read
+        other_filename = os.path.join(test_path, 'cache_other.bdf')
+        with open(other_filename, 'w') as bdf_file:
+            bdf_file.write('GRID,5,,4.,0.,0.\n')
+        model3.read_bdf(other_filename, xref=False, punch=True)
+        self.assertEqual(model3.bdf_filenames, [other_filename])
+        os.remove(other_filename)
+
+        os.remove(bdf_filename)
+        os.remove(include_filename)
+        for cache_filename in os.listdir(cache_dir):
+            os.remove(os.path.join(cache_dir, cache_filename))
+        os.rmdir(cache_dir)
+
+    def test_write_streaming(self):
+        """
+        Tests the parallel, gzip and INCLUDE file writers against the
+        serial writer
+        """
+        model = BDF(log=log, debug=False)
+        bdf_name = os.path.join(test_path, 'test_mass.dat')
+        model.read_bdf(bdf_name)
+        out_filename = os.path.join(test_path, 'test_mass_stream.out')
+        model.write_bdf(out_filename, interspersed=False)
+        with open(out_filename, 'r') as bdf_file:
+            expected = bdf_file.read()
+
+        # small chunks, so the cards are split across the workers
+        chunk_size = bdf_writeMesh.WRITE_CHUNK_SIZE
+        bdf_writeMesh.WRITE_CHUNK_SIZE = 2
+        try:
+            model.write_bdf(out_filename, interspersed=False, num_workers=2)
+        finally:
+            bdf_writeMesh.WRITE_CHUNK_SIZE = chunk_size
+        with open(out_filename, 'r') as bdf_file:
+            self.assertEqual(bdf_file.read(), expected)
+
+        gz_filename = out_filename + '.gz'
+        model.write_bdf(gz_filename, interspersed=False)
+        with gzip.open(gz_filename, 'rb') as bdf_file:
+            self.assertEqual(bdf_file.read().decode('ascii'), expected)
+
+        out_filename2 = os.path.join(test_path, 'test_mass_stream2.bdf')
+        model.write_bdf(out_filename2, interspersed=False, include_families=True)
+        nodes_filename = bdf_writeMesh.get_family_filename(out_filename2, 'nodes')
+        self.assertEqual(os.path.basename(nodes_filename), 'test_mass_stream2.nodes.bdf')
+        model2 = BDF(log=log, debug=False)
+        model2.read_bdf(out_filename2)
+        self.assertEqual(sorted(model2.nodes), sorted(model.nodes))
+        self.assertEqual(sorted(model2.elements), sorted(model.elements))
+        family_filenames = [bdf_writeMesh.get_family_filename(out_filename2, family)
+                            for family in bdf_writeMesh.INCLUDE_FAMILIES]
+        self.assertEqual(model2.bdf_filenames[1:],
+                         [filename for filename in family_filenames
+                          if os.path.exists(filename)])
+
+        for filename in [out_filename, gz_filename] + model2.bdf_filenames:
+            os.remove(filename)
+
     def test_read_bad_01(self):
         model = BDF()
         model.active_filenames = ['fake.file']
@@ -278,5 +278,128 @@ class TestLoadSum(unittest.TestCase):
             self.assertTrue(allclose(F1_expected, F), 'loadcase_id=%s F_expected=%s F=%s' % (loadcase_id, F1_expected, F))
             self.assertTrue(allclose(M1_expected, M), 'loadcase_id=%s M_expected=%s M=%s' % (loadcase_id, M1_expected, M))
 
+    def test_loads_sum_vectorized(self):
+        """the compiled load cases must match the card by card summation"""
+        p0 = array([1., 2., 3.])
+        for bdf_filename in [os.path.join('solid_bending', 'solid_bending.bdf'),
+                             os.path.join('sol_101_elements', 'static_solid_shell_bar.bdf'),
+                             os.path.join('plate', 'plate.bdf')]:
+            model = BDF(log=log, debug=False)
+            model.read_bdf(os.path.join(model_path, bdf_filename))
+            loadcase_ids = sorted(model.loads)
+            forces, moments = model.sum_forces_moments_loadcases(p0, loadcase_ids)
+            for i, loadcase_id in enumerate(loadcase_ids):
+                F_expected, M_expected = model.sum_forces_moments(p0, loadcase_id)
+                F, M = model.sum_forces_moments(p0, loadcase_id, vectorized=True)
+                msg = '%s loadcase_id=%s' % (bdf_filename, loadcase_id)
+                self.assertTrue(allclose(F_expected, F), msg)
+                self.assertTrue(allclose(M_expected, M), msg)
+                self.assertTrue(allclose(F_expected, forces[i]), msg)
+                self.assertTrue(allclose(M_expected, moments[i]), msg)
+
+    def test_loads_sum_compiled(self):
+        """FORCE/MOMENT/PLOAD/PLOAD2/PLOAD4 on a 2x1 plate and the cache"""
+        model = BDF(log=log, debug=False)
+        cards = [
+            ['GRID', 1, None, 0., 0., 0.],
+            ['GRID', 2, None, 1., 0., 0.],
+            ['GRID', 3, None, 1., 1., 0.],
+            ['GRID', 4, None, 0., 1., 0.],
+            ['GRID', 5, None, 2., 0., 0.],
+            ['GRID', 6, None, 2., 1., 0.],
+            ['MAT1', 1, 3.0e7, None, 0.3],
+            ['PSHELL', 1, 1, 0.1],
+            ['CQUAD4', 1, 1, 1, 2, 3, 4],
+            ['CTRIA3', 2, 1, 2, 5, 6],
+            ['CTRIA3', 3, 1, 2, 6, 3],
+            ['FORCE', 10, 5, 0, 2., 0., 0., 1.],
+            ['MOMENT', 10, 6, 0, 3., 1., 0., 0.],
+            ['PLOAD', 10, 4., 1, 2, 3, 4],
+            ['PLOAD2', 10, 5., 2, 3],
+            ['PLOAD4', 10, 1, 6.],
+            ['LOAD', 20, 2., 3., 10],
+        ]
+        for card in cards:
+            model.add_card(card, card[0], is_list=True)
+        model.cross_reference()
+
+        # force and moment about the origin
+        F_expected = array([0., 0., 2. + 4. + 5. * 1. + 6.])
+        M_expected = array([3., 0., 0.])
+        M_expected += cross([2., 0., 0.], [0., 0., 2.])  # FORCE
+        M_expected += cross([0.5, 0.5, 0.], [0., 0., 4. + 6.])  # PLOAD/PLOAD4
+        M_expected += cross([5. / 3., 1. / 3., 0.], [0., 0., 2.5])  # PLOAD2
+        M_expected += cross([4. / 3., 2. / 3., 0.], [0., 0., 2.5])
+
+        p0 = array([0., 0., 0.])
+        load_sum = model.get_load_sum(10)
+        self.assertEqual(len(load_sum.scales), 5)
+        F, M = model.sum_forces_moments(p0, 10, vectorized=True)
+        self.assertTrue(allclose(F_expected, F), 'F_expected=%s F=%s' % (F_expected, F))
+        self.assertTrue(allclose(M_expected, M), 'M_expected=%s M=%s' % (M_expected, M))
+
+        p0 = array([1., 2., 3.])
+        forces, moments = model.sum_forces_moments_loadcases(p0, [10, 20])
+        self.assertTrue(allclose(forces, [F_expected, 6. * F_expected]))
+        M_expected -= cross(p0, F_expected)
+        self.assertTrue(allclose(moments, [M_expected, 6. * M_expected]))
+
+        # the cache
+        self.assertTrue(model.get_load_sum(10) is load_sum)
+        model.add_card(['FORCE', 10, 1, 0, 1., 0., 0., -1.], 'FORCE', is_list=True)
+        model.cross_reference(incremental=True)
+        self.assertFalse(model.get_load_sum(10) is load_sum)
+        F, M = model.sum_forces_moments(p0, 10, vectorized=True)
+        self.assertTrue(allclose(F_expected - [0., 0., 1.], F))
+
+    def test_loads_sum_solid_faces(self):
+        """PLOAD4 on the faces of a CHEXA, CPENTA and CTETRA"""
+        model = BDF(log=log, debug=False)
+        cards = [
+            ['MAT1', 1, 3.0e7, None, 0.3],
+            ['PSOLID', 1, 1],
+            ['CHEXA', 1, 1, 1, 2, 3, 4, 5, 6, 7, 8],
+            ['CPENTA', 2, 1, 11, 12, 13, 14, 15, 16],
+            ['CTETRA', 3, 1, 21, 22, 23, 24],
+            ['PLOAD4', 10, 1, 2., None, None, None, 5, 7],  # top (quad)
+            ['PLOAD4', 10, 2, 3., None, None, None, 13, 14],  # x=2 (quad)
+            ['PLOAD4', 10, 2, 4., None, None, None, 15],  # top (triangle)
+            ['PLOAD4', 10, 3, 6., None, None, None, 21, 24],  # bottom
+            ['PLOAD4', 11, 1, 2., None, None, None, 1, 7],
+        ]
+        xyz = [[0., 0., 0.], [1., 0., 0.], [1., 1., 0.], [0., 1., 0.]]
+        for i, (x, y, z) in enumerate(xyz):
+            cards += [['GRID', i + 1, None, x, y, z], ['GRID', i + 5, None, x, y, z + 1.]]
+        for i, (x, y, z) in enumerate([xyz[0], xyz[1], xyz[3]]):
+            cards += [['GRID', i + 11, None, x + 2., y, z],
+                      ['GRID', i + 14, None, x + 2., y, z + 1.],
+                      ['GRID', i + 21, None, x + 4., y, z]]
+        cards.append(['GRID', 24, None, 4., 0., 1.])
+        for card in cards:
+            model.add_card(card, card[0], is_list=True)
+        model.cross_reference()
+
+        # a positive pressure pushes into the element
+        F_expected = array([3., 0., -2. - 2. + 3.])
+        M_expected = (cross([0.5, 0.5, 1.], [0., 0., -2.]) +
+                      cross([2., 0.5, 0.5], [3., 0., 0.]) +
+                      cross([2. + 1. / 3., 1. / 3., 1.], [0., 0., -2.]) +
+                      cross([4. + 1. / 3., 1. / 3., 0.], [0., 0., 3.]))
+        p0 = array([0., 0., 0.])
+        F, M = model.sum_forces_moments(p0, 10, vectorized=True)
+        self.assertTrue(allclose(F_expected, F), 'F_expected=%s F=%s' % (F_expected, F))
+        self.assertTrue(allclose(M_expected, M), 'M_expected=%s M=%s' % (M_expected, M))
+
+        # G1/G3 aren't diagonal corners of a face
+        with self.assertRaises(ValueError):
+            model.sum_forces_moments(p0, 11, vectorized=True)
+
+        # the PLOAD4s are on CTETRA faces
+        model = BDF(log=log, debug=False)
+        model.read_bdf(os.path.join(model_path, 'contact', 'model1_sim1-solution_1.bdf'))
+        F, M = model.sum_forces_moments(p0, 2, vectorized=True)
+        self.assertGreater(abs(F).max(), 0.)
+
+
 if __name__ == '__main__':  # pragma: no cover
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+
+from pyNastran.bdf.bdf import BDF
+
+log = None
+class TestTopology(unittest.TestCase):
+
+    def _get_model(self):
+        """
+        2 CQUAD4s and a CTRIA3 in a strip, a CBAR and 2 stacked CHEXAs
+        """
+        model = BDF(log=log, debug=False)
+        cards = [
+            ['CQUAD4', 1, 1, 1, 2, 5, 4],
+            ['CQUAD4', 2, 1, 2, 3, 6, 5],
+            ['CTRIA3', 3, 1, 3, 7, 6],
+            ['CBAR', 4, 2, 7, 8, 0., 0., 1.],
+            ['CHEXA', 10, 3, 11, 12, 13, 14, 15, 16, 17, 18],
+            ['CHEXA', 11, 3, 15, 16, 17, 18, 19, 20, 21, 22],
+        ]
+        for nid in list(range(1, 9)) + list(range(11, 23)) + [100]:
+            cards.append(['GRID', nid, None, float(nid), 0., 0.])
+        for card in cards:
+            model.add_card(card, card[0], is_list=True)
+        return model
+
+    def test_topology_nodes(self):
+        """the node -> element map and element neighbors"""
+        model = self._get_model()
+        topology = model.get_topology()
+        self.assertEqual(list(topology.eids), [1, 2, 3, 4, 10, 11])
+        self.assertEqual(list(topology.get_element_ids(5)), [1, 2])
+        self.assertEqual(list(topology.get_element_ids(7)), [3, 4])
+        self.assertEqual(list(topology.get_element_ids(100)), [])
+        self.assertEqual(list(topology.get_node_ids(3)), [3, 7, 6])
+
+        nid_to_eids = model.get_node_id_to_element_ids_map()
+        self.assertEqual(nid_to_eids[6], [2, 3])
+        self.assertEqual(nid_to_eids[100], [])
+
+        indptr, eids = topology.get_element_neighbors('node')
+        neighbors = dict([(eid, list(eids[indptr[i]:indptr[i + 1]]))
+                          for i, eid in enumerate(topology.eids)])
+        self.assertEqual(neighbors[1], [2])
+        self.assertEqual(neighbors[3], [2, 4])
+        self.assertEqual(neighbors[10], [11])
+
+        indptr, eids = topology.get_element_neighbors('edge')
+        self.assertEqual(list(eids[indptr[1]:indptr[2]]), [1, 3])
+        self.assertEqual(list(eids[indptr[2]:indptr[3]]), [2])
+
+        indptr, eids = topology.get_element_neighbors('face')
+        self.assertEqual(list(eids[indptr[4]:indptr[5]]), [11])
+        self.assertEqual(list(eids[indptr[0]:indptr[1]]), [])
+
+    def test_topology_edges_faces(self):
+        """the free/shared edges and faces"""
+        model = self._get_model()
+        topology = model.get_topology()
+
+        # 4 + 4 + 3 shell edges, 1 bar edge, 20 hexa edges
+        self.assertEqual(len(topology.edges), 9 + 1 + 20)
+        free_edges = set([tuple(edge) for edge in topology.get_free_edges()])
+        self.assertEqual(len(free_edges), 7)
+        self.assertTrue((1, 2) in free_edges)
+        self.assertFalse((2, 5) in free_edges)
+        self.assertEqual([list(edge) for edge in topology.get_shared_edges()],
+                         [[2, 5], [3, 6], [15, 16], [15, 18], [16, 17], [17, 18]])
+
+        # 3 shell faces + 11 hexa faces
+        self.assertEqual(len(topology.faces), 14)
+        self.assertEqual(len(topology.get_free_faces()), 10)
+        self.assertEqual([list(face) for face in topology.get_shared_faces()],
+                         [[15, 16, 17, 18]])
+        tri_faces = [list(face) for face in topology.faces if face[3] == -1]
+        self.assertEqual(tri_faces, [[3, 7, 6, -1]])
+
+    def test_topology_cache(self):
+        """the index is rebuilt when an element changes"""
+        model = self._get_model()
+        topology = model.get_topology()
+        self.assertTrue(model.get_topology() is topology)
+
+        model.add_card(['CTRIA3', 5, 1, 1, 4, 100], 'CTRIA3', is_list=True)
+        topology2 = model.get_topology()
+        self.assertFalse(topology2 is topology)
+        self.assertEqual(list(topology2.get_element_ids(100)), [5])
+
+        del model.elements[5]
+        self.assertEqual(list(model.get_topology().get_element_ids(100)), [])
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
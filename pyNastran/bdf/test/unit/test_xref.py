@@ -0,0 +1,114 @@
+import unittest
+
+from numpy import allclose
+
+from pyNastran.bdf.bdf import BDF, BDFCard, PSHELL, CORD2R, MAT1, MAT8
+
+log = None
+class TestXref(unittest.TestCase):
+
+    def _get_model(self):
+        model = BDF(log=log, debug=False)
+        cards = [
+            ['GRID', 1, None, 0., 0., 0.],
+            ['GRID', 2, None, 1., 0., 0.],
+            ['GRID', 3, None, 1., 1., 0.],
+            ['GRID', 4, None, 0., 1., 0.],
+            ['GRID', 5, 2, 0., 0., 0.],
+            ['CORD2R', 1, 0, 1., 0., 0., 1., 0., 1., 2., 0., 0.],
+            ['CORD2R', 2, 1, 0., 0., 1., 0., 0., 2., 1., 0., 1.],
+            ['CQUAD4', 10, 1, 1, 2, 3, 4],
+            ['PSHELL', 1, 1, 0.1],
+            ['MAT1', 1, 3.0e7, None, 0.3, 0.1],
+            ['FORCE', 100, 1, 0, 1., 1., 0., 0.],
+            ['SPC', 1, 1, 123456, 0.],
+        ]
+        for card in cards:
+            model.add_card(card, card[0], is_list=True)
+        return model
+
+    def test_xref_incremental(self):
+        """
+        Tests that cross_reference(incremental=True) links the new cards
+        and the cards that reference a replaced card
+        """
+        model = self._get_model()
+        model.cross_reference()
+        nspcs = len(str(model.spcObject))
+
+        # replace a property/material and a coordinate system that another
+        # coordinate system and a node depend on; add a node/element/load
+        pshell = PSHELL(BDFCard(['PSHELL', 1, 2, 0.2]))
+        model.add_property(pshell, allowOverwrites=True)
+        mat = MAT1(BDFCard(['MAT1', 2, 1.0e7, None, 0.3, 0.2]))
+        model.add_structural_material(mat)
+        coord = CORD2R(BDFCard(['CORD2R', 1, 0, 2., 0., 0., 2., 0., 1., 3., 0., 0.]))
+        model.add_coord(coord, allowOverwrites=True)
+        for card in [['GRID', 6, None, 2., 0., 0.],
+                     ['CQUAD4', 11, 1, 2, 6, 3, 3],
+                     ['FORCE', 100, 6, 0, 1., 1., 0., 0.],
+                     ['SPC', 1, 6, 123456, 0.]]:
+            model.add_card(card, card[0], is_list=True)
+        self.assertEqual(sorted(model.properties.dirty_keys), [1])
+
+        model.cross_reference(incremental=True)
+        self.assertEqual(model.properties.dirty_keys, set())
+        elem = model.elements[10]
+        self.assertTrue(elem.pid is pshell)
+        self.assertTrue(elem.pid.mid1 is mat)
+        self.assertAlmostEqual(elem.MassPerArea(), 0.2 * 0.2)
+        self.assertTrue(model.elements[11].nodes[1] is model.nodes[6])
+        self.assertTrue(model.coords[2].rid is coord)
+        self.assertTrue(allclose(model.nodes[5].Position(), [2., 0., 1.]))
+        force = model.loads[100][1]
+        self.assertTrue(force.cid is model.coords[0])
+        self.assertTrue(len(str(model.spcObject)) > nspcs)
+
+        # a card that's modified in place is marked by assigning it again
+        for e in [coord.e1, coord.e2, coord.e3]:
+            e[0] += 1.
+        model.coords[1] = coord
+        model.cross_reference(incremental=True)
+        self.assertTrue(allclose(model.nodes[5].Position(), [3., 0., 1.]))
+
+        # a card that's still referenced can't be deleted
+        del model.materials[2]
+        with self.assertRaises(KeyError):
+            model.cross_reference(incremental=True)
+
+    def test_xref_incremental_first(self):
+        """the first incremental cross_reference is a full one"""
+        model = self._get_model()
+        model.cross_reference(incremental=True)
+        self.assertTrue(model.elements[10].pid is model.properties[1])
+        self.assertTrue(allclose(model.nodes[5].Position(), [1., 0., 1.]))
+
+        # nothing changed
+        model.cross_reference(incremental=True)
+        self.assertTrue(model.elements[10].nodes[0] is model.nodes[1])
+
+    def test_xref_incremental_plies(self):
+        """the PCOMP ply materials are nested references"""
+        model = self._get_model()
+        for card in [['PCOMP', 2, None, None, None, None, None, None, None,
+                      5, 0.1, 0., 'YES', 6, 0.2, 45., 'YES'],
+                     ['MAT8', 5, 1.0e7, 1.0e6, 0.3],
+                     ['MAT8', 6, 2.0e7, 1.0e6, 0.3]]:
+            model.add_card(card, card[0], is_list=True)
+        model.cross_reference()
+        pcomp = model.properties[2]
+        self.assertTrue(pcomp.plies[0][0] is model.materials[5])
+
+        mat = MAT8(BDFCard(['MAT8', 5, 3.0e7, 1.0e6, 0.3]))
+        model.add_structural_material(mat, allowOverwrites=True)
+        model.cross_reference(incremental=True)
+        self.assertTrue(pcomp.plies[0][0] is mat)
+        self.assertTrue(pcomp.plies[1][0] is model.materials[6])
+
+        # a ply material that's still referenced can't be deleted
+        del model.materials[6]
+        with self.assertRaises(KeyError):
+            model.cross_reference(incremental=True)
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
@@ -16,6 +16,8 @@ from pyNastran.f06.tables.oef import OEF
 from pyNastran.f06.tables.lama import LAMA
 from pyNastran.f06.tables.max_min import MAX_MIN
 from pyNastran.f06.f06Writer import F06Writer
+from pyNastran.f06.f06_index import SectionIndex
+from pyNastran.f06.f06_table import convert_split_table
 from pyNastran.op2.tables.ogf_gridPointForces.ogf_Objects import RealGridPointForces
 
 from pyNastran.utils import is_binary
@@ -321,6 +323,8 @@ class F06(OES, OEF, OUG, OQG, LAMA, MAX_MIN, F06Writer):
         -4 -> 1                                                     JANUARY   5, 2014  MSC.NASTRAN 11/25/11   PAGE    14
         -3 -> DEFAULT
         -2 -> xxx             subcase 1
+
+        :param n: the stored line with the label/subcase (default=-2)
         """
         #print('-----------------')
         #for iline in [-4, -3, -2, -1, 0]:
@@ -357,11 +361,7 @@ class F06(OES, OEF, OUG, OQG, LAMA, MAX_MIN, F06Writer):
         subcase_name = ''
         #print("subcaseLine = %r" % subcaseName)
 
-        # hack...
-        if 'F O R C E S   I N   Q U A D R I L A T E R A L   E L E M E N T S   ( Q U A D 4 )        OPTION = BILIN' in self.stored_lines[0]:
-            label_isubcase = self.stored_lines[-3]
-        else:
-            label_isubcase = self.stored_lines[-2]
+        label_isubcase = self.stored_lines[n]
         label, isubcase = _parse_label_isubcase(label_isubcase)
 
         #subtitle = 'SUBCASE %s' % isubcase
@@ -560,27 +560,61 @@ class F06(OES, OEF, OUG, OQG, LAMA, MAX_MIN, F06Writer):
 
     def _read_f06_table(self, Format, debug=False):
         """
-        Reads displacement, spc/mpc forces
+        Reads a table that's split on whitespace (e.g. the eigenvalue
+        summary); the table ends at a blank line or the next PAGE
 
         :self:   the object pointer
         :Format: .. seealso:: parseLine
+
+        The lines are read as a block and converted by column (see
+        f06_table.convert_split_table).  If the block can't be converted
+        at once, the table is read again one line at a time and ends at
+        the first line that can't be parsed.
         """
-        sline = True
-        data = []
-        while sline:
+        n0 = self.infile.tell()
+        i0 = self.i
+        slines = []
+        while 1:
             line = self.infile.readline()[1:].strip()
             sline = line.split()
             if debug:
                 print(sline)
             self.i += 1
+            if not sline or 'PAGE' in sline:
+                break
+            slines.append(sline)
+
+        data = convert_split_table(slines, Format)
+        if data is not None:
+            return data
+
+        self.infile.seek(n0)
+        self.i = i0
+        data = []
+        while 1:
+            sline = self.infile.readline()[1:].strip().split()
+            self.i += 1
             if 'PAGE' in sline:
-                #self.stored_lines = [line]  ## changed...
                 return data
             sline = self.parseLine(sline, Format)
             if sline is None or len(sline) == 0:
                 return data
             data.append(sline)
-        return data
+
+    def _read_f06_block(self):
+        """
+        Reads the lines of a table up to the next PAGE
+
+        :returns lines: the lines without the carriage control character
+        """
+        lines = []
+        readline = self.infile.readline
+        line = readline()
+        while line and 'PAGE' not in line:
+            lines.append(line)
+            line = readline()
+        self.i += len(lines)
+        return [line[1:].rstrip() for line in lines]
 
     def _read_table_dummy(self):
         sline = True
@@ -629,13 +663,24 @@ class F06(OES, OEF, OUG, OQG, LAMA, MAX_MIN, F06Writer):
             out.append(entry2)
         return out
 
-    def read_f06(self, f06_filename=None):
+    def read_f06(self, f06_filename=None, subcases=None, tables=None, index_filename=None):
         """
         Reads the F06 file
 
         :self: the object pointer
 
         :f06FileName: the file to be parsed (None -> GUI)
+        :subcases:    the subcases to read (default=None -> all); the
+                      sections without a subcase are always read
+        :tables:      the section markers to read (default=None -> all);
+                      spaces are ignored, so 'DISPLACEMENT VECTOR' reads the
+                      'D I S P L A C E M E N T   V E C T O R' sections
+        :index_filename: a sidecar file for the section index
+                      (default=None -> don't save the index).  If it exists
+                      and matches the F06, the F06 isn't scanned again.
+
+        If subcases, tables or index_filename is used, the F06 is indexed
+        (see f06_index.py) and only the selected sections are parsed.
         """
         if f06_filename is None:
             from pyNastran.utils.gui_io import load_file_dialog
@@ -659,6 +704,11 @@ class F06(OES, OEF, OUG, OQG, LAMA, MAX_MIN, F06Writer):
         self.log.debug('f06_filename = %r' % f06_filename)
         self.f06_filename = f06_filename
 
+        if subcases is not None or tables is not None or index_filename is not None:
+            section_index = self.get_section_index(index_filename)
+            self._read_f06_sections(section_index.get_sections(subcases, tables))
+            self._finish_read_f06()
+            return
 
         blank = 0
         self.infile = open(self.f06_filename, 'r')
@@ -669,18 +719,7 @@ class F06(OES, OEF, OUG, OQG, LAMA, MAX_MIN, F06Writer):
             marker = line[1:].strip()
 
             if 'FATAL' in marker and 'IF THE FLAG IS FATAL' not in marker:
-                msg = '\n' + marker
-                fatal_count = 0
-                while 1:
-                    line = self.infile.readline().rstrip()
-                    #print("blank = %s" % blank)
-                    fatal_count += 1
-                    if fatal_count == 20 or '* * * END OF JOB * * *' in line:
-                        break
-                    #else:
-                        #blank = 0
-                    msg += line + '\n'
-                raise FatalError(msg.rstrip())
+                self._read_fatal(marker)
 
             if(marker != '' and 'SUBCASE' not in marker and 'PAGE' not in marker and 'FORTRAN' not in marker
                and 'USER INFORMATION MESSAGE' not in marker and 'TOTAL DATA WRITTEN FOR DATA BLOCK' not in marker
@@ -727,11 +766,77 @@ class F06(OES, OEF, OUG, OQG, LAMA, MAX_MIN, F06Writer):
             self.i += 1
         #print("i=%i" % self.i)
         self.infile.close()
+        self._finish_read_f06()
+
+    def _finish_read_f06(self):
         self._process_f06()
         if hasattr(self, '_ieigenvalue'):
             del self._ieigenvalue
         self.build_vectorization()
 
+    def _read_fatal(self, marker):
+        """reads the FATAL message and raises a FatalError"""
+        msg = '\n' + marker
+        fatal_count = 0
+        while 1:
+            line = self.infile.readline().rstrip()
+            #print("blank = %s" % blank)
+            fatal_count += 1
+            if fatal_count == 20 or '* * * END OF JOB * * *' in line:
+                break
+            #else:
+                #blank = 0
+            msg += line + '\n'
+        raise FatalError(msg.rstrip())
+
+    def get_section_index(self, index_filename=None):
+        """
+        Gets the section index of the F06 (see f06_index.py)
+
+        :param index_filename: a sidecar file for the index
+            (default=None -> don't save the index)
+        :returns section_index: the SectionIndex
+        """
+        if index_filename is not None and os.path.exists(index_filename):
+            section_index = SectionIndex().read(index_filename)
+            if section_index.is_valid(self.f06_filename):
+                self.log.debug('using section index %r' % index_filename)
+                return section_index
+
+        line_markers = ['R E A L   E I G E N V E C T O R   N O',
+                        'C O M P L E X   E I G E N V E C T O R   NO']
+        section_index = SectionIndex().scan(self.f06_filename, self.markers, line_markers)
+        if index_filename is not None:
+            section_index.write(index_filename)
+        return section_index
+
+    def _read_f06_sections(self, sections):
+        """
+        Reads a series of sections of the F06 by seeking to each one
+
+        :param sections: the SectionEntry objects in file order
+        """
+        self.infile = open(self.f06_filename, 'r')
+        try:
+            for section in sections:
+                self.infile.seek(section.n_context)
+                self.stored_lines = [self.infile.readline() for i in range(section.ncontext)]
+                line = self.infile.readline()
+                marker = line[1:].strip()
+
+                if section.marker == 'FATAL':
+                    self._read_fatal(marker)
+                elif section.marker in self._marker_map:
+                    self._marker_map[section.marker]()
+                    if(self._stop_after_reading_mass and
+                       marker in 'O U T P U T   F R O M   G R I D   P O I N T   W E I G H T   G E N E R A T O R'):
+                        break
+                else:
+                    self._line_marker_map[section.marker](marker)
+                self.stored_lines = []
+        finally:
+            self.infile.close()
+
     def _process_f06(self):
         #data = [self.disp,self.SpcForces,self.stress,self.isoStress,self.barStress,self.solidStress,self.temperature]
         data_pack = [self.solidStress]
@@ -865,7 +865,7 @@ class F06Writer(object):
                 res_length = max(len(result.__class__.__name__), res_length)
                 continue
             elif len(res_type) != 0:
-                key0 = res_type.keys()[0]
+                key0 = list(res_type.keys())[0]
                 result = res_type[key0]
                 class_name = result.__class__.__name__
                 print('%s - results not found...key=%s' % (class_name, res_key))
@@ -896,7 +896,7 @@ class F06Writer(object):
                 f06 = open(f06_outname, 'w')
             self.write_summary(f06)
         else:
-            assert isinstance(f06_outname, file), 'type(f06_outname)= %s' % f06_outname
+            assert hasattr(f06_outname, 'write'), 'type(f06_outname)= %s' % f06_outname
             f06 = f06_outname
             f06_outname = f06.name
             print('f06_outname =', f06_outname)
@@ -0,0 +1,287 @@
+"""
+Defines the SectionIndex, which stores where the sections (tables) of an
+F06 live in the file, so a read can seek to the requested subcases/tables
+instead of parsing every line.
+
+The index is built in one pass over large binary blocks.  The sections
+start a few lines after a page header, so the 'PAGE' anchors are found
+with bytes.find and only the lines after them are checked with the
+marker (e.g. 'D I S P L A C E M E N T   V E C T O R') regex, which
+keeps the large regex off most of the file.  It may be saved as a
+sidecar file next to the F06, so re-reading the same F06 doesn't need to
+scan it again.
+"""
+from __future__ import print_function
+import os
+import re
+
+#: the number of lines before a marker that are stored; the section
+#: readers get the title/subtitle/label/subcase/transient lines from them
+NCONTEXT = 8
+
+#: the number of lines after a page header that may have a marker
+NAFTER_PAGE = 10
+
+#: the markers that may be in the middle of a page, which are found with
+#: bytes.find instead of the page header
+UNANCHORED_MARKERS = ['FATAL', 'M O D E L   S U M M A R Y']
+
+_PAGE_REGEX = re.compile(br'PAGE\s+(\d+)')
+
+
+class SectionEntry(object):
+    """A single section (e.g. the displacements of a subcase) in the F06"""
+    def __init__(self, marker, n, n_context, ncontext, page, isubcase):
+        #: the marker that's used to pick the reader
+        #: (e.g. 'D I S P L A C E M E N T   V E C T O R')
+        self.marker = marker
+        #: the file offset of the marker line
+        self.n = n
+        #: the file offset of the first line before the marker that's stored
+        self.n_context = n_context
+        #: the number of lines between n_context and n
+        self.ncontext = ncontext
+        #: the page number (None if the page header wasn't found)
+        self.page = page
+        #: the subcase ID (None if the section doesn't have one)
+        self.isubcase = isubcase
+
+    def __repr__(self):
+        return 'SectionEntry(marker=%r, n=%s, page=%s, isubcase=%s)' % (
+            self.marker, self.n, self.page, self.isubcase)
+
+
+def _int_or_none(value):
+    if value == 'None':
+        return None
+    return int(value)
+
+
+def _compact(marker):
+    """'D I S P L A C E M E N T   V E C T O R' -> 'DISPLACEMENTVECTOR'"""
+    return marker.replace(' ', '').upper()
+
+
+class SectionIndex(object):
+    """
+    Stores the file offsets, markers, pages and subcases of every
+    section in an F06.
+    """
+    def __init__(self, f06_filename=None):
+        #: the list of SectionEntry objects in file order
+        self.sections = []
+        self.f06_size = None
+        self.f06_mtime = None
+        if f06_filename is not None:
+            self.f06_size, self.f06_mtime = self._get_file_stats(f06_filename)
+
+    @staticmethod
+    def _get_file_stats(f06_filename):
+        stat = os.stat(f06_filename)
+        return stat.st_size, int(stat.st_mtime)
+
+    def is_valid(self, f06_filename):
+        """is the index consistent with the F06 file"""
+        f06_size, f06_mtime = self._get_file_stats(f06_filename)
+        return f06_size == self.f06_size and f06_mtime == self.f06_mtime
+
+    def scan(self, f06_filename, markers, line_markers, block_size=16 * 1024 * 1024):
+        """
+        Finds the sections of an F06
+
+        :param f06_filename: the F06 to scan
+        :param markers: the markers that make up the entire line
+                        (after the carriage control character)
+        :param line_markers: the markers that are part of a line (e.g. the
+                        'R E A L   E I G E N V E C T O R   N O' line also
+                        has the cycles and mode number)
+        :param block_size: the number of bytes that are read at a time
+        """
+        self.f06_size, self.f06_mtime = self._get_file_stats(f06_filename)
+        self.sections = []
+        markers = set(markers)
+        line_markers = list(line_markers)
+        words = sorted(set(list(markers) + line_markers), key=len, reverse=True)
+        regex = re.compile(b'|'.join([re.escape(word.encode('latin1')) for word in words]))
+        unanchored = [word.encode('latin1') for word in UNANCHORED_MARKERS
+                      if word == 'FATAL' or word in markers]
+
+        # the bytes we keep before a new block so the context lines of
+        # the first marker in the block are available
+        noverlap = 64 * 1024
+
+        with open(f06_filename, 'rb') as f06_file:
+            data = b''
+            n0 = 0  # the file offset of data[0]
+            istart = 0  # the first byte of data that hasn't been scanned
+            while 1:
+                block = f06_file.read(block_size)
+                data += block
+                if block:
+                    # only scan complete lines
+                    iend = data.rfind(b'\n') + 1
+                else:
+                    iend = len(data)
+
+                ilines, iresume = self._find_marker_lines(
+                    data, istart, iend, regex, unanchored, is_last=not block)
+                for iline in ilines:
+                    self._add_section(data, n0, iline, markers, line_markers)
+
+                if not block:
+                    break
+                ikeep = data.rfind(b'\n', 0, max(min(iend - noverlap, iresume), 0)) + 1
+                data = data[ikeep:]
+                n0 += ikeep
+                istart = iresume - ikeep
+        return self
+
+    @staticmethod
+    def _find_marker_lines(data, istart, iend, regex, unanchored, is_last):
+        """
+        Finds the lines in data[istart:iend] that may be markers
+
+        :param data: the block
+        :param istart: the first byte to scan
+        :param iend: the end of the last complete line in the block
+        :param regex: the marker regex, which is run on the lines after
+            the page headers
+        :param unanchored: the markers that are found anywhere
+        :param is_last: is this the last block of the file
+        :returns ilines: the sorted offsets of the candidate lines
+        :returns iresume: where the next block should start scanning; a
+            page header whose lines run past iend is scanned again with
+            the next block
+        """
+        ilines = set([])
+        iresume = iend
+        iscanned = istart
+        ipage = data.find(b'PAGE', istart, iend)
+        while ipage != -1:
+            iafter = ipage
+            for i in range(NAFTER_PAGE):
+                iafter = data.find(b'\n', iafter, iend) + 1
+                if iafter == 0:
+                    iafter = iend
+                    break
+            if iafter == iend and not is_last:
+                iresume = data.rfind(b'\n', 0, ipage) + 1
+                iend = iresume
+                ilines = set([iline for iline in ilines if iline < iresume])
+                break
+            for match in regex.finditer(data, max(ipage, iscanned), iafter):
+                ilines.add(data.rfind(b'\n', 0, match.start()) + 1)
+            iscanned = iafter
+            ipage = data.find(b'PAGE', ipage + 4, iend)
+
+        for word in unanchored:
+            i = data.find(word, istart, iend)
+            while i != -1:
+                ilines.add(data.rfind(b'\n', 0, i) + 1)
+                i = data.find(word, i + len(word), iend)
+        return sorted(ilines), iresume
+
+    def _add_section(self, data, n0, iline, markers, line_markers):
+        """adds the section starting on the line at data[iline]"""
+        iline_end = data.find(b'\n', iline)
+        if iline_end == -1:
+            iline_end = len(data)
+        line = data[iline:iline_end].decode('latin1')
+        marker = line[1:].strip()
+        if marker in markers:
+            key = marker
+        elif 'FATAL' in marker and 'IF THE FLAG IS FATAL' not in marker:
+            key = 'FATAL'
+        else:
+            for line_marker in line_markers:
+                if line_marker in marker:
+                    key = line_marker
+                    break
+            else:
+                return
+
+        # the lines before the marker
+        i_context = iline
+        ncontext = 0
+        while ncontext < NCONTEXT and i_context > 0:
+            i_context = data.rfind(b'\n', 0, i_context - 1) + 1
+            ncontext += 1
+        context = data[i_context:iline]
+
+        page = None
+        pages = _PAGE_REGEX.findall(context)
+        if pages:
+            page = int(pages[-1])
+
+        isubcase = None
+        for context_line in context.split(b'\n')[-4:]:
+            if b'SUBCASE' in context_line:
+                try:
+                    isubcase = int(context_line.split()[-1])
+                except ValueError:
+                    pass
+        self.sections.append(SectionEntry(key, n0 + iline, n0 + i_context, ncontext,
+                                          page, isubcase))
+
+    def get_sections(self, subcases=None, tables=None):
+        """
+        Gets the sections that match the filters.
+
+        :param subcases: the subcase IDs (None -> all); sections without a
+                         subcase (e.g. the eigenvalue summary) are always used
+        :param tables: the markers of the sections (None -> all); the
+                       spaces are ignored, so 'DISPLACEMENT VECTOR' matches
+                       'D I S P L A C E M E N T   V E C T O R'; the FATAL
+                       messages are always used
+        """
+        if subcases is not None:
+            subcases = set(subcases)
+        if tables is not None:
+            tables = set([_compact(table) for table in tables])
+
+        out = []
+        for section in self.sections:
+            if section.marker == 'FATAL':
+                out.append(section)
+                continue
+            if subcases is not None and section.isubcase is not None and (
+                    section.isubcase not in subcases):
+                continue
+            if tables is not None and _compact(section.marker) not in tables:
+                continue
+            out.append(section)
+        return out
+
+    def write(self, index_filename):
+        """writes the index to a sidecar file"""
+        with open(index_filename, 'w') as index_file:
+            index_file.write('# pyNastran F06 section index\n')
+            index_file.write('f06_size %s\n' % self.f06_size)
+            index_file.write('f06_mtime %s\n' % self.f06_mtime)
+            for section in self.sections:
+                index_file.write('SECTION %s %s %s %s %s %s\n' % (
+                    section.n, section.n_context, section.ncontext, section.page,
+                    section.isubcase, section.marker))
+
+    def read(self, index_filename):
+        """reads an index from a sidecar file"""
+        self.sections = []
+        with open(index_filename, 'r') as index_file:
+            lines = index_file.readlines()
+
+        for line in lines:
+            sline = line.split()
+            if not sline or sline[0].startswith('#'):
+                continue
+            word = sline[0]
+            if word == 'f06_size':
+                self.f06_size = _int_or_none(sline[1])
+            elif word == 'f06_mtime':
+                self.f06_mtime = _int_or_none(sline[1])
+            elif word == 'SECTION':
+                sline = line.rstrip('\r\n').split(' ', 6)
+                n, n_context, ncontext, page, isubcase = [
+                    _int_or_none(value) for value in sline[1:6]]
+                self.sections.append(SectionEntry(sline[6], n, n_context, ncontext,
+                                                  page, isubcase))
+        return self
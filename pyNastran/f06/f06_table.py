@@ -0,0 +1,148 @@
+"""
+Defines the block parsers for the F06 result tables.
+
+Rather than converting one field at a time, all of the lines of a table
+(up to the next PAGE) are read and converted at once with numpy:
+
+    nodal:        the nodal tables (displacement, SPC forces, eigenvector,
+                  ...) are split on whitespace and converted by column;
+                  a table with SPOINTs or blank fields is sliced into its
+                  15 character fields
+    split:        the remaining tables (e.g. composite stress, eigenvalue
+                  summary) are split on whitespace and converted by column
+"""
+from __future__ import print_function
+from numpy import array, frombuffer, dtype, zeros, arange, repeat, cumsum, uint8
+
+#: the fields of a real nodal table line (without the carriage control
+#: character); a line is:  POINT ID., TYPE, T1, T2, T3, R1, R2, R3
+NODE_TABLE_DTYPE = dtype([
+    ('node_id', 'S14'), ('grid_type', 'S10'),
+    ('t1', 'S15'), ('t2', 'S15'), ('t3', 'S15'),
+    ('r1', 'S15'), ('r2', 'S15'), ('r3', 'S15'),
+])
+NODE_TABLE_WIDTH = NODE_TABLE_DTYPE.itemsize
+
+
+def parse_real_node_table(lines, allow_blanks=False):
+    """
+    Converts the lines of a real nodal table
+
+    :param lines: the lines of the table without the carriage control
+                  character (e.g. line[1:])
+    :param allow_blanks: blank fields are 0.0 (e.g. on an eigenvector);
+                  otherwise, a blank GRID field is an error
+    :returns node_ids: the (n,) node ids
+    :returns grid_types: the (n,) grid types ('G', 'S')
+    :returns data: the (n, 6) [t1, t2, t3, r1, r2, r3] values
+
+    A SPOINT line has up to 6 consecutive points, so it's split into one
+    row per point (the value is the T1 term).
+
+    ::
+
+      POINT ID.   TYPE          T1             T2             T3             R1             R2             R3
+             1      G      2.547245E-17  -6.388945E-16   2.292728E+00  -1.076928E-15   2.579163E-17   0.0
+          2004      S     -6.382321E-17  -1.556607E-15   3.242408E+00
+    """
+    nlines = len(lines)
+    if nlines == 0:
+        return zeros(0, dtype='int32'), zeros(0, dtype='|U1'), zeros((0, 6), dtype='float64')
+
+    # the common case is a table of GRIDs without any blank fields, so
+    # every line has 8 words
+    words = ' '.join(lines).split()
+    if len(words) == 8 * nlines and set(words[1::8]) == set(['G']):
+        node_ids = words[0::8]
+        del words[1::8]  # the grid types
+        del words[0::7]  # the node ids
+        try:
+            node_ids = array(list(map(int, node_ids)), dtype='int32')
+            data = array(list(map(float, words)), dtype='float64').reshape(nlines, 6)
+        except ValueError:
+            pass
+        else:
+            grid_types = zeros(nlines, dtype='|U1')
+            grid_types[:] = 'G'
+            return node_ids, grid_types, data
+
+    block = ''.join([line[:NODE_TABLE_WIDTH].ljust(NODE_TABLE_WIDTH) for line in lines])
+    block = block.encode('latin1')
+    table = frombuffer(block, dtype=NODE_TABLE_DTYPE)
+    chars = frombuffer(block, dtype=uint8).reshape(nlines, NODE_TABLE_WIDTH)
+
+    # a blank field is all spaces
+    fields = chars[:, 24:].reshape(nlines, 6, 15)
+    is_blank = (fields == 32).all(axis=2)
+    values = fields.copy().view('|S15').reshape(nlines, 6)
+    values[is_blank] = b'0.0'
+    data = values.astype('float64')
+
+    # the grid type is a single letter, so it's the largest character
+    node_ids = table['node_id'].astype('int32')
+    grid_types = chars[:, 14:24].max(axis=1).view('|S1').astype('|U1')
+
+    is_grid = grid_types == 'G'
+    is_spoint = grid_types == 'S'
+    is_other = ~(is_grid | is_spoint)
+    if is_other.any():
+        i = is_other.nonzero()[0][0]
+        raise NotImplementedError('grid_type = %r' % grid_types[i])
+    if not allow_blanks and is_blank[is_grid, :].any():
+        i = (is_blank.any(axis=1) & is_grid).nonzero()[0][0]
+        raise ValueError('blank field on line=%r' % lines[i])
+
+    if not is_spoint.any():
+        return node_ids, grid_types, data
+
+    # SPOINTs stop at the first blank field
+    nvalues = is_grid.astype('int32')
+    nleading = (~is_blank).cumprod(axis=1).sum(axis=1)
+    nvalues[is_spoint] = nleading[is_spoint]
+    irows = repeat(arange(nlines), nvalues)
+
+    # the offset of each row from the first row of its line
+    offsets = arange(len(irows)) - repeat(cumsum(nvalues) - nvalues, nvalues)
+
+    data2 = data[irows, :]
+    spoints = is_spoint[irows]
+    data2[spoints, 0] = data[irows[spoints], offsets[spoints]]
+    data2[spoints, 1:] = 0.0
+    return node_ids[irows] + offsets, grid_types[irows], data2
+
+
+def convert_split_table(slines, data_types):
+    """
+    Converts a table of split lines column by column
+
+    :param slines: the list of split lines
+    :param data_types: the type (int, float, str) of each field
+    :returns data: the list of the converted lines (see F06.parseLine) or
+                   None if the lines can't be converted as a block (e.g.
+                   they have a different number of fields)
+    """
+    nfields = len(data_types)
+    if not slines:
+        return []
+    nfields_line = len(slines[0])
+    if nfields_line < nfields:
+        return None
+    for sline in slines:
+        if len(sline) != nfields_line:
+            return None
+
+    table = array(slines)
+    columns = []
+    try:
+        for i, data_type in enumerate(data_types):
+            column = table[:, i]
+            if data_type is int:
+                column = column.astype('int64')
+            elif data_type is float:
+                column = column.astype('float64')
+            elif data_type is not str:
+                return None
+            columns.append(column.tolist())
+    except ValueError:
+        return None
+    return [list(line) for line in zip(*columns)]
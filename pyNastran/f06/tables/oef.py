@@ -136,7 +136,8 @@ class OEF(object):
         element_name = 'CQUAD4'
         element_type = 95
         #print(self.stored_lines)
-        (subcaseName, isubcase, transient, dt, analysis_code, is_sort1) = self._read_f06_subcase_header()
+        # there's an extra blank line after the subcase
+        (subcaseName, isubcase, transient, dt, analysis_code, is_sort1) = self._read_f06_subcase_header(n=-3)
         headers = self.skip(3)
 
         lines = []
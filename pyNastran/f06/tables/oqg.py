@@ -1,7 +1,7 @@
 #pylint: disable=C0301,C0103,C0111
-from pyNastran.op2.tables.oqg_constraintForces.oqg_spcForces import RealSPCForces  # ,ComplexSPCForcesObject
-from pyNastran.op2.tables.oqg_constraintForces.oqg_mpcForces import RealMPCForces  # ,ComplexMPCForcesObject
-from pyNastran.op2.tables.opg_appliedLoads.opg_loadVector import RealLoadVector
+from pyNastran.op2.tables.oqg_constraintForces.oqg_spcForces import RealSPCForces, RealSPCForcesArray  # ,ComplexSPCForcesObject
+from pyNastran.op2.tables.oqg_constraintForces.oqg_mpcForces import RealMPCForces, RealMPCForcesArray  # ,ComplexMPCForcesObject
+from pyNastran.op2.tables.opg_appliedLoads.opg_loadVector import RealLoadVector, RealLoadVectorArray
 
 class OQG(object):
     def _read_f06_table(self, data_types, debug=False):
@@ -18,7 +18,7 @@ class OQG(object):
         headers = self.skip(2)
         #print "headers = %s" %(headers)
 
-        data = self._real_f06_table_data(allow_blanks=False)
+        node_ids, grid_types, data = self._real_f06_table_arrays(allow_blanks=False)
 
         data_code = {'analysis_code': analysis_code,
                     'device_code': 1,
@@ -35,11 +35,14 @@ class OQG(object):
                     }
 
         if isubcase in self.loadVectors:
-            self.loadVectors[isubcase].add_f06_data(data, transient)
+            self.loadVectors[isubcase].add_f06_arrays(node_ids, grid_types, data, transient)
         else:
             is_sort1 = True
-            spc = RealLoadVector(data_code, is_sort1, isubcase, dt)
-            spc.add_f06_data(data, transient)
+            if self.is_vectorized:
+                spc = RealLoadVectorArray(data_code, is_sort1, isubcase, dt, f06_flag=True)
+            else:
+                spc = RealLoadVector(data_code, is_sort1, isubcase, dt)
+            spc.add_f06_arrays(node_ids, grid_types, data, transient)
             self.loadVectors[isubcase] = spc
         self.iSubcases.append(isubcase)
 
@@ -49,7 +52,7 @@ class OQG(object):
         headers = self.skip(2)
         #print "headers = %s" %(headers)
 
-        data = self._real_f06_table_data(allow_blanks=False)
+        node_ids, grid_types, data = self._real_f06_table_arrays(allow_blanks=False)
 
         data_code = {'analysis_code': analysis_code,
                     'device_code': 1, 'table_code': 3, 'sort_code': 0,
@@ -61,11 +64,14 @@ class OQG(object):
                     }
 
         if isubcase in self.spcForces:
-            self.spcForces[isubcase].add_f06_data(data, transient)
+            self.spcForces[isubcase].add_f06_arrays(node_ids, grid_types, data, transient)
         else:
             is_sort1 = True
-            spc = RealSPCForces(data_code, is_sort1, isubcase, dt)
-            spc.add_f06_data(data, transient)
+            if self.is_vectorized:
+                spc = RealSPCForcesArray(data_code, is_sort1, isubcase, dt, f06_flag=True)
+            else:
+                spc = RealSPCForces(data_code, is_sort1, isubcase, dt)
+            spc.add_f06_arrays(node_ids, grid_types, data, transient)
             self.spcForces[isubcase] = spc
         self.iSubcases.append(isubcase)
 
@@ -74,7 +80,7 @@ class OQG(object):
         headers = self.skip(2)
         #print "headers = %s" %(headers)
 
-        data = self._real_f06_table_data(allow_blanks=False)
+        node_ids, grid_types, data = self._real_f06_table_arrays(allow_blanks=False)
 
         data_code = {'analysis_code': analysis_code,
                     'device_code': 1, 'table_code': 39,
@@ -83,10 +89,13 @@ class OQG(object):
                     'dataNames':['lsdvmn']}
 
         if isubcase in self.mpcForces:
-            self.mpcForces[isubcase].add_f06_data(data, transient)
+            self.mpcForces[isubcase].add_f06_arrays(node_ids, grid_types, data, transient)
         else:
             is_sort1 = True
-            mpc = RealMPCForces(data_code, is_sort1, isubcase, dt)
-            mpc.add_f06_data(data, transient)
+            if self.is_vectorized:
+                mpc = RealMPCForcesArray(data_code, is_sort1, isubcase, dt, f06_flag=True)
+            else:
+                mpc = RealMPCForces(data_code, is_sort1, isubcase, dt)
+            mpc.add_f06_arrays(node_ids, grid_types, data, transient)
             self.mpcForces[isubcase] = mpc
         self.iSubcases.append(isubcase)
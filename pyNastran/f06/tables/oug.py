@@ -1,10 +1,12 @@
 #pylint: disable=C0301,C0103,W0612
 from six.moves import zip
 
-from pyNastran.op2.tables.oug.oug_displacements import RealDisplacement, ComplexDisplacement
+from pyNastran.op2.tables.oug.oug_displacements import (RealDisplacement, ComplexDisplacement,
+                                                         RealDisplacementArray)
 from pyNastran.op2.tables.oug.oug_eigenvectors import (Eigenvector,  # ,ComplexEigenVector
                                                        RealEigenvectorArray)
 from pyNastran.op2.tables.oug.oug_temperatures import RealTemperature
+from pyNastran.f06.f06_table import parse_real_node_table
 
 
 class OUG(object):
@@ -73,19 +75,19 @@ class OUG(object):
             #'s_code':0,
             #'element_name':'CBAR','element_type':34,'stress_bits':stress_bits,
         }
-        data = self._real_f06_table_data(allow_blanks=True)
+        node_ids, grid_types, data = self._real_f06_table_arrays(allow_blanks=True)
 
         #print("cycle=%-8s eigen=%s" % (cycle, eigenvalue_real))
         #print "isubcase = %s" % isubcase
         if isubcase in self.eigenvectors:
-            self.eigenvectors[isubcase].read_f06_data(data_code, data)
+            self.eigenvectors[isubcase].read_f06_arrays(data_code, node_ids, grid_types, data)
         else:
             is_sort1 = True
             if self.is_vectorized:
                 vector = RealEigenvectorArray(data_code, is_sort1, isubcase, iMode, f06_flag=True)
             else:
                 vector = Eigenvector(data_code, is_sort1, isubcase, iMode)
-            vector.read_f06_data(data_code, data)
+            vector.read_f06_arrays(data_code, node_ids, grid_types, data)
             self.eigenvectors[isubcase] = vector
 
     def _complex_eigenvectors(self, marker):
@@ -101,51 +103,28 @@ class OUG(object):
         :param allow_blanks: Accounting for blank entries (e.g. on eigenvector)
                              default=False
         :returns data:       the parsed data
+                             [[node_id, grid_type, t1, t2, t3, r1, r2, r3], ...]
 
         ..todo:: support L, H, and R points
         """
-        field_length = 15  # width of each eigenvector field
-        num_fields = 6     # the number of fields (T1, T2, T3, R1, R2, R3)
-        data = []
-
-        n = 0
-        while 1:
-            line = self.infile.readline()[1:].rstrip()
-
-            # TODO: add catch for FATAL
-            if 'PAGE' in line:
-                break
-
-            #: point ID (int)
-            node_id = int(line[:14].strip())
+        node_ids, grid_types, data = self._real_f06_table_arrays(allow_blanks)
+        return [[node_id, grid_type] + row for node_id, grid_type, row
+                in zip(node_ids.tolist(), grid_types.tolist(), data.tolist())]
 
-            #: TYPE (str)
-            grid_type = line[14:24].strip()
+    def _real_f06_table_arrays(self, allow_blanks=False):
+        """
+        Reads real displacement/velocity/spc forces/mpc forces as arrays
+        (see f06_table.parse_real_node_table)
 
-            if grid_type == 'G':
-                sline = [node_id, grid_type]
-                fields = [line[24:39], line[39:54], line[54:69], line[69:84], line[84:99], line[99:114]]
-                if allow_blanks:
-                    sline += [float(val) if val.strip() != '' else 0.0 for val in fields]
-                else:
-                    sline += [float(val) for val in fields]
-                data.append(sline)
-            elif grid_type == 'S':
-                fields = [line[24:39], line[39:54], line[54:69], line[69:84], line[84:99],  line[99:114]]
-                fields = [float(val) if val.strip() != '' else None for val in fields]
-                for ioffset, field in enumerate(fields):
-                    if field is None:
-                        # incomplete spoint line
-                        # ID, S, 1.0, 2.0, 3.0, 4.0, 5.0, None
-                        break
-                    sline = [node_id + ioffset,
-                             grid_type, field, 0.0, 0.0, 0.0, 0.0, 0.0]
-                    data.append(sline)
-            else:
-                raise NotImplementedError('grid_type = %r' % grid_type)
-            self.i += 1
-            n += 1
-        return data
+        :param self:         the object pointer
+        :param allow_blanks: Accounting for blank entries (e.g. on eigenvector)
+                             default=False
+        :returns node_ids:   the (n,) node ids
+        :returns grid_types: the (n,) grid types ('G', 'S')
+        :returns data:       the (n, 6) [t1, t2, t3, r1, r2, r3] values
+        """
+        lines = self._read_f06_block()
+        return parse_real_node_table(lines, allow_blanks)
 
     def _displacement_vector(self):
         """
@@ -177,14 +156,17 @@ class OUG(object):
         #print "headers = %s" %(headers)
         #print "transient =", transient
 
-        data = self._real_f06_table_data(allow_blanks=False)
+        node_ids, grid_types, data = self._real_f06_table_arrays(allow_blanks=False)
 
         if isubcase in self.displacements:
-            self.displacements[isubcase].add_f06_data(data, transient)
+            self.displacements[isubcase].add_f06_arrays(node_ids, grid_types, data, transient)
         else:
             is_sort1 = True
-            disp = RealDisplacement(data_code, is_sort1, isubcase, dt)
-            disp.add_f06_data(data, transient)
+            if self.is_vectorized:
+                disp = RealDisplacementArray(data_code, is_sort1, isubcase, dt, f06_flag=True)
+            else:
+                disp = RealDisplacement(data_code, is_sort1, isubcase, dt)
+            disp.add_f06_arrays(node_ids, grid_types, data, transient)
             self.displacements[isubcase] = disp
         self.iSubcases.append(isubcase)
 
@@ -1,6 +1,7 @@
 from pyNastran.f06.test.f06_test import main as F06
 from pyNastran.f06.test.f06_unit_tests import TestF06
 from pyNastran.f06.test.test_f06_formatting import TestFormatting
+from pyNastran.f06.test.test_f06_table import TestF06Table
 
 if __name__ == "__main__":
     import unittest
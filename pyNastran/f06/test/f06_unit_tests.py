@@ -23,6 +23,7 @@ class DummyWriter(object):
 import pyNastran
 from pyNastran.bdf.bdf import BDF
 from pyNastran.f06.f06 import F06, FatalError
+from pyNastran.f06.f06_index import SectionIndex
 from pyNastran.op2.op2 import OP2
 from pyNastran.op4.op4 import OP4
 
@@ -408,6 +409,62 @@ class TestF06(unittest.TestCase):
         #T3 = disp.translations[frequency][21][2]
         #self.assertEquals(T3, -1.456074E+02 + -6.035482E+00j)  # T3
 
+    def test_section_index(self):
+        """an indexed read of some subcases/tables matches the full read"""
+        f06name = os.path.join(test_path, 'failure_index_test.f06')
+        index_filename = os.path.join(test_path, 'failure_index_test.f06.idx')
+
+        f06 = F06(debug=False, log=None)
+        f06.read_f06(f06name)
+
+        section_index = SectionIndex().scan(f06name, f06.markers, [])
+        self.assertTrue(section_index.is_valid(f06name))
+        markers = set([section.marker for section in section_index.sections])
+        self.assertIn('D I S P L A C E M E N T   V E C T O R', markers)
+        subcases = set([section.isubcase for section in section_index.sections])
+        self.assertEqual(subcases, set([None, 1, 2]))
+        pages = [section.page for section in section_index.sections]
+        self.assertEqual(pages, sorted(pages))
+
+        # the page headers that straddle two blocks are scanned with the next block
+        section_index_small = SectionIndex().scan(f06name, f06.markers, [], block_size=700)
+        self.assertEqual(
+            [(section.marker, section.n, section.page, section.isubcase)
+             for section in section_index_small.sections],
+            [(section.marker, section.n, section.page, section.isubcase)
+             for section in section_index.sections])
+
+        # only the matching sections are read
+        f06_index = F06(debug=False, log=None)
+        f06_index.read_f06(f06name, subcases=[2])
+        self.assertEqual(list(f06_index.displacements.keys()), [2])
+        self.assertEqual(list(f06_index.plateForces2.keys()), [2])
+        self.assertEqual(sorted(f06_index.displacements[2].translations.keys()),
+                         sorted(f06.displacements[2].translations.keys()))
+
+        f06_index = F06(debug=False, log=None)
+        f06_index.read_f06(f06name, tables=['DISPLACEMENT VECTOR'])
+        self.assertEqual(sorted(f06_index.displacements.keys()), [1, 2])
+        self.assertEqual(len(f06_index.spcForces), 0)
+
+        # the sidecar index is written and then reused
+        for i in range(2):
+            f06_index = F06(debug=False, log=None)
+            f06_index.read_f06(f06name, index_filename=index_filename)
+            self.assertTrue(os.path.exists(index_filename))
+            for name in ['displacements', 'spcForces', 'gridPointForces',
+                         'compositePlateStress', 'plateForces2']:
+                self.assertEqual(sorted(getattr(f06_index, name).keys()),
+                                 sorted(getattr(f06, name).keys()), name)
+        section_index2 = SectionIndex().read(index_filename)
+        os.remove(index_filename)
+        self.assertTrue(section_index2.is_valid(f06name))
+        self.assertEqual(
+            [(section.marker, section.n, section.page, section.isubcase)
+             for section in section_index2.sections],
+            [(section.marker, section.n, section.page, section.isubcase)
+             for section in section_index.sections])
+
     def test_plate_openmdao(self):
         bdfname = os.path.join(model_path, 'plate', 'plate_openmdao.bdf')
         f06name = os.path.join(model_path, 'plate', 'plate.f06')
@@ -489,6 +546,50 @@ class TestF06(unittest.TestCase):
         self.assertTrue(array_equal(f06.eigenvectors[subcase].rotations[eig][2], array([1., 1., 1.])))
         self.assertTrue(array_equal(f06.eigenvectors[subcase].rotations[eig][4], array([1., 1., 1.])))
 
+    def test_vectorized_nodal_tables(self):
+        """the vectorized nodal tables match the dictionary based ones"""
+        f06_names = [
+            os.path.join(model_path, 'sol_101_elements', 'static_solid_shell_bar.f06'),
+            os.path.join(model_path, 'sol_101_elements', 'mode_solid_shell_bar.f06'),
+            os.path.join(model_path, 'plate', 'plate.f06'),
+            os.path.join(test_path, 'test_with_rotations.f06'),
+        ]
+        for f06_name in f06_names:
+            f06 = F06(debug=False)
+            f06.read_f06(f06_name)
+            f06v = F06(debug=False)
+            f06v.set_vectorization(True)
+            f06v.read_f06(f06_name)
+
+            nresults = 0
+            for result_name in ['displacements', 'spcForces', 'eigenvectors']:
+                results = getattr(f06, result_name)
+                resultsv = getattr(f06v, result_name)
+                self.assertEqual(sorted(results), sorted(resultsv))
+                for isubcase, result in iteritems(results):
+                    resultv = resultsv[isubcase]
+                    self.assertTrue(resultv.is_built)
+                    resultv.get_stats()
+                    if result.nonlinear_factor is None:
+                        translations = [result.translations]
+                        rotations = [result.rotations]
+                    else:
+                        times = sorted(result.translations)
+                        self.assertEqual(resultv._times.tolist(), times)
+                        translations = [result.translations[dt] for dt in times]
+                        rotations = [result.rotations[dt] for dt in times]
+
+                    node_ids = resultv.node_gridtype[:, 0].tolist()
+                    self.assertEqual(resultv.data.shape, (len(translations), len(node_ids), 6))
+                    for itime, (translation, rotation) in enumerate(zip(translations, rotations)):
+                        self.assertEqual(sorted(translation), sorted(node_ids))
+                        for inid, nid in enumerate(node_ids):
+                            datai = resultv.data[itime, inid, :]
+                            expected = array([translation[nid], rotation[nid]], dtype='float32')
+                            self.assertTrue(array_equal(datai, expected.ravel()), (f06_name, nid))
+                        nresults += 1
+            self.assertGreater(nresults, 0, f06_name)
+
     def test_plate_vonmises(self):
         bdfname = os.path.join(model_path, 'plate', 'plate.bdf')
         f06name = os.path.join(model_path, 'plate', 'plate.f06')
@@ -512,7 +613,7 @@ class TestF06(unittest.TestCase):
             if stress.isVonMises():
                 #vonMises = 'VON MISES'
                 for eid,ovm in sorted(iteritems(stress.ovmShear)):
-                    ovmkeys = ovm.keys()
+                    ovmkeys = list(ovm.keys())
                     ovmkeys.remove(cen)
                     ovmkeys.sort()
                     ovmkeys = [cen] + ovmkeys
@@ -524,7 +625,7 @@ class TestF06(unittest.TestCase):
             else:
                 #vonMises = 'MAX SHEAR'
                 for eid,ovm in sorted(iteritems(stress.ovmShear)):
-                    ovmkeys = ovm.keys()
+                    ovmkeys = list(ovm.keys())
                     ovmkeys.remove(cen)
                     ovmkeys.sort()
                     ovmkeys = [cen] + ovmkeys
@@ -0,0 +1,59 @@
+from __future__ import absolute_import
+
+import unittest
+from numpy import array_equal
+
+from pyNastran.f06.f06_table import parse_real_node_table, convert_split_table
+
+
+class TestF06Table(unittest.TestCase):
+
+    def test_real_node_table(self):
+        """the fast (split) path and the fixed width path"""
+        lines = [
+            '           1      G      1.000000E+00  -2.000000E+00   3.000000E+00   0.0            0.0           -1.234567E-17',
+            '           2      G      4.000000E+00   5.000000E+00   6.000000E+00   1.0            2.0            3.0',
+        ]
+        node_ids, grid_types, data = parse_real_node_table(lines)
+        self.assertEqual(node_ids.tolist(), [1, 2])
+        self.assertEqual(grid_types.tolist(), ['G', 'G'])
+        self.assertEqual(data.tolist(), [
+            [1., -2., 3., 0., 0., -1.234567E-17],
+            [4., 5., 6., 1., 2., 3.]])
+
+        # the SPOINT line is split into 1 row per point
+        lines2 = lines + ['          10      S      7.000000E+00   8.000000E+00   9.000000E+00']
+        node_ids, grid_types, data2 = parse_real_node_table(lines2)
+        self.assertEqual(node_ids.tolist(), [1, 2, 10, 11, 12])
+        self.assertEqual(grid_types.tolist(), ['G', 'G', 'S', 'S', 'S'])
+        self.assertTrue(array_equal(data2[:2, :], data))
+        self.assertEqual(data2[2:, :].tolist(), [
+            [7., 0., 0., 0., 0., 0.],
+            [8., 0., 0., 0., 0., 0.],
+            [9., 0., 0., 0., 0., 0.]])
+
+        # blank GRID fields are only allowed on an eigenvector
+        lines3 = [lines[0], '           3      G      1.000000E+00                 3.000000E+00']
+        node_ids, grid_types, data3 = parse_real_node_table(lines3, allow_blanks=True)
+        self.assertEqual(data3[1, :].tolist(), [1., 0., 3., 0., 0., 0.])
+        with self.assertRaises(ValueError):
+            parse_real_node_table(lines3)
+
+        with self.assertRaises(NotImplementedError):
+            parse_real_node_table(['           3      L      1.000000E+00'])
+        self.assertEqual(parse_real_node_table([])[2].shape, (0, 6))
+
+    def test_split_table(self):
+        """the split lines are converted by column"""
+        slines = [['1', '2', '3.5', 'a', 'extra'], ['4', '5', '-6.', 'b', 'extra']]
+        data = convert_split_table(slines, [int, int, float, str])
+        self.assertEqual(data, [[1, 2, 3.5, 'a'], [4, 5, -6., 'b']])
+        self.assertEqual(convert_split_table([], [int]), [])
+
+        # the caller parses these one line at a time
+        self.assertIsNone(convert_split_table([['1', '2'], ['3']], [int, int]))
+        self.assertIsNone(convert_split_table([['1', 'FX']], [int, float]))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    unittest.main()
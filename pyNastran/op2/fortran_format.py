@@ -1,9 +1,57 @@
 from __future__ import print_function
+from six import PY3
 from six.moves import range
 import sys
+import mmap
 from struct import unpack
 import copy
 
+
+class MemoryMappedFile(object):
+    """
+    A read-only, file-like view of a memory-mapped file.
+
+    Reads return ``memoryview`` slices of the mapped file rather than
+    copies, so the OP2 blocks are only copied when a parser needs them to
+    be (e.g. a record that spans multiple blocks).
+    """
+    def __init__(self, filename):
+        self._f = open(filename, 'rb')
+        self._mmap = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        self._nbytes = len(self._mmap)
+        self._n = 0
+
+    def read(self, n=-1):
+        n0 = self._n
+        if n < 0:
+            n1 = self._nbytes
+        else:
+            n1 = min(n0 + n, self._nbytes)
+        self._n = n1
+        return self._view[n0:n1]
+
+    def seek(self, n, whence=0):
+        if whence == 1:
+            n += self._n
+        elif whence == 2:
+            n += self._nbytes
+        self._n = n
+
+    def tell(self):
+        return self._n
+
+    def close(self):
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # a result still references a slice of the map, so we let the
+            # garbage collector unmap the file once the slice is gone
+            pass
+        self._f.close()
+
+
 class FortranFormat(object):
     def __init__(self):
         """
@@ -21,6 +69,11 @@ class FortranFormat(object):
         self.isAllSubcases = True
         self.valid_subcases = []
 
+        #: the TableIndex of the OP2 (None -> no index)
+        self.table_index = None
+        #: should the table index be filled as the file is read
+        self._build_table_index = False
+
     def show(self, n, types='ifs'):
         """
         :param self:    the OP2 object pointer
@@ -197,11 +250,17 @@ class FortranFormat(object):
         self._data_factor = 1
 
         nstart = self.n
+        if PY3 and isinstance(self.table_name, bytes):
+            # the table mapper and the table3/table4 parsers use str names
+            self.table_name = self.table_name.decode('latin1')
+        self._n_table3 = None
         self.isubtable = -3
         self.read_markers([-3, 1, 0])
         self.binary_debug.write('***isubtable = %i\n' % self.isubtable)
         self.binary_debug.write('---markers = [-3, 1, 0]---\n')
         table_mapper = self._get_table_mapper()
+        if self._build_table_index:
+            self.table_index.start_subtables()
 
         # get the parsing functions (table3_parser, table4_parser)
         # or find out we're going to be skipping the tables
@@ -250,6 +309,7 @@ class FortranFormat(object):
         record_len = self._get_record_length()
 
         if record_len == 584:  # table3 has a length of 584
+            self._n_table3 = self.n
             self.data_code = {}
             self.obj = None
             data = self._read_record()
@@ -258,6 +318,8 @@ class FortranFormat(object):
                 #if hasattr(self, 'isubcase'):
                     #print("code = ", self._get_code())
         else:
+            if self._build_table_index:
+                self._add_subtable_to_index(passer, record_len)
             if passer or not self.is_valid_subcase():
                 data = self._skip_record()
             else:
@@ -270,6 +332,25 @@ class FortranFormat(object):
                     n = table4_parser(data)
                 #del n
 
+    def _add_subtable_to_index(self, passer, record_len):
+        """
+        Adds the table4 record we're about to read to the table index
+
+        :param passer:     is the table being skipped
+        :param record_len: the length of the table4 record
+        """
+        isubcase = None
+        element_type = None
+        num_wide = None
+        n3 = None
+        if not passer:
+            isubcase = getattr(self, 'isubcase', None)
+            element_type = getattr(self, 'element_type', None)
+            num_wide = getattr(self, 'num_wide', None)
+            n3 = getattr(self, '_n_table3', None)
+        self.table_index.add_subtable(isubcase, element_type, n3, self.n,
+                                      record_len, num_wide)
+
     def _read_subtable_results(self, table4_parser, record_len):
         """
         # if reading the data
@@ -284,7 +365,9 @@ class FortranFormat(object):
 
             # we stream the record because we get it in partial blocks
             for data in self._stream_record():
-                data = datai + data
+                if len(datai):
+                    # the previous block ended in the middle of an entry
+                    data = b''.join([datai, data])
 
                 n = table4_parser(data)
                 assert isinstance(n, int), self.table_name
@@ -350,7 +433,8 @@ class FortranFormat(object):
                 #n = self.n
                 n = 0
                 for i, data in enumerate(self._stream_record()):
-                    data = datai + data
+                    if len(datai):
+                        data = b''.join([datai, data])
                     ndata = len(data)
                     n = table4_parser(data)
                     assert isinstance(n, int), self.table_name
@@ -508,5 +592,5 @@ class FortranFormat(object):
                 nloop += 1
 
             if nloop > 0:
-                record = ''.join(records)
+                record = b''.join(records)
         return record
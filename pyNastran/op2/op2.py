@@ -29,7 +29,8 @@ from pyNastran.op2.tables.opg_appliedLoads.opg import OPG
 from pyNastran.op2.tables.oqg_constraintForces.oqg import OQG
 from pyNastran.op2.tables.oug.oug import OUG
 from pyNastran.op2.tables.ogpwg import OGPWG
-from pyNastran.op2.fortran_format import FortranFormat
+from pyNastran.op2.fortran_format import FortranFormat, MemoryMappedFile
+from pyNastran.op2.op2_index import TableIndex
 
 #from pyNastran.bdf.bdf import BDF
 
@@ -421,7 +422,7 @@ class OP2(LAMA, ONR, OGPF,
     def _table_passer(self, data):
         return len(data)
 
-    def read_op2(self, op2_filename=None):
+    def read_op2(self, op2_filename=None, use_mmap=False, index_filename=None):
         """
         Starts the OP2 file reading
 
@@ -430,6 +431,13 @@ class OP2(LAMA, ONR, OGPF,
 
             init=None,  op2_filename=None   -> a dialog is popped up  (not implemented; crash)
             init=fname, op2_filename=fname  -> fname is used
+        :param use_mmap: memory-map the OP2 instead of reading it through a
+            file handle (default=False).  Blocks are then zero-copy slices of
+            the mapped file, which cuts the peak memory on large OP2s.
+        :param index_filename: a sidecar file for the table index
+            (default=None -> don't save the index).  If it exists and matches
+            the OP2, it's used to jump over the tables without any requested
+            results; otherwise, it's written once the OP2 has been scanned.
         """
         sr = list(self._saved_results)
         sr.sort()
@@ -472,9 +480,13 @@ class OP2(LAMA, ONR, OGPF,
         #: file index
         self.n = 0
         self.table_name = None
+        self._setup_table_index(index_filename)
 
         #: the OP2 file object
-        self.f = open(self.op2_filename, 'rb')
+        if use_mmap:
+            self.f = MemoryMappedFile(self.op2_filename)
+        else:
+            self.f = open(self.op2_filename, 'rb')
         try:
             markers = self.get_nmarkers(1, rewind=True)
         except:
@@ -506,6 +518,10 @@ class OP2(LAMA, ONR, OGPF,
             raise FatalError('no tables exists...')
 
         table_names = self._read_tables(table_name)
+        if self._build_table_index:
+            self._build_table_index = False
+            if index_filename is not None:
+                self.table_index.write(index_filename)
         if self.debug:
             self.binary_debug.write('-' * 80 + '\n')
             self.binary_debug.write('f.tell()=%s\ndone...\n' % self.f.tell())
@@ -517,6 +533,118 @@ class OP2(LAMA, ONR, OGPF,
         #self.remove_unpickable_data()
         return table_names
 
+    def _setup_table_index(self, index_filename):
+        """
+        Loads the table index from a sidecar file or flags that it should
+        be built while the OP2 is read.
+
+        :param index_filename: the sidecar file (None -> no sidecar)
+        """
+        if self.read_mode == 2:
+            # the index was built on the first pass
+            return
+        self.table_index = None
+        self._build_table_index = False
+        if index_filename is None and self.read_mode == 0:
+            return
+
+        if index_filename is not None and os.path.exists(index_filename):
+            table_index = TableIndex().read(index_filename)
+            if table_index.is_valid(self.op2_filename):
+                self.log.debug('using table index %r' % index_filename)
+                self.table_index = table_index
+                return
+        self.table_index = TableIndex(self.op2_filename)
+        self._build_table_index = True
+
+    def _can_skip_table(self, itable):
+        """
+        Uses the table index to check if the current table has any results
+        that will be read, so we can jump over it.
+
+        :param itable: the index of the table in the OP2
+        """
+        if self._build_table_index or self.table_index is None:
+            return False
+        table = self.table_index.tables[itable]
+        if table.n_start != self.n:
+            msg = 'the table index is inconsistent with op2_filename=%r; table=%s n=%s' % (
+                self.op2_filename, table, self.n)
+            raise RuntimeError(msg)
+        if table.subtables is None:
+            # not a standard table, so we always read it
+            return False
+
+        # the index stores str names, so it works the same way on Python 3
+        table_mapper = self._get_table_mapper()
+        if table.table_name not in table_mapper:
+            return True
+        table3_parser, table4_parser = table_mapper[table.table_name]
+        if table4_parser == self._table_passer:
+            return True
+        if self.isAllSubcases:
+            return False
+        for subtable in table.subtables:
+            if subtable.isubcase is None or subtable.isubcase in self.valid_subcases:
+                return False
+        return True
+
+    def _get_indexed_table(self, itable):
+        """
+        Gets the TableEntry of the current table if its subtables can be
+        read by seeking to them (None -> read the table record by record).
+
+        :param itable: the index of the table in the OP2
+        """
+        if self._build_table_index or self.table_index is None:
+            return None
+        table = self.table_index.tables[itable]
+        if not table.subtables:
+            return None
+        for subtable in table.subtables:
+            if subtable.n3 is None:
+                return None
+        return table
+
+    def _read_indexed_table(self, table):
+        """
+        Reads the subtables of a results table using the offsets in the
+        table index, so the subtables without any requested results (e.g.
+        other subcases) aren't read and the record markers aren't scanned.
+
+        :param table: the TableEntry
+        """
+        table_mapper = self._get_table_mapper()
+        for subtable in table.subtables:
+            if not self.isAllSubcases and subtable.isubcase not in self.valid_subcases:
+                continue
+            self._read_indexed_subtable(table.table_name, subtable, table_mapper)
+        self.goto(table.n_end)
+
+    def _read_indexed_subtable(self, table_name, subtable, table_mapper):
+        """
+        Reads a single table3/table4 pair that was found with the table index
+
+        :param table_name: the name of the table (e.g. 'OUGV1')
+        :param subtable: the SubtableEntry
+        :param table_mapper: the table name -> (table3_parser, table4_parser) map
+        """
+        table3_parser, table4_parser = table_mapper[table_name]
+        self.table_name = table_name
+        self._data_factor = 1
+        self.is_start_of_subtable = True
+
+        self.goto(subtable.n3)
+        self._n_table3 = subtable.n3
+        self.data_code = {}
+        self.obj = None
+        data = self._read_record()
+        table3_parser(data)
+
+        self.goto(subtable.n4)
+        self._read_subtable_results(table4_parser, subtable.record_len)
+        self.finish()
+
     def create_unpickable_data(self):
         raise NotImplementedError()
         #==== not needed ====
@@ -547,6 +675,33 @@ class OP2(LAMA, ONR, OGPF,
         del self._mpt_map
         del self._table_mapper
 
+    def export_hdf5(self, hdf5_filename, compression='gzip'):
+        """
+        Writes the vectorized results to an HDF5 file (requires h5py)
+
+        :param hdf5_filename: the HDF5 file to write
+        :param compression: the h5py compression filter (e.g. 'gzip', 'lzf', None)
+        """
+        from pyNastran.op2.op2_hdf5 import export_hdf5
+        export_hdf5(self, hdf5_filename, compression=compression)
+
+    def load_hdf5(self, hdf5_filename, result_names=None, itimes=None, irows=None):
+        """
+        Loads the results written by ``export_hdf5`` (requires h5py)
+
+        :param hdf5_filename: the HDF5 file to read
+        :param result_names: the results to load (e.g. ['displacements'];
+            default=None -> all)
+        :param itimes: the time/mode/frequency index to load (int, slice, or
+            an increasing list; default=None -> all)
+        :param irows: the nodes to load (int, slice, or an increasing list;
+            default=None -> all); only the nodal results (e.g.
+            displacements) support irows
+        """
+        from pyNastran.op2.op2_hdf5 import load_hdf5
+        load_hdf5(self, hdf5_filename, result_names=result_names,
+                  itimes=itimes, irows=irows)
+
     def _read_tables(self, table_name):
         """
         Reads all the geometry/result tables.
@@ -555,6 +710,7 @@ class OP2(LAMA, ONR, OGPF,
         :param table_name: the first table's name
         """
         table_names = []
+        itable = 0
         while table_name is not None:
             #print "----------------------------------"
             table_names.append(table_name)
@@ -564,7 +720,13 @@ class OP2(LAMA, ONR, OGPF,
                 self.binary_debug.write('table_name = %r; f.tell()=%s\n' % (table_name, self.f.tell()))
 
             self.table_name = table_name
-            if 0:
+            if self._build_table_index:
+                self.table_index.add_table(table_name, self.n)
+
+            if self._can_skip_table(itable):
+                # the index says there are no results we want
+                self.goto(self.table_index.tables[itable].n_end)
+            elif 0:
                 self._skip_table(table_name)
             else:
                 if table_name in [b'GEOM1', b'GEOM2', b'GEOM3', b'GEOM4',  # regular
@@ -666,10 +828,13 @@ class OP2(LAMA, ONR, OGPF,
                                     b'HOEF1',
                                     b'ONRGY2',
                                     ]:
-                    self._read_results_table()
+                    self._read_results_table(self._get_indexed_table(itable))
                 else:
                     raise NotImplementedError('%r' % table_name)
 
+            if self._build_table_index:
+                self.table_index.end_table(self.n)
+            itable += 1
             table_name = self.read_table_name(rewind=True, stop_on_failure=False)
             #if table_name is None:
                 #self.show(100)
@@ -1237,9 +1402,12 @@ class OP2(LAMA, ONR, OGPF,
         self.read_markers([-4, 1, 0, 0])
         #self._read_subtables()
 
-    def _read_results_table(self):
+    def _read_results_table(self, table=None):
         """
         Reads a results table
+
+        :param table: the TableEntry from the table index
+            (None -> read the subtables record by record)
         """
         if self.debug:
             self.binary_debug.write('read_results_table - %s\n' % self.table_name)
@@ -1272,7 +1440,11 @@ class OP2(LAMA, ONR, OGPF,
             msg += 'ints     = %r\n' % str(ints)
             msg += 'floats   = %r' % str(floats)
             raise NotImplementedError(msg)
-        self._read_subtables()
+
+        if table is None:
+            self._read_subtables()
+        else:
+            self._read_indexed_table(table)
 
     def _print_month(self, month, day, year, zero, one):
         """
@@ -1,9 +1,11 @@
 from __future__ import print_function
-from six import string_types
+from six import string_types, PY3
 from six.moves import range
 import copy
 from struct import Struct, unpack
 
+from numpy import frombuffer, dtype as np_dtype, radians, exp
+
 from pyNastran import isRelease
 from pyNastran.op2.op2_helper import polar_to_real_imag
 from pyNastran.utils import object_attributes
@@ -12,6 +14,16 @@ from pyNastran.f06.f06Writer import F06Writer
 from pyNastran.op2.op2_writer import OP2Writer
 from pyNastran.op2.op2Codes import Op2Codes
 
+#: a real displacement-style table4 entry (num_wide=8)
+REAL_TABLE_DTYPE = np_dtype([
+    ('eid_device', 'int32'), ('grid_type', 'int32'), ('data', 'float32', (6,))])
+
+#: a complex displacement-style table4 entry (num_wide=14)
+COMPLEX_TABLE_DTYPE = np_dtype([
+    ('eid_device', 'int32'), ('grid_type', 'int32'),
+    ('real', 'float32', (6,)), ('imag', 'float32', (6,))])
+
+
 class OP2Common(Op2Codes, F06Writer, OP2Writer):
     def __init__(self):
         Op2Codes.__init__(self)
@@ -395,6 +407,10 @@ class OP2Common(Op2Codes, F06Writer, OP2Writer):
         assert len(data) == 584, len(data)
         # titleSubtitleLabel
         Title, subtitle, label = unpack(b'128s128s128s', data[200:])
+        if PY3:
+            Title = Title.decode('latin1')
+            subtitle = subtitle.decode('latin1')
+            label = label.decode('latin1')
 
         self.Title = Title.strip()
 
@@ -556,6 +572,10 @@ class OP2Common(Op2Codes, F06Writer, OP2Writer):
 
         assert nnodes > 0
         #assert len(data) % ntotal == 0
+        if self.read_mode == 2 and hasattr(obj, 'itime'):
+            # vectorized object, so we can decode the block in one shot
+            return self._read_real_table_vectorized(data, nnodes, flag, dt)
+
         s = Struct(format1)
         for inode in range(nnodes):
             edata = data[n:n+ntotal]
@@ -588,6 +608,10 @@ class OP2Common(Op2Codes, F06Writer, OP2Writer):
         assert self.obj is not None
         assert nnodes > 0
         #assert len(data) % ntotal == 0
+        if self.read_mode == 2 and hasattr(obj, 'itime'):
+            # vectorized object, so we can decode the block in one shot
+            return self._read_complex_table_vectorized(data, nnodes, flag, dt,
+                                                       is_magnitude_phase)
 
         for inode in range(nnodes):
             edata = data[n:n+ntotal]
@@ -620,6 +644,56 @@ class OP2Common(Op2Codes, F06Writer, OP2Writer):
             n += ntotal
         return n
 
+    def _fill_table_array(self, entries, nnodes, flag, dt, values):
+        """
+        Writes a block of decoded table4 entries into the vectorized
+        object (e.g. RealDisplacementArray) as whole slices.
+
+        :param entries: the structured array of table4 entries
+        :param nnodes:  the number of nodes/elements in the block
+        :param flag:    'node' or 'elem'
+        :param dt:      the time/frequency/mode of the block
+        :param values:  the (nnodes, 6) real/complex results
+        """
+        obj = self.obj
+        eids = (entries['eid_device'] - self.device_code) // 10
+        if self.debug:
+            for eid, entry in zip(eids, entries):
+                self.binary_debug.write('  %s=%i; %s\n' % (flag, eid, str(entry)))
+        assert eids.min() > -1 and eids.max() < 1000000000, eids
+
+        itotal = obj.itotal
+        itotal2 = itotal + nnodes
+        obj._times[obj.itime] = dt
+        obj.node_gridtype[itotal:itotal2, 0] = eids
+        obj.node_gridtype[itotal:itotal2, 1] = entries['grid_type']
+        obj.data[obj.itime, itotal:itotal2, :] = values
+        obj.itotal = itotal2
+
+    def _read_real_table_vectorized(self, data, nnodes, flag, dt):
+        """
+        Vectorized version of ``_read_real_table`` that views the block as
+        a structured array instead of unpacking it node by node.
+        """
+        ntotal = nnodes * 32
+        entries = frombuffer(data, dtype=REAL_TABLE_DTYPE, count=nnodes)
+        self._fill_table_array(entries, nnodes, flag, dt, entries['data'])
+        return ntotal
+
+    def _read_complex_table_vectorized(self, data, nnodes, flag, dt, is_magnitude_phase):
+        """
+        Vectorized version of ``_read_complex_table`` that views the block as
+        a structured array instead of unpacking it node by node.
+        """
+        ntotal = nnodes * 56
+        entries = frombuffer(data, dtype=COMPLEX_TABLE_DTYPE, count=nnodes)
+        if is_magnitude_phase:
+            values = entries['real'] * exp(1j * radians(entries['imag']))
+        else:
+            values = entries['real'] + 1j * entries['imag']
+        self._fill_table_array(entries, nnodes, flag, dt, values)
+        return ntotal
+
     def _read_complex_table2(self, data, result_name, flag):
         #return
         if self.debug4():
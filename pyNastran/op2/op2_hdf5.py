@@ -0,0 +1,242 @@
+"""
+Defines the HDF5 export/import of the vectorized OP2 result objects
+(e.g. RealDisplacementArray, RealPlateStressArray).
+
+Each result object is stored as a group:
+
+    /results/<result_name>/<i>
+        attrs: class_module, class_name, key, is_sort1, data_code, attrs
+        datasets: data, _times, node_gridtype/element_node, ...
+
+The ndarray attributes are stored as chunked, compressed datasets, so
+``load_hdf5`` can read a single time step or a range of rows (e.g.
+nodes) using HDF5 hyperslabs without reading the whole array.  The
+scalar attributes and the data_code are stored as JSON.
+"""
+from __future__ import print_function
+import json
+import importlib
+from six import iteritems, string_types, integer_types
+
+from numpy import ndarray, generic
+import h5py
+
+#: the number of values per chunk of the data array
+CHUNK_SIZE = 262144
+
+
+def _to_json(value):
+    """converts a value to something json can store (bytes/tuples are tagged)"""
+    if isinstance(value, bytes):
+        return {'__bytes__' : value.decode('latin1')}
+    elif isinstance(value, string_types):
+        return str(value)
+    elif isinstance(value, tuple):
+        return {'__tuple__' : [_to_json(valuei) for valuei in value]}
+    elif isinstance(value, list):
+        return [_to_json(valuei) for valuei in value]
+    elif isinstance(value, generic):
+        return value.item()
+    elif value is None or isinstance(value, (bool, float) + integer_types):
+        return value
+    raise TypeError('type=%s is not supported' % type(value))
+
+
+def _from_json(value):
+    """inverse of _to_json"""
+    if isinstance(value, dict):
+        if '__bytes__' in value:
+            return value['__bytes__'].encode('latin1')
+        if '__tuple__' in value:
+            return tuple([_from_json(valuei) for valuei in value['__tuple__']])
+        return dict([(key, _from_json(valuei)) for key, valuei in iteritems(value)])
+    elif isinstance(value, list):
+        return [_from_json(valuei) for valuei in value]
+    return value
+
+
+def _dumps(value):
+    return json.dumps(_to_json(value))
+
+
+def _loads(value):
+    if isinstance(value, bytes):
+        value = value.decode('latin1')
+    return _from_json(json.loads(value))
+
+
+def _get_chunks(value):
+    """chunks by time step and a block of rows, so hyperslabs are cheap"""
+    if value.ndim != 3:
+        return True
+    ntimes, nrows, ncols = value.shape
+    nrows_chunk = max(1, min(nrows, CHUNK_SIZE // max(1, ncols)))
+    return (1, nrows_chunk, ncols)
+
+
+def _write_result(group, key, obj, compression):
+    """writes a single result object to a group"""
+    group.attrs['class_module'] = obj.__class__.__module__
+    group.attrs['class_name'] = obj.__class__.__name__
+    group.attrs['key'] = _dumps(key)
+    is_sort1 = True
+    if hasattr(obj, 'sort_bits'):
+        is_sort1 = obj.is_sort1()
+    group.attrs['is_sort1'] = bool(is_sort1)
+    group.attrs['data_code'] = json.dumps(
+        dict([(str(keyi), _to_json(value)) for keyi, value in iteritems(obj.data_code)
+              if keyi != 'log']))
+
+    attrs = {'__unicode__' : []}
+    for name, value in sorted(iteritems(obj.__dict__)):
+        if name == 'data_code':
+            continue
+        if isinstance(value, ndarray):
+            if value.dtype.kind == 'U':
+                # HDF5 doesn't support unicode arrays
+                attrs['__unicode__'].append(name)
+                value = value.astype('|S')
+            if value.ndim == 0 or value.size == 0:
+                group.create_dataset(name, data=value)
+            else:
+                group.create_dataset(name, data=value, chunks=_get_chunks(value),
+                                     compression=compression)
+            continue
+        try:
+            attrs[name] = _to_json(value)
+        except TypeError:
+            # methods, old-style dictionaries, ...
+            continue
+    group.attrs['attrs'] = json.dumps(attrs)
+
+
+def export_hdf5(model, hdf5_filename, compression='gzip'):
+    """
+    Writes the vectorized results of an OP2 to an HDF5 file
+
+    :param model: the OP2 object
+    :param hdf5_filename: the HDF5 file to write
+    :param compression: the h5py compression filter (e.g. 'gzip', 'lzf', None)
+    """
+    with h5py.File(hdf5_filename, 'w') as hdf5_file:
+        results_group = hdf5_file.create_group('results')
+        for result_name in model.get_table_types():
+            results = getattr(model, result_name, None)
+            if not results:
+                continue
+            result_group = None
+            for i, (key, obj) in enumerate(results.items()):
+                if not isinstance(getattr(obj, 'data', None), ndarray):
+                    model.log.debug('skipping %s[%r]; %s is not vectorized' % (
+                        result_name, key, obj.__class__.__name__))
+                    continue
+                if result_group is None:
+                    result_group = results_group.create_group(result_name)
+                _write_result(result_group.create_group(str(i)), key, obj, compression)
+
+
+def _get_slice(index):
+    """an int index keeps the axis; lists/arrays must be increasing for HDF5"""
+    if index is None:
+        return slice(None)
+    elif isinstance(index, integer_types):
+        return slice(index, index + 1)
+    return index
+
+
+def _slice_list(values, index):
+    """applies a time index to a python list (e.g. the modes of an eigenvector)"""
+    if isinstance(index, slice):
+        return values[index]
+    return [values[i] for i in index]
+
+
+def _read_result(group, itimes, irows):
+    """reads a single result object from a group"""
+    module = importlib.import_module(group.attrs['class_module'])
+    cls = getattr(module, group.attrs['class_name'])
+    key = _loads(group.attrs['key'])
+    data_code = _loads(group.attrs['data_code'])
+    attrs = _loads(group.attrs['attrs'])
+
+    obj = cls(data_code, bool(group.attrs['is_sort1']), attrs.get('isubcase'), attrs.get('dt'))
+    unicode_names = attrs.pop('__unicode__', [])
+    obj.__dict__.update(attrs)
+
+    nrows = None
+    ntimes = None
+    if 'data' in group and group['data'].ndim == 3:
+        ntimes, nrows = group['data'].shape[:2]
+        if irows is not None and 'node_gridtype' not in group:
+            # the rows of an element result are element/node pairs, so the
+            # per-element arrays (e.g. element_cid) and counters can't be
+            # sliced consistently
+            msg = 'irows is only supported for the nodal results; %s is an element result' % (
+                cls.__name__)
+            raise NotImplementedError(msg)
+
+    itime = _get_slice(itimes)
+    irow = _get_slice(irows)
+    for name, dataset in iteritems(group):
+        if name == 'data' and dataset.ndim == 3:
+            value = dataset[itime, irow, :]
+        elif name == '_times' and dataset.ndim == 1:
+            value = dataset[itime]
+        elif dataset.ndim >= 1 and nrows is not None and dataset.shape[0] == nrows:
+            # node_gridtype
+            value = dataset[irow]
+        else:
+            value = dataset[()]
+        if value.dtype.kind == 'S' and name in unicode_names:
+            value = value.astype('U')
+        setattr(obj, name, value)
+
+    if nrows is None:
+        return key, obj
+
+    ntimesi, nrowsi = obj.data.shape[:2]
+    if itimes is not None:
+        obj.ntimes = ntimesi
+        # the transient values (e.g. modes, eigrs) have one entry per time
+        for name in data_code.get('dataNames', []):
+            values = getattr(obj, name + 's', None)
+            if isinstance(values, list) and len(values) == ntimes:
+                setattr(obj, name + 's', _slice_list(values, itime))
+
+    # the counters are either per time step (e.g. nelements for solids)
+    # or summed over the time steps (e.g. nelements for plates)
+    for name in ['ntotal', 'nelements', '_nnodes']:
+        value = getattr(obj, name, None)
+        if not isinstance(value, integer_types) or nrows == 0:
+            continue
+        if value == ntimes * nrows and ntimes > 1:
+            setattr(obj, name, ntimesi * nrowsi)
+        else:
+            setattr(obj, name, value * nrowsi // nrows)
+    return key, obj
+
+
+def load_hdf5(model, hdf5_filename, result_names=None, itimes=None, irows=None):
+    """
+    Loads the results written by ``export_hdf5``
+
+    :param model: the OP2 object to load the results into
+    :param hdf5_filename: the HDF5 file to read
+    :param result_names: the results to load (e.g. ['displacements'];
+        default=None -> all)
+    :param itimes: the time/mode/frequency index to load (int, slice, or
+        an increasing list; default=None -> all)
+    :param irows: the nodes to load (int, slice, or an increasing list;
+        default=None -> all).  node_gridtype is sliced too.  Only the
+        nodal results (e.g. displacements, eigenvectors) support irows;
+        a NotImplementedError is raised for an element result.
+    """
+    with h5py.File(hdf5_filename, 'r') as hdf5_file:
+        results_group = hdf5_file['results']
+        for result_name, result_group in iteritems(results_group):
+            if result_names is not None and result_name not in result_names:
+                continue
+            results = getattr(model, result_name)
+            for i in sorted(result_group, key=int):
+                key, obj = _read_result(result_group[i], itimes, irows)
+                results[key] = obj
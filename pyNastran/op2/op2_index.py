@@ -0,0 +1,198 @@
+"""
+Defines the TableIndex, which stores where the tables/subtables of an
+OP2 live in the file, so the file doesn't need to be scanned again.
+"""
+from __future__ import print_function
+import os
+
+
+class SubtableEntry(object):
+    """
+    A table3/table4 pair inside a table (e.g. one subcase/element type
+    of an OES1X1 table).
+    """
+    def __init__(self, isubcase, element_type, n3, n4, record_len, num_wide,
+                 result_names=None):
+        #: the subcase ID (None if the table3 wasn't parsed)
+        self.isubcase = isubcase
+        #: the OES/OEF element type (None for other tables)
+        self.element_type = element_type
+        #: the file offset of the table3 record (None for geometry tables)
+        self.n3 = n3
+        #: the file offset of the table4 record
+        self.n4 = n4
+        #: the number of bytes in the table4 record
+        self.record_len = record_len
+        #: the number of words per entry (None for B-list tables)
+        self.num_wide = num_wide
+        #: the OP2 results (e.g. 'displacements') the table4 fills
+        #: (None -> unknown)
+        self.result_names = result_names
+
+    def __repr__(self):
+        return 'SubtableEntry(isubcase=%s, element_type=%s, n3=%s, n4=%s, record_len=%s, num_wide=%s)' % (
+            self.isubcase, self.element_type, self.n3, self.n4, self.record_len, self.num_wide)
+
+
+class TableEntry(object):
+    """A single table (e.g. OUGV1) in the OP2"""
+    def __init__(self, table_name, n_start, n_end=None):
+        #: the name of the table as a string (e.g. 'OUGV1')
+        self.table_name = table_name
+        #: the file offset of the table name record
+        self.n_start = n_start
+        #: the file offset just past the end of the table
+        self.n_end = n_end
+        #: the subtables; None if the table isn't read with _read_subtables
+        self.subtables = None
+
+    def __repr__(self):
+        nsubtables = None if self.subtables is None else len(self.subtables)
+        return 'TableEntry(table_name=%r, n_start=%s, n_end=%s, nsubtables=%s)' % (
+            self.table_name, self.n_start, self.n_end, nsubtables)
+
+
+def _to_str(value):
+    if isinstance(value, bytes):
+        return value.decode('latin1')
+    return value
+
+
+def _int_or_none(value):
+    if value == 'None':
+        return None
+    return int(value)
+
+
+class TableIndex(object):
+    """
+    Stores the file offsets of every table/subtable in an OP2.
+
+    The index is built during the first pass of a read (using the
+    record markers), so later passes can seek past tables that don't
+    have any requested results.  It may be saved as a sidecar file
+    next to the OP2, so re-opening the same OP2 doesn't need to scan the
+    table structure again.
+    """
+    def __init__(self, op2_filename=None):
+        #: the list of TableEntry objects in file order
+        self.tables = []
+        self.op2_size = None
+        self.op2_mtime = None
+        if op2_filename is not None:
+            self.op2_size, self.op2_mtime = self._get_file_stats(op2_filename)
+
+    @staticmethod
+    def _get_file_stats(op2_filename):
+        stat = os.stat(op2_filename)
+        return stat.st_size, int(stat.st_mtime)
+
+    def add_table(self, table_name, n_start):
+        """starts a new table"""
+        self.tables.append(TableEntry(_to_str(table_name), n_start))
+
+    def end_table(self, n_end):
+        """closes out the current table"""
+        self.tables[-1].n_end = n_end
+
+    def add_subtable(self, isubcase, element_type, n3, n4, record_len, num_wide,
+                     result_names=None):
+        """adds a table3/table4 pair to the current table"""
+        table = self.tables[-1]
+        if table.subtables is None:
+            table.subtables = []
+        table.subtables.append(SubtableEntry(isubcase, element_type, n3, n4,
+                                             record_len, num_wide, result_names))
+
+    def start_subtables(self):
+        """flags the current table as being read with _read_subtables"""
+        table = self.tables[-1]
+        if table.subtables is None:
+            table.subtables = []
+
+    def is_valid(self, op2_filename):
+        """is the index consistent with the OP2 file"""
+        if not self.tables or self.tables[-1].n_end is None:
+            return False
+        op2_size, op2_mtime = self._get_file_stats(op2_filename)
+        return op2_size == self.op2_size and op2_mtime == self.op2_mtime
+
+    def get_subtables(self, table_name=None, isubcase=None, element_type=None,
+                      result_name=None):
+        """
+        Gets the (TableEntry, SubtableEntry) pairs that match the filters.
+
+        :param table_name:   the table name (e.g. 'OES1X1'; None -> all)
+        :param isubcase:     the subcase ID (None -> all)
+        :param element_type: the element type (None -> all)
+        :param result_name:  the result (e.g. 'displacements'; None -> all)
+        """
+        table_name = _to_str(table_name)
+        out = []
+        for table in self.tables:
+            if table.subtables is None:
+                continue
+            if table_name is not None and table.table_name != table_name:
+                continue
+            for subtable in table.subtables:
+                if isubcase is not None and subtable.isubcase != isubcase:
+                    continue
+                if element_type is not None and subtable.element_type != element_type:
+                    continue
+                if result_name is not None and (subtable.result_names is None or
+                                                result_name not in subtable.result_names):
+                    continue
+                out.append((table, subtable))
+        return out
+
+    def write(self, index_filename):
+        """writes the index to a sidecar file"""
+        with open(index_filename, 'w') as index_file:
+            index_file.write('# pyNastran OP2 table index\n')
+            index_file.write('op2_size %s\n' % self.op2_size)
+            index_file.write('op2_mtime %s\n' % self.op2_mtime)
+            for table in self.tables:
+                index_file.write('TABLE %s %s %s\n' % (table.table_name, table.n_start, table.n_end))
+                if table.subtables is None:
+                    continue
+                index_file.write('SUBTABLES %i\n' % len(table.subtables))
+                for subtable in table.subtables:
+                    if subtable.result_names is None:
+                        result_names = 'None'
+                    elif len(subtable.result_names) == 0:
+                        result_names = '-'
+                    else:
+                        result_names = ','.join(subtable.result_names)
+                    index_file.write('  %s %s %s %s %s %s %s\n' % (
+                        subtable.isubcase, subtable.element_type, subtable.n3,
+                        subtable.n4, subtable.record_len, subtable.num_wide,
+                        result_names))
+
+    def read(self, index_filename):
+        """reads an index from a sidecar file"""
+        self.tables = []
+        with open(index_filename, 'r') as index_file:
+            lines = index_file.readlines()
+
+        for line in lines:
+            sline = line.split()
+            if not sline or sline[0].startswith('#'):
+                continue
+            word = sline[0]
+            if word == 'op2_size':
+                self.op2_size = _int_or_none(sline[1])
+            elif word == 'op2_mtime':
+                self.op2_mtime = _int_or_none(sline[1])
+            elif word == 'TABLE':
+                table_name, n_start, n_end = sline[1:]
+                self.add_table(table_name, int(n_start))
+                self.end_table(_int_or_none(n_end))
+            elif word == 'SUBTABLES':
+                self.start_subtables()
+            else:
+                values = [_int_or_none(value) for value in sline[:6]]
+                result_names = None
+                if len(sline) > 6 and sline[6] != 'None':
+                    result_names = [] if sline[6] == '-' else sline[6].split(',')
+                self.add_subtable(*values, result_names=result_names)
+        return self
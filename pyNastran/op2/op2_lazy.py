@@ -0,0 +1,281 @@
+#pylint: disable=C0103,W0201,W0223,R0901,R0902,R0904
+"""
+Defines the OP2_Lazy class, which only decodes a result when it's used.
+
+The OP2 is scanned once to build a table index (see ``op2_index.py``)
+that tracks which results each subtable fills.  The result attributes
+(e.g. ``displacements``, ``plateStress``) are then replaced by
+LazyResultDict objects, which seek to the subtables of a subcase and
+decode them on first access.  Decoded results are kept in an LRU cache
+with an optional memory budget.
+"""
+from __future__ import (nested_scopes, generators, division, absolute_import,
+                        print_function, unicode_literals)
+from collections import OrderedDict
+from six import iteritems
+from numpy import ndarray
+
+from pyNastran.op2.op2 import OP2, TrashWriter
+from pyNastran.op2.op2_index import TableIndex
+
+
+class LazyResultDict(object):
+    """
+    A dict-like object keyed by subcase ID that decodes a result
+    (e.g. ``displacements``) on first access.
+    """
+    def __init__(self, model, result_name, subcases):
+        self.model = model
+        self.result_name = result_name
+        self.subcases = subcases
+
+    def __getitem__(self, isubcase):
+        if isubcase not in self.subcases:
+            raise KeyError(isubcase)
+        return self.model._load_lazy_result(self.result_name, isubcase)
+
+    def get(self, isubcase, default=None):
+        if isubcase not in self.subcases:
+            return default
+        return self[isubcase]
+
+    def __contains__(self, isubcase):
+        return isubcase in self.subcases
+
+    def keys(self):
+        return list(self.subcases)
+
+    def __iter__(self):
+        return iter(self.subcases)
+
+    def __len__(self):
+        return len(self.subcases)
+
+    def items(self):
+        return [(isubcase, self[isubcase]) for isubcase in self.subcases]
+
+    def iteritems(self):
+        for isubcase in self.subcases:
+            yield isubcase, self[isubcase]
+
+    def values(self):
+        return [self[isubcase] for isubcase in self.subcases]
+
+    def __repr__(self):
+        return 'LazyResultDict(result_name=%r, subcases=%s)' % (self.result_name, self.subcases)
+
+
+def _get_nbytes(obj):
+    """estimates the memory used by the numpy arrays in a result object"""
+    nbytes = 0
+    for value in obj.__dict__.values():
+        if isinstance(value, ndarray):
+            nbytes += value.nbytes
+        elif isinstance(value, dict):
+            for valuei in value.values():
+                if isinstance(valuei, ndarray):
+                    nbytes += valuei.nbytes
+                elif isinstance(valuei, dict):
+                    # e.g. translations[dt][node_id]
+                    nbytes += 8 * len(valuei)
+                else:
+                    nbytes += 8
+    return nbytes
+
+
+class OP2_Lazy(OP2):
+
+    def __init__(self, debug=False, log=None, debug_file=None, max_memory=None):
+        """
+        Initializes the OP2_Lazy object
+
+        :param debug: enables the debug log and sets the debug in the logger (default=False)
+        :param log: a logging object to write debug messages to
+         (.. seealso:: import logging)
+        :param debug_file: sets the filename that will be written to (default=None -> no debug)
+        :param max_memory: the number of bytes of decoded results to keep
+         before the least recently used one is dropped (default=None -> no limit)
+        """
+        OP2.__init__(self, debug=debug, log=log, debug_file=debug_file)
+        self.max_memory = max_memory
+        self._is_scanning = False
+        self._lazy_cache = OrderedDict()
+        self._lazy_nbytes = 0
+        self._lazy_results = {}
+        self._index_updated = False
+
+    def read_op2(self, op2_filename=None, use_mmap=False, index_filename=None):
+        """
+        Scans the OP2 and sets up the lazy results.  The file is left open
+        until ``close`` is called.
+
+        :param op2_filename: the OP2 to read
+        :param use_mmap: memory-map the OP2 (default=False)
+        :param index_filename: a sidecar file for the table index
+            (default=None -> don't save the index)
+        """
+        self.read_mode = 0
+        self._close_op2 = False
+        self._is_scanning = True
+        self._index_updated = False
+        self._lazy_cache = OrderedDict()
+        self._lazy_nbytes = 0
+
+        try:
+            table_names = OP2.read_op2(self, op2_filename=op2_filename,
+                                       use_mmap=use_mmap, index_filename=index_filename)
+        finally:
+            self._is_scanning = False
+        self.binary_debug = TrashWriter('debug.out', 'wb')
+
+        if self._index_updated and index_filename is not None:
+            self.table_index.write(index_filename)
+        self._setup_lazy_results()
+        return table_names
+
+    def _setup_table_index(self, index_filename):
+        """
+        Loads the table index from a sidecar file or builds it.  Unlike
+        the OP2 class, we always need an index.
+        """
+        OP2._setup_table_index(self, index_filename)
+        if self.table_index is None:
+            self.table_index = TableIndex(self.op2_filename)
+            self._build_table_index = True
+        self._subtables_by_n4 = {}
+        if not self._build_table_index:
+            for table in self.table_index.tables:
+                if table.subtables is None:
+                    continue
+                for subtable in table.subtables:
+                    self._subtables_by_n4[subtable.n4] = subtable
+
+    def _can_skip_table(self, itable):
+        """
+        While scanning, tables that are fully described by the index don't
+        need to be read.
+        """
+        if OP2._can_skip_table(self, itable):
+            return True
+        if not self._is_scanning or self._build_table_index:
+            return False
+        table = self.table_index.tables[itable]
+        if table.subtables is None:
+            return False
+        for subtable in table.subtables:
+            if subtable.result_names is None:
+                return False
+        return True
+
+    def _read_subtable_results(self, table4_parser, record_len):
+        """
+        While scanning, finds the results that the table4 fills by only
+        decoding its first block.
+        """
+        if not self._is_scanning or self._n_table3 is None:
+            # geometry tables don't have a table3 and are always read
+            return OP2._read_subtable_results(self, table4_parser, record_len)
+
+        n4 = self.n
+        if self._build_table_index:
+            subtable = self.table_index.tables[-1].subtables[-1]
+        else:
+            subtable = self._subtables_by_n4[n4]
+
+        if subtable.result_names is None:
+            table_types = self.get_table_types()
+            results = [getattr(self, result_name) for result_name in table_types]
+            for result_name in table_types:
+                setattr(self, result_name, {})
+            try:
+                self.ntotal = 0
+                for data in self._stream_record():
+                    table4_parser(data)
+                    break
+                isubcase = getattr(self, 'isubcase', None)
+                filled_names = [result_name for result_name in table_types
+                                if getattr(self, result_name)]
+                result_names = [result_name for result_name in filled_names
+                                if isubcase in getattr(self, result_name)]
+            finally:
+                for result_name, result in zip(table_types, results):
+                    setattr(self, result_name, result)
+            if hasattr(self, 'eid_old'):
+                del self.eid_old
+
+            if len(result_names) < len(filled_names):
+                # results that aren't keyed by subcase (e.g. eigenvalues)
+                # are small, so they're read now
+                self.goto(n4)
+                return OP2._read_subtable_results(self, table4_parser, record_len)
+            subtable.result_names = result_names
+            self._index_updated = True
+        self.goto(n4)
+        self._skip_record()
+        return record_len
+
+    def _setup_lazy_results(self):
+        """replaces the result dictionaries with LazyResultDict objects"""
+        self._lazy_results = {}
+        for table, subtable in self.table_index.get_subtables():
+            if subtable.result_names is None or subtable.isubcase is None:
+                continue
+            for result_name in subtable.result_names:
+                subcases = self._lazy_results.setdefault(result_name, [])
+                if subtable.isubcase not in subcases:
+                    subcases.append(subtable.isubcase)
+
+        for result_name, subcases in iteritems(self._lazy_results):
+            setattr(self, result_name, LazyResultDict(self, result_name, subcases))
+
+    def _load_lazy_result(self, result_name, isubcase):
+        """
+        Decodes a result for a single subcase (or gets it from the cache)
+
+        :param result_name: the result (e.g. 'displacements')
+        :param isubcase: the subcase ID
+        """
+        key = (result_name, isubcase)
+        if key in self._lazy_cache:
+            obj, nbytes = self._lazy_cache.pop(key)
+            self._lazy_cache[key] = (obj, nbytes)
+            return obj
+
+        subtables = self.table_index.get_subtables(isubcase=isubcase, result_name=result_name)
+        if len(subtables) == 0:
+            raise KeyError('result_name=%r isubcase=%s' % (result_name, isubcase))
+
+        setattr(self, result_name, {})
+        try:
+            table_mapper = self._get_table_mapper()
+            for table, subtable in subtables:
+                self._read_indexed_subtable(table.table_name, subtable, table_mapper)
+            results = getattr(self, result_name)
+        finally:
+            setattr(self, result_name, LazyResultDict(self, result_name,
+                                                      self._lazy_results[result_name]))
+
+        if isubcase not in results:
+            raise KeyError('result_name=%r isubcase=%s' % (result_name, isubcase))
+        obj = results[isubcase]
+        self._add_to_lazy_cache(key, obj)
+        return obj
+
+    def _add_to_lazy_cache(self, key, obj):
+        """adds a result to the LRU cache and drops the old ones that don't fit"""
+        nbytes = _get_nbytes(obj)
+        self._lazy_cache[key] = (obj, nbytes)
+        self._lazy_nbytes += nbytes
+        if self.max_memory is None:
+            return
+        while self._lazy_nbytes > self.max_memory and len(self._lazy_cache) > 1:
+            unused_key, (unused_obj, nbytesi) = self._lazy_cache.popitem(last=False)
+            self._lazy_nbytes -= nbytesi
+
+    def close(self):
+        """closes the OP2 and clears the cache"""
+        self._lazy_cache = OrderedDict()
+        self._lazy_nbytes = 0
+        if hasattr(self, 'f'):
+            self.f.close()
+            del self.f
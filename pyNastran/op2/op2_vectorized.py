@@ -6,8 +6,45 @@ from __future__ import (nested_scopes, generators, division, absolute_import,
                         print_function, unicode_literals)
 import os
 import sys
+from six import iteritems
 from numpy import array, unique, where
-from pyNastran.op2.op2 import OP2
+from pyNastran.op2.op2 import OP2, TrashWriter
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:  # python 2 without the futures backport
+    ProcessPoolExecutor = None
+
+
+def _read_subtables_vectorized(op2_filename, saved_results, results, subtables):
+    """
+    Fills the vectorized results of a set of subtables.  This is run in a
+    worker process by ``OP2_Vectorized.read_op2(..., num_workers=N)``.
+
+    :param op2_filename: the OP2 to read
+    :param saved_results: the results to read (``OP2._saved_results``)
+    :param results: the objects from the read_mode=1 pass that the
+        subtables fill ({result_name: {code: obj}})
+    :param subtables: the (table_name, SubtableEntry) pairs to read
+    :returns results: the filled objects
+    """
+    model = OP2_Vectorized()
+    model.is_vectorized = True
+    model.read_mode = 2
+    model._saved_results = saved_results
+    model.op2_filename = op2_filename
+    model.binary_debug = TrashWriter()
+    for result_name, result in iteritems(results):
+        setattr(model, result_name, result)
+
+    model.f = open(op2_filename, 'rb')
+    try:
+        table_mapper = model._get_table_mapper()
+        for table_name, subtable in subtables:
+            model._read_indexed_subtable(table_name, subtable, table_mapper)
+    finally:
+        model.f.close()
+    return results
+
 
 class OP2_Vectorized(OP2):
 
@@ -31,6 +68,12 @@ class OP2_Vectorized(OP2):
         #self.binary_debug = None
         self.ask = False
 
+        #: the read_mode=1 objects of each table4 (n4 -> obj); only used
+        #: when the OP2 is read with multiple processes
+        self._subtable_objs = None
+        #: the table4 offsets that are read by the worker processes
+        self._parallel_n4s = set([])
+
     def set_as_vectorized(self, ask=False):
         """
         Enables vectorization (currently subject to change and break frequently)
@@ -93,36 +136,150 @@ class OP2_Vectorized(OP2):
         """
         self.ask = ask
 
-    def read_op2(self, op2_filename=None):
+    def read_op2(self, op2_filename=None, use_mmap=False, index_filename=None,
+                 num_workers=None):
         """
         Starts the OP2 file reading
+
+        The first pass builds (or loads) a TableIndex, which the second pass
+        uses to jump over tables that don't have any requested results.
+
+        :param op2_filename: the OP2 to read
+        :param use_mmap: memory-map the OP2 (default=False)
+        :param index_filename: a sidecar file to load/save the table index
+            (default=None -> the index isn't saved)
+        :param num_workers: the number of processes used to fill the results
+            (default=None -> read everything in this process)
         """
         assert self.ask in [True, False], self.ask
+        is_parallel = num_workers is not None and num_workers > 1
+        if is_parallel and ProcessPoolExecutor is None:
+            raise ImportError('num_workers=%s requires concurrent.futures '
+                              '(pip install futures)' % num_workers)
+
         self.is_vectorized = True
         if self.is_vectorized:
             self.log.info('-------- reading the op2 with read_mode=1 --------')
             self.read_mode = 1
             self._close_op2 = False
+            self._subtable_objs = {} if is_parallel else None
 
             # get GUI object names, build objects, but don't read data
-            OP2.read_op2(self, op2_filename=op2_filename)
+            OP2.read_op2(self, op2_filename=op2_filename, use_mmap=use_mmap,
+                         index_filename=index_filename)
 
             # TODO: stuff to figure out objects
             # TODO: stuff to show gui of table names
             # TODO: clear out objects the user doesn't want
             self.read_mode = 2
             self._close_op2 = True
-            self.log.info('-------- reading the op2 with read_mode=2 --------')
-            OP2.read_op2(self, op2_filename=op2_filename)
+            if is_parallel:
+                self.log.info('-------- reading the op2 with read_mode=2 and %i workers --------' % num_workers)
+                self._read_op2_parallel(op2_filename, use_mmap, num_workers)
+            else:
+                self.log.info('-------- reading the op2 with read_mode=2 --------')
+                OP2.read_op2(self, op2_filename=op2_filename, use_mmap=use_mmap)
         else:
             #self.read_mode = 0
-            OP2.read_op2(self, op2_filename=op2_filename)
+            OP2.read_op2(self, op2_filename=op2_filename, use_mmap=use_mmap)
             return
             #raise NotImplementedError()
         #self.f.close()
         self.combine_results()
         self.log.info('finished reading op2')
 
+    def _read_op2_parallel(self, op2_filename, use_mmap, num_workers):
+        """
+        Runs the read_mode=2 pass with the results split across worker
+        processes.  Each worker opens the OP2 and fills the objects of a set
+        of subtables, while this process reads the rest of the OP2.
+
+        :param op2_filename: the OP2 to read
+        :param use_mmap: memory-map the OP2 in this process
+        :param num_workers: the number of worker processes
+        """
+        tasks = self._get_parallel_tasks(num_workers)
+        self._subtable_objs = None
+
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            futures = []
+            for results, subtables in tasks:
+                futures.append(executor.submit(
+                    _read_subtables_vectorized, self.op2_filename,
+                    self._saved_results, results, subtables))
+                for table_name, subtable in subtables:
+                    self._parallel_n4s.add(subtable.n4)
+
+            try:
+                OP2.read_op2(self, op2_filename=op2_filename, use_mmap=use_mmap)
+            finally:
+                self._parallel_n4s = set([])
+
+            for future in futures:
+                for result_name, results in iteritems(future.result()):
+                    getattr(self, result_name).update(results)
+
+    def _get_parallel_tasks(self, num_workers):
+        """
+        Groups the subtables by the object they fill and balances the groups
+        across the workers by the number of bytes to read.
+
+        :param num_workers: the number of worker processes
+        :returns tasks: list of (results, subtables) for each worker, where
+            results is {result_name: {code: obj}} and subtables is a list of
+            (table_name, SubtableEntry) in file order
+        """
+        # the read_mode=1 objects of each subtable are looked up by id
+        # because they may not be hashable
+        obj_keys = {}
+        for result_name in self.get_table_types():
+            for code, obj in iteritems(getattr(self, result_name)):
+                obj_keys[id(obj)] = (result_name, code)
+
+        groups = {}
+        for table, subtable in self.table_index.get_subtables():
+            obj = self._subtable_objs.get(subtable.n4)
+            if obj is None or id(obj) not in obj_keys:
+                # non-vectorized results are read in this process
+                continue
+            if id(obj) not in groups:
+                result_name, code = obj_keys[id(obj)]
+                groups[id(obj)] = [result_name, code, obj, [], 0]
+            group = groups[id(obj)]
+            group[3].append((table.table_name, subtable))
+            group[4] += subtable.record_len
+
+        nbytes = [0] * num_workers
+        tasks = [({}, []) for i in range(num_workers)]
+        for result_name, code, obj, subtables, nbytesi in sorted(
+                groups.values(), key=lambda group: -group[4]):
+            iworker = nbytes.index(min(nbytes))
+            results, subtables_all = tasks[iworker]
+            results.setdefault(result_name, {})[code] = obj
+            subtables_all.extend(subtables)
+            nbytes[iworker] += nbytesi
+
+        tasks = [(results, sorted(subtables, key=lambda table_subtable: table_subtable[1].n4))
+                 for results, subtables in tasks if subtables]
+        return tasks
+
+    def _read_subtable_results(self, table4_parser, record_len):
+        """
+        Skips the subtables that are read by the worker processes and
+        tracks the object each subtable fills during the read_mode=1 pass.
+        """
+        n4 = self.n
+        if self.read_mode == 2 and n4 in self._parallel_n4s:
+            self._skip_record()
+            return record_len
+
+        n = OP2._read_subtable_results(self, table4_parser, record_len)
+        if self.read_mode == 1 and self._subtable_objs is not None:
+            obj = getattr(self, 'obj', None)
+            if obj is not None and hasattr(obj, '_reset_indices'):
+                self._subtable_objs[n4] = obj
+        return n
+
     def combine_results(self, combine=True):
         """
         we want the data to be in the same format and grouped by subcase, so
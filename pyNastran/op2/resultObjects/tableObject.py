@@ -2,7 +2,7 @@ from six import string_types, iteritems
 from six.moves import zip, range
 from struct import Struct, pack
 
-from numpy import array, zeros, sqrt, abs, angle  # dot,
+from numpy import array, zeros, sqrt, abs, angle, where, vstack, column_stack  # dot,
 
 from pyNastran.op2.resultObjects.op2_Objects import ScalarObject
 from pyNastran.f06.f06_formatting import writeFloats13E, writeImagFloats13E
@@ -111,9 +111,72 @@ class TableArray(ScalarObject):  # displacement style table
 
 
 class RealTableArray(TableArray):  # displacement style table
-    def __init__(self, data_code, is_sort1, isubcase, dt):
+    def __init__(self, data_code, is_sort1, isubcase, dt, f06_flag=False):
         TableArray.__init__(self, data_code, is_sort1, isubcase, dt)
 
+        if f06_flag:
+            # the F06 blocks are stacked by build_f06_vectorization
+            self.itime = -1
+            self._times = []
+            self.data = []
+            self.node_gridtype = []
+
+    def build_f06_vectorization(self):
+        """stacks the (node_gridtype, data) F06 blocks of each time"""
+        self.data = array([vstack(blocks) for blocks in self.data], dtype='float32')
+        self.node_gridtype = vstack(self.node_gridtype).astype('int32')
+        if self.nonlinear_factor is None:
+            self._times = zeros(self.ntimes, dtype='float32')
+        else:
+            self._times = array(self._times)
+        self.ntotal = self.data.shape[1]
+        self._nnodes = self.ntotal
+        self.itime = 0
+        self.itotal = 0
+        self.is_built = True
+
+    def add_new_f06_time(self, dt):
+        self._times.append(dt)
+        self.itime += 1
+        self.ntimes += 1
+        self.data.append([])
+        self.node_gridtype = []
+
+    def update_f06_time(self, data_code, dt):
+        """
+        this method is called if the object
+        already exits and a new time step is found
+        """
+        self.data_code = data_code
+        self.apply_data_code()
+        if self._times:
+            # the data members of the first time are set by __init__
+            self.set_data_members()
+        self.add_new_f06_time(dt)
+
+    def _add_f06_block(self, node_ids, grid_types, data):
+        # the F06 grid types are only GRIDs (1) and SPOINTs (2)
+        grid_type_ids = where(grid_types == 'S', 2, 1)
+        self.node_gridtype.append(column_stack([node_ids, grid_type_ids]))
+        self.data[self.itime].append(data)
+
+    def add_f06_arrays(self, node_ids, grid_types, data, transient):
+        """
+        Adds a table of F06 data at once (see f06_table.parse_real_node_table)
+
+        :param node_ids: the (n,) node ids
+        :param grid_types: the (n,) grid types ('G', 'S')
+        :param data: the (n, 6) [t1, t2, t3, r1, r2, r3] values
+        :param transient: (name, dt) or None for a static result
+        """
+        dt = None
+        if transient is not None:
+            (dtName, dt) = transient
+            self.data_code['name'] = dtName
+        if dt not in self._times:
+            self.update_f06_time(self.data_code, dt)
+        self._add_f06_block(node_ids, grid_types, data)
+
     def is_real(self):
         return True
 
@@ -409,6 +472,32 @@ class RealTableObject(ScalarObject):  # displacement style table
             self.translations[dt][nodeID] = array([t1, t2, t3], dtype='float32')
             self.rotations[dt][nodeID] = array([r1, r2, r3], dtype='float32')
 
+    def add_f06_arrays(self, node_ids, grid_types, data, transient):
+        """
+        Adds a table of F06 data at once (see f06_table.parse_real_node_table)
+
+        :param node_ids: the (n,) node ids
+        :param grid_types: the (n,) grid types ('G', 'S')
+        :param data: the (n, 6) [t1, t2, t3, r1, r2, r3] values
+        :param transient: (name, dt) or None for a static result
+        """
+        if transient is None:
+            translations = self.translations
+            rotations = self.rotations
+        else:
+            (dtName, dt) = transient
+            self.data_code['name'] = dtName
+            if dt not in self.translations:
+                self.update_dt(self.data_code, dt)
+            translations = self.translations[dt]
+            rotations = self.rotations[dt]
+
+        node_ids = node_ids.tolist()
+        data = data.astype('float32')
+        self.gridTypes.update(zip(node_ids, grid_types.tolist()))
+        translations.update(zip(node_ids, data[:, :3]))
+        rotations.update(zip(node_ids, data[:, 3:]))
+
     def update_dt(self, data_code, dt):
         self.data_code = data_code
         self.apply_data_code()
@@ -424,7 +513,7 @@ class RealTableObject(ScalarObject):  # displacement style table
         del self.rotations[dt]
 
     def get_transients(self):
-        k = self.translations.keys()
+        k = list(self.translations.keys())
         k.sort()
         return k
 
@@ -486,7 +575,7 @@ class RealTableObject(ScalarObject):  # displacement style table
         rotations2 = {}
         if self.dt is not None:
             for dt, translations in sorted(iteritems(self.translations)):
-                nodeIDs = translations.keys()
+                nodeIDs = list(translations.keys())
                 for nodeID in nodeIDs:
                     translations2[nodeID] = {}
                     rotations2[nodeID] = {}
@@ -698,7 +787,7 @@ class ComplexTableObject(ScalarObject):
         del self.rotations[dt]
 
     def get_transients(self):
-        k = self.translations.keys()
+        k = list(self.translations.keys())
         k.sort()
         return k
 
@@ -39,7 +39,7 @@ class StrainEnergyObject(ScalarObject):
         msg = []
         if self.nonlinear_factor is not None:  # transient
             ntimes = len(self.energy)
-            time0 = self.energy.keys()[0]
+            time0 = list(self.energy.keys())[0]
             nelements = len(self.energy[time0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -73,7 +73,7 @@ class StrainEnergyObject(ScalarObject):
         del self.density[dt]
 
     def get_transients(self):
-        k = self.energy.keys()
+        k = list(self.energy.keys())
         k.sort()
         return k
 
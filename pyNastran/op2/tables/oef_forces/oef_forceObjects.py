@@ -209,7 +209,7 @@ class RealRodForce(ScalarObject):  # 1-ROD
         msg = self.get_data_code()
         if self.dt is not None:  # transient
             ntimes = len(self.torque)
-            time0 = self.torque.keys()[0]
+            time0 = list(self.torque.keys())[0]
             nelements = len(self.torque[time0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -345,7 +345,7 @@ class RealCBeamForce(ScalarObject):  # 2-CBEAM
         msg = self.get_data_code()
         if self.dt is not None:  # transient
             ntimes = len(self.shear)
-            time0 = self.shear.keys()[0]
+            time0 = list(self.shear.keys())[0]
             nelements = len(self.shear[time0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -540,7 +540,7 @@ class RealCShearForce(ScalarObject):  # 4-CSHEAR
         msg = self.get_data_code()
         if self.dt is not None:  # transient
             ntimes = len(self.shear12)
-            time0 = self.shear12.keys()[0]
+            time0 = list(self.shear12.keys())[0]
             nelements = len(self.shear12[time0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -734,7 +734,7 @@ class RealSpringForce(ScalarObject):  # 11-CELAS1,12-CELAS2,13-CELAS3, 14-CELAS4
         msg = self.get_data_code()
         if self.dt is not None:  # transient
             ntimes = len(self.force)
-            time0 = self.force.keys()[0]
+            time0 = list(self.force.keys())[0]
             nelements = len(self.force[time0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -846,7 +846,7 @@ class RealDamperForce(ScalarObject):  # 20-CDAMP1,21-CDAMP2,22-CDAMP3,23-CDAMP4
         msg = self.get_data_code()
         if self.dt is not None:  # transient
             ntimes = len(self.force)
-            time0 = self.force.keys()[0]
+            time0 = list(self.force.keys())[0]
             nelements = len(self.force[time0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -960,7 +960,7 @@ class RealViscForce(ScalarObject):  # 24-CVISC
         msg = self.get_data_code()
         if self.dt is not None:  # transient
             ntimes = len(self.torque)
-            time0 = self.torque.keys()[0]
+            time0 = list(self.torque.keys())[0]
             nelements = len(self.torque[time0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -1027,7 +1027,7 @@ class RealPlateForce(ScalarObject):  # 33-CQUAD4, 74-CTRIA3
         msg = self.get_data_code()
         if self.dt is not None:  # transient
             ntimes = len(self.mx)
-            time0 = self.mx.keys()[0]
+            time0 = list(self.mx.keys())[0]
             nelements = len(self.mx[time0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -1351,7 +1351,7 @@ class RealPlate2Force(ScalarObject):  # 64-CQUAD8, 75-CTRIA6, 82-CQUADR
             if ntimes == 0:
                 nelements = 0
             else:
-                time0 = self.mx.keys()[0]
+                time0 = list(self.mx.keys())[0]
                 nelements = len(self.mx[time0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -1559,7 +1559,7 @@ class RealCBarForce(ScalarObject):  # 34-CBAR
         msg = self.get_data_code()
         if self.dt is not None:  # transient
             ntimes = len(self.torque)
-            time0 = self.torque.keys()[0]
+            time0 = list(self.torque.keys())[0]
             nelements = len(self.torque[time0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -1683,7 +1683,7 @@ class RealCBar100Force(ScalarObject):  # 100-CBAR
         msg = self.get_data_code()
         if self.dt is not None:  # transient
             ntimes = len(self.torque)
-            time0 = self.torque.keys()[0]
+            time0 = list(self.torque.keys())[0]
             nelements = len(self.torque[time0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -1756,7 +1756,7 @@ class RealConeAxForce(ScalarObject):  # 35-CCONEAX
         msg = self.get_data_code()
         if self.dt is not None:  # transient
             ntimes = len(self.hopa)
-            time0 = self.hopa.keys()[0]
+            time0 = list(self.hopa.keys())[0]
             nelements = len(self.hopa[time0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -1839,7 +1839,7 @@ class RealCGapForce(ScalarObject):  # 38-CGAP
         msg = self.get_data_code()
         if self.dt is not None:  # transient
             ntimes = len(self.fx)
-            time0 = self.fx.keys()[0]
+            time0 = list(self.fx.keys())[0]
             nelements = len(self.fx[time0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -1929,7 +1929,7 @@ class RealBendForce(ScalarObject):  # 69-CBEND
         msg = self.get_data_code()
         if self.dt is not None:  # transient
             ntimes = len(self.torque)
-            time0 = self.torque.keys()[0]
+            time0 = list(self.torque.keys())[0]
             nelements = len(self.torque[time0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -2011,7 +2011,7 @@ class RealPentaPressureForce(ScalarObject):  # 77-PENTA_PR,78-TETRA_PR
         msg = self.get_data_code()
         if self.dt is not None:  # transient
             ntimes = len(self.acceleration)
-            time0 = self.acceleration.keys()[0]
+            time0 = list(self.acceleration.keys())[0]
             nelements = len(self.acceleration[time0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -2109,7 +2109,7 @@ class RealCBushForce(ScalarObject):  # 102-CBUSH
         msg = self.get_data_code()
         if self.dt is not None:  # transient
             ntimes = len(self.force)
-            time0 = self.force.keys()[0]
+            time0 = list(self.force.keys())[0]
             nelements = len(self.force[time0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
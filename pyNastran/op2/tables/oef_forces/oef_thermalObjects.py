@@ -374,7 +374,7 @@ class HeatFlux_CONV(ScalarObject):  # 110-CONV
         msg = self.get_data_code()
         if self.nonlinear_factor is not None:  # transient
             ntimes = len(self.cntlNode)
-            times0 = self.cntlNode.keys()[0]
+            times0 = list(self.cntlNode.keys())[0]
             nelements = len(self.cntlNode[times0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
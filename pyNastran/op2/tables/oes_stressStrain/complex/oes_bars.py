@@ -96,7 +96,7 @@ class ComplexBarStress(StressObject):
         del self.axial[dt]
 
     def get_transients(self):
-        k = self.s1.keys()
+        k = list(self.s1.keys())
         k.sort()
         return k
 
@@ -315,7 +315,7 @@ class ComplexBarStrain(StrainObject):
         del self.exial[dt]
 
     def get_transients(self):
-        k = self.e1.keys()
+        k = list(self.e1.keys())
         k.sort()
         return k
 
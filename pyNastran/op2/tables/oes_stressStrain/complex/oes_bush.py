@@ -74,7 +74,7 @@ class ComplexBushStress(StressObject):
         del self.rotations[dt]
 
     def get_transients(self):
-        k = self.translations.keys()
+        k = list(self.translations.keys())
         k.sort()
         return k
 
@@ -238,7 +238,7 @@ class ComplexBushStrain(StrainObject):
         del self.rotations[dt]
 
     def get_transients(self):
-        k = self.translations.keys()
+        k = list(self.translations.keys())
         k.sort()
         return k
 
@@ -84,7 +84,7 @@ class ComplexBush1DStress(StressObject):
         del self.axial_strain[dt]
 
     def get_transients(self):
-        k = self.element_force.keys()
+        k = list(self.element_force.keys())
         k.sort()
         return k
 
@@ -451,7 +451,7 @@ class ComplexPlateStress(StressObject):
         del self.txy[dt]
 
     def get_transients(self):
-        k = self.oxx.keys()
+        k = list(self.oxx.keys())
         k.sort()
         return k
 
@@ -557,7 +557,7 @@ class ComplexPlateStress(StressObject):
         quadrMsg = ['                C O M P L E X   S T R E S S E S   I N   Q U A D R I L A T E R A L   E L E M E N T S   ( Q U A D R )'] + formWord + quadMsgTemp
         quad8Msg = ['                C O M P L E X   S T R E S S E S   I N   Q U A D R I L A T E R A L   E L E M E N T S   ( Q U A D 8 )'] + formWord + quadMsgTemp
 
-        eTypes = self.eType.values()
+        eTypes = list(self.eType.values())
         msgPacks = {'CTRIA3': triMsg,
                     'CTRIA6': tri6Msg,
                     'CTRIAR': trirMsg,
@@ -651,16 +651,16 @@ class ComplexPlateStress(StressObject):
         quad8Msg = None
         quadrMsg = None
 
-        eTypes = self.eType.values()
-        dts = self.oxx.keys()
+        eTypes = list(self.eType.values())
+        dts = list(self.oxx.keys())
         #print self.oxx
         #print "dts = ",dts
         dt = dts[0]
         if 'CQUAD4' in eTypes:
             qkey = eTypes.index('CQUAD4')
-            kkey = self.eType.keys()[qkey]
+            kkey = list(self.eType.keys())[qkey]
             #print "qkey=%s kkey=%s" %(qkey,kkey)
-            ekey = self.oxx[dt][kkey].keys()
+            ekey = list(self.oxx[dt][kkey].keys())
             isBilinear = True
             quadMsg = header + ['                         S T R E S S E S   I N   Q U A D R I L A T E R A L   E L E M E N T S   ( Q U A D 4 )        OPTION = BILIN  \n \n'] + magReal + gridMsgTemp
             if len(ekey) == 1:
@@ -694,7 +694,7 @@ class ComplexPlateStress(StressObject):
         (eTypes, orderedETypes) = self.getOrderedETypes(validTypes)
 
         msg = []
-        dts = self.oxx.keys()
+        dts = list(self.oxx.keys())
         dts.sort()
         for eType in eTypes:
             eids = orderedETypes[eType]
@@ -806,7 +806,7 @@ class ComplexPlateStress(StressObject):
 
     def writeF06_Quad4_Bilinear(self, eid, n, is_mag_phase, cen):
         msg = ''
-        k = self.oxx[eid].keys()
+        k = list(self.oxx[eid].keys())
         k.remove(cen)
         k.sort()
         for nid in [cen] + k:
@@ -830,7 +830,7 @@ class ComplexPlateStress(StressObject):
 
     def writeF06_Quad4_BilinearTransient(self, dt, eid, n, is_mag_phase, cen):
         msg = ''
-        k = self.oxx[dt][eid].keys()
+        k = list(self.oxx[dt][eid].keys())
         #cen = 'CEN/' + str(n)
         k.remove(cen)
         k.sort()
@@ -856,7 +856,7 @@ class ComplexPlateStress(StressObject):
 
     def writeF06_Tri3(self, eid, n, is_mag_phase):
         msg = ''
-        k = self.oxx[eid].keys()
+        k = list(self.oxx[eid].keys())
         cen = 'CEN/' + str(n)
         k.remove(cen)
         k.sort()
@@ -877,7 +877,7 @@ class ComplexPlateStress(StressObject):
 
     def writeF06_Tri3Transient(self, dt, eid, n, is_mag_phase):
         msg = ''
-        k = self.oxx[dt][eid].keys()
+        k = list(self.oxx[dt][eid].keys())
         cen = 'CEN/' + str(n)
         k.remove(cen)
         k.sort()
@@ -1009,7 +1009,7 @@ class ComplexPlateStrain(StrainObject):
         del self.exy[dt]
 
     def get_transients(self):
-        k = self.exx.keys()
+        k = list(self.exx.keys())
         k.sort()
         return k
 
@@ -1112,14 +1112,14 @@ class ComplexPlateStrain(StrainObject):
         tri6Msg = None
         trirMsg = None
 
-        eTypes = self.eType.values()
+        eTypes = list(self.eType.values())
         if 'CQUAD4' in eTypes:
             ElemKey = eTypes.index('CQUAD4')
             #print qkey
-            eid = self.eType.keys()[ElemKey]
+            eid = list(self.eType.keys())[ElemKey]
             #print "self.oxx = ",self.oxx
             #print "eid=%s" %(eid)
-            dt = self.exx.keys()[0]
+            dt = list(self.exx.keys())[0]
             #print "dt=%s" %(dt)
             nLayers = len(self.exx[dt][eid])
             #print "elementKeys = ",elementKeys
@@ -1151,7 +1151,7 @@ class ComplexPlateStrain(StrainObject):
         (typesOut, orderedETypes) = self.getOrderedETypes(validTypes)
 
         msg = []
-        dts = self.exx.keys()
+        dts = list(self.exx.keys())
         dts.sort()
         for eType in typesOut:
             eids = orderedETypes[eType]
@@ -1231,7 +1231,7 @@ class ComplexPlateStrain(StrainObject):
 
     def writeF06_Quad4_BilinearTransient(self, dt, eid, n, is_mag_phase, cen):
         msg = ''
-        k = self.exx[dt][eid].keys()
+        k = list(self.exx[dt][eid].keys())
         k.remove(cen)
         k.sort()
         for nid in [cen] + k:
@@ -1255,7 +1255,7 @@ class ComplexPlateStrain(StrainObject):
 
     def writeF06_Tri3Transient(self, dt, eid, n, is_mag_phase):
         msg = ''
-        k = self.exx[dt][eid].keys()
+        k = list(self.exx[dt][eid].keys())
         cen = 'CEN/' + str(n)
         k.remove(cen)
         k.sort()
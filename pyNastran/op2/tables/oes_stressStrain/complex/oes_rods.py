@@ -63,7 +63,7 @@ class ComplexRodStress(StressObject):
         del self.torsion[dt]
 
     def get_transients(self):
-        k = self.axial.keys()
+        k = list(self.axial.keys())
         k.sort()
         return k
 
@@ -216,7 +216,7 @@ class ComplexRodStrain(StrainObject):
         del self.torsion[dt]
 
     def get_transients(self):
-        k = self.axial.keys()
+        k = list(self.axial.keys())
         k.sort()
         return k
 
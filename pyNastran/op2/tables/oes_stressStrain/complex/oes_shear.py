@@ -39,7 +39,7 @@ class ComplexShearStress(StressObject):
         msg = self.get_data_code()
         if self.dt is not None:  # transient
             ntimes = len(self.maxShear)
-            s0 = self.maxShear.keys()[0]
+            s0 = list(self.maxShear.keys())[0]
             nelements = len(self.maxShear[s0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -55,7 +55,7 @@ class ComplexShearStress(StressObject):
         del self.avgShear[dt]
 
     def get_transients(self):
-        k = self.maxShear.keys()
+        k = list(self.maxShear.keys())
         k.sort()
         return k
 
@@ -117,7 +117,7 @@ class ComplexShearStrain(StrainObject):
         msg = self.get_data_code()
         if self.dt is not None:  # transient
             ntimes = len(self.maxShear)
-            s0 = self.maxShear.keys()[0]
+            s0 = list(self.maxShear.keys())[0]
             nelements = len(self.maxShear[s0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -136,7 +136,7 @@ class ComplexShearStrain(StrainObject):
         del self.avgShear[dt]
 
     def get_transients(self):
-        k = self.maxShear.keys()
+        k = list(self.maxShear.keys())
         k.sort()
         return k
 
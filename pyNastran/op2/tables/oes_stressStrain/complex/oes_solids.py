@@ -417,7 +417,7 @@ class ComplexSolidStress(StressObject):
         del self.txz[dt]
 
     def get_transients(self):
-        k = self.oxx.keys()
+        k = list(self.oxx.keys())
         k.sort()
         return k
 
@@ -596,7 +596,7 @@ class ComplexSolidStress(StressObject):
         (tetra_msg, hexa_msg, penta_msg,
          tetra_eids, hexa_eids, penta_eids,
          tetra10_eids, hexa20_eids, penta15_eids) = self.getF06_Header(is_mag_phase)
-        dts = self.oxx.keys()
+        dts = list(self.oxx.keys())
         for dt in sorted(dts):
             if tetra_eids:
                 self.write_element_transient('CTETRA', 4, tetra_eids, dt, header, tetra_msg, f, is_mag_phase)
@@ -633,7 +633,7 @@ class ComplexSolidStress(StressObject):
 
         f.write('\n'.join(msg))
         for eid in eids:
-            node_ids = self.oxx[dt][eid].keys()
+            node_ids = list(self.oxx[dt][eid].keys())
             node_ids.remove('CENTER')
             cid = 10
             f.write('0 %12i %11sGRID CS %2i GP\n' % (eid, 0, nnodes))
@@ -722,7 +722,7 @@ class ComplexSolidStrain(StrainObject):
         del self.exz[dt]
 
     def get_transients(self):
-        k = self.exx.keys()
+        k = list(self.exx.keys())
         k.sort()
         return k
 
@@ -840,7 +840,7 @@ class ComplexSolidStrain(StrainObject):
         (tetra_msg, hexa_msg, penta_msg,
          tetra_eids, hexa_eids, penta_eids,
          tetra10_eids, hexa20_eids, penta15_eids) = self.getF06_Header(is_mag_phase)
-        dts = self.exx.keys()
+        dts = list(self.exx.keys())
         for dt in sorted(dts):
             if tetra_eids:
                 self.write_element_transient('CTETRA', 4, tetra_eids, dt, header, tetra_msg, f, is_mag_phase)
@@ -877,7 +877,7 @@ class ComplexSolidStrain(StrainObject):
 
         f.write('\n'.join(msg))
         for eid in eids:
-            node_ids = self.exx[dt][eid].keys()
+            node_ids = list(self.exx[dt][eid].keys())
             node_ids.remove('CENTER')
             cid = 10
             f.write('0 %12i %11sGRID CS %2i GP\n' % (eid, 0, nnodes))
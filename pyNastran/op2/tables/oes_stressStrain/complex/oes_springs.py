@@ -55,7 +55,7 @@ class ComplexCelasStress(complexStressObject):
         del self.stress[dt]
 
     def get_transients(self):
-        k = self.stress.keys()
+        k = list(self.stress.keys())
         k.sort()
         return k
 
@@ -164,7 +164,7 @@ class ComplexCelasStrain(complexStrainObject):
         del self.strain[dt]
 
     def get_transients(self):
-        k = self.strain.keys()
+        k = list(self.strain.keys())
         k.sort()
         return k
 
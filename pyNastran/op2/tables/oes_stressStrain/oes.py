@@ -6,6 +6,7 @@ from __future__ import (nested_scopes, generators, division, absolute_import,
                         print_function, unicode_literals)
 from six.moves import range
 from struct import Struct
+from numpy import frombuffer, dtype as np_dtype, zeros, repeat, arange, where, concatenate
 
 from pyNastran.op2.op2_common import OP2Common
 from pyNastran.op2.op2_helper import polar_to_real_imag
@@ -44,6 +45,51 @@ from pyNastran.op2.tables.oes_stressStrain.complex.oes_springs import ComplexCel
 
 from pyNastran.op2.tables.oes_stressStrain.oes_nonlinear import NonlinearRod, NonlinearQuad, HyperelasticQuad
 
+#: a real CQUAD4-33/CTRIA3-74 entry (num_wide=17) with 2 layers of
+#: [fd, oxx, oyy, txy, angle, major, minor, ovm]
+REAL_PLATE_DTYPE = np_dtype([
+    ('eid_device', 'int32'), ('layers', 'float32', (2, 8))])
+
+#: a real CQUAD4-95/CQUAD8-96/CTRIA3-97/CTRIA6-98 ply (num_wide=11)
+REAL_COMPOSITE_PLATE_DTYPE = np_dtype([
+    ('eid_device', 'int32'), ('layer', 'int32'), ('data', 'float32', (9,))])
+
+#: a node of a real bilinear plate (the first one is the centroid)
+REAL_BILINEAR_PLATE_NODE_DTYPE = np_dtype([
+    ('grid', 'int32'), ('layers', 'float32', (2, 8))])
+
+#: a node of a real solid (the first one is the centroid) with
+#: [sxx, sxy, s1, a1, a2, a3, pressure, svm,
+#:  syy, syz, s2, b1, b2, b3,
+#:  szz, sxz, s3, c1, c2, c3]
+REAL_SOLID_NODE_DTYPE = np_dtype([
+    ('grid', 'int32'), ('data', 'float32', (20,))])
+
+#: maps the solid node data to [oxx, oyy, ozz, txy, tyz, txz, o1, o2, o3, ovm]
+REAL_SOLID_INDEX = [0, 8, 14, 1, 9, 15, 2, 10, 16, 7]
+
+
+def get_real_bilinear_plate_dtype(nnodes):
+    """
+    Gets the dtype of a real bilinear plate (e.g. CQUAD4-144) entry.
+
+    :param nnodes: the number of corner nodes (the centroid is added)
+    """
+    return np_dtype([
+        ('eid_device', 'int32'), ('j', 'S4'),
+        ('nodes', REAL_BILINEAR_PLATE_NODE_DTYPE, (nnodes + 1,))])
+
+
+def get_real_solid_dtype(nnodes):
+    """
+    Gets the dtype of a real solid (e.g. CHEXA-67) entry.
+
+    :param nnodes: the number of nodes including the centroid
+    """
+    return np_dtype([
+        ('eid_device', 'int32'), ('cid', 'int32'), ('abcd', 'S4'), ('nnodes', 'int32'),
+        ('nodes', REAL_SOLID_NODE_DTYPE, (nnodes,))])
+
 
 class OES(OP2Common):
     """
@@ -865,6 +911,9 @@ class OES(OP2Common):
                                                        obj_real, obj_vector_real)
                 if auto_return:
                     return nelements * self.num_wide * 4
+                if self._is_vectorized(obj_vector_real, slot_vector):
+                    return self._read_real_solid_vectorized(data, nelements, nnodes_expected,
+                                                            element_name, dt)
 
                 struct1 = Struct(b'ii4si')
                 struct2 = Struct(b'i20f')
@@ -1019,6 +1068,8 @@ class OES(OP2Common):
                 if auto_return:
                     self._data_factor = 2
                     return nelements * ntotal
+                if self._is_vectorized(obj_vector_real, slot_vector):
+                    return self._read_real_plate_vectorized(data, nelements, 0, dt)
 
                 s = Struct(b'i16f')
                 for i in range(nelements):
@@ -1128,8 +1179,8 @@ class OES(OP2Common):
                     msg = 'sort1 Type=%s num=%s' % (self.element_name, self.element_type)
                     return self._not_implemented_or_skip(data, msg)
             else:
-                result_name = 'plateStress'
-                slot = self.plateStress
+                result_name = 'plateStrain'
+                slot = self.plateStrain
                 obj_real = RealPlateStrain
                 obj_complex = ComplexPlateStrain
 
@@ -1157,6 +1208,8 @@ class OES(OP2Common):
                 if auto_return:
                     self._data_factor = 2
                     return nelements * ntotal
+                if self._is_vectorized(obj_vector_real, slot_vector):
+                    return self._read_real_plate_vectorized(data, nelements, 0, dt)
 
                 s = Struct(b'i16f')
                 if self.debug:
@@ -1337,6 +1390,8 @@ class OES(OP2Common):
                                                        obj_real, obj_vector_real)
                 if auto_return:
                     return nelements * self.num_wide * 4
+                if self._is_vectorized(obj_vector_real, slot_vector):
+                    return self._read_real_plate_vectorized(data, nelements, nnodes, dt)
 
                 #assert ntotal == 348, ntotal
                 center_format = b'i4si16f'
@@ -1609,6 +1664,8 @@ class OES(OP2Common):
                                                        obj_real, obj_vector_real)
                 if auto_return:
                     return nelements * self.num_wide * 4
+                if self._is_vectorized(obj_vector_real, slot_vector):
+                    return self._read_real_composite_plate_vectorized(data, nelements, dt)
 
                 s = Struct(b'ii9f')
                 if self.debug:
@@ -2458,6 +2515,127 @@ class OES(OP2Common):
             #self.obj.add_new_eid(element_name, dt, eid, force, stress)
             n += ntotal
 
+    def _get_oes_eids(self, entries):
+        """
+        Gets the element IDs of a block of entries and writes the debug
+        output that the element-by-element loops would have.
+
+        :param entries: the structured array of table4 entries
+        """
+        eids = (entries['eid_device'] - self.device_code) // 10
+        if self.debug:
+            for eid, entry in zip(eids, entries):
+                self.binary_debug.write('  eid=%i; C=[%s]\n' % (eid, str(entry)))
+        assert eids.min() > 0, eids
+        return eids
+
+    def _read_real_plate_vectorized(self, data, nelements, nnodes, dt):
+        """
+        Vectorized version of the real CQUAD4/CTRIA3 loops (centroidal
+        or bilinear), which views the block as a structured array and fills
+        the RealPlateArray as whole slices.
+
+        :param data:      the table4 block
+        :param nelements: the number of elements in the block
+        :param nnodes:    the number of corner nodes (0 -> centroid only)
+        :param dt:        the time/frequency/mode of the block
+        """
+        if nnodes == 0:
+            entries = frombuffer(data, dtype=REAL_PLATE_DTYPE, count=nelements)
+            grids = zeros((nelements, 1), dtype='int32')
+            layers = entries['layers']
+        else:
+            entries = frombuffer(data, dtype=get_real_bilinear_plate_dtype(nnodes),
+                                 count=nelements)
+            grids = entries['nodes']['grid'].copy()
+            assert grids[:, 1:].min() > 0, grids
+            grids[:, 0] = 0  # centroid
+            layers = entries['nodes']['layers']
+        eids = self._get_oes_eids(entries)
+
+        # each node has 2 layers (fiber distances)
+        nlayers = nelements * (nnodes + 1) * 2
+        obj = self.obj
+        itotal = obj.itotal
+        itotal2 = itotal + nlayers
+        obj._times[obj.itime] = dt
+        obj.element_node[itotal:itotal2, 0] = repeat(eids, (nnodes + 1) * 2)
+        obj.element_node[itotal:itotal2, 1] = repeat(grids.ravel(), 2)
+        obj.data[obj.itime, itotal:itotal2, :] = layers.reshape(nlayers, 8)
+        obj.itotal = itotal2
+        obj.ielement += nelements
+        return nelements * self.num_wide * 4
+
+    def _read_real_composite_plate_vectorized(self, data, nelements, dt):
+        """
+        Vectorized version of the real composite plate loop, which fills
+        the RealCompositePlateArray as whole slices.
+
+        :param data:      the table4 block
+        :param nelements: the number of plies in the block
+        :param dt:        the time/frequency/mode of the block
+        """
+        entries = frombuffer(data, dtype=REAL_COMPOSITE_PLATE_DTYPE, count=nelements)
+        eids = self._get_oes_eids(entries)
+
+        # the plies of an element may be split across blocks
+        eid_old = 0
+        if hasattr(self, 'eid_old'):
+            eid_old = self.eid_old
+        is_new_element = eids != concatenate([[eid_old], eids[:-1]])
+
+        obj = self.obj
+        itotal = obj.itotal
+        itotal2 = itotal + nelements
+        if is_new_element.any():
+            obj._times[obj.itime] = dt
+        obj.element_layer[itotal:itotal2, 0] = eids
+        obj.element_layer[itotal:itotal2, 1] = entries['layer']
+        obj.data[obj.itime, itotal:itotal2, :] = entries['data']
+        obj.itotal = itotal2
+        obj.ielement += int(is_new_element.sum())
+        self.eid_old = int(eids[-1])
+        return nelements * self.num_wide * 4
+
+    def _read_real_solid_vectorized(self, data, nelements, nnodes, element_name, dt):
+        """
+        Vectorized version of the real CTETRA/CHEXA/CPENTA loop, which
+        fills the RealSolidArray as whole slices.
+
+        :param data:         the table4 block
+        :param nelements:    the number of elements in the block
+        :param nnodes:       the number of nodes including the centroid
+        :param element_name: the name stored in obj.eType (e.g. 'CHEXA8')
+        :param dt:           the time/frequency/mode of the block
+        """
+        entries = frombuffer(data, dtype=get_real_solid_dtype(nnodes), count=nelements)
+        assert entries['nnodes'].max() < 21, entries['nnodes'].max()
+        eids = self._get_oes_eids(entries)
+        grids = entries['nodes']['grid'].copy()
+        grids[:, 0] = 0  # centroid
+        values = entries['nodes']['data'][:, :, REAL_SOLID_INDEX]
+
+        obj = self.obj
+        ntotal = nelements * nnodes
+        itotal = obj.itotal
+        itotal2 = itotal + ntotal
+        obj._times[obj.itime] = dt
+        obj.element_node[itotal:itotal2, 0] = repeat(eids, nnodes)
+        obj.element_node[itotal:itotal2, 1] = grids.ravel()
+        obj.data[obj.itime, itotal:itotal2, :] = values.reshape(ntotal, 10)
+        obj.itotal = itotal2
+
+        # ielement wraps around to 0 once every element has been seen, but
+        # eType is keyed by the value before it wraps (see add_eid_sort1)
+        ielement = obj.ielement + arange(nelements)
+        icid = ielement % obj.nelements
+        ietype = where((icid == 0) & (ielement > 0), obj.nelements, icid)
+        obj.element_cid[icid, 0] = eids
+        obj.element_cid[icid, 1] = entries['cid']
+        obj.eType.update(dict.fromkeys(ietype.tolist(), element_name))
+        obj.ielement = int(icid[-1]) + 1
+        return nelements * self.num_wide * 4
+
     def _create_oes_object2(self, nelements,
                             result_name, result_vector_name,
                             slot, slot_vector,
@@ -73,7 +73,7 @@ class NonlinearQuad(StressObject):
         del self.ecs[dt]
 
     def get_transients(self):
-        k = self.oxx.keys()
+        k = list(self.oxx.keys())
         k.sort()
         return k
 
@@ -235,7 +235,7 @@ class HyperelasticQuad(StressObject):
         del self.minorP[dt]
 
     def get_transients(self):
-        k = self.oxx.keys()
+        k = list(self.oxx.keys())
         k.sort()
         return k
 
@@ -346,7 +346,7 @@ class NonlinearRod(StressObject):
         del self.linearTorsionalStress[dt]
 
     def get_transients(self):
-        k = self.axialStress.keys()
+        k = list(self.axialStress.keys())
         k.sort()
         return k
 
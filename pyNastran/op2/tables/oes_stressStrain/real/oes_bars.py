@@ -384,7 +384,7 @@ class RealBarStress(StressObject):
         del self.smin[dt]
 
     def get_transients(self):
-        k = self.s1.keys()
+        k = list(self.s1.keys())
         k.sort()
         return k
 
@@ -662,7 +662,7 @@ class RealBarStrain(StrainObject):
         del self.emin[dt]
 
     def get_transients(self):
-        k = self.e1.keys()
+        k = list(self.e1.keys())
         k.sort()
         return k
 
@@ -328,7 +328,7 @@ class RealBeamStress(StressObject):
         msg = self.get_data_code()
         if self.dt is not None:  # transient
             ntimes = len(self.smax)
-            s0 = self.smax.keys()[0]
+            s0 = list(self.smax.keys())[0]
             nelements = len(self.smax[s0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -360,7 +360,7 @@ class RealBeamStress(StressObject):
         del self.MS_compression[dt]
 
     def get_transients(self):
-        k = self.smax.keys()
+        k = list(self.smax.keys())
         k.sort()
         return k
 
@@ -609,7 +609,7 @@ class RealBeamStrain(StrainObject):
         msg = self.get_data_code()
         if self.dt is not None:  # transient
             ntimes = len(self.smax)
-            s0 = self.smax.keys()[0]
+            s0 = list(self.smax.keys())[0]
             nelements = len(self.smax[s0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -641,7 +641,7 @@ class RealBeamStrain(StrainObject):
         del self.MS_compression[dt]
 
     def get_transients(self):
-        k = self.smax.keys()
+        k = list(self.smax.keys())
         k.sort()
         return k
 
@@ -63,7 +63,7 @@ class RealBushStress(StressObject):
         del self.rotations[dt]
 
     def get_transients(self):
-        k = self.translations.keys()
+        k = list(self.translations.keys())
         k.sort()
         return k
 
@@ -189,7 +189,7 @@ class RealBushStrain(StrainObject):
         del self.rotations[dt]
 
     def get_transients(self):
-        k = self.translations.keys()
+        k = list(self.translations.keys())
         k.sort()
         return k
 
@@ -96,7 +96,7 @@ class RealBush1DStress(StressObject):
         del self.is_failed[dt]
 
     def get_transients(self):
-        k = self.element_force.keys()
+        k = list(self.element_force.keys())
         k.sort()
         return k
 
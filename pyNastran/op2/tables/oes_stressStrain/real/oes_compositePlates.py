@@ -392,7 +392,7 @@ class RealCompositePlateStress(StressObject):
         del self.ovmShear[dt]
 
     def get_transients(self):
-        k = self.o11.keys()
+        k = list(self.o11.keys())
         k.sort()
         return k
 
@@ -502,7 +502,7 @@ class RealCompositePlateStress(StressObject):
         words = ['   ELEMENT  PLY  STRESSES IN FIBER AND MATRIX DIRECTIONS    INTER-LAMINAR  STRESSES  PRINCIPAL STRESSES (ZERO SHEAR)      %s\n' % von,
                  '     ID      ID    NORMAL-1     NORMAL-2     SHEAR-12     SHEAR XZ-MAT  SHEAR YZ-MAT  ANGLE    MAJOR        MINOR        %s\n' % mises]
 
-        eTypes = self.eType.values()
+        eTypes = list(self.eType.values())
         if 'CQUAD4' in eTypes or 'QUAD4LC' in eTypes:
             quadMsg = header + ['                   S T R E S S E S   I N   L A Y E R E D   C O M P O S I T E   E L E M E N T S   ( Q U A D 4 )\n'] + words
             isQuad = True
@@ -564,7 +564,7 @@ class RealCompositePlateStress(StressObject):
         words = ['   ELEMENT  PLY  STRESSES IN FIBER AND MATRIX DIRECTIONS    INTER-LAMINAR  STRESSES  PRINCIPAL STRESSES (ZERO SHEAR)      %s\n' % von,
                  '     ID      ID    NORMAL-1     NORMAL-2     SHEAR-12     SHEAR XZ-MAT  SHEAR YZ-MAT  ANGLE    MAJOR        MINOR        %s\n' % mises]
 
-        eTypes = self.eType.values()
+        eTypes = list(self.eType.values())
         if 'CQUAD4' in eTypes or 'QUAD4LC' in eTypes:
             quadWords = ['                   S T R E S S E S   I N   L A Y E R E D   C O M P O S I T E   E L E M E N T S   ( Q U A D 4 )\n'] + words
             isQuad = True
@@ -730,7 +730,7 @@ class RealCompositePlateStrain(StrainObject):
         del self.evmShear[dt]
 
     def get_transients(self):
-        k = self.e11.keys()
+        k = list(self.e11.keys())
         k.sort()
         return k
 
@@ -833,7 +833,7 @@ class RealCompositePlateStrain(StrainObject):
         words = ['   ELEMENT  PLY   STRAINS IN FIBER AND MATRIX DIRECTIONS    INTER-LAMINAR   STRAINS  PRINCIPAL  STRAINS (ZERO SHEAR)      %s\n' % von,
                  '     ID      ID    NORMAL-1     NORMAL-2     SHEAR-12     SHEAR XZ-MAT  SHEAR YZ-MAT  ANGLE    MAJOR        MINOR        %s\n' % mises]
 
-        eTypes = self.eType.values()
+        eTypes = list(self.eType.values())
         if 'CQUAD4' in eTypes or 'QUAD4LC' in eTypes:
             quadMsg = header + ['                     S T R A I N S   I N   L A Y E R E D   C O M P O S I T E   E L E M E N T S   ( Q U A D 4 )\n'] + words
             isQuad = True
@@ -896,7 +896,7 @@ class RealCompositePlateStrain(StrainObject):
         words = ['   ELEMENT  PLY   STRAINS IN FIBER AND MATRIX DIRECTIONS    INTER-LAMINAR   STRAINS  PRINCIPAL  STRAINS (ZERO SHEAR)      %s\n' % von,
                  '     ID      ID    NORMAL-1     NORMAL-2     SHEAR-12     SHEAR XZ-MAT  SHEAR YZ-MAT  ANGLE    MAJOR        MINOR        %s\n' % mises]
 
-        eTypes = self.eType.values()
+        eTypes = list(self.eType.values())
         if 'CQUAD4' in eTypes or 'QUAD4LC' in eTypes:
             quadWords = ['                     S T R A I N S   I N   L A Y E R E D   C O M P O S I T E   E L E M E N T S   ( Q U A D 4 )\n'] + words
             isQuad = True
@@ -59,7 +59,7 @@ class NonlinearGapStress(StressObject):
         del self.compX[dt]
 
     def get_transients(self):
-        k = self.compX.keys()
+        k = list(self.compX.keys())
         k.sort()
         return k
 
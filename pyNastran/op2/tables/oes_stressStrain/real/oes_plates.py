@@ -662,7 +662,7 @@ class RealPlateStress(StressObject):
         del self.ovmShear[dt]
 
     def get_transients(self):
-        k = self.oxx.keys()
+        k = list(self.oxx.keys())
         k.sort()
         return k
 
@@ -844,11 +844,11 @@ class RealPlateStress(StressObject):
         quadMsg = None
         quad8Msg = None
         quadrMsg = None
-        eTypes = self.eType.values()
+        eTypes = list(self.eType.values())
         if 'CQUAD4' in eTypes:
             qkey = eTypes.index('CQUAD4')
-            kkey = self.eType.keys()[qkey]
-            ekey = self.oxx[kkey].keys()
+            kkey = list(self.eType.keys())[qkey]
+            ekey = list(self.oxx[kkey].keys())
             isBilinear = True
             quadMsg = header + ['                         S T R E S S E S   I N   Q U A D R I L A T E R A L   E L E M E N T S   ( Q U A D 4 )        OPTION = BILIN  \n \n'] + quadMsgTemp
             if len(ekey) == 1:
@@ -860,8 +860,8 @@ class RealPlateStress(StressObject):
 
         if 'CQUADR' in eTypes:
             qkey = eTypes.index('CQUADR')
-            kkey = self.eType.keys()[qkey]
-            ekey = self.oxx[kkey].keys()
+            kkey = list(self.eType.keys())[qkey]
+            ekey = list(self.oxx[kkey].keys())
             isBilinear = True
             quadrMsg = header + ['                         S T R E S S E S   I N   Q U A D R I L A T E R A L   E L E M E N T S   ( Q U A D R )        OPTION = BILIN  \n \n'] + quadMsgTemp
             if len(ekey) == 1:
@@ -961,15 +961,15 @@ class RealPlateStress(StressObject):
         quad8Msg = None
         quadrMsg = None
 
-        eTypes = self.eType.values()
-        dts = self.oxx.keys()
+        eTypes = list(self.eType.values())
+        dts = list(self.oxx.keys())
         dt = dts[0]
         if 'CQUAD4' in eTypes:
             qkey = eTypes.index('CQUAD4')
             #print(self.eType)
-            kkey = self.eType.keys()[qkey]
+            kkey = list(self.eType.keys())[qkey]
             try:
-                ekey = self.oxx[dt][kkey].keys()
+                ekey = list(self.oxx[dt][kkey].keys())
             except KeyError:
                 assert dt in self.oxx, 'dt=%r not in oxx' % dt
                 assert kkey in self.oxx[dt], 'kkey=%r not in oxx[%r]' % (kkey, dt)
@@ -985,8 +985,8 @@ class RealPlateStress(StressObject):
 
         if 'CQUADR' in eTypes:
             qkey = eTypes.index('CQUADR')
-            kkey = self.eType.keys()[qkey]
-            ekey = self.oxx[dt][kkey].keys()
+            kkey = list(self.eType.keys())[qkey]
+            ekey = list(self.oxx[dt][kkey].keys())
             isBilinear = True
             quadrMsg = header + ['                         S T R E S S E S   I N   Q U A D R I L A T E R A L   E L E M E N T S   ( Q U A D R )        OPTION = BILIN  \n \n'] + quadMsgTemp
             if len(ekey) == 1:
@@ -1014,7 +1014,7 @@ class RealPlateStress(StressObject):
         (typesOut, orderedETypes) = self.getOrderedETypes(validTypes)
 
         msg = []
-        dts = self.oxx.keys()
+        dts = list(self.oxx.keys())
         dts.sort()
         if isinstance(dts[0], int):
             dt_msg =  ' %s = %%-10i\n' % self.data_code['name']
@@ -1096,7 +1096,7 @@ class RealPlateStress(StressObject):
 
     def _write_f06_quad4_bilinear(self, eid, n, cen):
         msg = ['']
-        k = self.oxx[eid].keys()
+        k = list(self.oxx[eid].keys())
         #cen = 'CEN/' + str(n)
         k.remove(cen)
         k.sort()
@@ -1125,7 +1125,7 @@ class RealPlateStress(StressObject):
 
     def _write_f06_quad4_bilinear_transient(self, dt, eid, n, cen):
         msg = ['']
-        k = self.oxx[dt][eid].keys()
+        k = list(self.oxx[dt][eid].keys())
         #cen = 'CEN/' + str(n)
         k.remove(cen)
         k.sort()
@@ -1154,7 +1154,7 @@ class RealPlateStress(StressObject):
 
     def _write_f06_tri3(self, eid):
         msg = ['']
-        oxxNodes = self.oxx[eid].keys()
+        oxxNodes = list(self.oxx[eid].keys())
         for nid in sorted(oxxNodes):
             for iLayer in range(len(self.oxx[eid][nid])):
                 fd = self.fiberCurvature[eid][nid][iLayer]
@@ -1176,7 +1176,7 @@ class RealPlateStress(StressObject):
 
     def _write_f06_tri3_transient(self, dt, eid):
         msg = ['']
-        oxxNodes = self.oxx[dt][eid].keys()
+        oxxNodes = list(self.oxx[dt][eid].keys())
         for nid in sorted(oxxNodes):
             for iLayer in range(len(self.oxx[dt][eid][nid])):
                 fd = self.fiberCurvature[eid][nid][iLayer]
@@ -1412,7 +1412,7 @@ class RealPlateStrain(StrainObject):
         del self.evmShear[dt]
 
     def get_transients(self):
-        k = self.exx.keys()
+        k = list(self.exx.keys())
         k.sort()
         return k
 
@@ -1590,11 +1590,11 @@ class RealPlateStrain(StrainObject):
         tri6Msg = None
         trirMsg = None
 
-        eTypes = self.eType.values()
+        eTypes = list(self.eType.values())
         if 'CQUAD4' in eTypes:
             qkey = eTypes.index('CQUAD4')
-            kkey = self.eType.keys()[qkey]
-            ekey = self.exx[kkey].keys()
+            kkey = list(self.eType.keys())[qkey]
+            ekey = list(self.exx[kkey].keys())
             isBilinear = True
             quadMsg = header + ['                           S T R A I N S   I N   Q U A D R I L A T E R A L   E L E M E N T S   ( Q U A D 4 )        OPTION = BILIN  \n \n'] + quadMsgTemp
             if len(ekey) == 1:
@@ -1603,8 +1603,8 @@ class RealPlateStrain(StrainObject):
 
         if 'CQUAD8' in eTypes:
             qkey = eTypes.index('CQUAD8')
-            kkey = self.eType.keys()[qkey]
-            ekey = self.exx[kkey].keys()
+            kkey = list(self.eType.keys())[qkey]
+            ekey = list(self.exx[kkey].keys())
             isBilinear = True
             quad8Msg = header + ['                           S T R A I N S   I N   Q U A D R I L A T E R A L   E L E M E N T S   ( Q U A D 8 )        OPTION = BILIN  \n \n'] + quadMsgTemp
             if len(ekey) == 1:
@@ -1613,8 +1613,8 @@ class RealPlateStrain(StrainObject):
 
         if 'CQUADR' in eTypes:
             qkey = eTypes.index('CQUADR')
-            kkey = self.eType.keys()[qkey]
-            ekey = self.exx[kkey].keys()
+            kkey = list(self.eType.keys())[qkey]
+            ekey = list(self.exx[kkey].keys())
             isBilinear = True
             quadrMsg = header + ['                           S T R A I N S   I N   Q U A D R I L A T E R A L   E L E M E N T S   ( Q U A D R )        OPTION = BILIN  \n \n'] + quadMsgTemp
             if len(ekey) == 1:
@@ -1716,14 +1716,14 @@ class RealPlateStrain(StrainObject):
         tri6Msg = None
         trirMsg = None
 
-        eTypes = self.eType.values()
+        eTypes = list(self.eType.values())
         if 'CQUAD4' in eTypes:
             ElemKey = eTypes.index('CQUAD4')
             #print qkey
-            eid = self.eType.keys()[ElemKey]
+            eid = list(self.eType.keys())[ElemKey]
             #print "self.oxx = ",self.oxx
             #print "eid=%s" %(eid)
-            dt = self.exx.keys()[0]
+            dt = list(self.exx.keys())[0]
             #print "dt=%s" %(dt)
             nLayers = len(self.exx[dt][eid])
             #print "elementKeys = ",elementKeys
@@ -1738,9 +1738,9 @@ class RealPlateStrain(StrainObject):
 
         if 'CQUADR' in eTypes:
             qkey = eTypes.index('CQUADR')
-            kkey = self.eType.keys()[qkey]
-            dt = self.exx.keys()[0]
-            ekey = self.exx[dt][kkey].keys()
+            kkey = list(self.eType.keys())[qkey]
+            dt = list(self.exx.keys())[0]
+            ekey = list(self.exx[dt][kkey].keys())
             isBilinear = True
             quadrMsg = header + ['                           S T R A I N S   I N   Q U A D R I L A T E R A L   E L E M E N T S   ( Q U A D R )        OPTION = BILIN  \n \n'] + quadMsgTemp
             if len(ekey) == 1:
@@ -1768,7 +1768,7 @@ class RealPlateStrain(StrainObject):
                       'CQUAD8', 'CQUADR']
         (typesOut, orderedETypes) = self.getOrderedETypes(validTypes)
 
-        dts = self.exx.keys()
+        dts = list(self.exx.keys())
         dts.sort()
         if isinstance(dts[0], int):
             dt_msg =  ' %s = %%-10i\n' % self.data_code['name']
@@ -1858,7 +1858,7 @@ class RealPlateStrain(StrainObject):
 
     def writeF06_Quad4_Bilinear(self, eid, n, cen):
         msg = ['']
-        k = self.exx[eid].keys()
+        k = list(self.exx[eid].keys())
         #cen = 'CEN/' + str(n)
         k.remove(cen)
         k.sort()
@@ -1887,7 +1887,7 @@ class RealPlateStrain(StrainObject):
 
     def _write_f06_quad4_bilinear_transient(self, dt, eid, n, cen):
         msg = ['']
-        k = self.exx[dt][eid].keys()
+        k = list(self.exx[dt][eid].keys())
         #cen = 'CEN/' + str(n)
         k.remove(cen)
         k.sort()
@@ -1917,7 +1917,7 @@ class RealPlateStrain(StrainObject):
 
     def writeF06_Tri3(self, eid):
         msg = ['']
-        k = self.exx[eid].keys()
+        k = list(self.exx[eid].keys())
         for nid in sorted(k):
             for iLayer in range(len(self.exx[eid][nid])):
                 fd = self.fiberCurvature[eid][nid][iLayer]
@@ -252,7 +252,7 @@ class RodDamper(StressObject):
         eTypes = list(set(self.eType.values()))
         if self.nonlinear_factor is not None:  # transient
             ntimes = len(self.axial)
-            a0 = self.stress.keys()[0]
+            a0 = list(self.stress.keys())[0]
             nelements = len(self.axial[a0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -306,7 +306,7 @@ class RealRodStress(StressObject):
         msg = self.get_data_code()
         if self.dt is not None:  # transient
             ntimes = len(self.axial)
-            a0 = self.axial.keys()[0]
+            a0 = list(self.axial.keys())[0]
             nelements = len(self.axial[a0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -361,7 +361,7 @@ class RealRodStress(StressObject):
         del self.MS_torsion[dt]
 
     def get_transients(self):
-        k = self.axial.keys()
+        k = list(self.axial.keys())
         k.sort()
         return k
 
@@ -516,7 +516,7 @@ class RealRodStrain(StrainObject):
         msg = self.get_data_code()
         if self.dt is not None:  # transient
             ntimes = len(self.axial)
-            a0 = self.axial.keys()[0]
+            a0 = list(self.axial.keys())[0]
             nelements = len(self.axial[a0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -568,7 +568,7 @@ class RealRodStrain(StrainObject):
         del self.MS_torsion[dt]
 
     def get_transients(self):
-        k = self.axial.keys()
+        k = list(self.axial.keys())
         k.sort()
         return k
 
@@ -246,7 +246,7 @@ class RealShearStress(StressObject):
         msg = self.get_data_code()
         if self.dt is not None:  # transient
             ntimes = len(self.maxShear)
-            s0 = self.maxShear.keys()[0]
+            s0 = list(self.maxShear.keys())[0]
             nelements = len(self.maxShear[s0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -263,7 +263,7 @@ class RealShearStress(StressObject):
         del self.margin[dt]
 
     def get_transients(self):
-        k = self.maxShear.keys()
+        k = list(self.maxShear.keys())
         k.sort()
         return k
 
@@ -343,7 +343,7 @@ class RealShearStrain(StrainObject):
         msg = self.get_data_code()
         if self.dt is not None:  # transient
             ntimes = len(self.maxShear)
-            s0 = self.maxShear.keys()[0]
+            s0 = list(self.maxShear.keys())[0]
             nelements = len(self.maxShear[s0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -360,7 +360,7 @@ class RealShearStrain(StrainObject):
         del self.margin[dt]
 
     def get_transients(self):
-        k = self.maxShear.keys()
+        k = list(self.maxShear.keys())
         k.sort()
         return k
 
@@ -515,7 +515,7 @@ class RealSolidStress(StressObject):
         del self.o3[dt]
 
     def get_transients(self):
-        k = self.oxx.keys()
+        k = list(self.oxx.keys())
         k.sort()
         return k
 
@@ -735,7 +735,7 @@ class RealSolidStress(StressObject):
     def _write_f06_transient(self, header, pageStamp, page_num, f):
         (tetraMsg, pentaMsg, hexaMsg,
          TETRA, HEXA, PENTA) = self.getF06_Header()
-        dts = self.oxx.keys()
+        dts = list(self.oxx.keys())
         for dt in dts:
             keys = [int(key) for key in TETRA.keys()]
             for key in sorted(keys):
@@ -765,7 +765,7 @@ class RealSolidStress(StressObject):
         for eid in eids:
             #eType = self.eType[eid]
 
-            k = self.oxx[eid].keys()
+            k = list(self.oxx[eid].keys())
             cen = 'CENTER'
             k.remove(cen)
             k.sort()
@@ -804,7 +804,7 @@ class RealSolidStress(StressObject):
         f.write(''.join(header + tetraMsg))
         cen = 'CENTER'
         for eid in eids:
-            k = self.oxx[dt][eid].keys()
+            k = list(self.oxx[dt][eid].keys())
             k.remove(cen)
             k.sort()
             f.write('0  %8s           0GRID CS  %i GP\n' % (eid, nNodes))
@@ -1053,7 +1053,7 @@ class RealSolidStrain(StrainObject):
         del self.e3[dt]
 
     def get_transients(self):
-        k = self.exx.keys()
+        k = list(self.exx.keys())
         k.sort()
         return k
 
@@ -1287,7 +1287,7 @@ class RealSolidStrain(StrainObject):
         msg = []
         (tetraMsg, pentaMsg, hexaMsg,
          TETRA, PENTA, HEXA) = self.getF06_Header()
-        dts = self.exx.keys()
+        dts = list(self.exx.keys())
         for dt in dts:
             keys = [int(key) for key in TETRA.keys()]
             for key in sorted(keys):
@@ -1316,7 +1316,7 @@ class RealSolidStrain(StrainObject):
         f.write(''.join(header + tetraMsg))
         cen = 'CENTER'
         for eid in eids:
-            k = self.exx[eid].keys()
+            k = list(self.exx[eid].keys())
             k.remove(cen)
             k.sort()
             f.write('0  %8s           0GRID CS  %i GP\n' % (eid, nNodes))
@@ -1353,7 +1353,7 @@ class RealSolidStrain(StrainObject):
         f.write(''.join(header + tetraMsg))
         cen = 'CENTER'
         for eid in eids:
-            k = self.exx[dt][eid].keys()
+            k = list(self.exx[dt][eid].keys())
             k.remove(cen)
             k.sort()
             f.write('0  %8s           0GRID CS  %i GP\n' % (eid, nNodes))
@@ -63,7 +63,7 @@ class RealCelasStress(StressObject):
         del self.stress[dt]
 
     def get_transients(self):
-        k = self.stress.keys()
+        k = list(self.stress.keys())
         k.sort()
         return k
 
@@ -225,7 +225,7 @@ class RealCelasStrain(StrainObject):
         del self.strain[dt]
 
     def get_transients(self):
-        k = self.strain.keys()
+        k = list(self.strain.keys())
         k.sort()
         return k
 
@@ -317,7 +317,7 @@ class NonlinearSpringStress(StressObject):
         del self.stress[dt]
 
     def get_transients(self):
-        k = self.stress.keys()
+        k = list(self.stress.keys())
         k.sort()
         return k
 
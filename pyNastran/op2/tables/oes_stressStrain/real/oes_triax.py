@@ -49,7 +49,7 @@ class RealTriaxStress(StressObject):
         msg = self.get_data_code()
         if self.nonlinear_factor is not None:  # transient
             ntimes = len(self.radial)
-            r0 = self.radial.keys()[0]
+            r0 = list(self.radial.keys())[0]
             nelements = len(self.radial[r0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -103,7 +103,7 @@ class RealTriaxStress(StressObject):
         del self.ovm[dt]
 
     def get_transients(self):
-        k = self.axial.keys()
+        k = list(self.axial.keys())
         k.sort()
         return k
 
@@ -269,7 +269,7 @@ class RealTriaxStrain(StrainObject):
         msg = self.get_data_code()
         if self.nonlinear_factor is not None:  # transient
             ntimes = len(self.radial)
-            r0 = self.radial.keys()[0]
+            r0 = list(self.radial.keys())[0]
             nelements = len(self.radial[r0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -294,7 +294,7 @@ class RealTriaxStrain(StrainObject):
         del self.evm[dt]
 
     def get_transients(self):
-        k = self.axial.keys()
+        k = list(self.axial.keys())
         k.sort()
         return k
 
@@ -116,7 +116,7 @@ class RealGridPointForces(ScalarObject):
         del self.elemName[dt]
 
     def get_transients(self):
-        k = self.forces.keys()
+        k = list(self.forces.keys())
         k.sort()
         return k
 
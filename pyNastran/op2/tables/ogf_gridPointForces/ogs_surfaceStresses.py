@@ -34,7 +34,7 @@ class GridPointStressesArray(ScalarObject):
         msg = self.get_data_code()
         if self.nonlinear_factor is not None:  # transient
             ntimes = len(self.nx)
-            times0 = self.nx.keys()[0]
+            times0 = list(self.nx.keys())[0]
             nelements = len(self. nx[times0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -73,7 +73,7 @@ class GridPointStresses(ScalarObject):
         msg = self.get_data_code()
         if self.nonlinear_factor is not None:  # transient
             ntimes = len(self.nx)
-            times0 = self.nx.keys()[0]
+            times0 = list(self.nx.keys())[0]
             nelements = len(self. nx[times0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -161,7 +161,7 @@ class GridPointStresses(ScalarObject):
         del self.ovm[dt]
 
     def get_transients(self):
-        k = self.nx.keys()
+        k = list(self.nx.keys())
         k.sort()
         return k
 
@@ -271,7 +271,7 @@ class GridPointStressesVolume(ScalarObject):
         msg = self.get_data_code()
         if self.nonlinear_factor is not None:  # transient
             ntimes = len(self.nx)
-            times0 = self.nx.keys()[0]
+            times0 = list(self.nx.keys())[0]
             nelements = len(self. nx[times0])
             msg.append('  type=%s ntimes=%s nelements=%s\n'
                        % (self.__class__.__name__, ntimes, nelements))
@@ -359,7 +359,7 @@ class GridPointStressesVolume(ScalarObject):
         del self.ovm[dt]
 
     def get_transients(self):
-        k = self.nx.keys()
+        k = list(self.nx.keys())
         k.sort()
         return k
 
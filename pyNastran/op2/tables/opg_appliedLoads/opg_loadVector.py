@@ -5,8 +5,8 @@ from pyNastran.f06.f06_formatting import writeFloats13E
 
 class RealLoadVectorArray(RealTableArray):  # table_code=2, sort_code=0, thermal=0
 
-    def __init__(self, data_code, is_sort1, isubcase, dt):
-        RealTableArray.__init__(self, data_code, is_sort1, isubcase, dt)
+    def __init__(self, data_code, is_sort1, isubcase, dt, f06_flag=False):
+        RealTableArray.__init__(self, data_code, is_sort1, isubcase, dt, f06_flag=f06_flag)
 
     def write_f06(self, header, pageStamp, page_num=1, f=None, is_mag_phase=False):
         words = ['                                                     L O A D   V E C T O R\n', ]
@@ -4,8 +4,8 @@ from pyNastran.f06.f06_formatting import writeFloats13E, writeImagFloats13E
 
 
 class RealMPCForcesArray(RealTableArray):
-    def __init__(self, data_code, is_sort1, isubcase, dt):
-        RealTableArray.__init__(self, data_code, is_sort1, isubcase, dt)
+    def __init__(self, data_code, is_sort1, isubcase, dt, f06_flag=False):
+        RealTableArray.__init__(self, data_code, is_sort1, isubcase, dt, f06_flag=f06_flag)
 
     def write_f06(self, header, pageStamp, page_num=1, f=None, is_mag_phase=False):
         words = ['                               F O R C E S   O F   M U L T I - P O I N T   C O N S T R A I N T\n', ]
@@ -3,8 +3,8 @@ from pyNastran.f06.f06_formatting import writeFloats13E
 from pyNastran.op2.resultObjects.tableObject import RealTableArray, ComplexTableArray, RealTableObject, ComplexTableObject
 
 class RealSPCForcesArray(RealTableArray):
-    def __init__(self, data_code, is_sort1, isubcase, dt):
-        RealTableArray.__init__(self, data_code, is_sort1, isubcase, dt)
+    def __init__(self, data_code, is_sort1, isubcase, dt, f06_flag=False):
+        RealTableArray.__init__(self, data_code, is_sort1, isubcase, dt, f06_flag=f06_flag)
 
     def write_f06(self, header, pageStamp, page_num=1, f=None, is_mag_phase=False):
         words = ['                               F O R C E S   O F   S I N G L E - P O I N T   C O N S T R A I N T\n', ]
@@ -21,7 +21,7 @@ class Flux(ScalarObject):  # approach_code=1, table_code=3, thermal=1
         del self.fluxes[dt]
 
     def get_transients(self):
-        k = self.fluxes.keys()
+        k = list(self.fluxes.keys())
         k.sort()
         return k
 
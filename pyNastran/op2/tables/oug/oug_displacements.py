@@ -1,3 +1,4 @@
+from six import b, string_types
 from struct import pack as spack, Struct as sStruct
 
 def pack(fascii, msg, fmt, data):
@@ -12,6 +13,7 @@ class Struct(object):
     def pack(self, msg, data):
         self.fascii.write('%s = %s\n' % (msg, data))
         if isinstance(data, list):
+            data = [b(d) if isinstance(d, string_types) else d for d in data]
             return self.s.pack(*data)
         return self.s.pack(data)
 
@@ -65,8 +67,8 @@ def make_pack_form(data):
 
 
 class RealDisplacementArray(RealTableArray):
-    def __init__(self, data_code, is_sort1, isubcase, dt):
-        RealTableArray.__init__(self, data_code, is_sort1, isubcase, dt)
+    def __init__(self, data_code, is_sort1, isubcase, dt, f06_flag=False):
+        RealTableArray.__init__(self, data_code, is_sort1, isubcase, dt, f06_flag=f06_flag)
 
     def write_f06(self, header, pageStamp, page_num=1, f=None, is_mag_phase=False):
         words = ['                                             D I S P L A C E M E N T   V E C T O R\n', ]
@@ -14,41 +14,7 @@ class ComplexEigenvectorArray(ComplexTableArray):
 
 class RealEigenvectorArray(RealTableArray):
     def __init__(self, data_code, is_sort1, isubcase, dt, f06_flag=False):
-        RealTableArray.__init__(self, data_code, is_sort1, isubcase, dt)
-
-        if f06_flag:
-            self.itime = -1
-            self._times = []
-            self.data = []
-            self.node_gridtype = []
-
-            self.data_code = data_code
-            self.apply_data_code()
-            self.set_data_members()
-
-    def build_f06_vectorization(self):
-        self.data = array(self.data, dtype='float32')
-        self.node_gridtype = array(self.node_gridtype)
-        self._times = array(self._times)
-
-    def add_new_f06_mode(self, imode):
-        self._times.append(imode)
-        self.itime += 1
-        self.ntimes += 1
-        self.data.append([])
-        self.node_gridtype = []
-
-    def update_f06_mode(self, data_code, imode):
-        """
-        this method is called if the object
-        already exits and a new time step is found
-        """
-        #assert mode >= 0.
-        self.data_code = data_code
-        self.apply_data_code()
-        #self.caseVal = imode
-        self.add_new_f06_mode(imode)
-        self.set_data_members()
+        RealTableArray.__init__(self, data_code, is_sort1, isubcase, dt, f06_flag=f06_flag)
 
     def read_f06_data(self, data_code, lines):
         """
@@ -61,22 +27,30 @@ class RealEigenvectorArray(RealTableArray):
            [101, 'S', 1.0, 0.0, 0.0, 0.0, 0.0, 0.0] #  valid
            [102, 'S', 2.0, 0.0, 0.0, 0.0, 0.0, 0.0] #  valid
         """
-        imode = data_code['mode']
-        if imode not in self._times:
-            self.update_f06_mode(data_code, imode)
-
-        itime = self.itime
-        datai = self.data[itime]
-
         for line in lines:
             if len(line) != 8:
                 msg = 'invalid length; even spoints must be in \n'
                 msg += '[nid, type, t1, t2, t3, r1, r2, t3] format\nline=%s\n' % line
                 msg += 'expected length=8; length=%s' % len(line)
                 raise RuntimeError(msg)
-            (node_id, grid_type, t1, t2, t3, r1, r2, r3) = line
-            self.node_gridtype.append([node_id, self.cast_grid_type(grid_type)])
-            datai.append([t1, t2, t3, r1, r2, r3])
+        node_ids = array([line[0] for line in lines], dtype='int32')
+        grid_types = array([line[1] for line in lines])
+        data = array([line[2:] for line in lines], dtype='float32').reshape(len(lines), 6)
+        self.read_f06_arrays(data_code, node_ids, grid_types, data)
+
+    def read_f06_arrays(self, data_code, node_ids, grid_types, data):
+        """
+        Adds a table of F06 data at once (see f06_table.parse_real_node_table)
+
+        :param data_code: the data_code of the mode
+        :param node_ids: the (n,) node ids
+        :param grid_types: the (n,) grid types ('G', 'S')
+        :param data: the (n, 6) [t1, t2, t3, r1, r2, r3] values
+        """
+        imode = data_code['mode']
+        if imode not in self._times:
+            self.update_f06_time(data_code, imode)
+        self._add_f06_block(node_ids, grid_types, data)
         assert self.eigrs[-1] == data_code['eigr'], 'eigrs=%s\ndata_code[eigrs]=%s' %(self.eigrs, data_code['eigr'])
 
     def write_f06(self, header, page_stamp, page_num=1, f=None, is_mag_phase=False):
@@ -173,6 +147,25 @@ class Eigenvector(RealTableObject):  # approach_code=2, sort_code=0, thermal=0
             self.rotations[imode][node_id] = array([r1, r2, r3])
         assert self.eigrs[-1] == data_code['eigr'], 'eigrs=%s\ndata_code[eigrs]=%s' %(self.eigrs, data_code['eigr'])
 
+    def read_f06_arrays(self, data_code, node_ids, grid_types, data):
+        """
+        Adds a table of F06 data at once (see f06_table.parse_real_node_table)
+
+        :param data_code: the data_code of the mode
+        :param node_ids: the (n,) node ids
+        :param grid_types: the (n,) grid types ('G', 'S')
+        :param data: the (n, 6) [t1, t2, t3, r1, r2, r3] values
+        """
+        imode = data_code['mode']
+        if imode not in self.translations:
+            self.update_mode(data_code, imode)
+
+        node_ids = node_ids.tolist()
+        self.gridTypes.update(zip(node_ids, grid_types.tolist()))
+        self.translations[imode].update(zip(node_ids, data[:, :3]))
+        self.rotations[imode].update(zip(node_ids, data[:, 3:]))
+        assert self.eigrs[-1] == data_code['eigr'], 'eigrs=%s\ndata_code[eigrs]=%s' %(self.eigrs, data_code['eigr'])
+
     def update_mode(self, data_code, imode):
         """
         this method is called if the object
@@ -284,7 +277,7 @@ class RealEigenvector(ScalarObject):  # approach_code=2, sort_code=0, thermal=0
         del self.rotations[dt]
 
     def get_transients(self):
-        k = self.translations.keys()
+        k = list(self.translations.keys())
         k.sort()
         return k
 
@@ -88,7 +88,7 @@ class RealTemperature(ScalarObject):  # approach_code=1, sort_code=0, thermal=1
         del self.temperatures[dt]
 
     def get_transients(self):
-        k = self.temperatures.keys()
+        k = list(self.temperatures.keys())
         k.sort()
         return k
 
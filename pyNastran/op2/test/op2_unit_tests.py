@@ -1,15 +1,41 @@
 import os
+import shutil
+import tempfile
 import unittest
+from struct import Struct
+from six import StringIO
+
+from numpy import array, zeros, allclose, array_equal
+
 import pyNastran
 testPath = pyNastran.__path__[0]
 #print "testPath = ",testPath
 
-from pyNastran.op2.op2 import OP2
+from pyNastran.op2.op2 import OP2, TrashWriter
+from pyNastran.op2.op2_geom import OP2Geom
+from pyNastran.op2.op2_vectorized import OP2_Vectorized
+from pyNastran.op2.op2_index import TableIndex
+from pyNastran.op2.op2_lazy import OP2_Lazy, LazyResultDict
+from pyNastran.op2.tables.oug.oug_displacements import (
+    RealDisplacementArray, ComplexDisplacementArray)
+from pyNastran.op2.tables.oes_stressStrain.real.oes_compositePlates import RealCompositePlateStressArray
 from pyNastran.op2.test.test_op2 import run_op2
 from pyNastran.bdf.test.bdf_unit_tests import Tester
 
+try:
+    import h5py
+    IS_H5PY = True
+except ImportError:
+    IS_H5PY = False
+
 
 class TestOP2(Tester):
+    def _mkdtemp(self):
+        """makes a scratch directory for the sidecar files, so they don't end up in the tree"""
+        dirname = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, dirname)
+        return dirname
+
     def _spike(self):
         op2 = OP2()
         op2.set_results('solidStress.oxx')
@@ -63,5 +89,361 @@ class TestOP2(Tester):
                 write_f06=write_f06, is_vector=True,
                 debug=debug, stopOnFailure=True)
 
+    def test_op2_write_f06_plates(self):
+        """the static and transient plate results can be written to an F06"""
+        folder = os.path.abspath(os.path.join(testPath, '..', 'models'))
+        for op2_filename in ['static_solid_shell_bar.op2', 'mode_solid_shell_bar.op2']:
+            op2 = OP2(debug=False)
+            op2.read_op2(os.path.join(folder, 'sol_101_elements', op2_filename))
+            for results in [op2.plateStress, op2.plateStrain]:
+                self.assertEqual(len(results), 1)
+                for obj in results.values():
+                    f = StringIO()
+                    obj.write_f06(['', '', ''], 'PAGE %i', page_num=1, f=f)
+                    self.assertIn('Q U A D R I L A T E R A L', f.getvalue())
+
+    def test_op2_mmap(self):
+        """reading through a memory map gives the same model"""
+        folder = os.path.abspath(os.path.join(testPath, '..', 'models'))
+        op2_filename = os.path.join(folder, 'solid_bending', 'solid_bending.op2')
+        op2a = OP2Geom(make_geom=True)
+        table_names_a = op2a.read_op2(op2_filename)
+
+        op2b = OP2Geom(make_geom=True)
+        table_names_b = op2b.read_op2(op2_filename, use_mmap=True)
+        self.assertEqual(table_names_a, table_names_b)
+        self.assertEqual(sorted(op2a.nodes), sorted(op2b.nodes))
+        self.assertEqual(sorted(op2a.elements), sorted(op2b.elements))
+        for nid, node in op2a.nodes.items():
+            self.assertTrue(array_equal(node.xyz, op2b.nodes[nid].xyz))
+        self.assertEqual(len(op2a.displacements), 1)
+        self.assertEqual(len(op2a.solidStress), 1)
+        self.assertEqual(op2a.get_op2_stats(), op2b.get_op2_stats())
+
+    def test_op2_table_index(self):
+        """the table index sidecar is written and reused"""
+        folder = os.path.abspath(os.path.join(testPath, '..', 'models'))
+        op2_filename = os.path.join(folder, 'solid_bending', 'solid_bending.op2')
+        index_filename = os.path.join(self._mkdtemp(), 'solid_bending.op2.idx')
+
+        op2a = OP2_Vectorized()
+        op2a.set_as_vectorized(ask=False)
+        op2a.read_op2(op2_filename, index_filename=index_filename)
+        self.assertTrue(os.path.exists(index_filename))
+        self.assertEqual(len(op2a.displacements), 1)
+        self.assertEqual(len(op2a.ctetra_stress), 1)
+
+        table_index = TableIndex().read(index_filename)
+        self.assertTrue(table_index.is_valid(op2_filename))
+        self.assertEqual(len(table_index.tables), len(op2a.table_index.tables))
+        for tablea, tableb in zip(op2a.table_index.tables, table_index.tables):
+            self.assertEqual(tablea.table_name, tableb.table_name)
+            self.assertEqual(tablea.n_start, tableb.n_start)
+            self.assertEqual(tablea.n_end, tableb.n_end)
+        self.assertTrue(len(table_index.get_subtables('OUGV1')) > 0)
+
+        op2b = OP2_Vectorized()
+        op2b.set_as_vectorized(ask=False)
+        op2b.read_op2(op2_filename, index_filename=index_filename)
+        self.assertFalse(op2b._build_table_index)
+        self.assertEqual(op2a.get_op2_stats(), op2b.get_op2_stats())
+        for isubcase, obj in op2a.displacements.items():
+            self.assertTrue(array_equal(obj.data, op2b.displacements[isubcase].data))
+
+        # the subtables are found with the index, so the other subcases aren't read
+        op2c = OP2(debug=False)
+        op2c.read_op2(op2_filename, index_filename=index_filename)
+        op2d = OP2(debug=False)
+        op2d.read_op2(op2_filename)
+        self.assertEqual(op2c.get_op2_stats(), op2d.get_op2_stats())
+
+        op2e = OP2_Vectorized()
+        op2e.set_as_vectorized(ask=False)
+        op2e.set_subcases([2])
+        op2e.read_op2(op2_filename, index_filename=index_filename)
+        self.assertEqual(len(op2e.displacements), 0)
+        self.assertEqual(len(op2e.ctetra_stress), 0)
+
+    def test_op2_num_workers(self):
+        """the results are the same when they're read by worker processes"""
+        folder = os.path.abspath(os.path.join(testPath, '..', 'models'))
+        op2_filename = os.path.join(folder, 'sol_101_elements', 'mode_solid_shell_bar.op2')
+
+        op2a = OP2_Vectorized()
+        op2a.set_as_vectorized(ask=False)
+        op2a.read_op2(op2_filename)
+
+        op2b = OP2_Vectorized()
+        op2b.set_as_vectorized(ask=False)
+        op2b.read_op2(op2_filename, num_workers=2)
+        self.assertEqual(len(op2a.eigenvectors), 1)
+        self.assertEqual(len(op2a.cquad4_stress), 1)
+        self.assertEqual(len(op2a.chexa_stress), 1)
+        for result_name in op2a.get_table_types():
+            resultsa = getattr(op2a, result_name)
+            resultsb = getattr(op2b, result_name)
+            self.assertEqual(sorted(resultsa.keys()), sorted(resultsb.keys()))
+            for key, obja in resultsa.items():
+                if hasattr(obja, 'data'):
+                    self.assertTrue(array_equal(obja.data, resultsb[key].data))
+
+    def test_op2_lazy(self):
+        """lazy results match the eagerly read results"""
+        folder = os.path.abspath(os.path.join(testPath, '..', 'models'))
+        op2_filename = os.path.join(folder, 'solid_bending', 'solid_bending.op2')
+        index_filename = os.path.join(self._mkdtemp(), 'solid_bending_lazy.op2.idx')
+
+        op2 = OP2(debug=False)
+        table_names = op2.read_op2(op2_filename)
+
+        for i in range(2):
+            op2_lazy = OP2_Lazy(max_memory=1)
+            table_names_lazy = op2_lazy.read_op2(op2_filename, index_filename=index_filename)
+            self.assertEqual(op2_lazy._build_table_index, False)
+            self.assertTrue(os.path.exists(index_filename))
+            if i == 0:
+                self.assertEqual(table_names, table_names_lazy)
+            self.assertEqual(sorted(op2_lazy._lazy_results),
+                             ['displacements', 'solidStress', 'spcForces'])
+
+            for result_name in op2_lazy._lazy_results:
+                results = getattr(op2, result_name)
+                lazy_results = getattr(op2_lazy, result_name)
+                self.assertIsInstance(lazy_results, LazyResultDict)
+                self.assertEqual(sorted(results.keys()), sorted(lazy_results.keys()))
+                for isubcase, obj in results.items():
+                    self.assertEqual(obj.get_stats(), lazy_results[isubcase].get_stats())
+                    # the max_memory is tiny, so only the last result is kept
+                    self.assertEqual(len(op2_lazy._lazy_cache), 1)
+            op2_lazy.close()
+
+    @unittest.skipIf(not IS_H5PY, 'h5py is not installed')
+    def test_op2_hdf5(self):
+        """results round trip through HDF5 and partial reads work"""
+        hdf5_filename = os.path.join(self._mkdtemp(), 'op2_hdf5.h5')
+        data_code = {'nonlinear_factor' : 1, 'table_name' : 'OUGV1',
+                     'device_code' : 1, 'sort_code' : 0, 'mode' : 1,
+                     'eigr' : 1.0, 'mode_cycle' : 0., 'subtitle' : b'DEFAULT',
+                     'dataNames' : ['mode', 'eigr', 'mode_cycle']}
+        obj = RealDisplacementArray(data_code, True, 1, 1)
+        obj.ntimes = 3
+        obj.ntotal = 4
+        obj._nnodes = 12
+        obj.build()
+        obj._times[:] = [1, 2, 3]
+        obj.node_gridtype[:, 0] = [1, 2, 10, 11]
+        obj.node_gridtype[:, 1] = 1
+        obj.data[:] = array(range(72)).reshape(3, 4, 6)
+
+        op2 = OP2()
+        op2.displacements[1] = obj
+        op2.export_hdf5(hdf5_filename)
+
+        op2_hdf5 = OP2()
+        op2_hdf5.load_hdf5(hdf5_filename)
+        obj2 = op2_hdf5.displacements[1]
+        self.assertIsInstance(obj2, RealDisplacementArray)
+        self.assertEqual(obj2.data_code['subtitle'], b'DEFAULT')
+        self.assertEqual(obj2.ntimes, 3)
+        self.assertTrue(array_equal(obj._times, obj2._times))
+        self.assertTrue(array_equal(obj.node_gridtype, obj2.node_gridtype))
+        self.assertTrue(array_equal(obj.data, obj2.data))
+
+        # a single mode and a node range
+        op2_hdf5 = OP2()
+        op2_hdf5.load_hdf5(hdf5_filename, result_names=['displacements'],
+                           itimes=1, irows=slice(1, 3))
+        obj2 = op2_hdf5.displacements[1]
+        self.assertEqual(obj2.ntimes, 1)
+        self.assertEqual(obj2.ntotal, 2)
+        self.assertTrue(array_equal(obj2._times, [2]))
+        self.assertTrue(array_equal(obj2.node_gridtype[:, 0], [2, 10]))
+        self.assertTrue(array_equal(obj2.data, obj.data[1:2, 1:3, :]))
+
+    @unittest.skipIf(not IS_H5PY, 'h5py is not installed')
+    def test_op2_hdf5_modes(self):
+        """a single mode loaded from HDF5 matches that mode of the full result"""
+        folder = os.path.abspath(os.path.join(testPath, '..', 'models'))
+        op2_filename = os.path.join(folder, 'sol_101_elements', 'mode_solid_shell_bar.op2')
+        hdf5_filename = os.path.join(self._mkdtemp(), 'mode_solid_shell_bar.h5')
+        op2 = OP2_Vectorized()
+        op2.set_as_vectorized(ask=False)
+        op2.read_op2(op2_filename)
+        op2.export_hdf5(hdf5_filename)
+
+        op2_full = OP2()
+        op2_full.load_hdf5(hdf5_filename)
+        op2_mode = OP2()
+        op2_mode.load_hdf5(hdf5_filename, itimes=1)
+        for result_name in ['eigenvectors', 'ctria3_stress', 'ctetra_stress']:
+            obj = getattr(op2_full, result_name)[1]
+            obj2 = getattr(op2_mode, result_name)[1]
+            self.assertEqual(obj.ntimes, 3)
+            self.assertEqual(obj2.ntimes, 1)
+            self.assertEqual(obj2.modes, obj.modes[1:2])
+            self.assertEqual(obj2.eigrs, obj.eigrs[1:2])
+            self.assertTrue(array_equal(obj2.data, obj.data[1:2, :, :]))
+            self.assertEqual(obj2.ntotal, obj.ntotal)
+
+        # nelements is summed over the modes for plates, but not for solids
+        self.assertEqual(op2_full.ctria3_stress[1].nelements, 24)
+        self.assertEqual(op2_mode.ctria3_stress[1].nelements, 8)
+        self.assertEqual(op2_mode.ctetra_stress[1].nelements,
+                         op2_full.ctetra_stress[1].nelements)
+
+        op2_nodes = OP2()
+        op2_nodes.load_hdf5(hdf5_filename, result_names=['eigenvectors'],
+                            itimes=[0, 2], irows=slice(0, 5))
+        obj = op2_full.eigenvectors[1]
+        obj2 = op2_nodes.eigenvectors[1]
+        self.assertEqual(obj2.modes, [obj.modes[0], obj.modes[2]])
+        self.assertEqual((obj2.ntimes, obj2.ntotal, obj2._nnodes), (2, 5, 5))
+        self.assertTrue(array_equal(obj2.data, obj.data[[0, 2], :5, :]))
+
+        # the per-element arrays of a solid aren't changed by a mode load
+        obj = op2_full.ctetra_stress[1]
+        obj2 = op2_mode.ctetra_stress[1]
+        self.assertTrue(array_equal(obj2.element_cid, obj.element_cid))
+        self.assertTrue(array_equal(obj2.element_node, obj.element_node))
+
+        # the rows of a solid are element/node pairs, so they can't be sliced
+        with self.assertRaises(NotImplementedError):
+            OP2().load_hdf5(hdf5_filename, result_names=['ctetra_stress'],
+                            irows=slice(0, 5))
+
+    def _build_table_array(self, op2, class_obj, nnodes):
+        data_code = {'nonlinear_factor' : None, 'table_name' : 'OUGV1',
+                     'device_code' : 1, 'sort_code' : 0, 'lsdvmn' : 1,
+                     'dataNames' : ['lsdvmn']}
+        obj = class_obj(data_code, True, 1, None)
+        obj.ntimes = 1
+        obj.ntotal = nnodes
+        obj._nnodes = nnodes
+        obj.build()
+        op2.obj = obj
+        return obj
+
+    def test_table_vectorized_decode(self):
+        """the vectorized table4 decoder matches the node-by-node one"""
+        op2 = OP2()
+        op2.binary_debug = TrashWriter()
+        op2.device_code = 1
+        op2.nonlinear_factor = None
+
+        s = Struct(b'2i6f')
+        nids = [1, 2, 10, 11]
+        data = b''.join([s.pack(nid * 10 + 1, 1, 0.1 * nid, 1., 2., 3., 4., -5.)
+                         for nid in nids])
+
+        op2.read_mode = 0
+        obj1 = self._build_table_array(op2, RealDisplacementArray, 4)
+        n = op2._read_real_table(data, 'displacements', 'node')
+        self.assertEqual(n, len(data))
+
+        op2.read_mode = 2
+        obj2 = self._build_table_array(op2, RealDisplacementArray, 4)
+        n = op2._read_real_table(data, 'displacements', 'node')
+        self.assertEqual(n, len(data))
+        self.assertTrue(array_equal(obj2.node_gridtype[:, 0], nids))
+        self.assertTrue(array_equal(obj1.node_gridtype, obj2.node_gridtype))
+        self.assertTrue(array_equal(obj1.data, obj2.data))
+
+        s = Struct(b'2i12f')
+        data = b''.join([s.pack(nid * 10 + 1, 1, 1., 2., 3., 4., 5., 6.,
+                                0., 90., 180., 45., -30., 10.)
+                         for nid in nids])
+        op2.format_code = 3  # magnitude/phase
+        op2.read_mode = 0
+        obj1 = self._build_table_array(op2, ComplexDisplacementArray, 4)
+        op2._read_complex_table(data, 'displacements', 'node')
+
+        op2.read_mode = 2
+        obj2 = self._build_table_array(op2, ComplexDisplacementArray, 4)
+        op2._read_complex_table(data, 'displacements', 'node')
+        self.assertTrue(array_equal(obj1.node_gridtype, obj2.node_gridtype))
+        self.assertTrue(allclose(obj1.data, obj2.data, atol=1e-6))
+
+    def test_oes_composite_vectorized_decode(self):
+        """the vectorized composite decoder handles elements split across blocks"""
+        op2 = OP2()
+        op2.binary_debug = TrashWriter()
+        op2.device_code = 1
+        op2.num_wide = 11
+
+        data_code = {'nonlinear_factor' : None, 'table_name' : 'OES1C',
+                     'element_type' : 95, 'element_name' : 'CQUAD4',
+                     'device_code' : 1, 'sort_code' : 0, 'lsdvmn' : 1,
+                     'dataNames' : ['lsdvmn']}
+        obj = RealCompositePlateStressArray(data_code, True, 1, None)
+        obj.ntimes = 1
+        obj.nelements = 2
+        obj.ntotal = 5
+        obj.build()
+        op2.obj = obj
+
+        s = Struct(b'ii9f')
+        eids = [5, 5, 5, 7, 7]
+        layers = [1, 2, 3, 1, 2]
+        data = b''.join([s.pack(eid * 10 + 1, layer, *range(i, i + 9))
+                         for i, (eid, layer) in enumerate(zip(eids, layers))])
+
+        n = op2._read_real_composite_plate_vectorized(data[:88], 2, None)
+        self.assertEqual(n, 88)
+        n = op2._read_real_composite_plate_vectorized(data[88:], 3, None)
+        self.assertEqual(n, 132)
+        self.assertEqual(op2.eid_old, 7)
+        self.assertEqual(obj.ielement, 2)
+        self.assertEqual(obj.itotal, 5)
+        self.assertTrue(array_equal(obj.element_layer[:, 0], eids))
+        self.assertTrue(array_equal(obj.element_layer[:, 1], layers))
+        self.assertTrue(array_equal(obj.data[0, :, 0], range(5)))
+
+    def test_oes_plate_solid_vectorized_decode(self):
+        """the vectorized plate/bilinear plate/solid decoders match the element loops"""
+        folder = os.path.abspath(os.path.join(testPath, '..', 'models'))
+        op2_filename = os.path.join(folder, 'sol_101_elements', 'mode_solid_shell_bar.op2')
+        op2 = OP2(debug=False)
+        op2.read_op2(op2_filename)
+        op2v = OP2_Vectorized()
+        op2v.set_as_vectorized(ask=False)
+        op2v.read_op2(op2_filename)
+
+        # CTRIA3-74 is centroidal and CQUAD4-144 is bilinear
+        stress = op2.plateStress[1]
+        names = ['oxx', 'oyy', 'txy', 'angle', 'majorP', 'minorP', 'ovmShear']
+        for result_name, center in [('ctria3_stress', 'CEN/3'), ('cquad4_stress', 'CEN/4')]:
+            obj = getattr(op2v, result_name)[1]
+            eids = [eid for eid, etype in stress.eType.items()
+                    if etype == obj.element_name]
+            self.assertEqual(sorted(set(obj.element_node[:, 0])), sorted(eids))
+            nrows = sum([len(stress.oxx[1][eid]) * 2 for eid in eids])
+            self.assertEqual(obj.element_node.shape[0], nrows)
+            for itime, dt in enumerate(sorted(stress.oxx)):
+                for itotal, (eid, nid) in enumerate(obj.element_node):
+                    nid = center if nid == 0 else nid
+                    ilayer = itotal % 2
+                    expected = [stress.fiberCurvature[eid][nid][ilayer]]
+                    expected += [getattr(stress, name)[dt][eid][nid][ilayer] for name in names]
+                    self.assertTrue(allclose(obj.data[itime, itotal, :], expected),
+                                    (result_name, dt, eid, nid))
+
+        stress = op2.solidStress[1]
+        names = ['oxx', 'oyy', 'ozz', 'txy', 'tyz', 'txz', 'o1', 'o2', 'o3', 'ovmShear']
+        for result_name in ['ctetra_stress', 'chexa_stress', 'cpenta_stress']:
+            obj = getattr(op2v, result_name)[1]
+            eids = obj.element_cid[:, 0]
+            self.assertEqual(sorted(set(obj.element_node[:, 0])), sorted(eids))
+            for eid, cid in obj.element_cid:
+                self.assertEqual(cid, stress.cid[eid])
+            nrows = sum([len(stress.oxx[1][eid]) for eid in eids])
+            self.assertEqual(obj.element_node.shape[0], nrows)
+            for itime, dt in enumerate(sorted(stress.oxx)):
+                for itotal, (eid, nid) in enumerate(obj.element_node):
+                    nid = 'CENTER' if nid == 0 else nid
+                    expected = [getattr(stress, name)[dt][eid][nid] for name in names]
+                    self.assertTrue(allclose(obj.data[itime, itotal, :], expected),
+                                    (result_name, dt, eid, nid))
+
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -1,19 +1,66 @@
 #!/usr/bin/env python
-__all__ = ['OP4']
+__all__ = ['OP4', 'OP4Entry']
 from six import string_types, iteritems, PY2
 from six.moves import range
 import os
 import io
-from struct import pack, unpack
+from struct import pack, unpack, Struct
 
 from numpy import (array, zeros, float32, float64, complex64, complex128,
-                  allclose, ndarray)
-from scipy.sparse import coo_matrix
+                  allclose, ndarray, arange, repeat, cumsum, frombuffer,
+                  flatnonzero, diff, concatenate, bincount, memmap)
+from numpy import dtype as np_dtype
+from scipy.sparse import coo_matrix, csc_matrix, issparse
 
 from pyNastran.utils import is_binary
 from pyNastran.utils.mathematics import print_matrix, print_annotated_matrix
 
 
+class OP4Entry(object):
+    """
+    The location and header of a matrix in a binary OP4 (see
+    OP4.read_op4_directory), which is found without reading the values.
+    """
+    def __init__(self, name, form, Type, nrows, ncols, isBigMat, is_sparse,
+                 offset, nbytes, data_offset, column_stride=None):
+        #: the name of the matrix
+        self.name = name
+        #: the form of the matrix (1=square, 2=rectangular, 6=symmetric, ...)
+        self.form = form
+        #: 1=real/single, 2=real/double, 3=complex/single, 4=complex/double
+        self.Type = Type
+        self.nrows = nrows
+        self.ncols = ncols
+        self.isBigMat = isBigMat
+        self.is_sparse = is_sparse
+        #: the file offset of the matrix header
+        self.offset = offset
+        #: the number of bytes of the matrix (header through end record)
+        self.nbytes = nbytes
+        #: the file offset of the first column record
+        self.data_offset = data_offset
+        #: the number of bytes per column (None if the matrix isn't
+        #: dense with every column stored from the first to the last row)
+        self.column_stride = column_stride
+
+    @property
+    def shape(self):
+        return (self.nrows, self.ncols)
+
+    @property
+    def dtype(self):
+        return get_dtype(self.Type)
+
+    @property
+    def is_contiguous(self):
+        """can the values be memory mapped/read with a single read"""
+        return self.column_stride is not None
+
+    def __repr__(self):
+        return 'OP4Entry(name=%r, form=%s, Type=%s, shape=%s, is_sparse=%s, offset=%s)' % (
+            self.name, self.form, self.Type, self.shape, self.is_sparse, self.offset)
+
+
 class OP4(object):
     """
     todo:: add endian checking
@@ -25,7 +72,7 @@ class OP4(object):
         self.n = 0
         self.endian = ''
 
-    def read_op4(self, op4_filename=None, matrix_names=None, precision='default'):
+    def read_op4(self, op4_filename=None, matrix_names=None, precision='default', mmap=False):
         """
         Reads a NASTRAN OUTPUT4 file, regular or sparse, and stores the
         matrices as the output arguments of the function.  The number of
@@ -60,6 +107,9 @@ class OP4(object):
         :param precision: specifies if the matrices are in single or double
                precsion (values='default', 'single', 'double') which means the
                format will be whatever the file is in
+        :param mmap: memory map the dense binary matrices that have every
+               column stored (the values are read only and keep the endian
+               of the file); default=False
 
         :returns: dictionary of matrices where the key is the name and the
                   value is [form, matrix]
@@ -106,7 +156,7 @@ class OP4(object):
         #assert isinstance(matrix_names, list), 'type(matrix_names)=%s' % type(matrix_names)
 
         if is_binary(op4_filename):
-            return self.read_op4_binary(op4_filename, matrix_names, precision)
+            return self.read_op4_binary(op4_filename, matrix_names, precision, mmap=mmap)
         else:
             return self.read_op4_ascii(op4_filename, matrix_names, precision)
 
@@ -443,9 +493,59 @@ class OP4(object):
         return irow
 
 #--------------------------------------------------------------------------
-    def read_op4_binary(self, op4_filename, matrix_names=None, precision='default'):
-        """matrix_names must be a list or None, but basically the same"""
-        f = io.open(op4_filename, mode='rb')
+    def read_op4_binary(self, op4_filename, matrix_names=None, precision='default', mmap=False):
+        """
+        matrix_names must be a list or None, but basically the same
+
+        The matrices are found with read_op4_directory, so the matrices that
+        aren't in matrix_names are skipped without being read.
+        """
+        with io.open(op4_filename, mode='rb') as f:
+            self._get_endian_binary(f)
+            entries = self._read_directory_binary(f)
+
+            matrices = {}
+            for entry in entries:
+                name = entry.name
+                if matrix_names is not None and (
+                        name not in matrix_names and name.decode('latin1') not in matrix_names):
+                    continue
+                if entry.is_contiguous:
+                    A = self._read_dense_contiguous_binary(f, entry, op4_filename, mmap)
+                    matrices[name] = (entry.form, A)
+                else:
+                    f.seek(entry.offset)
+                    self.n = entry.offset
+                    (name, form, A) = self._read_matrix_binary(f, precision, matrix_names)
+                    matrices[name] = (form, A)
+        return matrices
+
+    def read_op4_directory(self, op4_filename):
+        """
+        Finds the matrices in a binary OP4 without reading the values.
+        Only the matrix headers and the column headers are read, so a
+        matrix with a known layout (see OP4Entry.column_stride) is
+        skipped with a few reads.
+
+        >>> op4 = OP4()
+        >>> entries = op4.read_op4_directory(op4_filename)
+        >>> for entry in entries:
+        ...     print(entry.name, entry.shape, entry.is_sparse)
+
+        :param op4_filename: a binary OP4 filename
+        :returns entries: the list of OP4Entry objects in file order
+        """
+        if not os.path.exists(op4_filename):
+            raise IOError('cannot find op4_filename=%r' % op4_filename)
+        if not is_binary(op4_filename):
+            raise NotImplementedError('only binary OP4s are supported; op4_filename=%r' % op4_filename)
+        with io.open(op4_filename, mode='rb') as f:
+            self._get_endian_binary(f)
+            entries = self._read_directory_binary(f)
+        return entries
+
+    def _get_endian_binary(self, f):
+        """sets the endian from the first record length (24)"""
         self.n = 0
 
         # get the endian
@@ -464,47 +564,104 @@ class OP4(object):
             raise RuntimeError(msg)
         f.seek(0)
 
-        i = 0
-        matrices = {}
-        name = 'dummyName'
-        while name is not None:
-            #print "i =", i
-            # checks for the end of the file
-            assert self.n == f.tell(), 'n=%s tell=%s' % (self.n, f.tell())
-            n = self.n
-            data1 = f.read(1)
+    def _read_directory_binary(self, f):
+        """finds the matrices from the current position to the end of the file"""
+        offset = f.tell()
+        f.seek(0, os.SEEK_END)
+        nbytes_file = f.tell()
+
+        entries = []
+        while offset < nbytes_file:
+            entry = self._scan_matrix_binary(f, offset)
+            entries.append(entry)
+            offset += entry.nbytes
+        f.seek(offset)
+        self.n = offset
+        return entries
+
+    def _scan_matrix_binary(self, f, offset):
+        """
+        Finds the size of the matrix at offset by jumping from column header
+        to column header (see _read_matrix_binary for the layout).
+
+        If the first column of a dense matrix has every row, every column
+        is assumed to have the same size, which is checked with the last
+        column and the end record, so the columns don't need to be read.
+        """
+        f.seek(offset)
+        data = f.read(28)
+        (recordLength, ncols, nrows, form, Type, name) = unpack(self.endian + 'i4i8s', data)
+        if recordLength != 24:
+            raise NotImplementedError('recordLength=%s filename=%r' % (recordLength, f.name))
+        name = name.strip()
+        if nrows < 0:  # if less than 0, big
+            isBigMat = True
+            nrows = abs(nrows)
+        elif nrows > 0:
+            isBigMat = False
+        else:
+            raise RuntimeError('unknown BIGMAT.  nRows=%s' % nrows)
+        (NWV, NBW, d, dtype) = self._get_matrix_info(Type)
+
+        # the end record is the column header, the 1.0, and the record length
+        if d in ['d', 'dd']:
+            nend = 20 + 8 + 4
+        else:
+            nend = 20 + 4 + 4
+
+        column_struct = Struct(self.endian + '5i')
+        def read_column_header(n):
             f.seek(n)
-            if len(data1) == 0:
-                break
-            #self.show(f, 60)
-
-            (name, form, matrix) = self._read_matrix_binary(f, precision, matrix_names)
-            #print print_matrix(matrix)
-            if name is not None:
-                if matrix_names is None or name in matrix_names:  # save the matrix
-                    matrices[name] = (form, matrix)
-
-            #print "not f.closed = ",not f.closed,form,name
-            # if not f.closed or form is not None:
-            #     data = f.read(4)
-            #     self.n+=4
-            #     if len(data) == 0:
-            #         break
-            #     (recordLength,) = unpack(self.endian+'i', data)
-            #     print("RL = %s" % recordLength)
-            #     if recordLength == 24:
-            #         self.n-=4
-            #         f.seek(self.n)
-            #     else:
-            #         data = f.read(4)
-            #         if len(data) == 0:
-            #             break
-            #         (recordLength2,) = unpack(self.endian+'i', data)
-            #         assert recordLength2 == 24
-            #         f.seek(self.n)
-            #
-            i += 1
-        return matrices
+            data = f.read(20)
+            if len(data) != 20:
+                raise RuntimeError('the OP4 is truncated; name=%r filename=%r' % (name, f.name))
+            # the end of the previous record, the start of this one,
+            # the column, the row (0=sparse), and the number of words
+            return column_struct.unpack(data)[2:]
+
+        data_offset = offset + 28
+        (icol, irow, nwords) = read_column_header(data_offset)
+        is_sparse = irow == 0
+
+        column_stride = None
+        n = data_offset
+        if irow == 1 and icol == 1 and nwords == nrows * NWV:
+            stride = 20 + 4 * nwords
+            if (read_column_header(data_offset + (ncols - 1) * stride) == (ncols, 1, nwords) and
+                    read_column_header(data_offset + ncols * stride)[0] == ncols + 1):
+                column_stride = stride
+                n = data_offset + ncols * stride
+
+        if column_stride is None:
+            while icol != ncols + 1:
+                n += 20 + 4 * nwords
+                (icol, irow, nwords) = read_column_header(n)
+        nbytes = n + nend - offset
+        return OP4Entry(name, form, Type, nrows, ncols, isBigMat, is_sparse,
+                        offset, nbytes, data_offset, column_stride)
+
+    def _read_dense_contiguous_binary(self, f, entry, op4_filename, mmap=False):
+        """
+        Reads a dense matrix that has every row of every column, so the
+        columns are records of the same size and the values are read at once.
+
+        :param mmap: the values are a view of a numpy.memmap of the file,
+                     so only the values that are used are read
+        """
+        column_dtype = np_dtype([
+            ('header', self.endian + 'i4', (5,)),
+            ('values', self.endian + _VALUE_DTYPES[entry.Type], (entry.nrows,)),
+        ])
+        assert column_dtype.itemsize == entry.column_stride, entry
+        if mmap:
+            columns = memmap(op4_filename, dtype=column_dtype, mode='r',
+                             offset=entry.data_offset, shape=(entry.ncols,))
+            return columns['values'].T
+
+        f.seek(entry.data_offset)
+        data = f.read(column_dtype.itemsize * entry.ncols)
+        columns = frombuffer(data, dtype=column_dtype)
+        return columns['values'].T.astype(entry.dtype)
 
     def read_start_marker(self, f):
         #print '--------------------------------------'
@@ -677,12 +834,103 @@ class OP4(object):
 
     def _read_real_binary(self, f, nrows, ncols, Type, is_sparse, isBigMat):
         if is_sparse:
-            A = self._read_real_sparse_binary(f, nrows, ncols, Type, is_sparse, isBigMat)
+            A = self._read_sparse_binary(f, nrows, ncols, Type, isBigMat)
         else:
             A = self._read_real_dense_binary(f, nrows, ncols, Type, is_sparse, isBigMat)
         return A
 
+    def _read_sparse_binary(self, f, nrows, ncols, Type, isBigMat):
+        """
+        Reads a real/complex sparse binary matrix
+
+        A column record is a series of strings, where a string is a header
+        (the first row and the number of words) followed by the values of
+        consecutive rows.  The headers are decoded while walking the record,
+        but the values are only copied into a single byte buffer, so they're
+        converted with one numpy call once the matrix has been read.  The
+        row indices and the column pointers (CSC) are then built from the
+        string headers.
+
+        :returns A: the matrix as a coo_matrix
+        """
+        (NWV, NBW, d, dtype) = self._get_matrix_info(Type)
+        values_dtype = self.endian + _VALUE_DTYPES[Type]
+        column_struct = Struct(self.endian + '5i')
+        if isBigMat:
+            string_struct = Struct(self.endian + '2i')
+        else:
+            string_struct = Struct(self.endian + 'i')
+        nheader = string_struct.size
+
+        values = bytearray()
+        string_irows = []
+        string_nvalues = []
+        string_icols = []
+        is_sorted = True
+        icol_last = 0
+        while 1:
+            assert self.n == f.tell(), 'n=%s tell=%s' % (self.n, f.tell())
+            # the end of the previous record, the start of this one,
+            # the column, the row (0=sparse), and the number of words
+            (_rl_end, _rl_start, icol, irow, nwords) = column_struct.unpack(f.read(20))
+            self.n += 20
+            if icol == ncols + 1:
+                break
+
+            nbytes = 4 * nwords
+            data = f.read(nbytes)
+            self.n += nbytes
+            view = memoryview(data)
+
+            i = 0
+            while i < nbytes:
+                if isBigMat:
+                    (L, irow) = string_struct.unpack_from(data, i)
+                    L -= 1
+                else:
+                    (IS,) = string_struct.unpack_from(data, i)
+                    L = IS // 65536 - 1
+                    irow = IS - 65536 * (L + 1)
+                if L < 0:  # null string
+                    break
+                i += nheader
+                nvalues = L // NWV
+                j = i + nvalues * NBW
+                values += view[i:j]
+                string_irows.append(irow - 1)
+                string_nvalues.append(nvalues)
+                string_icols.append(icol - 1)
+                i = j
+
+            if icol < icol_last:
+                is_sorted = False
+            icol_last = icol
+        f.read(4)
+        self.n += 4
+
+        data = frombuffer(values, dtype=values_dtype).astype(dtype)
+        nvalues = array(string_nvalues, dtype='int32')
+        icols = array(string_icols, dtype='int32')
+
+        # the row is the first row of the string + the position in the string
+        istart = cumsum(nvalues) - nvalues
+        irows = array(string_irows, dtype='int32') - istart
+        rows = repeat(irows, nvalues) + arange(len(data), dtype='int32')
+        if not is_sorted:
+            cols = repeat(icols, nvalues)
+            return coo_matrix((data, (rows, cols)), shape=(nrows, ncols), dtype=dtype)
+
+        indptr = zeros(ncols + 1, dtype='int32')
+        indptr[1:] = cumsum(bincount(icols, weights=nvalues, minlength=ncols))
+        A = csc_matrix((data, rows, indptr), shape=(nrows, ncols), dtype=dtype)
+        return A.tocoo()
+
     def _read_real_sparse_binary(self, f, nrows, ncols, Type, is_sparse, isBigMat):
+        """
+        Reads a real sparse binary matrix one string at a time (see
+        _read_sparse_binary).  This is kept as the reference reader for
+        performance.py.
+        """
         (NWV, NBW, d, dtype) = self._get_matrix_info(Type)
         rows = []
         cols = []
@@ -883,12 +1131,17 @@ class OP4(object):
 
     def _read_complex_binary(self, f, nrows, ncols, Type, is_sparse, isBigMat):
         if is_sparse:
-            A = self._read_complex_sparse_binary(f, nrows, ncols, Type, isBigMat)
+            A = self._read_sparse_binary(f, nrows, ncols, Type, isBigMat)
         else:
             A = self._read_complex_dense_binary(f, nrows, ncols, Type, isBigMat)
         return A
 
     def _read_complex_sparse_binary(self, f, nrows, ncols, Type, isBigMat):
+        """
+        Reads a complex sparse binary matrix one string at a time (see
+        _read_sparse_binary).  This is kept as the reference reader for
+        performance.py.
+        """
         (NWV, NBW, d, dtype) = self._get_matrix_info(Type)
         rows = []
         cols = []
@@ -1112,12 +1365,13 @@ class OP4(object):
             if not form in (1, 2, 3, 6, 8, 9):
                 raise ValueError('form=%r and must be in [1, 2, 3, 6, 8, 9]' % form)
 
-            if isinstance(matrix, coo_matrix):
+            if issparse(matrix):
                 #write_DMIG(f, name, matrix, form, precision='default')
                 if is_binary:
-                    raise NotImplementedError('sparse binary op4 writing not implemented')
+                    self._write_sparse_matrix_binary(f, name, matrix, form=form,
+                                                     precision=precision, isBigMat=isBigMat)
                 else:
-                    self._write_sparse_matrix_ascii(f, name, matrix, form=form,
+                    self._write_sparse_matrix_ascii(f, name, matrix.tocoo(), form=form,
                                                     precision=precision, isBigMat=isBigMat)
             elif isinstance(matrix, ndarray):
                 if is_binary:
@@ -1125,7 +1379,7 @@ class OP4(object):
                 else:
                     self._write_dense_matrix_ascii(f, name, matrix, form=form, precision=precision)
             else:
-                raise NotImplementedError('Matrix type=%r is not supported.  types=[coo_matrix, ndarray]' % type(matrix))
+                raise NotImplementedError('Matrix type=%r is not supported.  types=[scipy.sparse, ndarray]' % type(matrix))
 
 
     def __backup(self, name, matrix, form=2, precision='default'):
@@ -1275,6 +1529,86 @@ class OP4(object):
         f.write('%8i%8i%8i\n' % (ncols + 1, 1, 1))
         f.write(' 1.0000000000000000E+00\n')
 
+    def _write_sparse_matrix_binary(self, f, name, A, form=2, isBigMat=False, precision='default'):
+        """
+        Writes a sparse binary matrix from the CSC form of the matrix, so
+        it's never densified.  The rows of a column are split into strings
+        of consecutive rows.
+
+        :param A: a scipy.sparse matrix
+
+        .. note:: BIGMAT is used if the row or string length doesn't fit
+                  in the small string header
+        """
+        A = A.tocsc()
+        A.sum_duplicates()  # also sorts the rows of each column
+        (Type, NWV) = self._get_type_nwv(A.data, precision)
+        (NWV, NBW, d, dtype) = self._get_matrix_info(Type)
+        (nrows, ncols) = A.shape
+        rows = A.indices
+        indptr = A.indptr
+        nvalues = len(rows)
+
+        # a string starts at the start of a column or after a skipped row
+        is_start = zeros(nvalues, dtype='bool')
+        if nvalues:
+            is_start[0] = True
+            is_start[1:] = diff(rows) != 1
+            is_start[indptr[:-1][diff(indptr) > 0]] = True
+        starts = flatnonzero(is_start)
+        ends = concatenate([starts[1:], [nvalues]])
+        nwords = (ends - starts) * NWV
+        irows = rows[starts] + 1
+        if not isBigMat and (nrows >= 65536 or (nwords.max(initial=0) + 1) >= 32768):
+            isBigMat = True
+
+        if isBigMat:
+            headers = array([nwords + 1, irows]).T
+            nheader = 2
+        else:
+            headers = irows + 65536 * (nwords + 1)
+            nheader = 1
+        header_bytes = headers.astype(self.endian + 'i4').tobytes()
+        value_bytes = A.data.astype(self.endian + _VALUE_DTYPES[Type]).tobytes()
+        header_view = memoryview(header_bytes)
+        value_view = memoryview(value_bytes)
+
+        # the strings of column icol are istrings[icol]:istrings[icol+1]
+        istrings = starts.searchsorted(indptr).tolist()
+        column_nwords = (diff(indptr) * NWV + diff(istrings) * nheader).tolist()
+        starts = starts.tolist()
+        ends = ends.tolist()
+
+        name2 = '%-8s' % name
+        assert len(name2) == 8, 'name=%r is too long; 8 characters max' % name
+        if not isinstance(name2, bytes):
+            name2 = name2.encode('latin1')
+        nrows2 = -nrows if isBigMat else nrows
+        f.write(pack(self.endian + '5i8si', 24, ncols, nrows2, form, Type, name2, 24))
+
+        column_struct = Struct(self.endian + '4i')
+        rl_struct = Struct(self.endian + 'i')
+        nheader_bytes = 4 * nheader
+        for icol in range(ncols):
+            istring0 = istrings[icol]
+            istring1 = istrings[icol + 1]
+            if istring0 == istring1:  # null column
+                continue
+            nwordsi = column_nwords[icol]
+            record_length = 12 + 4 * nwordsi
+            msg = [column_struct.pack(record_length, icol + 1, 0, nwordsi)]
+            for istring in range(istring0, istring1):
+                msg.append(header_view[istring * nheader_bytes:(istring + 1) * nheader_bytes])
+                msg.append(value_view[starts[istring] * NBW:ends[istring] * NBW])
+            msg.append(rl_struct.pack(record_length))
+            f.write(b''.join(msg))
+
+        if d in ['f', 'ff']:
+            msg = pack(self.endian + '4ifi', 16, ncols + 1, 1, 1, 1.0, 16)
+        else:
+            msg = pack(self.endian + '4idi', 20, ncols + 1, 1, 1, 1.0, 20)
+        f.write(msg)
+
     def _write_dense_matrix_binary(self, f, name, matrix, form=2, precision='default'):
         """
         24 bytes is the record length
@@ -1402,6 +1736,15 @@ class OP4(object):
         f.write(msg)
 
 
+#: the numpy dtype (without the endian) of the values of each matrix Type
+_VALUE_DTYPES = {
+    1: 'f4',
+    2: 'f8',
+    3: 'c8',
+    4: 'c16',
+}
+
+
 def get_dtype(Type, precision='default'):
     """reset the type if 'default' not selected"""
     if precision == 'single':
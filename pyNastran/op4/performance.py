@@ -5,6 +5,9 @@ Create a collection of dense binary matrices in the current directory
 then see how long it takes to read the values back in using the
 pure Python and the Cython OP4 modules.  Plot the timing results.
 al.danial@gmail.com March 2013
+
+The sparse test creates banded binary matrices and compares the
+vectorized sparse reader with the one string at a time reader.
 """
 from __future__ import print_function
 from six.moves import range
@@ -12,12 +15,79 @@ import time
 import numpy as np
 import os
 import sys
-from matplotlib import pyplot as plt
+from scipy.sparse import diags
+
+from pyNastran.op4.op4 import OP4  # pure Python
+
+
+class ReferenceOP4(OP4):
+    """the OP4 reader with the one string at a time sparse binary readers"""
+    def _read_sparse_binary(self, f, nrows, ncols, Type, isBigMat):
+        if Type in [1, 2]:
+            return self._read_real_sparse_binary(f, nrows, ncols, Type, True, isBigMat)
+        return self._read_complex_sparse_binary(f, nrows, ncols, Type, isBigMat)
+
+
+def _best_time(func, nrepeat):
+    """the fastest of nrepeat calls"""
+    times = []
+    for i in range(nrepeat):
+        start_elapsed = time.time()
+        out = func()
+        times.append(time.time() - start_elapsed)
+    return min(times), out
+
+
+def sparse_banded_test(dimension, bandwidth=20, dtype='float64', nrepeat=3):
+    """
+    Compares the sparse binary readers on banded matrices (a single string
+    per column, so both readers support them)
+
+    :param dimension: the sizes of the square matrices
+    :param bandwidth: the number of terms on each side of the diagonal
+    :param dtype: the type of the matrix (float32, float64, complex64, complex128)
+    :param nrepeat: the number of reads; the fastest is used
+    """
+    new_load = []
+    ref_load = []
+    filenames = []
+    random = np.random.RandomState(42)
+    for i, n in enumerate(dimension):
+        filename = 'pyop4_%dx%d_sparse_%s.op4' % (n, n, dtype)
+        filenames.append(filename)
+        offsets = range(-bandwidth, bandwidth + 1)
+        bands = [random.randn(n - abs(offset)) for offset in offsets]
+        A = diags(bands, offsets, shape=(n, n), format='csc').astype(dtype)
+        if 'complex' in dtype:
+            A = A + 1j * A
+
+        start_elapsed = time.time()
+        OP4().write_op4(filename, {'A' : (2, A)}, is_binary=True)
+        end_elapsed = time.time()
+        print('wrote %-32s in %8.3f s (nnz=%s)' % (filename, end_elapsed - start_elapsed, A.nnz))
+
+        dt_new, matrices_new = _best_time(lambda: OP4().read_op4(filename), nrepeat)
+        dt_ref, matrices_ref = _best_time(lambda: ReferenceOP4().read_op4(filename), nrepeat)
+        A_new = matrices_new[b'A'][1].tocsc()
+        A_ref = matrices_ref[b'A'][1].tocsc()
+        assert A_new.dtype == A_ref.dtype == A.dtype, (A_new.dtype, A_ref.dtype, A.dtype)
+        assert (A_new != A).nnz == 0, filename
+        assert (A_ref != A).nnz == 0, filename
+        new_load.append(dt_new)
+        ref_load.append(dt_ref)
+        del matrices_new, matrices_ref, A_new, A_ref
+        os.remove(filename)
+
+    print('Dimension   reference   vectorized   speedup')
+    print('---------   ---------   ----------   -------')
+    for i, n in enumerate(dimension):
+        print('%9d   %9.3f   %10.3f   %7.1f' % (
+            n, ref_load[i], new_load[i], ref_load[i] / new_load[i]))
+    return ref_load, new_load
 
-import cop4          # Cython
-from op4 import OP4  # pure Python
 
 def dense_square_test(dimension, is_binary=True):
+    import cop4  # Cython
     filenames = []
     cop4_save = []
     cop4_load = []
@@ -101,6 +171,7 @@ def dense_square_test(dimension, is_binary=True):
         print('%6d     %8.3f       %8.3f' % (n, cop4_load[i], pop4_load[i]))
 
     if make_plot:
+        from matplotlib import pyplot as plt
         plt.semilogy(dimension, cop4_load, color='green')
         plt.semilogy(dimension, pop4_load, color='blue' )
         plt.legend(['cop4', 'op4'], 'upper left')
@@ -122,7 +193,13 @@ if __name__ == '__main__':  # pragma: no cover
     #dimension = range(5, 10, 10)
     #print dimension
 
-    if 1:
+    # the sparse test doesn't need cop4/matplotlib
+    is_sparse = True
+    if is_sparse:
+        for dtype in ['float64', 'complex128']:
+            sparse_banded_test([2000, 10000, 50000], bandwidth=20, dtype=dtype)
+    else:
+        from matplotlib import pyplot as plt
         #plt.figure(1)
         #dense_square_test(dimension, is_binary=False)
         #plt.title('ASCII Dense Square Matrix Load Performance')
@@ -131,6 +208,5 @@ if __name__ == '__main__':  # pragma: no cover
         dense_square_test(dimension, is_binary=True)
         plt.title('Binary Dense Square Matrix Load Performance')
 
-
-    if make_plot:
-        plt.show()
\ No newline at end of file
+        if make_plot:
+            plt.show()
\ No newline at end of file
@@ -1,7 +1,7 @@
 from six import iteritems
 import os
 
-from numpy import ndarray, eye, array_equal, complex64, complex128, zeros
+from numpy import ndarray, eye, array_equal, complex64, complex128, zeros, array, memmap
 import unittest
 from pyNastran.op4.op4 import OP4
 #from pyNastran.op4.cop4 import OP4 as cOP4
@@ -151,6 +151,62 @@ class TestOP4(unittest.TestCase):
                 self.assertTrue(array_equal(A, E))
             del A
 
+    def test_sparse_binary(self):
+        """the sparse binary writer/reader with multiple strings per column"""
+        from scipy.sparse import coo_matrix
+        rows = [0, 1, 2, 5, 6, 9, 0, 9, 3]
+        cols = [0, 0, 0, 0, 0, 0, 2, 2, 3]
+        values = [1., 2., 3., 4., 5., 6., 7., 8., 9.]
+        A1 = coo_matrix((values, (rows, cols)), shape=(10, 4))
+        A2 = coo_matrix((array(values) * (1. + 2.j), (rows, cols)), shape=(10, 4),
+                        dtype='complex64')
+
+        # BIGMAT (more than 65535 rows)
+        A3 = coo_matrix(([1., 2., 3.], ([0, 70000, 70001], [1, 1, 1])), shape=(70002, 2))
+        matrices = {
+            'A1': (2, A1),
+            'A2': (2, A2),
+            'A3': (2, A3.tocsr()),
+        }
+        op4 = OP4()
+        op4_filename = os.path.join(op4Path, 'sparse_binary.op4')
+        op4.write_op4(op4_filename, matrices, name_order=None, precision='default',
+                      is_binary=True)
+        matrices2 = op4.read_op4(op4_filename, precision='default')
+        for name, (form, A) in sorted(iteritems(matrices)):
+            (form2, B) = matrices2[name.encode('latin1')]
+            self.assertEqual(form, form2)
+            self.assertEqual(A.dtype, B.dtype)
+            self.assertTrue(array_equal(A.toarray(), B.toarray()), name)
+
+    def test_op4_directory(self):
+        """the matrices are found without reading them"""
+        op4 = OP4()
+        op4_filename = os.path.join(op4Path, 'mat_b_dn.op4')
+        entries = op4.read_op4_directory(op4_filename)
+        names = [entry.name for entry in entries]
+        self.assertEqual(names, [b'EYE10', b'LOW', b'RND1RS', b'RND1RD', b'RND1CS',
+                                 b'RND1CD', b'NULL', b'STRINGS', b'EYE5CD'])
+        entry = entries[5]
+        self.assertEqual(entry.shape, (4, 4))
+        self.assertEqual(entry.dtype, 'complex128')
+        self.assertTrue(entry.is_contiguous)
+        self.assertFalse(entries[1].is_contiguous)  # LOW doesn't have every row
+        self.assertEqual(entries[-1].offset + entries[-1].nbytes,
+                         os.path.getsize(op4_filename))
+
+        matrices = op4.read_op4(op4_filename)
+        matrices2 = op4.read_op4(op4_filename, matrix_names=['RND1CD', 'LOW'])
+        matrices3 = op4.read_op4(op4_filename, mmap=True)
+        self.assertEqual(sorted(matrices2.keys()), [b'LOW', b'RND1CD'])
+        for name, (form, A) in sorted(iteritems(matrices)):
+            (form3, A3) = matrices3[name]
+            self.assertEqual(form, form3)
+            self.assertTrue(array_equal(A, A3), name)
+            if name in matrices2:
+                self.assertTrue(array_equal(A, matrices2[name][1]), name)
+        self.assertIsInstance(matrices3[b'RND1RS'][1], memmap)
+
     def test_bad_inputs_1(self):
         op4 = OP4()
         op4_filename = os.path.join(op4Path, 'bad_inputs.op4')